@@ -23,6 +23,7 @@ from flask import Flask, render_template, request, redirect, url_for, flash
 from inference_adapter import (
     run_inference_with_features,
     get_model_info,
+    warm_up,
     InferenceError,
     ModelNotFoundError,
 )
@@ -37,6 +38,9 @@ from audio_utils import (
 app = Flask(__name__)
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", "dev-secret-key-change-in-prod")
 
+# Warm the extraction stack once at start-up so the first request is not slow
+warm_up()
+
 
 @app.route("/")
 def index():
@@ -21,6 +21,7 @@ import csv
 from parkinsons_voice_classification.inference import (
     run_inference as core_run_inference,
     get_model_info,
+    warm_up,
     InferenceResult,
     InferenceError,
     ModelNotFoundError,
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Compute new per-file aggregate features from the frame store.
+
+Reads the frame-level tracks saved by ``pvc-extract --save-frames`` and
+computes the requested statistics for every file at once, without re-running
+Praat or librosa. The result is keyed by filename, so it can be joined onto
+the feature CSV.
+
+Usage:
+    python scripts/aggregate_frame_tracks.py --task ReadText --track f0 --stats median p10 p90
+    python scripts/aggregate_frame_tracks.py --track mfcc --stats mean std --voiced-only
+
+Output:
+    outputs/features/{baseline|extended}/frame_aggregates_{task}.csv (default)
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from parkinsons_voice_classification.config import get_features_output_dir
+from parkinsons_voice_classification.features.frame_store import (
+    TRACK_COLUMNS,
+    FrameStore,
+    aggregate_tracks,
+    get_frame_store_dir,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate stored frame tracks per file")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue"],
+        default="ReadText",
+        help="Speech task (default: ReadText)",
+    )
+    parser.add_argument(
+        "--track",
+        nargs="+",
+        choices=list(TRACK_COLUMNS),
+        default=list(TRACK_COLUMNS),
+        help="Tracks to aggregate (default: all)",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="+",
+        default=["median", "p10", "p90"],
+        help="Statistics: mean, std, median, min, max, p0-p100 (default: median p10 p90)",
+    )
+    parser.add_argument(
+        "--voiced-only", action="store_true", help="Use only frames at voiced pitch frames"
+    )
+    parser.add_argument("--output", type=str, default=None, help="Output CSV path")
+    args = parser.parse_args()
+
+    store = FrameStore(get_frame_store_dir(args.task))
+    print(f"Frame store: {store.store_dir} ({len(store.filenames)} files)")
+    print(f"Extraction : {store.metadata}")
+
+    start = time.perf_counter()
+    frames = [
+        aggregate_tracks(store, track, stats=args.stats, voiced_only=args.voiced_only)
+        for track in args.track
+    ]
+    elapsed = time.perf_counter() - start
+    df = pd.concat(frames, axis=1)
+
+    if args.output is None:
+        output_path = get_features_output_dir() / f"frame_aggregates_{args.task.lower()}.csv"
+    else:
+        output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output_path)
+
+    print(f"\nComputed {df.shape[1]} columns for {df.shape[0]} files in {elapsed * 1000:.1f} ms")
+    print(f"  ✓ Saved: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Benchmark report for the batched Logistic Regression backend.
+
+Fits Logistic Regression on every fold of a repeated grouped CV of MDVR-KCL
+features, once per fold with sklearn's lbfgs and once with
+BatchedLogisticRegression.fit_batch, and reports:
+- fit time of both backends and the speedup
+- coefficient agreement with lbfgs (default tol) and with a tightly converged
+  lbfgs (tol=1e-10), as max relative deviation per fold
+- fraction of identical test-fold predictions
+- wall time of run_repeated_cv with the Logistic Regression model only
+
+Usage:
+    python scripts/benchmark_batched_logistic.py
+    python scripts/benchmark_batched_logistic.py --task SpontaneousDialogue --repeats 50
+
+Outputs:
+    outputs/results/benchmarks/batched_logistic_folds.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.preprocessing import StandardScaler
+
+import parkinsons_voice_classification.models.training as training
+from parkinsons_voice_classification.config import OUTPUTS_DIR, RANDOM_SEED
+from parkinsons_voice_classification.data.mdvr_kcl import load_features
+from parkinsons_voice_classification.models.classifiers import get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the batched LR backend")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue"],
+        default="ReadText",
+        help="Speech task to benchmark (default: ReadText)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=100, help="CV repeats (default: 100, 5 folds each)"
+    )
+    args = parser.parse_args()
+
+    X, y, groups = load_features(args.task)
+    folds = []
+    for repeat in range(args.repeats):
+        for train_idx, test_idx in get_cv_splits(y, groups, seed=RANDOM_SEED + repeat):
+            scaler = StandardScaler().fit(X[train_idx])
+            folds.append(
+                (scaler.transform(X[train_idx]), y[train_idx], scaler.transform(X[test_idx]))
+            )
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("BATCHED LOGISTIC REGRESSION BENCHMARK")
+    print(f"Task        : {args.task} ({X.shape[0]} recordings, {X.shape[1]} features)")
+    print(f"Folds       : {len(folds)} ({args.repeats} repeats × 5)")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    lbfgs = get_models("sklearn")["LogisticRegression"].steps[-1][1]
+    batched = get_models("batched")["LogisticRegression"].steps[-1][1]
+    tight = clone(lbfgs).set_params(tol=1e-10, max_iter=100_000)
+
+    start = time.perf_counter()
+    lbfgs_models = [clone(lbfgs).fit(X_train, y_train) for X_train, y_train, _ in folds]
+    lbfgs_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched_models = batched.fit_batch([(X_train, y_train) for X_train, y_train, _ in folds])
+    batched_seconds = time.perf_counter() - start
+
+    tight_models = [clone(tight).fit(X_train, y_train) for X_train, y_train, _ in folds]
+
+    rows = []
+    for fold, (_, _, X_test) in enumerate(folds):
+        reference, model, exact = lbfgs_models[fold], batched_models[fold], tight_models[fold]
+        scale = np.abs(exact.coef_).max()
+        rows.append(
+            {
+                "fold": fold,
+                "rel_dev_lbfgs": np.abs(model.coef_ - reference.coef_).max() / scale,
+                "rel_dev_tight": np.abs(model.coef_ - exact.coef_).max() / scale,
+                "lbfgs_vs_tight": np.abs(reference.coef_ - exact.coef_).max() / scale,
+                "same_predictions": np.array_equal(
+                    model.predict(X_test), reference.predict(X_test)
+                ),
+                "newton_iterations": int(model.n_iter_[0]),
+            }
+        )
+    folds_df = pd.DataFrame(rows)
+    folds_path = output_dir / "batched_logistic_folds.csv"
+    folds_df.to_csv(folds_path, index=False)
+
+    # End-to-end repeated CV, Logistic Regression only
+    cv_seconds = {}
+    for backend in ("sklearn", "batched"):
+        training.get_models = lambda backend=backend: {
+            "LogisticRegression": get_models(backend)["LogisticRegression"]
+        }
+        start = time.perf_counter()
+        training.run_repeated_cv(X, y, groups, use_groups=True, n_repeats=args.repeats, jobs=1)
+        cv_seconds[backend] = time.perf_counter() - start
+
+    print(f"\nFit time ({len(folds)} folds):")
+    print(f"  lbfgs (per fold) : {lbfgs_seconds:.3f}s")
+    print(f"  batched Newton   : {batched_seconds:.3f}s ({lbfgs_seconds / batched_seconds:.1f}×)")
+    print("\nMax relative coefficient deviation over folds:")
+    print(f"  batched vs lbfgs (tol=1e-4)  : {folds_df['rel_dev_lbfgs'].max():.2e}")
+    print(f"  batched vs lbfgs (tol=1e-10) : {folds_df['rel_dev_tight'].max():.2e}")
+    print(f"  lbfgs (tol=1e-4) vs tol=1e-10: {folds_df['lbfgs_vs_tight'].max():.2e}")
+    print(f"\nIdentical test predictions: {folds_df['same_predictions'].mean():.1%} of folds")
+    print(f"\nrun_repeated_cv, Logistic Regression only ({args.repeats} repeats):")
+    print(f"  sklearn : {cv_seconds['sklearn']:.2f}s")
+    print(
+        f"  batched : {cv_seconds['batched']:.2f}s "
+        f"({cv_seconds['sklearn'] / cv_seconds['batched']:.1f}×)"
+    )
+
+    print(f"\n  ✓ Saved: {folds_path.name}")
+
+
+if __name__ == "__main__":
+    main()
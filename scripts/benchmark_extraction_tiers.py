@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Benchmark report for the Praat extraction quality tiers.
+
+Runs the prosodic extractor once per tier on MDVR-KCL recordings and reports:
+- per-feature deviation of each tier from 'accurate' (mean / max relative error)
+- per-file extraction time and speedup over 'accurate'
+
+Spectral (librosa) features do not depend on the tier and are not timed.
+
+Usage:
+    python scripts/benchmark_extraction_tiers.py
+    python scripts/benchmark_extraction_tiers.py --task SpontaneousDialogue --limit 10
+
+Outputs:
+    outputs/results/benchmarks/extraction_tiers_deviation.csv
+    outputs/results/benchmarks/extraction_tiers_timing.csv
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from parkinsons_voice_classification.config import OUTPUTS_DIR
+from parkinsons_voice_classification.data.mdvr_kcl import load_dataset_manifest
+from parkinsons_voice_classification.features.prosodic_simple import extract_prosodic_features
+from parkinsons_voice_classification.features.tiers import EXTRACTION_TIERS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Praat extraction tiers")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue"],
+        default="ReadText",
+        help="Speech task to benchmark (default: ReadText)",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=None, help="Benchmark only the first N recordings"
+    )
+    parser.add_argument(
+        "--data-dir", type=str, default=None, help="MDVR-KCL base directory (default: config)"
+    )
+    args = parser.parse_args()
+
+    base_dir = Path(args.data_dir) if args.data_dir else None
+    manifest = load_dataset_manifest(args.task, base_dir).sort_values("filename")
+    if args.limit is not None:
+        manifest = manifest.head(args.limit)
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("EXTRACTION TIER BENCHMARK")
+    print(f"Task        : {args.task} ({len(manifest)} recordings)")
+    print(f"Tiers       : {', '.join(EXTRACTION_TIERS)}")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    values = []
+    timings = []
+    for filepath, filename in zip(manifest["filepath"], manifest["filename"]):
+        for tier in EXTRACTION_TIERS:
+            start = time.perf_counter()
+            features = extract_prosodic_features(filepath, tier=tier)
+            elapsed = time.perf_counter() - start
+
+            timings.append({"filename": filename, "tier": tier, "seconds": elapsed})
+            for feature, value in features.items():
+                values.append(
+                    {"filename": filename, "tier": tier, "feature": feature, "value": value}
+                )
+        print(f"  ✓ {filename}")
+
+    # ------------------------------------------------------------------ #
+    # Per-feature deviation from 'accurate'                                #
+    # ------------------------------------------------------------------ #
+    values_df = pd.DataFrame(values)
+    reference = values_df[values_df["tier"] == "accurate"][["filename", "feature", "value"]]
+    merged = values_df.merge(
+        reference, on=["filename", "feature"], suffixes=("", "_accurate")
+    )
+    merged["abs_error"] = (merged["value"] - merged["value_accurate"]).abs()
+    merged["rel_error"] = merged["abs_error"] / merged["value_accurate"].abs().replace(0, np.nan)
+
+    deviation = (
+        merged[merged["tier"] != "accurate"]
+        .groupby(["tier", "feature"])
+        .agg(
+            mean_abs_error=("abs_error", "mean"),
+            mean_rel_error=("rel_error", "mean"),
+            max_rel_error=("rel_error", "max"),
+        )
+        .reset_index()
+    )
+    deviation_path = output_dir / "extraction_tiers_deviation.csv"
+    deviation.to_csv(deviation_path, index=False)
+
+    # ------------------------------------------------------------------ #
+    # Per-file speedup                                                     #
+    # ------------------------------------------------------------------ #
+    timing_df = pd.DataFrame(timings).pivot(index="filename", columns="tier", values="seconds")
+    for tier in EXTRACTION_TIERS:
+        timing_df[f"speedup_{tier}"] = timing_df["accurate"] / timing_df[tier]
+    timing_path = output_dir / "extraction_tiers_timing.csv"
+    timing_df.reset_index().to_csv(timing_path, index=False)
+
+    print("\nMedian per-file speedup over 'accurate':")
+    for tier in EXTRACTION_TIERS:
+        print(f"  {tier:10s}: {timing_df[f'speedup_{tier}'].median():.2f}×")
+
+    print("\nWorst mean relative deviation per tier:")
+    for tier, group in deviation.groupby("tier"):
+        worst = group.nlargest(3, "mean_rel_error")
+        for _, row in worst.iterrows():
+            print(f"  {tier:10s} {row['feature']:25s} {row['mean_rel_error']:.2%}")
+
+    print(f"\n  ✓ Saved: {deviation_path.name}, {timing_path.name}")
+
+
+if __name__ == "__main__":
+    main()
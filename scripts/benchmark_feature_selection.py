@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+"""
+Benchmark report for feature selection (FEATURE_SELECTION) on Dataset B.
+
+Part 1 times the cached statistics of "correlation" and "mrmr" (absolute
+correlation matrix and mutual information) on each CV training fold:
+computed from scratch, loaded from the disk cache, and from memory.
+
+Part 2 runs 5-fold CV of the three thesis models once per selection method
+(with "none" = all features) and reports per method and model:
+- selection time (statistics already cached) and fit time over the folds
+- size of the reduced training matrices
+- mean accuracy and ROC-AUC across folds
+
+Without assets/PD_SPEECH_FEATURES.csv, ``--dataset synthetic`` uses random
+data of the same shape with redundant (linearly dependent) columns.
+
+Usage:
+    python scripts/benchmark_feature_selection.py
+    python scripts/benchmark_feature_selection.py --dataset synthetic --k 50
+
+Outputs:
+    outputs/results/benchmarks/feature_selection_{dataset}.csv
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+
+from parkinsons_voice_classification.config import (
+    FEATURE_SELECTION_K,
+    OUTPUTS_DIR,
+    RANDOM_SEED,
+)
+from parkinsons_voice_classification.data.pd_speech import load_features
+from parkinsons_voice_classification.models import feature_selection
+from parkinsons_voice_classification.models.classifiers import (
+    FEATURE_SELECTION_METHODS,
+    get_models,
+)
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.models.training import compute_metrics
+
+
+def load_dataset(name: str) -> tuple[np.ndarray, np.ndarray]:
+    """X and y of Dataset B, or random data of its shape."""
+    if name == "B":
+        return load_features()
+    X, y = make_classification(
+        n_samples=756,
+        n_features=752,
+        n_informative=40,
+        n_redundant=300,
+        weights=[0.25],
+        flip_y=0.05,
+        random_state=RANDOM_SEED,
+    )
+    return X, y
+
+
+def time_statistics(X: np.ndarray, y: np.ndarray, splits: list) -> pd.DataFrame:
+    """
+    Seconds to get the fold statistics from scratch, from disk and from memory.
+
+    Leaves them in the in-memory cache for the CV runs.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for fold, (train_idx, _) in enumerate(splits):
+            X_train, y_train = X[train_idx], y[train_idx]
+            for source in ("computed", "disk", "memory"):
+                if source != "memory":
+                    key = feature_selection._stats_key(X_train, y_train)
+                    feature_selection._stats_cache.pop(key, None)
+                start = time.perf_counter()
+                feature_selection.feature_statistics(X_train, y_train, cache_dir=cache_dir)
+                rows.append(
+                    {"fold": fold, "source": source, "seconds": time.perf_counter() - start}
+                )
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feature selection methods")
+    parser.add_argument(
+        "--dataset",
+        choices=["B", "synthetic"],
+        default="B",
+        help="Dataset B or random data of its shape (default: B)",
+    )
+    parser.add_argument(
+        "--k",
+        type=int,
+        default=FEATURE_SELECTION_K,
+        help=f"Features kept (default: {FEATURE_SELECTION_K})",
+    )
+    args = parser.parse_args()
+
+    try:
+        X, y = load_dataset(args.dataset)
+    except FileNotFoundError as e:
+        parser.error(f"{e} (use --dataset synthetic)")
+    splits = get_cv_splits(y)
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("FEATURE SELECTION BENCHMARK")
+    print(f"Dataset     : {args.dataset} ({X.shape[0]} samples, {X.shape[1]} features)")
+    print(f"Features    : {args.k} kept")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    stats_times = time_statistics(X, y, splits).groupby("source", sort=False)["seconds"].sum()
+    print("\nCorrelation + mutual information statistics (all folds):")
+    for source, seconds in stats_times.items():
+        print(f"  {source:<10} {seconds:8.3f}s")
+
+    rows = []
+    for method in FEATURE_SELECTION_METHODS:
+        models = get_models(feature_selection=method)
+        for name, pipeline in models.items():
+            select_seconds = fit_seconds = 0.0
+            train_bytes = 0
+            fold_metrics = []
+            for train_idx, test_idx in splits:
+                X_train, X_test = X[train_idx], X[test_idx]
+                if method != "none":
+                    start = time.perf_counter()
+                    selector = clone(pipeline.named_steps["select"])
+                    selector.set_params(n_features=args.k).fit(X_train, y[train_idx])
+                    X_train, X_test = selector.transform(X_train), selector.transform(X_test)
+                    select_seconds += time.perf_counter() - start
+                    model = pipeline[1:]
+                else:
+                    model = pipeline
+                train_bytes += X_train.nbytes
+
+                start = time.perf_counter()
+                model = clone(model).fit(X_train, y[train_idx])
+                fit_seconds += time.perf_counter() - start
+                fold_metrics.append(
+                    compute_metrics(
+                        y[test_idx], model.predict(X_test), model.predict_proba(X_test)[:, 1]
+                    )
+                )
+
+            metrics = pd.DataFrame(fold_metrics).mean()
+            rows.append(
+                {
+                    "method": method,
+                    "model": name,
+                    "n_features": X_train.shape[1],
+                    "select_seconds": select_seconds,
+                    "fit_seconds": fit_seconds,
+                    "train_mb": train_bytes / len(splits) / 1e6,
+                    "accuracy": metrics["accuracy"],
+                    "roc_auc": metrics["roc_auc"],
+                }
+            )
+            print(f"  {method:<12} {name:<20} fit {fit_seconds:7.2f}s")
+
+    results = pd.DataFrame(rows)
+    results_path = output_dir / f"feature_selection_{args.dataset}.csv"
+    results.to_csv(results_path, index=False)
+
+    print(
+        f"\n{'Method':<12} {'Model':<20} {'Feat':>5} {'Select (s)':>10} {'Fit (s)':>8} "
+        f"{'MB':>6} {'Acc':>6} {'AUC':>6}"
+    )
+    for _, row in results.iterrows():
+        print(
+            f"{row['method']:<12} {row['model']:<20} {row['n_features']:>5} "
+            f"{row['select_seconds']:>10.2f} {row['fit_seconds']:>8.2f} {row['train_mb']:>6.2f} "
+            f"{row['accuracy']:>6.3f} {row['roc_auc']:>6.3f}"
+        )
+
+    print(f"\n  ✓ Saved: {results_path.name}")
+
+
+if __name__ == "__main__":
+    main()
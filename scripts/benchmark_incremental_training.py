@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+Benchmark report for incremental model updates (pvc-train --update).
+
+Simulates a growing feature archive: a synthetic feature CSV of each archive
+size receives one daily batch of new recordings. For every model in
+--models the report compares:
+- "full": read the whole CSV and retrain from scratch (pvc-train)
+- "incremental": read only the rows appended after the saved model's
+  watermark and partial_fit the saved pipeline (pvc-train --update), for
+  models that support it
+with the wall time of each and accuracy on a held-out test set.
+
+Usage:
+    python scripts/benchmark_incremental_training.py
+    python scripts/benchmark_incremental_training.py --archive-sizes 1000 10000 100000 --batch 50
+
+Outputs:
+    outputs/results/benchmarks/incremental_training.csv
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.metrics import accuracy_score
+
+from parkinsons_voice_classification.cli.train_model import (
+    feature_watermark,
+    load_new_recordings,
+)
+from parkinsons_voice_classification.config import METADATA_COLUMNS, OUTPUTS_DIR, RANDOM_SEED
+from parkinsons_voice_classification.models.classifiers import OPTIONAL_MODELS, get_models
+from parkinsons_voice_classification.models.incremental import (
+    partial_fit_pipeline,
+    supports_partial_fit,
+)
+
+N_TEST = 2000
+
+
+def make_archive(n_samples: int) -> pd.DataFrame:
+    """Synthetic feature table with 47 features and the feature CSV's metadata columns."""
+    X, y = make_classification(
+        n_samples=n_samples,
+        n_features=47,
+        n_informative=15,
+        flip_y=0.05,
+        random_state=RANDOM_SEED,
+    )
+    df = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(X.shape[1])])
+    df.insert(0, "subject_id", [f"S{i // 4:05d}" for i in range(n_samples)])
+    df.insert(1, "label", y)
+    df.insert(2, "task", "ReadText")
+    df.insert(3, "filename", [f"rec_{i:06d}.wav" for i in range(n_samples)])
+    df.insert(4, "speech_ratio", 1.0)
+    return df
+
+
+def split_features(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """X and y of a feature table."""
+    feature_cols = [c for c in df.columns if c not in METADATA_COLUMNS]
+    return np.array(df[feature_cols].values), np.array(df["label"].values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental model updates")
+    parser.add_argument(
+        "--archive-sizes",
+        type=int,
+        nargs="+",
+        default=[2000, 8000, 32000],
+        help="Recordings already in the archive (default: 2000 8000 32000)",
+    )
+    parser.add_argument(
+        "--batch", type=int, default=100, help="New recordings per update (default: 100)"
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=["SGD_Logistic", "SGD_Hinge", "RandomForest"],
+        help="Models to compare (default: SGD_Logistic SGD_Hinge RandomForest)",
+    )
+    args = parser.parse_args()
+
+    models = get_models(extra_models=list(OPTIONAL_MODELS))
+    unknown = [name for name in args.models if name not in models]
+    if unknown:
+        parser.error(f"Unknown models: {unknown}. Available: {list(models)}")
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("INCREMENTAL TRAINING BENCHMARK")
+    print(f"Archive     : {args.archive_sizes} recordings + {args.batch} new")
+    print(f"Models      : {args.models}")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        features_path = Path(tmp) / "features_readtext.csv"
+        for archive_size in args.archive_sizes:
+            table = make_archive(archive_size + args.batch + N_TEST)
+            X_test, y_test = split_features(table.iloc[-N_TEST:])
+            archive = table.iloc[:archive_size]
+            X_old, y_old = split_features(archive)
+            # The archive the saved model was trained on, then the appended batch
+            archive.to_csv(features_path, index=False)
+            watermark = feature_watermark(features_path)
+            table.iloc[archive_size : archive_size + args.batch].to_csv(
+                features_path, mode="a", header=False, index=False
+            )
+
+            for name in args.models:
+                start = time.perf_counter()
+                X_all, y_all = split_features(pd.read_csv(features_path))
+                full = clone(models[name]).fit(X_all, y_all)
+                full_seconds = time.perf_counter() - start
+                rows.append(
+                    {
+                        "archive_size": archive_size,
+                        "model": name,
+                        "mode": "full",
+                        "seconds": full_seconds,
+                        "accuracy": accuracy_score(y_test, full.predict(X_test)),
+                    }
+                )
+
+                if not supports_partial_fit(models[name]):
+                    print(f"  {archive_size:>7} {name:<14} full {full_seconds:7.3f}s")
+                    continue
+
+                saved = clone(models[name]).fit(X_old, y_old)
+                start = time.perf_counter()
+                new_rows, _ = load_new_recordings(features_path, watermark)
+                X_new, y_new = split_features(new_rows)
+                class_counts = {c: int(np.sum(y_all == c)) for c in (0, 1)}
+                partial_fit_pipeline(saved, X_new, y_new, class_counts)
+                update_seconds = time.perf_counter() - start
+                rows.append(
+                    {
+                        "archive_size": archive_size,
+                        "model": name,
+                        "mode": "incremental",
+                        "seconds": update_seconds,
+                        "accuracy": accuracy_score(y_test, saved.predict(X_test)),
+                    }
+                )
+                print(
+                    f"  {archive_size:>7} {name:<14} full {full_seconds:7.3f}s   "
+                    f"incremental {update_seconds:7.3f}s"
+                )
+
+    results = pd.DataFrame(rows)
+    results_path = output_dir / "incremental_training.csv"
+    results.to_csv(results_path, index=False)
+
+    print(f"\n{'Archive':>8} {'Model':<14} {'Mode':<12} {'Time (s)':>9} {'Acc':>6}")
+    for _, row in results.iterrows():
+        print(
+            f"{row['archive_size']:>8} {row['model']:<14} {row['mode']:<12} "
+            f"{row['seconds']:>9.3f} {row['accuracy']:>6.3f}"
+        )
+
+    print(f"\n  ✓ Saved: {results_path.name}")
+
+
+if __name__ == "__main__":
+    main()
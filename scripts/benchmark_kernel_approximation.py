@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""
+Benchmark report comparing the exact SVM_RBF with the RBF_Approx model.
+
+Runs 5-fold CV of SVM_RBF and of RBF_Approx with each KERNEL_APPROXIMATIONS
+feature map ("nystroem", "fourier") and reports per model and data size:
+- total fit time and predict time (predict + probabilities) over the folds
+- mean accuracy and ROC-AUC across folds
+- agreement of the test-fold predictions with SVM_RBF
+
+Dataset A has only 37 recordings, where the exact SVM is cheap;
+``--synthetic`` uses random data with 47 features (the baseline feature set)
+and the given numbers of samples, standing in for segment-level datasets.
+
+Usage:
+    python scripts/benchmark_kernel_approximation.py
+    python scripts/benchmark_kernel_approximation.py --synthetic --samples 1000 4000 16000
+    python scripts/benchmark_kernel_approximation.py --synthetic --components 100 300 1000
+
+Outputs:
+    outputs/results/benchmarks/kernel_approximation.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+
+from parkinsons_voice_classification.config import (
+    KERNEL_APPROX_COMPONENTS,
+    OUTPUTS_DIR,
+    RANDOM_SEED,
+)
+from parkinsons_voice_classification.data.mdvr_kcl import load_features
+from parkinsons_voice_classification.models.classifiers import KERNEL_APPROXIMATIONS, get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.models.training import compute_metrics
+
+
+def run_model(pipeline, X: np.ndarray, y: np.ndarray, splits: list) -> dict:
+    """Fit the pipeline on every split; return timings, predictions and mean metrics."""
+    fit_seconds = predict_seconds = 0.0
+    y_pred, fold_metrics = [], []
+    for train_idx, test_idx in splits:
+        start = time.perf_counter()
+        model = clone(pipeline).fit(X[train_idx], y[train_idx])
+        fit_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        fold_pred = model.predict(X[test_idx])
+        if hasattr(model, "predict_proba"):
+            fold_prob = model.predict_proba(X[test_idx])[:, 1]
+        else:
+            fold_prob = model.decision_function(X[test_idx])
+        predict_seconds += time.perf_counter() - start
+        y_pred.append(fold_pred)
+        fold_metrics.append(compute_metrics(y[test_idx], fold_pred, fold_prob))
+
+    metrics = pd.DataFrame(fold_metrics).mean()
+    return {
+        "fit_seconds": fit_seconds,
+        "predict_seconds": predict_seconds,
+        "accuracy": metrics["accuracy"],
+        "roc_auc": metrics["roc_auc"],
+        "y_pred": np.concatenate(y_pred),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark exact vs approximate RBF kernels")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue"],
+        default="ReadText",
+        help="Speech task to benchmark (default: ReadText)",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Use random data with 47 features instead of MDVR-KCL features",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        nargs="+",
+        default=[1000, 4000, 16000],
+        help="Sample counts for --synthetic (default: 1000 4000 16000)",
+    )
+    parser.add_argument(
+        "--components",
+        type=int,
+        nargs="+",
+        default=[KERNEL_APPROX_COMPONENTS],
+        help=f"Feature map sizes to compare (default: {KERNEL_APPROX_COMPONENTS})",
+    )
+    args = parser.parse_args()
+
+    if args.synthetic:
+        datasets = []
+        for n_samples in args.samples:
+            X, y = make_classification(
+                n_samples=n_samples,
+                n_features=47,
+                n_informative=15,
+                weights=[0.5],
+                flip_y=0.05,
+                random_state=RANDOM_SEED,
+            )
+            datasets.append((f"synthetic-{n_samples}", X, y, None))
+    else:
+        X, y, groups = load_features(args.task)
+        datasets = [(args.task, X, y, groups)]
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("KERNEL APPROXIMATION BENCHMARK")
+    print(f"Data        : {', '.join(name for name, *_ in datasets)}")
+    print(f"Components  : {args.components}")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    rows = []
+    for data_name, X, y, groups in datasets:
+        splits = get_cv_splits(y, groups)
+        candidates = [("SVM_RBF", None, get_models()["SVM_RBF"])]
+        for method in KERNEL_APPROXIMATIONS:
+            pipeline = get_models(extra_models=["RBF_Approx"], kernel_approximation=method)[
+                "RBF_Approx"
+            ]
+            for n_components in args.components:
+                candidates.append(
+                    (
+                        f"RBF_Approx[{method}]",
+                        n_components,
+                        clone(pipeline).set_params(feature_map__n_components=n_components),
+                    )
+                )
+
+        reference = None
+        for model_name, n_components, pipeline in candidates:
+            result = run_model(pipeline, X, y, splits)
+            if reference is None:
+                reference = result["y_pred"]
+            rows.append(
+                {
+                    "data": data_name,
+                    "n_samples": len(y),
+                    "model": model_name,
+                    "n_components": n_components,
+                    "fit_seconds": result["fit_seconds"],
+                    "predict_seconds": result["predict_seconds"],
+                    "accuracy": result["accuracy"],
+                    "roc_auc": result["roc_auc"],
+                    "agreement": np.mean(result["y_pred"] == reference),
+                }
+            )
+            print(
+                f"  {data_name:<16} {model_name:<22} fit {result['fit_seconds']:8.2f}s   "
+                f"predict {result['predict_seconds']:7.3f}s"
+            )
+
+    results = pd.DataFrame(rows)
+    results_path = output_dir / "kernel_approximation.csv"
+    results.to_csv(results_path, index=False)
+
+    print(
+        f"\n{'Data':<16} {'Model':<22} {'Comp':>5} {'Fit (s)':>8} {'Pred (s)':>9} "
+        f"{'Acc':>6} {'AUC':>6} {'Agree':>6}"
+    )
+    for _, row in results.iterrows():
+        components = "-" if pd.isna(row["n_components"]) else f"{int(row['n_components'])}"
+        print(
+            f"{row['data']:<16} {row['model']:<22} {components:>5} {row['fit_seconds']:>8.2f} "
+            f"{row['predict_seconds']:>9.3f} {row['accuracy']:>6.3f} {row['roc_auc']:>6.3f} "
+            f"{row['agreement']:>6.1%}"
+        )
+
+    print(f"\n  ✓ Saved: {results_path.name}")
+
+
+if __name__ == "__main__":
+    main()
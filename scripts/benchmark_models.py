@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Benchmark report comparing fit/predict time and accuracy of all registered models.
+
+Runs 5-fold CV of every model in classifiers.MODEL_NAMES (the three thesis
+models plus OPTIONAL_MODELS) and reports per model:
+- total fit time and predict time (predict + predict_proba) over the folds
+- mean accuracy and ROC-AUC across folds
+- with --importance, permutation importance time on the first test fold
+
+Dataset B (756 × 752) is the case the optional models target. Without
+assets/PD_SPEECH_FEATURES.csv, ``--dataset synthetic`` uses random data of
+the same shape.
+
+Usage:
+    python scripts/benchmark_models.py
+    python scripts/benchmark_models.py --dataset synthetic --importance
+    python scripts/benchmark_models.py --dataset ReadText
+
+Outputs:
+    outputs/results/benchmarks/models_{dataset}.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+
+from parkinsons_voice_classification.config import OUTPUTS_DIR, RANDOM_SEED
+from parkinsons_voice_classification.data.mdvr_kcl import load_features as load_mdvr_features
+from parkinsons_voice_classification.data.pd_speech import load_features as load_pd_speech_features
+from parkinsons_voice_classification.models.classifiers import OPTIONAL_MODELS, get_models
+from parkinsons_voice_classification.models.feature_importance import (
+    compute_permutation_importance,
+)
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.models.training import compute_metrics
+
+
+def load_dataset(name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """X, y and groups (None for ungrouped CV) of a benchmark dataset."""
+    if name == "B":
+        X, y = load_pd_speech_features()
+        return X, y, None
+    if name == "synthetic":
+        X, y = make_classification(
+            n_samples=756,
+            n_features=752,
+            n_informative=40,
+            weights=[0.25],
+            flip_y=0.05,
+            random_state=RANDOM_SEED,
+        )
+        return X, y, None
+    return load_mdvr_features(name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fit/predict time of all models")
+    parser.add_argument(
+        "--dataset",
+        choices=["B", "synthetic", "ReadText", "SpontaneousDialogue"],
+        default="B",
+        help="Dataset B, random data of Dataset B's shape, or a Dataset A task (default: B)",
+    )
+    parser.add_argument(
+        "--importance",
+        action="store_true",
+        help="Also time permutation importance on the first test fold",
+    )
+    args = parser.parse_args()
+
+    try:
+        X, y, groups = load_dataset(args.dataset)
+    except FileNotFoundError as e:
+        parser.error(f"{e} (use --dataset synthetic)")
+    splits = get_cv_splits(y, groups)
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("MODEL BENCHMARK")
+    print(f"Dataset     : {args.dataset} ({X.shape[0]} samples, {X.shape[1]} features)")
+    print(
+        f"CV          : {len(splits)} folds ({'grouped' if groups is not None else 'stratified'})"
+    )
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    rows = []
+    for name, pipeline in get_models(extra_models=list(OPTIONAL_MODELS)).items():
+        fit_seconds = predict_seconds = importance_seconds = 0.0
+        fold_metrics = []
+        for fold, (train_idx, test_idx) in enumerate(splits):
+            start = time.perf_counter()
+            model = clone(pipeline).fit(X[train_idx], y[train_idx])
+            fit_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            y_pred = model.predict(X[test_idx])
+            y_prob = model.predict_proba(X[test_idx])[:, 1]
+            predict_seconds += time.perf_counter() - start
+            fold_metrics.append(compute_metrics(y[test_idx], y_pred, y_prob))
+
+            if args.importance and fold == 0:
+                start = time.perf_counter()
+                compute_permutation_importance(model, X[test_idx], y[test_idx])
+                importance_seconds = time.perf_counter() - start
+
+        metrics = pd.DataFrame(fold_metrics).mean()
+        rows.append(
+            {
+                "model": name,
+                "fit_seconds": fit_seconds,
+                "predict_seconds": predict_seconds,
+                "importance_seconds": importance_seconds if args.importance else np.nan,
+                "accuracy": metrics["accuracy"],
+                "roc_auc": metrics["roc_auc"],
+            }
+        )
+        print(f"  {name:<22} fit {fit_seconds:7.2f}s   predict {predict_seconds:6.3f}s")
+
+    results = pd.DataFrame(rows)
+    results_path = output_dir / f"models_{args.dataset}.csv"
+    results.to_csv(results_path, index=False)
+
+    print(f"\n{'Model':<22} {'Fit (s)':>8} {'Pred (s)':>9} {'Perm (s)':>9} {'Acc':>6} {'AUC':>6}")
+    for _, row in results.iterrows():
+        print(
+            f"{row['model']:<22} {row['fit_seconds']:>8.2f} {row['predict_seconds']:>9.3f} "
+            f"{row['importance_seconds']:>9.2f} {row['accuracy']:>6.3f} {row['roc_auc']:>6.3f}"
+        )
+
+    print(f"\n  ✓ Saved: {results_path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Benchmark report for the SVM probability modes (SVM_PROBABILITY).
+
+Runs grouped CV of the SVM_RBF pipeline on MDVR-KCL features once per mode
+("platt" = SVC(probability=True), "holdout", "oof") and reports:
+- total fit time and speedup over "platt"
+- whether test-fold predictions are identical to "platt"
+- ROC-AUC (pooled over folds), Brier score and log loss of the out-of-fold
+  probabilities
+
+On the small MDVR-KCL folds SVM training is cheap next to per-fit overhead;
+``--synthetic`` runs the same comparison on random data of Dataset B's size
+(756 recordings of 252 subjects, 753 features), where training dominates.
+
+For "oof", the probabilities of each test fold come from a sigmoid fitted on
+the out-of-fold decision values of the other folds (cross-fitting), so no
+test sample calibrates its own probability.
+
+Usage:
+    python scripts/benchmark_svm_probability.py
+    python scripts/benchmark_svm_probability.py --task SpontaneousDialogue --repeats 20
+    python scripts/benchmark_svm_probability.py --synthetic --repeats 3
+
+Outputs:
+    outputs/results/benchmarks/svm_probability.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.metrics import brier_score_loss, log_loss, roc_auc_score
+
+from parkinsons_voice_classification.config import OUTPUTS_DIR, RANDOM_SEED
+from parkinsons_voice_classification.data.mdvr_kcl import load_features
+from parkinsons_voice_classification.models.classifiers import get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.models.svm_probability import fit_sigmoid
+
+MODES = ("platt", "holdout", "oof")
+
+
+def run_mode(mode: str, X: np.ndarray, y: np.ndarray, splits: list) -> dict:
+    """Fit the SVM on every split; return timings, predictions and probabilities."""
+    pipeline = get_models(svm_probability=mode)["SVM_RBF"]
+    fit_seconds = 0.0
+    y_pred, y_prob, decision = [], [], []
+    for train_idx, test_idx in splits:
+        start = time.perf_counter()
+        model = clone(pipeline).fit(X[train_idx], y[train_idx])
+        fit_seconds += time.perf_counter() - start
+        y_pred.append(model.predict(X[test_idx]))
+        decision.append(model.decision_function(X[test_idx]))
+        if mode != "oof":
+            y_prob.append(model.predict_proba(X[test_idx])[:, 1])
+
+    if mode == "oof":
+        # Cross-fitted sigmoid: fold k is calibrated on the other folds' scores
+        y_test = [y[test_idx] for _, test_idx in splits]
+        for k in range(len(splits)):
+            others = [j for j in range(len(splits)) if j != k]
+            a, b = fit_sigmoid(
+                np.concatenate([decision[j] for j in others]),
+                np.concatenate([y_test[j] for j in others]) == 1,
+            )
+            y_prob.append(1.0 / (1.0 + np.exp(a * decision[k] + b)))
+    return {"fit_seconds": fit_seconds, "y_pred": y_pred, "y_prob": y_prob}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SVM probability modes")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue"],
+        default="ReadText",
+        help="Speech task to benchmark (default: ReadText)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=10, help="CV repeats (default: 10, 5 folds each)"
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Use random data of Dataset B's size instead of MDVR-KCL features",
+    )
+    args = parser.parse_args()
+
+    if args.synthetic:
+        X, y = make_classification(
+            n_samples=756,
+            n_features=753,
+            n_informative=30,
+            weights=[0.25],
+            flip_y=0.1,
+            random_state=RANDOM_SEED,
+        )
+        groups = np.arange(len(y)) // 3
+        source = "synthetic"
+    else:
+        X, y, groups = load_features(args.task)
+        source = args.task
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("SVM PROBABILITY BENCHMARK")
+    print(f"Data        : {source} ({X.shape[0]} recordings, {X.shape[1]} features)")
+    print(f"Repeats     : {args.repeats} × 5 folds")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    rows = []
+    for repeat in range(args.repeats):
+        splits = get_cv_splits(y, groups, seed=RANDOM_SEED + repeat)
+        y_true = np.concatenate([y[test_idx] for _, test_idx in splits])
+        reference = None
+        for mode in MODES:
+            result = run_mode(mode, X, y, splits)
+            y_pred = np.concatenate(result["y_pred"])
+            y_prob = np.concatenate(result["y_prob"])
+            if reference is None:
+                reference = y_pred
+            rows.append(
+                {
+                    "repeat": repeat,
+                    "mode": mode,
+                    "fit_seconds": result["fit_seconds"],
+                    "same_predictions": np.array_equal(y_pred, reference),
+                    "roc_auc": roc_auc_score(y_true, y_prob),
+                    "brier": brier_score_loss(y_true, y_prob),
+                    "log_loss": log_loss(y_true, y_prob),
+                }
+            )
+
+    results = pd.DataFrame(rows)
+    results_path = output_dir / "svm_probability.csv"
+    results.to_csv(results_path, index=False)
+
+    summary = results.groupby("mode", sort=False).agg(
+        fit_seconds=("fit_seconds", "sum"),
+        same_predictions=("same_predictions", "mean"),
+        roc_auc=("roc_auc", "mean"),
+        brier=("brier", "mean"),
+        log_loss=("log_loss", "mean"),
+    )
+    platt_seconds = summary.loc["platt", "fit_seconds"]
+
+    print(
+        f"\n{'Mode':<10} {'Fit (s)':>8} {'Speedup':>8} {'Same pred':>10} "
+        f"{'ROC-AUC':>8} {'Brier':>7} {'LogLoss':>8}"
+    )
+    for mode, row in summary.iterrows():
+        print(
+            f"{mode:<10} {row['fit_seconds']:>8.2f} {platt_seconds / row['fit_seconds']:>7.1f}× "
+            f"{row['same_predictions']:>10.0%} {row['roc_auc']:>8.3f} {row['brier']:>7.3f} "
+            f"{row['log_loss']:>8.3f}"
+        )
+
+    print(f"\n  ✓ Saved: {results_path.name}")
+
+
+if __name__ == "__main__":
+    main()
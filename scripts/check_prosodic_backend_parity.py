@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Parity and throughput report: NumPy prosodic backend vs Praat.
+
+Runs the pitch, harmonicity and intensity analyses of the prosodic extractor
+with both backends on MDVR-KCL recordings and reports:
+- per-feature agreement (mean / max relative error, cross-file correlation)
+- per-file time of each backend and the NumPy speedup
+
+Jitter/shimmer and formants are computed by Praat in both backends and are
+not compared.
+
+Usage:
+    python scripts/check_prosodic_backend_parity.py
+    python scripts/check_prosodic_backend_parity.py --task SpontaneousDialogue --limit 10
+
+Outputs:
+    outputs/results/benchmarks/prosodic_backend_parity.csv
+    outputs/results/benchmarks/prosodic_backend_timing.csv
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from parkinsons_voice_classification.config import OUTPUTS_DIR
+from parkinsons_voice_classification.data.mdvr_kcl import load_dataset_manifest
+from parkinsons_voice_classification.features.prosodic_numpy import NUMPY_ANALYSES
+from parkinsons_voice_classification.features.prosodic_simple import (
+    PROSODIC_BACKENDS,
+    extract_prosodic_features,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare NumPy and Praat prosodic backends")
+    parser.add_argument(
+        "--task",
+        choices=["ReadText", "SpontaneousDialogue", "all"],
+        default="all",
+        help="Speech task to compare (default: all)",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=None, help="Compare only the first N recordings per task"
+    )
+    parser.add_argument(
+        "--data-dir", type=str, default=None, help="MDVR-KCL base directory (default: config)"
+    )
+    args = parser.parse_args()
+
+    tasks = ["ReadText", "SpontaneousDialogue"] if args.task == "all" else [args.task]
+    base_dir = Path(args.data_dir) if args.data_dir else None
+
+    output_dir = OUTPUTS_DIR / "results" / "benchmarks"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 65)
+    print("PROSODIC BACKEND PARITY (NumPy vs Praat)")
+    print(f"Tasks       : {', '.join(tasks)}")
+    print(f"Analyses    : {', '.join(sorted(NUMPY_ANALYSES))}")
+    print(f"Output dir  : {output_dir}")
+    print("=" * 65)
+
+    values = []
+    timings = []
+    for task in tasks:
+        manifest = load_dataset_manifest(task, base_dir).sort_values("filename")
+        if args.limit is not None:
+            manifest = manifest.head(args.limit)
+
+        for filepath, filename in zip(manifest["filepath"], manifest["filename"]):
+            for backend in PROSODIC_BACKENDS:
+                start = time.perf_counter()
+                features = extract_prosodic_features(
+                    filepath, analyses=NUMPY_ANALYSES, backend=backend
+                )
+                elapsed = time.perf_counter() - start
+
+                timings.append({"filename": filename, "backend": backend, "seconds": elapsed})
+                for feature, value in features.items():
+                    values.append(
+                        {
+                            "filename": filename,
+                            "backend": backend,
+                            "feature": feature,
+                            "value": value,
+                        }
+                    )
+            print(f"  ✓ {filename}")
+
+    # ------------------------------------------------------------------ #
+    # Per-feature agreement                                                #
+    # ------------------------------------------------------------------ #
+    wide = pd.DataFrame(values).pivot_table(
+        index=["filename", "feature"], columns="backend", values="value", dropna=False
+    )
+    wide = wide.reset_index()
+    wide["abs_error"] = (wide["numpy"] - wide["praat"]).abs()
+    wide["rel_error"] = wide["abs_error"] / wide["praat"].abs().replace(0, np.nan)
+
+    parity = (
+        wide.groupby("feature")
+        .apply(
+            lambda g: pd.Series(
+                {
+                    "mean_abs_error": g["abs_error"].mean(),
+                    "mean_rel_error": g["rel_error"].mean(),
+                    "max_rel_error": g["rel_error"].max(),
+                    "correlation": g["numpy"].corr(g["praat"]),
+                }
+            ),
+            include_groups=False,
+        )
+        .reset_index()
+    )
+    parity_path = output_dir / "prosodic_backend_parity.csv"
+    parity.to_csv(parity_path, index=False)
+
+    # ------------------------------------------------------------------ #
+    # Throughput                                                           #
+    # ------------------------------------------------------------------ #
+    timing_df = pd.DataFrame(timings).pivot(index="filename", columns="backend", values="seconds")
+    timing_df["speedup_numpy"] = timing_df["praat"] / timing_df["numpy"]
+    timing_path = output_dir / "prosodic_backend_timing.csv"
+    timing_df.reset_index().to_csv(timing_path, index=False)
+
+    print("\nPer-feature agreement:")
+    for _, row in parity.iterrows():
+        print(
+            f"  {row['feature']:22s} mean rel {row['mean_rel_error']:.2e}"
+            f"  max rel {row['max_rel_error']:.2e}  r={row['correlation']:.4f}"
+        )
+
+    total = timing_df[["praat", "numpy"]].sum()
+    print(f"\nThroughput ({len(timing_df)} recordings):")
+    print(f"  praat : {total['praat']:.2f} s total")
+    print(f"  numpy : {total['numpy']:.2f} s total")
+    print(f"  median per-file speedup: {timing_df['speedup_numpy'].median():.2f}×")
+
+    print(f"\n  ✓ Saved: {parity_path.name}, {timing_path.name}")
+
+
+if __name__ == "__main__":
+    main()
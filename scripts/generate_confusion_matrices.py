@@ -4,7 +4,8 @@ Standalone script to generate confusion matrix plots.
 
 Uses Extended feature set (78 features, unweighted) — the best-performing
 experimental condition — to produce publication-quality confusion matrices
-for all three datasets/tasks.
+for all three datasets/tasks. Folds come from the shared split cache
+(models/splits.py), so they are the same as in pvc-experiment.
 
 Outputs:
     outputs/plots/confusion_matrix_ReadText.pdf
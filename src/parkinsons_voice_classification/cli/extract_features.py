@@ -10,31 +10,54 @@ Usage:
     pvc-extract
     pvc-extract --task ReadText
     pvc-extract --task SpontaneousDialogue
+    pvc-extract --tier fast
+    pvc-extract --task SpontaneousDialogue --vad trim
+    pvc-extract --prosodic-backend numpy
+    pvc-extract --save-frames
+    pvc-extract --rescan
+    pvc-extract --archives site_a.zip site_b_part1.tar.gz site_b_part2.tar.gz
+    pvc-extract --task ReadText --sweep 2048:512:128:13 1024:256:128:13 1024:256:64:20
+    pvc-extract --queue /shared/pvc_queue.sqlite --jobs 4   (plus `pvc-worker` on other hosts)
 
 Output:
     outputs/features/features_readtext.csv (37 rows × 51 columns)
     outputs/features/features_spontaneousdialogue.csv (36 rows × 51 columns)
+    outputs/features/sweep/features_{task}_nfft{N}_hop{H}_mels{M}_mfcc{C}.csv (--sweep)
 """
 
 import argparse
-import os
+from pathlib import Path
 
 from parkinsons_voice_classification.features.extraction_simple import (
     run_extraction,
     get_all_feature_names,
 )
+from parkinsons_voice_classification.data.archives import is_archive, load_archive_manifest
 from parkinsons_voice_classification.data.mdvr_kcl import load_dataset_manifest
 from parkinsons_voice_classification.config import (
     USE_EXTENDED_FEATURES,
     get_features_output_dir,
     BASELINE_FEATURE_COUNT,
     EXTENDED_FEATURE_COUNT,
+    EXTRACTION_TIER,
+    VAD_MODE,
+    METADATA_COLUMNS,
+    PROSODIC_BACKEND,
+    SAVE_FRAME_TRACKS,
+    WORK_QUEUE_PATH,
 )
+from parkinsons_voice_classification.features.executor import get_extraction_executor
+from parkinsons_voice_classification.features.prosodic_simple import PROSODIC_BACKENDS
+from parkinsons_voice_classification.features.segmentation import VAD_MODES
+from parkinsons_voice_classification.features.spectral_sweep import (
+    parse_spectral_config,
+    run_spectral_sweep,
+)
+from parkinsons_voice_classification.features.tiers import EXTRACTION_TIERS
+from parkinsons_voice_classification.parallel import default_jobs
 
-# Default number of parallel workers
-_MAX_CPU_COUNT = 15  # My Ryzen 3700x has 8 cores / 16 threads
-_CPU_COUNT = os.cpu_count() or 4
-_DEFAULT_JOBS = min(_MAX_CPU_COUNT, max(1, _CPU_COUNT - 1))
+# Default number of parallel workers (cgroup-aware, capped by MAX_WORKERS)
+_DEFAULT_JOBS = default_jobs()
 
 
 def main():
@@ -53,9 +76,78 @@ def main():
         default=_DEFAULT_JOBS,
         help=f"Number of parallel workers (default: {_DEFAULT_JOBS})",
     )
+    parser.add_argument(
+        "--tier",
+        type=str,
+        choices=list(EXTRACTION_TIERS.keys()),
+        default=EXTRACTION_TIER,
+        help=f"Praat extraction quality tier (default: {EXTRACTION_TIER})",
+    )
+    parser.add_argument(
+        "--vad",
+        type=str,
+        choices=list(VAD_MODES),
+        default=VAD_MODE,
+        help=f"Voice-activity segmentation: off, measure or trim (default: {VAD_MODE})",
+    )
+    parser.add_argument(
+        "--prosodic-backend",
+        type=str,
+        choices=list(PROSODIC_BACKENDS),
+        default=PROSODIC_BACKEND,
+        help=f"Backend for pitch/HNR/intensity: praat or numpy (default: {PROSODIC_BACKEND})",
+    )
+    parser.add_argument(
+        "--save-frames",
+        action="store_true",
+        default=SAVE_FRAME_TRACKS,
+        help="Also save frame-level tracks to outputs/frames/ for re-aggregation",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=str,
+        nargs="+",
+        metavar="N_FFT:HOP:N_MELS:N_MFCC",
+        default=None,
+        help="Spectral sweep: decode each file once, write one feature table per configuration",
+    )
+
+    parser.add_argument(
+        "--archives",
+        type=str,
+        nargs="+",
+        metavar="ARCHIVE",
+        default=None,
+        help="Read recordings from zip/tar shards instead of the dataset directory",
+    )
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="List every dataset directory instead of trusting the manifest index",
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=WORK_QUEUE_PATH,
+        help=(
+            "Shared work queue file: run on `pvc-worker` processes, with --jobs local "
+            f"workers alongside (default: {WORK_QUEUE_PATH})"
+        ),
+    )
 
     args = parser.parse_args()
 
+    for archive in args.archives or []:
+        if not is_archive(archive) or not Path(archive).is_file():
+            parser.error(f"Not a zip/tar archive: {archive}")
+
+    sweep_configs = None
+    if args.sweep:
+        try:
+            sweep_configs = [parse_spectral_config(spec) for spec in args.sweep]
+        except ValueError as e:
+            parser.error(str(e))
+
     # Show feature configuration
     feature_names = get_all_feature_names()
     feature_mode = "EXTENDED" if USE_EXTENDED_FEATURES else "BASELINE"
@@ -69,6 +161,15 @@ def main():
     else:
         print(f"  - Prosodic: 21 (F0, jitter, shimmer, HNR, intensity, formants)")
         print(f"  - Spectral: 26 (MFCC 0-12 mean + delta MFCC 0-12 mean)")
+    print(f"Extraction tier: {args.tier}")
+    print(f"Prosodic backend: {args.prosodic_backend}")
+    print(f"VAD mode: {args.vad}")
+    if sweep_configs:
+        print(f"Spectral sweep: {', '.join(c.name for c in sweep_configs)}")
+    if args.queue:
+        print(f"Work queue: {args.queue} ({args.jobs} local workers)")
+    if args.archives:
+        print(f"Archives: {len(args.archives)} shard(s), streamed without unpacking")
     print(f"Output directory: {output_dir}")
     print()
 
@@ -78,29 +179,70 @@ def main():
     else:
         tasks = [args.task]
 
+    # One warmed worker pool, shared by all tasks (the work queue has its own workers)
+    executor = None
+    if args.jobs > 1 and not args.queue:
+        executor = get_extraction_executor(args.jobs, args.tier, args.prosodic_backend)
+        print(f"Warming {args.jobs} extraction workers...")
+        executor.warm()
+        print(f"  - Pool ready in {executor.warmup_seconds:.1f} s")
+
     for task in tasks:
         print(f"\n{'='*60}")
         print(f"Processing task: {task}")
         print(f"{'='*60}")
 
-        # Load manifest for summary
-        manifest = load_dataset_manifest(task)
+        # Load manifest for summary (refreshes the persisted manifest index)
+        if args.archives:
+            manifest = load_archive_manifest(task, args.archives)
+        else:
+            manifest = load_dataset_manifest(task, full_rescan=args.rescan)
         print(f"Found {len(manifest)} recordings")
         print(f"  - HC: {(manifest['label'] == 0).sum()}")
         print(f"  - PD: {(manifest['label'] == 1).sum()}")
         print(f"  - Subjects: {manifest['subject_id'].nunique()}")
 
+        if sweep_configs:
+            print(f"\nSweeping {len(sweep_configs)} spectral configurations...")
+            tables = run_spectral_sweep(
+                task,
+                sweep_configs,
+                jobs=args.jobs,
+                tier=args.tier,
+                vad_mode=args.vad,
+                prosodic_backend=args.prosodic_backend,
+                queue=args.queue,
+                archives=args.archives,
+            )
+            for name, table in tables.items():
+                print(f"  - {name}: {table.shape}")
+            continue
+
         # Extract features
         print(f"\nExtracting features with {args.jobs} parallel workers...")
-        df = run_extraction(task, jobs=args.jobs)
+        df = run_extraction(
+            task,
+            jobs=args.jobs,
+            tier=args.tier,
+            vad_mode=args.vad,
+            prosodic_backend=args.prosodic_backend,
+            save_frames=args.save_frames,
+            queue=args.queue,
+            archives=args.archives,
+        )
 
         # Summary
-        meta_cols = ["subject_id", "label", "task", "filename"]
+        meta_cols = [c for c in METADATA_COLUMNS if c in df.columns]
         feature_cols = [c for c in df.columns if c not in meta_cols]
 
         print(f"\nFeature matrix shape: {df.shape}")
         print(f"  - Rows (recordings): {len(df)}")
-        print(f"  - Columns: {len(df.columns)} (4 metadata + {len(feature_cols)} features)")
+        print(
+            f"  - Columns: {len(df.columns)} "
+            f"({len(meta_cols)} metadata + {len(feature_cols)} features)"
+        )
+        if "speech_ratio" in df.columns:
+            print(f"  - Mean speech ratio: {df['speech_ratio'].mean():.1%}")
 
         # Check for NaN features
         nan_counts = df[feature_cols].isna().sum()
@@ -111,6 +253,18 @@ def main():
             for col, count in cols_with_nan.items():
                 print(f"  - {col}: {count} NaN values")
 
+    if executor is not None:
+        stats = executor.stats()
+        worker_warmup = list(stats["worker_warmup_seconds"].values())
+        print(
+            f"\nWorker pool: {stats['max_workers']} workers, "
+            f"{stats['threads_per_worker']} BLAS thread(s) each"
+        )
+        print(f"  - Pool warm-up: {stats['warmup_seconds']:.1f} s")
+        if worker_warmup:
+            print(f"  - Per-worker warm-up: {sum(worker_warmup) / len(worker_warmup):.1f} s mean")
+        print(f"  - Tasks per worker: {sorted(stats['tasks_per_worker'].values(), reverse=True)}")
+
     print(f"\n{'='*60}")
     print("Feature extraction complete!")
     print(f"{'='*60}")
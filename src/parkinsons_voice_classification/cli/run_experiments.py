@@ -8,13 +8,36 @@ Runs all classification experiments:
 3. Dataset B - Pre-extracted features (standard CV)
 
 Saves results to outputs/results/{baseline,weighted}/{baseline,extended}/
+
+With --repeats N, each experiment is also run as repeated CV over N shuffled
+splits (seeds RANDOM_SEED, RANDOM_SEED + 1, ...), saved as repeated_results.csv
+and repeated_summary.csv (mean ± std across repeats).
+
+With --tree-curve, the Random Forest is also scored at 10, 25, 50, 100, 200
+and 500 trees from one 500-tree forest per fold, saved as
+tree_curve_results.csv and tree_curve_summary.csv.
+
+With --nested, each experiment is also run as nested CV (grid search over
+SEARCH_SPACES in an inner CV of each outer training set), saved as
+nested_results.csv and nested_summary.csv.
 """
 
+import argparse
+
+import numpy as np
 import pandas as pd
 
 from parkinsons_voice_classification.data.mdvr_kcl import load_features as load_mdvr_features
 from parkinsons_voice_classification.data.pd_speech import load_features as load_pd_speech_features
-from parkinsons_voice_classification.models.training import run_cv, summarize_results
+from parkinsons_voice_classification.models.search import run_nested_cv
+from parkinsons_voice_classification.models.training import (
+    run_cv,
+    run_repeated_cv,
+    run_tree_curve_cv,
+    summarize_repeated_results,
+    summarize_results,
+    summarize_tree_curve,
+)
 from parkinsons_voice_classification.visualization.plots import plot_confusion_matrix
 from parkinsons_voice_classification.config import (
     OUTPUTS_DIR,
@@ -23,8 +46,96 @@ from parkinsons_voice_classification.config import (
 )
 
 
+def run_repeated(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None,
+    dataset: str,
+    task: str,
+    n_repeats: int,
+) -> pd.DataFrame:
+    """Run repeated CV for one experiment and print mean ± std across repeats."""
+    results = run_repeated_cv(
+        X, y, groups=groups, use_groups=groups is not None, n_repeats=n_repeats
+    )
+    results["dataset"] = dataset
+    results["task"] = task
+
+    summary = summarize_repeated_results(results)
+    print(f"\n  Repeated CV ({n_repeats} shuffles, mean ± std across repeats):")
+    for model in summary["model"].unique():
+        print(f"\n  {model}:")
+        model_summary = summary[summary["model"] == model]
+        for _, row in model_summary.iterrows():
+            print(f"    {row['metric']:12s}: {row['mean_std']}")
+    return results
+
+
+def run_tree_curve(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None,
+    dataset: str,
+    task: str,
+) -> pd.DataFrame:
+    """Score the Random Forest at several tree counts and print mean ± std per count."""
+    results = run_tree_curve_cv(X, y, groups=groups, use_groups=groups is not None)
+    results["dataset"] = dataset
+    results["task"] = task
+
+    summary = summarize_tree_curve(results)
+    print("\n  RandomForest by number of trees (mean ± std across folds):")
+    for metric in ("accuracy", "roc_auc"):
+        metric_summary = summary[summary["metric"] == metric]
+        for _, row in metric_summary.iterrows():
+            print(f"    {metric:12s} {row['n_estimators']:>4d} trees: {row['mean_std']}")
+    return results
+
+
+def run_nested(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None,
+    dataset: str,
+    task: str,
+) -> pd.DataFrame:
+    """Run nested CV for one experiment and print mean ± std across outer folds."""
+    results = run_nested_cv(X, y, groups=groups, use_groups=groups is not None)
+    results["dataset"] = dataset
+    results["task"] = task
+
+    summary = summarize_results(results)
+    print("\n  Nested CV (hyperparameters tuned in an inner CV):")
+    for model in summary["model"].unique():
+        print(f"\n  {model}:")
+        model_summary = summary[summary["model"] == model]
+        for _, row in model_summary.iterrows():
+            print(f"    {row['metric']:12s}: {row['mean_std']}")
+    return results
+
+
 def main():
     """Run experiments on all datasets."""
+    parser = argparse.ArgumentParser(description="Run all classification experiments")
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Also run repeated CV with this many shuffled splits (default: 1, single split only)",
+    )
+    parser.add_argument(
+        "--tree-curve",
+        action="store_true",
+        help="Also score the Random Forest at 10-500 trees (one training pass per fold)",
+    )
+    parser.add_argument(
+        "--nested",
+        action="store_true",
+        help="Also run nested CV with hyperparameters tuned in an inner CV",
+    )
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
 
     # Output to {weight_mode}/{feature_mode}/ subdirectory based on config
     weight_subdir = "weighted" if USE_CLASS_WEIGHT_BALANCED else "baseline"
@@ -33,6 +144,9 @@ def main():
     results_dir.mkdir(parents=True, exist_ok=True)
 
     all_results = []
+    repeated_results = []
+    tree_curve_results = []
+    nested_results = []
     plots_dir = OUTPUTS_DIR / "plots"
     plots_dir.mkdir(parents=True, exist_ok=True)
 
@@ -77,6 +191,15 @@ def main():
             model_summary = summary[summary["model"] == model]
             for _, row in model_summary.iterrows():
                 print(f"    {row['metric']:12s}: {row['mean_std']}")
+
+        if args.repeats > 1:
+            repeated_results.append(
+                run_repeated(X, y, groups, "MDVR-KCL", "ReadText", args.repeats)
+            )
+        if args.tree_curve:
+            tree_curve_results.append(run_tree_curve(X, y, groups, "MDVR-KCL", "ReadText"))
+        if args.nested:
+            nested_results.append(run_nested(X, y, groups, "MDVR-KCL", "ReadText"))
     except FileNotFoundError as e:
         print(f"  ⚠ Skipped: {e}")
 
@@ -112,6 +235,17 @@ def main():
             model_summary = summary[summary["model"] == model]
             for _, row in model_summary.iterrows():
                 print(f"    {row['metric']:12s}: {row['mean_std']}")
+
+        if args.repeats > 1:
+            repeated_results.append(
+                run_repeated(X, y, groups, "MDVR-KCL", "SpontaneousDialogue", args.repeats)
+            )
+        if args.tree_curve:
+            tree_curve_results.append(
+                run_tree_curve(X, y, groups, "MDVR-KCL", "SpontaneousDialogue")
+            )
+        if args.nested:
+            nested_results.append(run_nested(X, y, groups, "MDVR-KCL", "SpontaneousDialogue"))
     except FileNotFoundError as e:
         print(f"  ⚠ Skipped: {e}")
 
@@ -145,6 +279,13 @@ def main():
         for _, row in model_summary.iterrows():
             print(f"    {row['metric']:12s}: {row['mean_std']}")
 
+    if args.repeats > 1:
+        repeated_results.append(run_repeated(X, y, None, "PD_SPEECH_FEATURES", "N/A", args.repeats))
+    if args.tree_curve:
+        tree_curve_results.append(run_tree_curve(X, y, None, "PD_SPEECH_FEATURES", "N/A"))
+    if args.nested:
+        nested_results.append(run_nested(X, y, None, "PD_SPEECH_FEATURES", "N/A"))
+
     import matplotlib.pyplot as plt
 
     plt.close("all")
@@ -164,6 +305,36 @@ def main():
         full_summary.to_csv(summary_path, index=False)
         print(f"Summary saved to: {summary_path}")
 
+    if repeated_results:
+        combined = pd.concat(repeated_results, ignore_index=True)
+        repeated_path = results_dir / "repeated_results.csv"
+        combined.to_csv(repeated_path, index=False)
+        print(f"Repeated CV results saved to: {repeated_path}")
+
+        repeated_summary_path = results_dir / "repeated_summary.csv"
+        summarize_repeated_results(combined).to_csv(repeated_summary_path, index=False)
+        print(f"Repeated CV summary saved to: {repeated_summary_path}")
+
+    if tree_curve_results:
+        combined = pd.concat(tree_curve_results, ignore_index=True)
+        tree_curve_path = results_dir / "tree_curve_results.csv"
+        combined.to_csv(tree_curve_path, index=False)
+        print(f"Tree-count curve results saved to: {tree_curve_path}")
+
+        tree_curve_summary_path = results_dir / "tree_curve_summary.csv"
+        summarize_tree_curve(combined).to_csv(tree_curve_summary_path, index=False)
+        print(f"Tree-count curve summary saved to: {tree_curve_summary_path}")
+
+    if nested_results:
+        combined = pd.concat(nested_results, ignore_index=True)
+        nested_path = results_dir / "nested_results.csv"
+        combined.to_csv(nested_path, index=False)
+        print(f"Nested CV results saved to: {nested_path}")
+
+        nested_summary_path = results_dir / "nested_summary.csv"
+        summarize_results(combined).to_csv(nested_summary_path, index=False)
+        print(f"Nested CV summary saved to: {nested_summary_path}")
+
     print("\n" + "=" * 70)
     print("All experiments complete!")
     print("=" * 70)
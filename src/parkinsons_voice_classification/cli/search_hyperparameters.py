@@ -0,0 +1,135 @@
+"""
+Hyperparameter Search CLI
+
+Tunes model hyperparameters on extracted Dataset A features by successive
+halving over grouped CV splits (see models/search.py) and saves the search
+history and winning parameters to outputs/search/.
+
+Usage:
+    pvc-search --task ReadText --model SVM_RBF --feature-set baseline
+    pvc-train --task ReadText --model SVM_RBF --feature-set baseline --tuned
+"""
+
+import argparse
+import logging
+
+from parkinsons_voice_classification.cli.train_model import (
+    load_training_features,
+    load_training_groups,
+)
+from parkinsons_voice_classification.config import (
+    SEARCH_HALVING_FACTOR,
+    SEARCH_METRIC,
+    SEARCH_REPEATS,
+    WORK_QUEUE_PATH,
+)
+from parkinsons_voice_classification.models.search import (
+    SEARCH_METRICS,
+    SEARCH_SPACES,
+    save_search_result,
+    successive_halving_search,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Tune model hyperparameters by successive halving over grouped CV"
+    )
+    parser.add_argument(
+        "--task",
+        type=str,
+        default="ReadText",
+        choices=["ReadText", "SpontaneousDialogue"],
+        help="Speech task to tune on (default: ReadText)",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="all",
+        choices=list(SEARCH_SPACES) + ["all"],
+        help="Model to tune (default: all)",
+    )
+    parser.add_argument(
+        "--feature-set",
+        type=str,
+        default="baseline",
+        choices=["baseline", "extended"],
+        help="Feature set to use (default: baseline)",
+    )
+    parser.add_argument(
+        "--metric",
+        type=str,
+        default=SEARCH_METRIC,
+        choices=list(SEARCH_METRICS),
+        help=f"Metric to maximize (default: {SEARCH_METRIC})",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=SEARCH_REPEATS,
+        help=f"Shuffled CV repeats used by the last rung (default: {SEARCH_REPEATS})",
+    )
+    parser.add_argument(
+        "--factor",
+        type=int,
+        default=SEARCH_HALVING_FACTOR,
+        help=f"Successive halving factor (default: {SEARCH_HALVING_FACTOR})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Maximum parallel workers (default: MAX_WORKERS)",
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=WORK_QUEUE_PATH,
+        help=f"Shared work queue file for `pvc-worker` processes (default: {WORK_QUEUE_PATH})",
+    )
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if args.factor < 2:
+        parser.error("--factor must be at least 2")
+
+    X, y, _ = load_training_features(args.task, args.feature_set)
+    groups = load_training_groups(args.task, args.feature_set)
+
+    model_names = list(SEARCH_SPACES) if args.model == "all" else [args.model]
+    for model_name in model_names:
+        logger.info(f"Searching {model_name} on {args.task} ({args.feature_set} features)...")
+        result = successive_halving_search(
+            model_name,
+            X,
+            y,
+            groups=groups,
+            use_groups=True,
+            metric=args.metric,
+            n_repeats=args.repeats,
+            factor=args.factor,
+            jobs=args.jobs,
+            queue=args.queue,
+        )
+        best_path = save_search_result(result, args.task, args.feature_set)
+
+        rungs = result.history.groupby("rung")
+        print(f"\n{model_name}: {result.history['candidate'].nunique()} candidates")
+        for rung, rung_history in rungs:
+            print(
+                f"  rung {rung}: {len(rung_history):3d} candidates on "
+                f"{rung_history['n_splits'].iloc[0]:2d} splits, "
+                f"{(rung_history['status'] == 'dominated').sum()} dominated"
+            )
+        print(f"  Best {result.metric}: {result.best_score:.3f} ({result.n_splits} splits)")
+        print(f"  Best params: {result.best_params}")
+        print(f"  ✓ Saved: {best_path}")
+
+
+if __name__ == "__main__":
+    main()
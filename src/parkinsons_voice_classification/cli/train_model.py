@@ -6,34 +6,68 @@ for use by the inference API and Flask demo app.
 
 Usage:
     pvc-train --task ReadText --model RandomForest --feature-set baseline
+    pvc-train --task ReadText --model SVM_RBF --tuned   # parameters from pvc-search
+    pvc-train --task ReadText --model SGD_Logistic --update   # new recordings only
 
-The trained model is saved to outputs/models/ with metadata for validation.
+The trained model is saved to outputs/models/ with metadata for validation,
+together with a versioned copy ({model}_{task}_{feature_set}_v{N}.joblib).
 """
 
 import argparse
+import hashlib
+import io
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
 import joblib
 import numpy as np
 import pandas as pd
+from sklearn.pipeline import Pipeline
 
 from parkinsons_voice_classification.config import (
     MODELS_DIR,
+    MODEL_REFRESH_DAYS,
     RANDOM_SEED,
     BASELINE_FEATURE_COUNT,
     EXTENDED_FEATURE_COUNT,
     get_features_output_dir,
+    METADATA_COLUMNS,
+    SVM_PROBABILITY,
+    KERNEL_APPROXIMATION,
+    KERNEL_APPROX_COMPONENTS,
 )
-from parkinsons_voice_classification.models.classifiers import get_models
-from parkinsons_voice_classification.features.extraction_simple import get_all_feature_names
+from parkinsons_voice_classification.models.classifiers import (
+    MODEL_NAMES,
+    OPTIONAL_MODELS,
+    get_models,
+)
+from parkinsons_voice_classification.models.incremental import (
+    partial_fit_pipeline,
+    refresh_due,
+    supports_partial_fit,
+)
+from parkinsons_voice_classification.models.search import apply_params, load_best_params
+from parkinsons_voice_classification.models.svm_probability import SigmoidSVC, calibrate_oof
+from parkinsons_voice_classification.features.extraction_simple import (
+    get_all_feature_names,
+    load_feature_metadata,
+)
+from parkinsons_voice_classification.features.tiers import DEFAULT_TIER
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def get_training_features_path(task: str, feature_set: str) -> Path:
+    """Return the feature CSV path for a task and feature set."""
+    features_dir = Path("outputs/features") / feature_set
+    task_filename = f"features_{task.lower()}.csv"
+    return features_dir / task_filename
+
+
 def load_training_features(task: str, feature_set: str) -> tuple[np.ndarray, np.ndarray, list[str]]:
     """
     Load extracted features for training.
@@ -50,10 +84,7 @@ def load_training_features(task: str, feature_set: str) -> tuple[np.ndarray, np.
     tuple[np.ndarray, np.ndarray, list[str]]
         X (features), y (labels), and feature column names.
     """
-    # Determine feature file path
-    features_dir = Path("outputs/features") / feature_set
-    task_filename = f"features_{task.lower()}.csv"
-    features_path = features_dir / task_filename
+    features_path = get_training_features_path(task, feature_set)
 
     if not features_path.exists():
         raise FileNotFoundError(
@@ -65,7 +96,7 @@ def load_training_features(task: str, feature_set: str) -> tuple[np.ndarray, np.
     df = pd.read_csv(features_path)
 
     # Separate features from metadata
-    metadata_cols = ["subject_id", "label", "task", "filename"]
+    metadata_cols = METADATA_COLUMNS
     feature_cols = [c for c in df.columns if c not in metadata_cols]
 
     X = np.array(df[feature_cols].values)
@@ -75,11 +106,134 @@ def load_training_features(task: str, feature_set: str) -> tuple[np.ndarray, np.
     return X, y, feature_cols
 
 
+def load_training_groups(task: str, feature_set: str) -> np.ndarray:
+    """Subject ID of each row of the training features (for grouped CV)."""
+    features_path = get_training_features_path(task, feature_set)
+    return pd.read_csv(features_path, usecols=["subject_id"])["subject_id"].to_numpy()
+
+
+# Bytes before a watermark's offset that its digest covers (with the header)
+_WATERMARK_WINDOW = 1 << 16
+
+
+def feature_watermark(features_path: Path, offset: int | None = None) -> dict:
+    """
+    Compact marker of how far into a feature CSV a model has been trained.
+
+    Parameters
+    ----------
+    features_path : Path
+        Feature CSV.
+    offset : int, optional
+        Byte offset of the end of the last trained row. Defaults to the end
+        of the file.
+
+    Returns
+    -------
+    dict
+        ``offset`` and ``digest``: a SHA-1 of the header line and of the
+        (up to) 64 KiB before the offset. Rows inserted or changed before the
+        offset shift or alter those bytes, so the digest no longer matches.
+        Cost is independent of the file size.
+    """
+    with open(features_path, "rb") as f:
+        header = f.readline()
+        if offset is None:
+            offset = f.seek(0, os.SEEK_END)
+        start = max(len(header), offset - _WATERMARK_WINDOW)
+        f.seek(start)
+        window = f.read(offset - start)
+    digest = hashlib.sha1(header + window).hexdigest()
+    return {"offset": offset, "digest": digest}
+
+
+def load_new_recordings(
+    features_path: Path, watermark: dict
+) -> tuple[pd.DataFrame, dict] | tuple[None, None]:
+    """
+    Rows of a feature CSV appended after ``watermark`` (see feature_watermark).
+
+    Only the header and the bytes from the watermark on are read.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, dict] or tuple[None, None]
+        The new rows (possibly none) and the watermark after them, or None
+        twice if the file no longer matches the watermark (rewritten, e.g.
+        re-extracted with rows inserted in filename order).
+    """
+    if os.path.getsize(features_path) < watermark["offset"]:
+        return None, None
+    if feature_watermark(features_path, watermark["offset"])["digest"] != watermark["digest"]:
+        return None, None
+    with open(features_path, "rb") as f:
+        header = f.readline()
+        f.seek(watermark["offset"])
+        new_rows = f.read()
+    # Up to the last complete row, in case the file is being appended to
+    new_rows = new_rows[: new_rows.rfind(b"\n") + 1]
+    new_watermark = feature_watermark(features_path, watermark["offset"] + len(new_rows))
+    return pd.read_csv(io.BytesIO(header + new_rows)), new_watermark
+
+
+def save_model_artifact(pipeline, metadata: dict, output_dir: Path) -> Path:
+    """
+    Save a pipeline with its metadata as the current model and a versioned copy.
+
+    The artifact gets ``model_version`` one higher than the current model's
+    (1 for the first). The current model,
+    ``{model_name}_{task}_{feature_set}.joblib``, is what inference loads;
+    ``..._v{N}.joblib`` keeps every version.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Fitted pipeline.
+    metadata : dict
+        Artifact metadata with model_name, task and feature_set.
+    output_dir : Path
+        Output directory.
+
+    Returns
+    -------
+    Path
+        Path to the current model.
+    """
+    stem = f"{metadata['model_name']}_{metadata['task']}_{metadata['feature_set']}"
+    model_path = output_dir / f"{stem}.joblib"
+    metadata_path = output_dir / f"{stem}_metadata.json"
+
+    previous_version = 0
+    if metadata_path.exists():
+        with open(metadata_path) as f:
+            previous_version = json.load(f).get("model_version", 1)
+    metadata["model_version"] = previous_version + 1
+
+    artifact = {
+        "pipeline": pipeline,
+        "metadata": metadata,
+    }
+    versioned_stem = f"{stem}_v{metadata['model_version']}"
+    for path in (model_path, output_dir / f"{versioned_stem}.joblib"):
+        joblib.dump(artifact, path)
+    logger.info(f"Model saved to {model_path} (version {metadata['model_version']})")
+
+    # Also save metadata as JSON for inspection
+    for path in (metadata_path, output_dir / f"{versioned_stem}_metadata.json"):
+        with open(path, "w") as f:
+            json.dump(metadata, f, indent=2, default=str)
+    logger.info(f"Metadata saved to {metadata_path}")
+
+    return model_path
+
+
 def train_and_save_model(
     task: str,
     model_name: str,
     feature_set: str,
     output_dir: Path | None = None,
+    tuned: bool = False,
+    hyperparameters: dict | None = None,
 ) -> Path:
     """
     Train a model and save it with metadata.
@@ -94,6 +248,12 @@ def train_and_save_model(
         Feature set used ('baseline' or 'extended').
     output_dir : Path, optional
         Output directory for model. Defaults to MODELS_DIR.
+    tuned : bool
+        Use the winning hyperparameters saved by pvc-search for this model,
+        task and feature set instead of the defaults.
+    hyperparameters : dict, optional
+        Final-estimator parameters to apply instead (e.g. those recorded by
+        the model being refreshed). Takes precedence over ``tuned``.
 
     Returns
     -------
@@ -106,19 +266,52 @@ def train_and_save_model(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Load features
+    features_path = get_training_features_path(task, feature_set)
     X, y, feature_names = load_training_features(task, feature_set)
+    watermark = feature_watermark(features_path)
+    store_metadata = load_feature_metadata(features_path)
 
     # Get the model pipeline
-    models = get_models()
+    models = get_models(extra_models=list(OPTIONAL_MODELS))
     if model_name not in models:
         raise ValueError(f"Unknown model: {model_name}. Available: {list(models.keys())}")
 
     pipeline = models[model_name]
+    if hyperparameters is None and tuned:
+        hyperparameters = load_best_params(model_name, task, feature_set)
+    if hyperparameters is not None:
+        apply_params(pipeline, hyperparameters)
+        logger.info(f"Using tuned hyperparameters: {hyperparameters}")
+
+    # Feature selection: the saved pipeline and its metadata cover only the
+    # selected features, so inference extracts just those
+    feature_selection = None
+    if "select" in pipeline.named_steps:
+        selector = pipeline.named_steps["select"].fit(X, y)
+        feature_selection = {
+            "method": selector.method,
+            "candidate_count": len(feature_names),
+            "selected_features": [feature_names[i] for i in selector.selected_],
+        }
+        X = X[:, selector.support_]
+        feature_names = [name for name, keep in zip(feature_names, selector.support_) if keep]
+        pipeline = Pipeline(pipeline.steps[1:])
+        logger.info(
+            f"Selected {len(feature_names)} of {feature_selection['candidate_count']} features "
+            f"({selector.method})"
+        )
 
     # Train on full dataset (for inference, not evaluation)
     logger.info(f"Training {model_name} on {task} ({feature_set} features)...")
     pipeline.fit(X, y)
 
+    # SigmoidSVC in "oof" mode: fit its probability sigmoid on out-of-fold
+    # decision values of grouped CV (by subject)
+    estimator = pipeline.steps[-1][1]
+    if isinstance(estimator, SigmoidSVC) and not hasattr(estimator, "sigmoid_"):
+        logger.info("Fitting SVM probability sigmoid on out-of-fold decision values...")
+        calibrate_oof(pipeline, X, y, groups=load_training_groups(task, feature_set))
+
     # Prepare metadata for validation at inference time
     metadata = {
         "model_name": model_name,
@@ -126,36 +319,165 @@ def train_and_save_model(
         "feature_set": feature_set,
         "feature_count": len(feature_names),
         "feature_names": feature_names,
+        "extraction_tier": store_metadata["extraction_tier"],
+        "prosodic_backend": store_metadata["prosodic_backend"],
+        "vad_mode": store_metadata["vad_mode"],
+        "svm_probability": SVM_PROBABILITY if model_name == "SVM_RBF" else None,
+        "kernel_approximation": (
+            {"method": KERNEL_APPROXIMATION, "n_components": KERNEL_APPROX_COMPONENTS}
+            if model_name == "RBF_Approx"
+            else None
+        ),
+        "hyperparameters": hyperparameters,
+        "feature_selection": feature_selection,
+        "update": "full",
         "training_samples": len(X),
+        "new_samples": len(X),
         "class_distribution": {
             "HC": int(np.sum(y == 0)),
             "PD": int(np.sum(y == 1)),
         },
+        "training_watermark": watermark,
         "random_seed": RANDOM_SEED,
         "trained_at": datetime.now().isoformat(),
         "version": "1.0.0",
     }
 
-    # Save model and metadata together
-    model_filename = f"{model_name}_{task}_{feature_set}.joblib"
-    model_path = output_dir / model_filename
+    return save_model_artifact(pipeline, metadata, output_dir)
 
-    artifact = {
-        "pipeline": pipeline,
-        "metadata": metadata,
-    }
 
-    joblib.dump(artifact, model_path)
-    logger.info(f"Model saved to {model_path}")
+def update_model(
+    task: str,
+    model_name: str,
+    feature_set: str,
+    output_dir: Path | None = None,
+    refresh_days: float = MODEL_REFRESH_DAYS,
+) -> Path:
+    """
+    Update a saved model with the recordings it has not been trained on.
 
-    # Also save metadata as JSON for inspection
-    metadata_path = output_dir / f"{model_name}_{task}_{feature_set}_metadata.json"
-    with open(metadata_path, "w") as f:
-        # Convert feature_names to list for JSON serialization
-        json.dump(metadata, f, indent=2, default=str)
-    logger.info(f"Metadata saved to {metadata_path}")
+    New recordings are the rows appended to the feature CSV after the
+    model's ``training_watermark``; only those are read. Models whose steps
+    all support partial_fit are updated with them. Other models are
+    retrained from scratch with train_and_save_model once their artifact is
+    ``refresh_days`` old. If the CSV was rewritten before the watermark (so
+    new rows cannot be told apart), incremental models are retrained too.
+    Either way a new version is saved; without new recordings, or when a
+    refresh is not due yet, the current model is kept.
 
-    return model_path
+    Parameters
+    ----------
+    task : str
+        Speech task the model is trained on.
+    model_name : str
+        Name of the model (e.g., 'SGD_Logistic').
+    feature_set : str
+        Feature set used ('baseline' or 'extended').
+    output_dir : Path, optional
+        Directory of the saved model. Defaults to MODELS_DIR.
+    refresh_days : float
+        Minimum artifact age in days before a non-incremental model is retrained.
+
+    Returns
+    -------
+    Path
+        Path to the current model.
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no saved model to update.
+    ValueError
+        If the feature CSV no longer matches the model's features or extraction.
+    """
+    if output_dir is None:
+        output_dir = MODELS_DIR
+
+    model_path = output_dir / f"{model_name}_{task}_{feature_set}.joblib"
+    if not model_path.exists():
+        raise FileNotFoundError(
+            f"Model not found: {model_path}\n"
+            f"Run 'pvc-train --task {task} --model {model_name} --feature-set {feature_set}' "
+            f"first."
+        )
+    artifact = joblib.load(model_path)
+    pipeline, previous = artifact["pipeline"], artifact["metadata"]
+
+    if "training_watermark" not in previous:
+        raise ValueError(
+            f"{model_path} does not record its training watermark. Retrain it with pvc-train."
+        )
+
+    features_path = get_training_features_path(task, feature_set)
+    store_metadata = load_feature_metadata(features_path)
+    # Artifacts that predate these keys were trained with the defaults (as in inference)
+    model_extraction = {
+        "extraction_tier": previous.get("extraction_tier", DEFAULT_TIER),
+        "prosodic_backend": previous.get("prosodic_backend", "praat"),
+        "vad_mode": previous.get("vad_mode", "off"),
+    }
+    for key, value in model_extraction.items():
+        if store_metadata[key] != value:
+            raise ValueError(
+                f"Feature store {key} is '{store_metadata[key]}' but {model_name} was trained "
+                f"on '{value}'. Retrain it with pvc-train."
+            )
+
+    df, watermark = load_new_recordings(features_path, previous["training_watermark"])
+    if df is not None and df.empty:
+        version = previous.get("model_version", 1)
+        logger.info(f"No new recordings for {model_name}; keeping version {version}")
+        return model_path
+
+    if df is None or not supports_partial_fit(pipeline):
+        if df is None:
+            reason = f"{features_path} was rewritten since {model_name} was trained"
+        else:
+            reason = f"{model_name} cannot be updated incrementally"
+        if (df is None and supports_partial_fit(pipeline)) or refresh_due(previous, refresh_days):
+            logger.info(f"{reason}; retraining on all rows...")
+            return train_and_save_model(
+                task,
+                model_name,
+                feature_set,
+                output_dir=output_dir,
+                hyperparameters=previous.get("hyperparameters"),
+            )
+        pending = "" if df is None else f" ({len(df)} new recordings pending)"
+        logger.info(
+            f"{reason} and it was trained less than {refresh_days} days ago; keeping it{pending}"
+        )
+        return model_path
+
+    # The model's features may be a selected subset of the CSV's columns
+    missing = [name for name in previous["feature_names"] if name not in df.columns]
+    if missing:
+        raise ValueError(
+            f"{features_path} lacks features {model_name} was trained on: {missing}. "
+            f"Retrain it with pvc-train."
+        )
+    X = np.array(df[previous["feature_names"]].values)
+    y = np.array(df["label"].values)
+
+    class_distribution = {
+        "HC": previous["class_distribution"]["HC"] + int(np.sum(y == 0)),
+        "PD": previous["class_distribution"]["PD"] + int(np.sum(y == 1)),
+    }
+    logger.info(f"Updating {model_name} with {len(X)} new recordings...")
+    partial_fit_pipeline(
+        pipeline, X, y, class_counts={0: class_distribution["HC"], 1: class_distribution["PD"]}
+    )
+
+    metadata = {
+        **previous,
+        "update": "incremental",
+        "training_samples": previous["training_samples"] + len(X),
+        "new_samples": len(X),
+        "class_distribution": class_distribution,
+        "training_watermark": watermark,
+        "trained_at": datetime.now().isoformat(),
+    }
+    return save_model_artifact(pipeline, metadata, output_dir)
 
 
 def main():
@@ -175,7 +497,7 @@ def main():
         "--model",
         type=str,
         default="RandomForest",
-        choices=["LogisticRegression", "SVM_RBF", "RandomForest"],
+        choices=list(MODEL_NAMES),
         help="Model to train (default: RandomForest)",
     )
     parser.add_argument(
@@ -191,19 +513,52 @@ def main():
         default=None,
         help="Output directory (default: outputs/models/)",
     )
+    parser.add_argument(
+        "--tuned",
+        action="store_true",
+        help="Use the winning hyperparameters from pvc-search (outputs/search/)",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Update the saved model with new recordings only (SGD models), or retrain "
+        "other models once their refresh is due",
+    )
+    parser.add_argument(
+        "--refresh-days",
+        type=float,
+        default=MODEL_REFRESH_DAYS,
+        help=f"With --update, minimum age before retraining other models "
+        f"(default: {MODEL_REFRESH_DAYS})",
+    )
 
     args = parser.parse_args()
+    if args.update and args.tuned:
+        parser.error("--update keeps the saved model's hyperparameters; drop --tuned")
 
     output_dir = Path(args.output_dir) if args.output_dir else None
 
-    model_path = train_and_save_model(
-        task=args.task,
-        model_name=args.model,
-        feature_set=args.feature_set,
-        output_dir=output_dir,
-    )
+    if args.update:
+        model_path = update_model(
+            task=args.task,
+            model_name=args.model,
+            feature_set=args.feature_set,
+            output_dir=output_dir,
+            refresh_days=args.refresh_days,
+        )
+    else:
+        model_path = train_and_save_model(
+            task=args.task,
+            model_name=args.model,
+            feature_set=args.feature_set,
+            output_dir=output_dir,
+            tuned=args.tuned,
+        )
 
-    print(f"\n✓ Model trained and saved to: {model_path}")
+    if args.update:
+        print(f"\n✓ Current model: {model_path}")
+    else:
+        print(f"\n✓ Model trained and saved to: {model_path}")
     print(f"  Task: {args.task}")
     print(f"  Model: {args.model}")
     print(f"  Feature set: {args.feature_set}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Work-Queue Worker
+
+Joins a shared work queue (see distributed.py) and runs extraction and CV
+tasks queued by `pvc-extract --queue`, or by any run with WORK_QUEUE_PATH set.
+Start any number of workers, on this host or on other hosts that mount the
+same filesystem.
+
+Usage:
+    pvc-worker --queue /shared/pvc_queue.sqlite
+    pvc-worker --queue /shared/pvc_queue.sqlite --idle-timeout 600 --threads 2
+"""
+
+import argparse
+import logging
+
+from parkinsons_voice_classification.config import WORK_QUEUE_PATH
+from parkinsons_voice_classification.distributed import run_worker
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run tasks from a shared work queue")
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=WORK_QUEUE_PATH,
+        required=WORK_QUEUE_PATH is None,
+        help=f"Work queue file on a shared filesystem (default: {WORK_QUEUE_PATH})",
+    )
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=None,
+        help="Name recorded on claimed tasks (default: hostname-pid)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many seconds without work (default: run until stopped)",
+    )
+    parser.add_argument(
+        "--max-tasks",
+        type=int,
+        default=None,
+        help="Exit after this many tasks (default: no limit)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Cap on BLAS/OpenMP threads per task (default: library defaults)",
+    )
+
+    args = parser.parse_args()
+
+    n_done = run_worker(
+        args.queue,
+        worker_id=args.worker_id,
+        idle_timeout=args.idle_timeout,
+        max_tasks=args.max_tasks,
+        n_threads=args.threads,
+    )
+    logger.info(f"Processed {n_done} tasks")
+
+
+if __name__ == "__main__":
+    main()
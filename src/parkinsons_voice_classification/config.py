@@ -30,6 +30,9 @@ MDVR_KCL_SPONTANEOUS = MDVR_KCL_DIR / "SpontaneousDialogue"
 # Dataset B path
 PD_SPEECH_FEATURES_CSV = ASSETS_DIR / "PD_SPEECH_FEATURES.csv"
 
+# Persisted Dataset A manifest index (see data/manifest_index.py)
+MANIFEST_INDEX_DIR = OUTPUTS_DIR / "manifest"
+
 # =============================================================================
 # FEATURE SET CONFIGURATION
 # =============================================================================
@@ -75,6 +78,38 @@ MFCC_N_MELS = 128  # Number of mel bands
 # Target sample rate for all audio
 TARGET_SAMPLE_RATE = 22050
 
+# Praat analysis quality tier: "accurate" (locked parameters above), "balanced" or "fast"
+# Faster tiers coarsen Harmonicity/Formant time steps (see features/tiers.py).
+# Recorded in feature-store and model metadata; inference rejects mismatches.
+EXTRACTION_TIER = "accurate"
+
+# Backend for the pitch, harmonicity and intensity features: "praat" (parselmouth,
+# locked thesis results) or "numpy" (batched frame analysis, features/prosodic_numpy.py).
+# Jitter/shimmer and formants always use Praat. Recorded in feature-store and model metadata.
+PROSODIC_BACKEND = "praat"
+
+# Voice-activity segmentation stage (see features/segmentation.py)
+# "off"     - analyse full recordings (locked thesis behaviour)
+# "measure" - segment each file and record its speech_ratio column only
+# "trim"    - additionally drop pauses before Praat and librosa analysis
+VAD_MODE = "off"
+VAD_FRAME_LENGTH = 0.025  # Analysis frame length (s)
+VAD_HOP_LENGTH = 0.010  # Frame hop (s)
+VAD_THRESHOLD_DB = -35.0  # Speech if frame energy is within this many dB of the loudest frame
+VAD_MAX_ZCR_HZ = 3000.0  # Voicing gate: max zero crossings per second
+VAD_MIN_SPEECH = 0.10  # Drop speech runs shorter than this (s)
+VAD_MIN_SILENCE = 0.30  # Bridge pauses shorter than this (s)
+VAD_PADDING = 0.05  # Pad each speech interval on both sides (s)
+
+# Frame-level track store (see features/frame_store.py)
+# When True, extraction also saves F0/intensity/HNR/formant/MFCC frame tracks to
+# outputs/frames/{task}/ so new aggregates can be computed without re-extraction
+SAVE_FRAME_TRACKS = False
+FRAME_STORE_DIR = OUTPUTS_DIR / "frames"
+
+# Non-feature columns of the feature CSVs ("speech_ratio" only when VAD_MODE != "off")
+METADATA_COLUMNS = ["subject_id", "label", "task", "filename", "speech_ratio"]
+
 # =============================================================================
 # FEATURE COUNTS (for documentation)
 # =============================================================================
@@ -107,6 +142,10 @@ LABEL_NAMES = {
 # =============================================================================
 N_FOLDS = 5
 
+# Cached fold assignments shared by CV runs (see models/splits.py).
+# None = keep them in memory only.
+SPLIT_CACHE_DIR = OUTPUTS_DIR / "splits"
+
 # =============================================================================
 # CLASS IMBALANCE HANDLING
 # =============================================================================
@@ -116,6 +155,95 @@ N_FOLDS = 5
 # Results are saved to outputs/results/baseline/
 USE_CLASS_WEIGHT_BALANCED = False
 
+# =============================================================================
+# MODEL BACKENDS (see models/classifiers.py)
+# =============================================================================
+# Solver for the LogisticRegression model:
+# "sklearn" - LogisticRegression(solver="lbfgs"), one fit per fold (locked thesis results)
+# "batched" - BatchedLogisticRegression: all CV folds solved at once with batched
+#             Newton iterations (models/batched_logistic.py); same optimum to lbfgs' tolerance.
+#             Only faster for narrow data: above MAX_BATCHED_FEATURES (64) features, e.g.
+#             Dataset B, it falls back to per-fold lbfgs
+LR_BACKEND = "sklearn"
+
+# Probability estimates of the SVM_RBF model (see models/svm_probability.py):
+# "platt"   - SVC(probability=True): libsvm's internal 5-fold Platt scaling on every
+#             fit, ~6 SVM trainings per fit (locked thesis results)
+# "holdout" - SigmoidSVC: sigmoid fitted on one stratified 20% hold-out, 2 trainings
+#             (noisier than "platt"; too few held-out recordings on Dataset A)
+# "oof"     - SigmoidSVC: 1 training; CV scores ROC-AUC on decision values and
+#             pvc-train fits the sigmoid on out-of-fold decision values
+# Predictions (and all metrics but ROC-AUC) are identical in every mode.
+SVM_PROBABILITY = "platt"
+
+# Optional models run next to the three thesis models (classifiers.OPTIONAL_MODELS),
+# e.g. ["HistGradientBoosting", "RBF_Approx"]. pvc-train accepts them regardless.
+EXTRA_MODELS = []
+
+# Feature map of the optional RBF_Approx model (an approximate RBF kernel followed
+# by a linear LogisticRegression; training near-linear in samples, fixed prediction cost):
+# "nystroem" - Nystroem: exact kernel against KERNEL_APPROX_COMPONENTS sampled landmarks
+# "fourier"  - RBFSampler: KERNEL_APPROX_COMPONENTS random Fourier features
+KERNEL_APPROXIMATION = "nystroem"
+KERNEL_APPROX_COMPONENTS = 300
+
+# =============================================================================
+# FEATURE SELECTION (see models/feature_selection.py)
+# =============================================================================
+# Feature subset every get_models pipeline starts with, chosen on each CV training fold:
+# "none"        - all features (locked thesis results)
+# "correlation" - most informative features, dropping those correlated >= threshold with a kept one
+# "mrmr"        - minimum redundancy (|r|), maximum relevance (mutual information)
+# "l1"          - largest L1 Logistic Regression coefficients
+# "rfe"         - recursive feature elimination with Logistic Regression
+# pvc-train stores the selected features in the model metadata, so inference
+# extracts only those.
+FEATURE_SELECTION = "none"
+FEATURE_SELECTION_K = 100  # Features kept
+FEATURE_SELECTION_CORR_THRESHOLD = 0.9  # |r| at which "correlation" drops a feature
+
+# Cached correlation matrices and mutual information, keyed by a hash of the
+# training data. None = keep them in memory only.
+FEATURE_STATS_CACHE_DIR = OUTPUTS_DIR / "feature_stats"
+
+# =============================================================================
+# HYPERPARAMETER SEARCH (see models/search.py)
+# =============================================================================
+# Successive halving over SEARCH_SPACES: candidates start on a few CV splits and
+# the best 1/SEARCH_HALVING_FACTOR move on to SEARCH_HALVING_FACTOR times as many.
+SEARCH_METRIC = "roc_auc"  # compute_metrics key to maximize
+SEARCH_REPEATS = 3  # Shuffled CV repeats; the last rung uses N_FOLDS * SEARCH_REPEATS splits
+SEARCH_HALVING_FACTOR = 3
+SEARCH_MIN_SPLITS = 3  # Floor on the first rung: one split is too noisy to halve on
+# Splits a rung needs before dominated candidates are discarded early: on a few
+# small test folds, "matched on every split" happens by chance
+SEARCH_MIN_DOMINANCE_SPLITS = 2 * N_FOLDS
+SEARCH_DIR = OUTPUTS_DIR / "search"  # Search history and winning parameters (pvc-train --tuned)
+
+# =============================================================================
+# PARALLEL EXECUTION (see parallel.py)
+# =============================================================================
+# Upper bound on parallel workers for extraction, CV and importance.
+# None = available CPUs minus one (respects affinity masks and cgroup CPU quotas).
+MAX_WORKERS = None
+
+# Estimated cost (seconds) of starting a cold process pool, weighed by the
+# adaptive executor against the measured per-task cost when choosing
+# serial, thread or process execution.
+PROCESS_STARTUP_SECONDS = 2.0
+
+# Shared work queue (see distributed.py): SQLite file on a filesystem shared by
+# every host running `pvc-worker`. Extraction and CV tasks then go through the
+# queue instead of the local pool. None = run on this machine only.
+WORK_QUEUE_PATH = None
+
+# Seconds a worker may hold a task without renewing its lease before another
+# worker takes it over (workers renew every third of this while running).
+WORK_QUEUE_LEASE_SECONDS = 60.0
+
+# Attempts per task (failures and lost leases) before the batch fails.
+WORK_QUEUE_MAX_ATTEMPTS = 3
+
 # =============================================================================
 # INFERENCE CONFIGURATION (Demo App)
 # =============================================================================
@@ -132,3 +260,9 @@ INFERENCE_TASK = "ReadText"  # Speech task the model was trained on
 INFERENCE_MODEL_PATH = (
     MODELS_DIR / f"{INFERENCE_MODEL_NAME}_{INFERENCE_TASK}_{INFERENCE_FEATURE_SET}.joblib"
 )
+
+# Incremental updates (pvc-train --update, see models/incremental.py): models that
+# cannot be updated with partial_fit are retrained on all recordings once their
+# artifact is at least this many days old. Every save also writes a versioned copy
+# {model_name}_{task}_{feature_set}_v{N}.joblib.
+MODEL_REFRESH_DAYS = 7
@@ -8,10 +8,22 @@ from parkinsons_voice_classification.data.mdvr_kcl import (
     build_subject_registry,
     load_dataset_manifest,
 )
+from parkinsons_voice_classification.data.manifest_index import (
+    load_manifest_index,
+    update_manifest_index,
+)
+from parkinsons_voice_classification.data.archives import (
+    iter_archive_members,
+    load_archive_manifest,
+)
 
 __all__ = [
     "parse_mdvr_filename",
     "discover_recordings",
     "build_subject_registry",
     "load_dataset_manifest",
+    "load_manifest_index",
+    "update_manifest_index",
+    "iter_archive_members",
+    "load_archive_manifest",
 ]
@@ -0,0 +1,226 @@
+"""
+Recordings Streamed from Zip/Tar Archives
+
+Recordings delivered as zip or tar bundles (one or more shards per clinic
+site) are read in place instead of being unpacked to disk first.
+
+- Enumeration: ``load_archive_manifest`` lists the WAV members of each shard
+  (zip central directory, or tar headers) and parses their filenames with
+  ``parse_mdvr_filename``. The task is taken from a ``ReadText`` or
+  ``SpontaneousDialogue`` directory in the member path.
+- Addressing: a member is referred to as ``{archive}::{member}`` in the
+  manifest's ``filepath`` column, so manifest rows look like on-disk ones.
+- Streaming: ``iter_archive_members`` reads one shard front to back in a
+  single sequential pass and yields each member's bytes, which the extractors
+  decode from memory (features/audio_io.py). Batch extraction runs one task
+  per shard, so parallel workers each stream a different shard.
+- ``read_archive_member`` fetches a single member (random access). Cheap for
+  zip and uncompressed tar; for compressed tar it decompresses up to the
+  member, so prefer shard streaming for batches.
+
+Supported: .zip, .tar, .tar.gz/.tgz, .tar.bz2, .tar.xz
+
+Usage:
+    manifest = load_archive_manifest("ReadText", ["site_a.zip", "site_b.tar.gz"])
+    for member, data in iter_archive_members("site_a.zip"):
+        ...
+"""
+
+import logging
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Iterator
+
+import pandas as pd
+
+from parkinsons_voice_classification.config import LABEL_MAP
+from parkinsons_voice_classification.data.manifest_index import TASKS
+from parkinsons_voice_classification.data.mdvr_kcl import parse_mdvr_filename
+
+logger = logging.getLogger(__name__)
+
+# Separates the archive path from the member name in manifest filepaths
+ARCHIVE_MEMBER_SEPARATOR = "::"
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+
+def is_archive(path: str | Path) -> bool:
+    """Whether ``path`` has a supported archive suffix."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def archive_member_path(archive: str | Path, member: str) -> str:
+    """Manifest filepath of an archive member."""
+    return f"{archive}{ARCHIVE_MEMBER_SEPARATOR}{member}"
+
+
+def split_archive_path(filepath: str | Path) -> tuple[str, str] | None:
+    """
+    Split a manifest filepath into (archive, member).
+
+    Returns
+    -------
+    tuple[str, str] or None
+        None for plain files.
+    """
+    archive, sep, member = str(filepath).partition(ARCHIVE_MEMBER_SEPARATOR)
+    if not sep or not is_archive(archive):
+        return None
+    return archive, member
+
+
+def _is_wav(name: str) -> bool:
+    return name.lower().endswith(".wav") and not PurePosixPath(name).name.startswith(".")
+
+
+def _list_members(archive: str | Path) -> list[tuple[str, int]]:
+    """(member name, uncompressed size) of every WAV member, in archive order."""
+    if str(archive).lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            infos = sorted(zf.infolist(), key=lambda info: info.header_offset)
+            return [
+                (i.filename, i.file_size) for i in infos if not i.is_dir() and _is_wav(i.filename)
+            ]
+    with tarfile.open(archive, mode="r|*") as tf:
+        return [(m.name, m.size) for m in tf if m.isfile() and _is_wav(m.name)]
+
+
+def iter_archive_members(
+    archive: str | Path, members: set[str] | None = None
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Stream WAV members of an archive in one sequential pass.
+
+    Parameters
+    ----------
+    archive : str or Path
+        Zip or tar archive.
+    members : set[str], optional
+        Member names to read; others are skipped without being decompressed
+        into memory, and the pass stops once all of them have been read.
+        Defaults to every WAV member.
+
+    Yields
+    ------
+    tuple[str, bytes]
+        (member name, file contents), in archive order.
+    """
+    remaining = None if members is None else set(members)
+    if str(archive).lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            for info in sorted(zf.infolist(), key=lambda info: info.header_offset):
+                if remaining is not None and not remaining:
+                    return
+                if info.is_dir() or not _is_wav(info.filename):
+                    continue
+                if remaining is None or info.filename in remaining:
+                    if remaining is not None:
+                        remaining.discard(info.filename)
+                    yield info.filename, zf.read(info)
+        return
+
+    # Stream mode: never seeks, so compressed shards are decompressed exactly once
+    with tarfile.open(archive, mode="r|*") as tf:
+        for member in tf:
+            if remaining is not None and not remaining:
+                return
+            if not member.isfile() or not _is_wav(member.name):
+                continue
+            if remaining is None or member.name in remaining:
+                if remaining is not None:
+                    remaining.discard(member.name)
+                yield member.name, tf.extractfile(member).read()
+
+
+def read_archive_member(archive: str | Path, member: str) -> bytes:
+    """
+    Read one member of an archive.
+
+    Raises
+    ------
+    KeyError
+        If the archive has no such member.
+    """
+    if str(archive).lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            return zf.read(member)
+    with tarfile.open(archive, mode="r:*") as tf:
+        extracted = tf.extractfile(member)
+        if extracted is None:
+            raise KeyError(f"{member} is not a regular file in {archive}")
+        return extracted.read()
+
+
+def _member_task(member: str) -> str | None:
+    """Speech task from a ReadText/SpontaneousDialogue directory in the member path."""
+    for part in PurePosixPath(member).parts[:-1]:
+        if part in TASKS:
+            return part
+    return None
+
+
+def load_archive_manifest(task: str, archives: list[str | Path]) -> pd.DataFrame:
+    """
+    Build a manifest of the recordings of a task stored in archives.
+
+    Parameters
+    ----------
+    task : str
+        Speech task: 'ReadText' or 'SpontaneousDialogue'.
+    archives : list[str or Path]
+        Archive shards (zip/tar) with the MDVR-KCL layout inside, e.g.
+        ``ReadText/HC/ID00_hc_0_0_0.wav`` (any leading directories).
+
+    Returns
+    -------
+    pd.DataFrame
+        Same columns as load_dataset_manifest (without the index-only
+        duration and mtime), with ``filepath`` = ``{archive}::{member}``.
+        A recording found in several shards is kept once (first shard wins).
+
+    Raises
+    ------
+    ValueError
+        If task is unknown or a path is not a supported archive.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Unknown task: {task}. Must be 'ReadText' or 'SpontaneousDialogue'.")
+
+    rows, seen = [], {}
+    for archive in archives:
+        if not is_archive(archive):
+            raise ValueError(
+                f"Unsupported archive: {archive}. Supported: {', '.join(ARCHIVE_SUFFIXES)}"
+            )
+        for member, size in _list_members(archive):
+            if _member_task(member) != task:
+                continue
+            filename = PurePosixPath(member).name
+            try:
+                parsed = parse_mdvr_filename(filename)
+            except ValueError as e:
+                logger.warning(f"Skipping {archive_member_path(archive, member)}: {e}")
+                continue
+            if filename in seen:
+                logger.warning(
+                    f"Duplicate recording {filename} in {archive}; keeping {seen[filename]}"
+                )
+                continue
+            seen[filename] = archive
+            rows.append(
+                {
+                    "filepath": archive_member_path(archive, member),
+                    "filename": filename,
+                    "subject_id": parsed["subject_id"],
+                    "label_str": parsed["class"],
+                    "label": LABEL_MAP[parsed["class"]],
+                    "task": task,
+                    "size": size,
+                }
+            )
+
+    return pd.DataFrame(
+        rows, columns=["filepath", "filename", "subject_id", "label_str", "label", "task", "size"]
+    )
@@ -0,0 +1,240 @@
+"""
+Persistent MDVR-KCL Manifest Index
+
+``discover_recordings`` globs and regex-parses every filename on each call,
+which takes minutes on large trees over network storage. The manifest index
+persists one record per recording:
+
+- filename, size, mtime_ns (to detect changed files)
+- subject_id, label_str, label (parsed once)
+- duration (seconds, read once from the WAV header; NaN if unreadable)
+
+It is stored per task and dataset directory under outputs/manifest/ as JSON,
+grouped by class directory (HC/, PD/) together with that directory's mtime.
+
+Rescans are incremental:
+- A class directory whose mtime is unchanged is not listed at all (adding,
+  removing or renaming a file changes the directory mtime).
+- Otherwise it is listed with ``os.scandir``. Files with unchanged size and
+  mtime keep their record, and only new or changed files are parsed and
+  have their header read.
+- ``full_rescan=True`` lists every directory regardless of its mtime, which
+  also catches files rewritten in place under the same name.
+
+Usage:
+    manifest = load_manifest_index("ReadText")   # DataFrame, refreshed incrementally
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from parkinsons_voice_classification.config import LABEL_MAP, MANIFEST_INDEX_DIR, MDVR_KCL_DIR
+from parkinsons_voice_classification.data.mdvr_kcl import parse_mdvr_filename
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record layout changes; older indexes are rebuilt
+INDEX_VERSION = 1
+
+TASKS = ("ReadText", "SpontaneousDialogue")
+CLASS_DIRS = ("HC", "PD")
+
+# Manifest columns (discover_recordings order, then the index-only ones)
+MANIFEST_COLUMNS = [
+    "filepath",
+    "filename",
+    "subject_id",
+    "label_str",
+    "label",
+    "task",
+    "size",
+    "mtime_ns",
+    "duration",
+]
+
+
+def get_manifest_index_path(task: str, base_dir: Path | None = None) -> Path:
+    """Return the index file of a task, keyed by the dataset directory."""
+    base_dir = Path(base_dir or MDVR_KCL_DIR).resolve()
+    digest = hashlib.sha1(str(base_dir).encode()).hexdigest()[:8]
+    return MANIFEST_INDEX_DIR / f"manifest_{task.lower()}_{digest}.json"
+
+
+def _read_duration(path: str) -> float | None:
+    """Duration in seconds from the audio header (None if unreadable)."""
+    import soundfile as sf
+
+    try:
+        return float(sf.info(path).duration)
+    except Exception:
+        return None
+
+
+def _scan_class_dir(path: Path, previous: dict, full_rescan: bool) -> tuple[dict, int]:
+    """
+    Refresh the index entry of one class directory.
+
+    Returns
+    -------
+    tuple[dict, int]
+        (directory entry, number of files parsed or re-read).
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    if not full_rescan and previous.get("mtime_ns") == mtime_ns:
+        return previous, 0
+
+    known = {record["filename"]: record for record in previous.get("files", [])}
+    skipped = set(previous.get("skipped", []))
+    files, new_skipped, n_read = [], [], 0
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".wav") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            record = known.get(entry.name)
+            if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                files.append(record)
+                continue
+            if entry.name in skipped:
+                new_skipped.append(entry.name)
+                continue
+
+            try:
+                parsed = parse_mdvr_filename(entry.name)
+            except ValueError as e:
+                logger.warning(f"Skipping file {entry.name}: {e}")
+                new_skipped.append(entry.name)
+                continue
+            files.append(
+                {
+                    "filename": entry.name,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "subject_id": parsed["subject_id"],
+                    "label_str": parsed["class"],
+                    "label": LABEL_MAP[parsed["class"]],
+                    "duration": _read_duration(entry.path),
+                }
+            )
+            n_read += 1
+
+    files.sort(key=lambda record: record["filename"])
+    return {"mtime_ns": mtime_ns, "files": files, "skipped": sorted(new_skipped)}, n_read
+
+
+def update_manifest_index(
+    task: str,
+    base_dir: Path | None = None,
+    full_rescan: bool = False,
+) -> dict:
+    """
+    Rescan a task's recordings incrementally and persist the index.
+
+    Parameters
+    ----------
+    task : str
+        Speech task: 'ReadText' or 'SpontaneousDialogue'.
+    base_dir : Path, optional
+        Base directory of MDVR-KCL dataset. Defaults to config path.
+    full_rescan : bool
+        List every class directory even if its mtime is unchanged.
+
+    Returns
+    -------
+    dict
+        The index ({'version', 'task', 'base_dir', 'dirs': {class_dir: entry}}).
+
+    Raises
+    ------
+    ValueError
+        If task is not 'ReadText' or 'SpontaneousDialogue'.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Unknown task: {task}. Must be 'ReadText' or 'SpontaneousDialogue'.")
+    base_dir = Path(base_dir or MDVR_KCL_DIR)
+    index_path = get_manifest_index_path(task, base_dir)
+
+    index = {}
+    if index_path.exists():
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable manifest index {index_path}: {e}")
+    if index.get("version") != INDEX_VERSION:
+        index = {}
+
+    dirs, n_read = {}, 0
+    for class_dir in CLASS_DIRS:
+        path = base_dir / task / class_dir
+        if not path.is_dir():
+            continue
+        dirs[class_dir], n = _scan_class_dir(
+            path, index.get("dirs", {}).get(class_dir, {}), full_rescan
+        )
+        n_read += n
+
+    updated = {
+        "version": INDEX_VERSION,
+        "task": task,
+        "base_dir": str(base_dir.resolve()),
+        "dirs": dirs,
+    }
+    if updated != index:
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(updated, f)
+            os.replace(tmp_path, index_path)  # atomic: readers never see a partial index
+            logger.info(f"Manifest index {index_path.name}: {n_read} new or changed recordings")
+        except OSError as e:
+            logger.warning(f"Could not save manifest index {index_path}: {e}")
+    return updated
+
+
+def load_manifest_index(
+    task: str,
+    base_dir: Path | None = None,
+    full_rescan: bool = False,
+) -> pd.DataFrame:
+    """
+    Load a task's manifest from the persisted index, refreshing it first.
+
+    Parameters
+    ----------
+    task : str
+        Speech task: 'ReadText' or 'SpontaneousDialogue'.
+    base_dir : Path, optional
+        Base directory of MDVR-KCL dataset. Defaults to config path.
+    full_rescan : bool
+        List every class directory even if its mtime is unchanged.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per recording (HC, then PD, each sorted by filename) with
+        columns MANIFEST_COLUMNS.
+    """
+    base_dir = Path(base_dir or MDVR_KCL_DIR)
+    index = update_manifest_index(task, base_dir, full_rescan)
+
+    # Column-wise construction; one Path per directory, not per file
+    records, filepaths = [], []
+    for class_dir, entry in index["dirs"].items():
+        prefix = str(base_dir / task / class_dir) + os.sep
+        records.extend(entry["files"])
+        filepaths.extend(prefix + record["filename"] for record in entry["files"])
+    columns = {"filepath": filepaths, "task": [task] * len(records)}
+    for column in MANIFEST_COLUMNS:
+        if column not in columns:
+            columns[column] = [record[column] for record in records]
+    df = pd.DataFrame(columns, columns=MANIFEST_COLUMNS)
+    df["duration"] = df["duration"].astype(float)
+    return df
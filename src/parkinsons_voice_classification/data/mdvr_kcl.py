@@ -9,6 +9,8 @@ Key features:
 - Filename parsing with edge case handling (ID22hc malformed filename)
 - Subject registry building for grouped cross-validation
 - Per-task file discovery
+- Manifest loading from a persisted, incrementally rescanned index
+  (data/manifest_index.py)
 
 Reference:
 - Dataset location: assets/DATASET_MDVR_KCL/
@@ -27,6 +29,7 @@ from parkinsons_voice_classification.config import (
     MDVR_KCL_READTEXT,
     MDVR_KCL_SPONTANEOUS,
     LABEL_MAP,
+    METADATA_COLUMNS,
 )
 
 
@@ -177,37 +180,33 @@ def build_subject_registry(recordings: list[RecordingInfo]) -> dict[str, dict]:
     return registry
 
 
-def load_dataset_manifest(task: str, base_dir: Optional[Path] = None) -> pd.DataFrame:
+def load_dataset_manifest(
+    task: str, base_dir: Optional[Path] = None, full_rescan: bool = False
+) -> pd.DataFrame:
     """
     Load dataset manifest as a DataFrame.
 
+    Reads the persisted manifest index (data/manifest_index.py), rescanning
+    only class directories that changed since the last call.
+
     Parameters
     ----------
     task : str
         Speech task: 'ReadText' or 'SpontaneousDialogue'.
     base_dir : Path, optional
         Base directory of MDVR-KCL dataset.
+    full_rescan : bool
+        List every directory even if unchanged (catches files rewritten in place).
 
     Returns
     -------
     pd.DataFrame
-        DataFrame with columns: filepath, filename, subject_id, label_str, label, task.
+        DataFrame with columns: filepath, filename, subject_id, label_str, label, task,
+        plus size, mtime_ns and duration (seconds) from the index.
     """
-    recordings = discover_recordings(task, base_dir)
-
-    data = [
-        {
-            "filepath": str(rec.filepath),
-            "filename": rec.filename,
-            "subject_id": rec.subject_id,
-            "label_str": rec.label_str,
-            "label": rec.label,
-            "task": rec.task,
-        }
-        for rec in recordings
-    ]
+    from parkinsons_voice_classification.data.manifest_index import load_manifest_index
 
-    return pd.DataFrame(data)
+    return load_manifest_index(task, base_dir, full_rescan)
 
 
 def get_subject_labels(manifest: pd.DataFrame) -> tuple[list[str], list[int]]:
@@ -263,7 +262,7 @@ def load_features(task: str) -> tuple:
     df = pd.read_csv(csv_path)
 
     # Metadata columns
-    meta_cols = ["subject_id", "label", "task", "filename"]
+    meta_cols = METADATA_COLUMNS
     feature_cols = [c for c in df.columns if c not in meta_cols]
 
     X = df[feature_cols].values
@@ -297,5 +296,5 @@ def get_feature_names(task: str) -> list[str]:
         )
 
     df = pd.read_csv(csv_path, nrows=0)
-    meta_cols = ["subject_id", "label", "task", "filename"]
+    meta_cols = METADATA_COLUMNS
     return [c for c in df.columns if c not in meta_cols]
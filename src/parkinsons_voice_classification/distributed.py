@@ -0,0 +1,548 @@
+"""
+Distributed Execution over a Shared Work Queue
+
+A single machine's pool caps extraction and cross-validation. This backend
+fans the same tasks out to any number of worker processes, on this host or on
+other hosts that share a filesystem, through a SQLite work queue file.
+
+- The coordinator (``DistributedExecutor.map``) writes one row per task and
+  waits for the results. Task arguments are pickled once per batch and
+  deduplicated by content hash, so e.g. the feature matrix shared by all
+  (model, fold) CV tasks is stored once.
+- Workers (``run_worker`` / ``pvc-worker``) claim tasks under a lease and
+  renew it while the task runs. A task whose lease expires (worker killed,
+  host lost) is claimed again by another worker.
+- A task that raises is retried until it has been attempted
+  WORK_QUEUE_MAX_ATTEMPTS times; after that the batch fails with the task's
+  traceback.
+- Results are returned in input order, as with parallel.AdaptiveExecutor,
+  so the backend never changes the output.
+
+Task functions must be module-level functions of this package (they are
+pickled by reference), and every host needs the same package version.
+Leases use wall-clock time, so host clocks must be roughly synchronized
+(well within WORK_QUEUE_LEASE_SECONDS). The queue file must live on a
+filesystem with working POSIX locks (a local disk, or NFS with locking).
+
+Usage (coordinator, with 4 local workers):
+    executor = DistributedExecutor("/shared/pvc_queue.sqlite", local_workers=4)
+    results = executor.map(fn, [(arg1, arg2), ...])
+
+Usage (additional workers, any host):
+    pvc-worker --queue /shared/pvc_queue.sqlite
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from pathlib import Path
+
+from tqdm import tqdm
+
+from parkinsons_voice_classification.config import (
+    WORK_QUEUE_LEASE_SECONDS,
+    WORK_QUEUE_MAX_ATTEMPTS,
+)
+from parkinsons_voice_classification.parallel import limit_worker_threads, thread_budget
+
+logger = logging.getLogger(__name__)
+
+# Task states
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+# Seconds between polls of the queue (coordinator and idle workers)
+_POLL_SECONDS = 0.2
+
+# Seconds to wait for the SQLite write lock before giving up
+_LOCK_TIMEOUT = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    batch TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (batch, digest)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    fn BLOB NOT NULL,
+    args TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_seconds REAL NOT NULL,
+    lease_expires REAL,
+    worker TEXT,
+    result BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+CREATE INDEX IF NOT EXISTS tasks_batch ON tasks (batch, position);
+"""
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    """Open the queue database (autocommit; transactions are explicit)."""
+    conn = sqlite3.connect(str(path), timeout=_LOCK_TIMEOUT, isolation_level=None)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class WorkQueue:
+    """
+    SQLite-backed task queue with lease-based claiming.
+
+    Parameters
+    ----------
+    path : str or Path
+        Queue database file, created if missing.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = _connect(self.path)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def submit(
+        self,
+        fn,
+        items: list,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+        lease_seconds: float = WORK_QUEUE_LEASE_SECONDS,
+    ) -> str:
+        """
+        Enqueue ``fn(*args)`` for every ``args`` tuple in ``items``.
+
+        Returns
+        -------
+        str
+            Batch identifier.
+        """
+        batch = uuid.uuid4().hex
+        fn_blob = pickle.dumps(fn)
+        blobs: dict[str, bytes] = {}
+        rows = []
+        for position, args in enumerate(items):
+            digests = []
+            for arg in args:
+                data = pickle.dumps(arg, protocol=pickle.HIGHEST_PROTOCOL)
+                digest = hashlib.sha1(data).hexdigest()
+                blobs.setdefault(digest, data)
+                digests.append(digest)
+            rows.append(
+                (batch, position, fn_blob, json.dumps(digests), max_attempts, lease_seconds)
+            )
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(
+                "INSERT INTO blobs (batch, digest, data) VALUES (?, ?, ?)",
+                [(batch, digest, data) for digest, data in blobs.items()],
+            )
+            self.conn.executemany(
+                "INSERT INTO tasks (batch, position, fn, args, max_attempts, lease_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return batch
+
+    def claim(self, worker: str) -> tuple[int, str, bytes, list[str], float] | None:
+        """
+        Claim the oldest pending task, or a running task whose lease expired.
+
+        Returns
+        -------
+        tuple or None
+            (task id, batch, pickled function, argument digests, lease
+            seconds), or None if no task is available.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Expired leases that have used up their attempts fail for good
+            self.conn.execute(
+                "UPDATE tasks SET status = ?, error = 'lease expired (worker lost)' "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, RUNNING, now),
+            )
+            row = self.conn.execute(
+                "SELECT id, batch, fn, args, lease_seconds FROM tasks "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, RUNNING, now),
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            task_id, batch, fn_blob, args, lease_seconds = row
+            self.conn.execute(
+                "UPDATE tasks SET status = ?, attempts = attempts + 1, worker = ?, "
+                "lease_expires = ? WHERE id = ?",
+                (RUNNING, worker, now + lease_seconds, task_id),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return task_id, batch, fn_blob, json.loads(args), lease_seconds
+
+    def load_blobs(self, batch: str, digests: list[str]) -> dict[str, bytes]:
+        """Return the pickled arguments of a batch, by digest."""
+        placeholders = ",".join("?" * len(digests))
+        rows = self.conn.execute(
+            f"SELECT digest, data FROM blobs WHERE batch = ? AND digest IN ({placeholders})",
+            (batch, *digests),
+        ).fetchall()
+        return dict(rows)
+
+    def renew(self, task_id: int, worker: str) -> bool:
+        """Extend the lease of a task held by ``worker``; False if it was lost."""
+        cursor = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ? + lease_seconds "
+            "WHERE id = ? AND worker = ? AND status = ?",
+            (time.time(), task_id, worker, RUNNING),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id: int, worker: str, result) -> bool:
+        """Store a task's result if ``worker`` still holds it; False if the lease was lost."""
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = ?, result = ?, lease_expires = NULL, error = NULL "
+            "WHERE id = ? AND worker = ? AND status = ?",
+            (
+                DONE,
+                pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                task_id,
+                worker,
+                RUNNING,
+            ),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id: int, worker: str, error: str) -> bool:
+        """
+        Record a failure of a task ``worker`` still holds: back to pending, or
+        failed after the last attempt. False if the lease was lost.
+        """
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts < max_attempts THEN ? ELSE ? END, "
+            "error = ?, lease_expires = NULL WHERE id = ? AND worker = ? AND status = ?",
+            (PENDING, FAILED, error, task_id, worker, RUNNING),
+        )
+        return cursor.rowcount == 1
+
+    def progress(self, batch: str) -> dict[str, int]:
+        """Number of tasks per state in a batch."""
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE batch = ? GROUP BY status", (batch,)
+        ).fetchall()
+        return dict(rows)
+
+    def active_leases(self, batch: str) -> int:
+        """Number of tasks of a batch held by a worker under an unexpired lease."""
+        (count,) = self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE batch = ? AND status = ? AND lease_expires >= ?",
+            (batch, RUNNING, time.time()),
+        ).fetchone()
+        return count
+
+    def first_error(self, batch: str) -> tuple[int, str] | None:
+        """(position, error) of the first failed task of a batch, if any."""
+        return self.conn.execute(
+            "SELECT position, error FROM tasks WHERE batch = ? AND status = ? "
+            "ORDER BY position LIMIT 1",
+            (batch, FAILED),
+        ).fetchone()
+
+    def results(self, batch: str) -> list:
+        """Unpickled results of a finished batch, in submission order."""
+        rows = self.conn.execute(
+            "SELECT result FROM tasks WHERE batch = ? ORDER BY position", (batch,)
+        ).fetchall()
+        return [pickle.loads(result) for (result,) in rows]
+
+    def delete(self, batch: str) -> None:
+        """Remove a batch's tasks and arguments."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.conn.execute("DELETE FROM tasks WHERE batch = ?", (batch,))
+        self.conn.execute("DELETE FROM blobs WHERE batch = ?", (batch,))
+        self.conn.execute("COMMIT")
+
+
+class _LeaseRenewer(threading.Thread):
+    """Background thread renewing a task's lease while it runs."""
+
+    def __init__(self, queue_path: Path, task_id: int, worker: str, interval: float):
+        super().__init__(daemon=True)
+        self.queue_path = queue_path
+        self.task_id = task_id
+        self.worker = worker
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        conn = WorkQueue(self.queue_path)  # SQLite connections are per thread
+        try:
+            while not self.stopped.wait(self.interval):
+                if not conn.renew(self.task_id, self.worker):
+                    logger.warning(f"Lost lease on task {self.task_id}")
+                    return
+        finally:
+            conn.close()
+
+
+def run_worker(
+    queue_path: str | Path,
+    worker_id: str | None = None,
+    idle_timeout: float | None = None,
+    max_tasks: int | None = None,
+    n_threads: int | None = None,
+    stop=None,
+) -> int:
+    """
+    Process tasks from a work queue until stopped.
+
+    Parameters
+    ----------
+    queue_path : str or Path
+        Queue database file (shared with the coordinator).
+    worker_id : str, optional
+        Name recorded on claimed tasks. Defaults to ``{hostname}-{pid}``.
+    idle_timeout : float, optional
+        Exit after this many seconds without work. None waits forever.
+    max_tasks : int, optional
+        Exit after this many tasks.
+    n_threads : int, optional
+        Cap on nested BLAS/OpenMP/numba threads (see parallel.limit_worker_threads).
+    stop : Event, optional
+        Exit once set (checked between tasks).
+
+    Returns
+    -------
+    int
+        Number of tasks processed.
+    """
+    worker = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    if n_threads is not None:
+        limit_worker_threads(n_threads)
+
+    queue = WorkQueue(queue_path)
+    blob_cache: dict[str, object] = {}
+    cache_batch = None
+    n_done = 0
+    idle_since = time.monotonic()
+    logger.info(f"Worker {worker} polling {queue_path}")
+
+    try:
+        while (max_tasks is None or n_done < max_tasks) and not (stop and stop.is_set()):
+            claimed = queue.claim(worker)
+            if claimed is None:
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    break
+                time.sleep(_POLL_SECONDS)
+                continue
+            task_id, batch, fn_blob, digests, lease_seconds = claimed
+
+            renewer = _LeaseRenewer(queue.path, task_id, worker, lease_seconds / 3)
+            renewer.start()
+            try:
+                # Arguments shared by the tasks of a batch are loaded once
+                if batch != cache_batch:
+                    blob_cache, cache_batch = {}, batch
+                missing = [d for d in set(digests) if d not in blob_cache]
+                if missing:
+                    for digest, data in queue.load_blobs(batch, missing).items():
+                        blob_cache[digest] = pickle.loads(data)
+
+                fn = pickle.loads(fn_blob)
+                result = fn(*(blob_cache[d] for d in digests))
+                error = None
+            except Exception:
+                error = traceback.format_exc()
+            finally:
+                renewer.stopped.set()
+                renewer.join()
+
+            if error is None:
+                stored = queue.complete(task_id, worker, result)
+            else:
+                logger.warning(f"Task {task_id} failed on {worker}")
+                stored = queue.fail(task_id, worker, error)
+            if not stored:
+                # Another worker claimed the task after our lease expired
+                logger.warning(f"Discarding outcome of task {task_id}: lease lost")
+            n_done += 1
+            idle_since = time.monotonic()
+    finally:
+        queue.close()
+
+    logger.info(f"Worker {worker} exiting after {n_done} tasks")
+    return n_done
+
+
+class DistributedExecutor:
+    """
+    Map tasks over a shared work queue; drop-in for parallel.AdaptiveExecutor.
+
+    Parameters
+    ----------
+    queue_path : str or Path
+        Queue database file on a filesystem shared with all workers.
+    local_workers : int
+        Worker processes to start on this host for the duration of each
+        ``map`` call (0 = rely on external ``pvc-worker`` processes only).
+    max_attempts : int
+        Attempts per task before the batch fails.
+    lease_seconds : float
+        Lease length; a worker that stops renewing for this long loses the task.
+    timeout : float, optional
+        Give up on a batch after this many seconds. None waits forever, as
+        long as some worker is alive: if every local worker has exited and no
+        other worker holds a task of the batch for ``lease_seconds``, the
+        batch fails.
+
+    Attributes
+    ----------
+    last_mode : str
+        Always 'distributed' (mirrors AdaptiveExecutor).
+    """
+
+    last_mode = "distributed"
+
+    def __init__(
+        self,
+        queue_path: str | Path,
+        local_workers: int = 0,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+        lease_seconds: float = WORK_QUEUE_LEASE_SECONDS,
+        timeout: float | None = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.queue_path = Path(queue_path)
+        self.local_workers = max(0, local_workers)
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.timeout = timeout
+
+    def _start_local_workers(self, n_tasks: int, context, stop) -> list:
+        n_workers = min(self.local_workers, n_tasks)
+        processes = []
+        for i in range(n_workers):
+            process = context.Process(
+                target=run_worker,
+                kwargs={
+                    "queue_path": str(self.queue_path),
+                    "worker_id": f"{socket.gethostname()}-local{i}-{uuid.uuid4().hex[:6]}",
+                    "n_threads": thread_budget(n_workers),
+                    "stop": stop,
+                },
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+        return processes
+
+    def map(self, fn, items: list, desc: str | None = None, sizes: list[int] | None = None) -> list:
+        """
+        Run ``fn(*args)`` for every ``args`` tuple in ``items`` on the queue's workers.
+
+        Parameters
+        ----------
+        fn : callable
+            Module-level (picklable) task function.
+        items : list[tuple]
+            Argument tuples, one per task.
+        desc : str, optional
+            Progress bar label (no progress bar if None).
+        sizes : list[int], optional
+            Ignored: workers claim tasks as they free up, so nothing is timed
+            up front. Accepted for AdaptiveExecutor's ``map`` interface.
+
+        Returns
+        -------
+        list
+            Results in ``items`` order.
+
+        Raises
+        ------
+        RuntimeError
+            If a task fails on its last attempt, all local workers died with
+            no other worker taking over, or the timeout passes.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        queue = WorkQueue(self.queue_path)
+        batch = queue.submit(fn, items, self.max_attempts, self.lease_seconds)
+        logger.info(f"Queued {len(items)} tasks (batch {batch[:8]}) in {self.queue_path}")
+        # spawn: workers must not inherit the coordinator's SQLite handle or threads
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        processes = self._start_local_workers(len(items), context, stop)
+        had_local_workers = bool(processes)
+
+        start = time.monotonic()
+        unattended_since = None  # When the last local worker was found dead
+        try:
+            with tqdm(total=len(items), desc=desc, disable=desc is None) as progress_bar:
+                while True:
+                    counts = queue.progress(batch)
+                    progress_bar.update(counts.get(DONE, 0) - progress_bar.n)
+                    if counts.get(FAILED):
+                        position, error = queue.first_error(batch)
+                        raise RuntimeError(
+                            f"Task {position} failed after {self.max_attempts} attempt(s):\n"
+                            f"{error}"
+                        )
+                    if counts.get(DONE, 0) == len(items):
+                        break
+                    for process in [p for p in processes if p.exitcode is not None]:
+                        logger.warning(f"Local worker exited with code {process.exitcode}")
+                        processes.remove(process)
+                    if had_local_workers and not processes:
+                        # Wait one lease for external workers to take over the
+                        # tasks the dead workers held, then give up
+                        if queue.active_leases(batch):
+                            unattended_since = None
+                        elif unattended_since is None:
+                            unattended_since = time.monotonic()
+                        elif time.monotonic() - unattended_since > self.lease_seconds:
+                            raise RuntimeError(
+                                "All local workers exited and no other worker took over "
+                                f"({counts.get(DONE, 0)}/{len(items)} tasks done)"
+                            )
+                    if self.timeout is not None and time.monotonic() - start > self.timeout:
+                        raise RuntimeError(
+                            f"Work queue batch timed out after {self.timeout:.0f} s "
+                            f"({counts.get(DONE, 0)}/{len(items)} tasks done)"
+                        )
+                    time.sleep(_POLL_SECONDS)
+            return queue.results(batch)
+        finally:
+            # Local workers finish their current task (of any batch) and exit
+            stop.set()
+            for process in processes:
+                process.join()
+            queue.delete(batch)
+            queue.close()
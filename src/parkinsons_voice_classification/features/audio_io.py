@@ -0,0 +1,54 @@
+"""
+Audio Decoding for the Extractors
+
+The extractors accept an audio *source* instead of only a file path:
+
+- a path to a WAV file (decoded by Praat / librosa from disk, as before),
+- an archive member path ``{archive}::{member}`` (data/archives.py), read
+  from the archive into memory,
+- the raw bytes of a WAV file, e.g. streamed from an archive shard.
+
+In-memory sources are decoded with soundfile. For PCM WAV this gives the same
+samples as Praat's and librosa's file readers, so features do not depend on
+where a recording is stored.
+"""
+
+import io
+from pathlib import Path
+
+import librosa
+import numpy as np
+import parselmouth
+import soundfile as sf
+
+from parkinsons_voice_classification.data.archives import read_archive_member, split_archive_path
+
+# Audio source accepted by the extractors
+AudioSource = str | Path | bytes
+
+
+def _resolve(source: AudioSource) -> str | bytes:
+    """File path (str) for plain files, file contents (bytes) otherwise."""
+    if isinstance(source, bytes):
+        return source
+    archive_member = split_archive_path(source)
+    if archive_member is not None:
+        return read_archive_member(*archive_member)
+    return str(source)
+
+
+def load_sound(source: AudioSource) -> parselmouth.Sound:
+    """Decode an audio source into a parselmouth Sound (all channels)."""
+    source = _resolve(source)
+    if isinstance(source, str):
+        return parselmouth.Sound(source)
+    samples, sample_rate = sf.read(io.BytesIO(source), dtype="float64", always_2d=True)
+    return parselmouth.Sound(np.ascontiguousarray(samples.T), sampling_frequency=sample_rate)
+
+
+def load_samples(source: AudioSource, sr: int) -> tuple[np.ndarray, int]:
+    """Decode an audio source as mono samples at ``sr`` (librosa.load)."""
+    source = _resolve(source)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return librosa.load(source, sr=sr)
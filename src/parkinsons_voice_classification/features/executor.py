@@ -0,0 +1,272 @@
+"""
+Persistent, Warmed Extraction Executor
+
+Every fresh loky pool pays the same start-up cost in each worker: importing
+librosa and parselmouth, first-call compilation in librosa's numba kernels,
+and building per-process DSP state (mel filterbanks, FFT plans). With one pool
+per ``run_extraction`` call, ``pvc-extract --task all`` pays it twice.
+
+The ExtractionExecutor wraps loky's reusable executor. It is created once per
+process (``get_extraction_executor``), and each worker is warmed by an
+initializer that runs one full extraction on a short synthetic recording. It
+is then shared by every batch extraction in the process (both tasks of
+``pvc-extract``, spectral sweeps, long-lived services).
+
+Single-file, in-process callers (the demo app) warm their own process with
+``warm_extraction_state()``.
+
+Stats:
+- warmup_seconds:        wall time of the last ``warm()`` (pool start + initializers)
+- worker_warmup_seconds: initializer time per worker PID
+- tasks_per_worker:      tasks run per worker PID over the executor's lifetime
+
+Usage:
+    executor = get_extraction_executor(jobs=8)
+    results = executor.map(fn, items)
+    print(executor.stats())
+"""
+
+import logging
+import os
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from joblib.externals.loky import get_reusable_executor
+from tqdm import tqdm
+
+from parkinsons_voice_classification.parallel import limit_worker_threads, thread_budget
+
+logger = logging.getLogger(__name__)
+
+# Worker-process state (set by the initializer)
+_WORKER_WARMUP_SECONDS: float | None = None
+
+# Upper bound on ExtractionExecutor.warm() (seconds)
+_WARM_TIMEOUT = 300.0
+
+# Process-wide shared executor (see get_extraction_executor)
+_shared_executor: "ExtractionExecutor | None" = None
+
+
+def _synthetic_recording(path: Path, sr: int = 22050, duration: float = 1.0) -> None:
+    """Write a short voiced-like test signal (harmonic 150 Hz tone with vibrato and noise)."""
+    import soundfile as sf
+
+    t = np.arange(int(sr * duration)) / sr
+    phase = 2 * np.pi * np.cumsum(150.0 + 5.0 * np.sin(2 * np.pi * 5.0 * t)) / sr
+    y = sum(np.sin(k * phase) / k for k in range(1, 6))
+    y += 0.01 * np.random.default_rng(0).standard_normal(len(t))
+    sf.write(path, (0.3 * y / np.abs(y).max()).astype(np.float32), sr)
+
+
+def warm_extraction_state(tier: str | None = None, prosodic_backend: str | None = None) -> float:
+    """
+    Warm the current process for feature extraction.
+
+    Imports the extractors and runs one full extraction on a short synthetic
+    recording, so the first real file does not pay for imports, numba
+    compilation or DSP set-up.
+
+    Parameters
+    ----------
+    tier : str, optional
+        Praat extraction quality tier. Defaults to EXTRACTION_TIER from config.
+    prosodic_backend : str, optional
+        'praat' or 'numpy'. Defaults to PROSODIC_BACKEND from config.
+
+    Returns
+    -------
+    float
+        Warm-up time in seconds.
+    """
+    start = time.perf_counter()
+
+    from parkinsons_voice_classification.features.extraction_simple import extract_all_features
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "warmup.wav"
+        _synthetic_recording(path)
+        extract_all_features(str(path), tier=tier, prosodic_backend=prosodic_backend)
+
+    return time.perf_counter() - start
+
+
+def _initialize_worker(tier: str | None, prosodic_backend: str | None, n_threads: int) -> None:
+    """loky initializer: cap nested threads, warm the worker and record how long it took."""
+    global _WORKER_WARMUP_SECONDS
+    limit_worker_threads(n_threads)
+    try:
+        _WORKER_WARMUP_SECONDS = warm_extraction_state(tier, prosodic_backend)
+    except Exception as e:  # A failed warm-up must not kill the worker
+        logger.warning(f"Worker warm-up failed: {e}")
+        _WORKER_WARMUP_SECONDS = float("nan")
+
+
+def _run_task(fn, args: tuple) -> tuple[int, float | None, object]:
+    """Run one task in a worker; report the worker PID and its warm-up time."""
+    return os.getpid(), _WORKER_WARMUP_SECONDS, fn(*args)
+
+
+class ExtractionExecutor:
+    """
+    Reusable, warmed process pool for feature extraction.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker processes.
+    tier : str, optional
+        Extraction tier used for the warm-up run.
+    prosodic_backend : str, optional
+        Prosodic backend used for the warm-up run.
+
+    Attributes
+    ----------
+    threads_per_worker : int
+        Nested BLAS/OpenMP/numba thread budget of each worker
+        (``parallel.thread_budget``).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        tier: str | None = None,
+        prosodic_backend: str | None = None,
+    ):
+        self.max_workers = max_workers
+        self.tier = tier
+        self.prosodic_backend = prosodic_backend
+        self.threads_per_worker = thread_budget(max_workers)
+        self.warmup_seconds: float | None = None
+        self.worker_warmup_seconds: dict[int, float] = {}
+        self.tasks_per_worker: Counter = Counter()
+        self._pool = None
+
+    def _executor(self):
+        # loky returns the same pool while the arguments are unchanged, and
+        # transparently restarts it if workers died. reuse="auto" never adopts
+        # a pool started with other arguments (e.g. by joblib); it is replaced.
+        executor = get_reusable_executor(
+            max_workers=self.max_workers,
+            initializer=_initialize_worker,
+            initargs=(self.tier, self.prosodic_backend, self.threads_per_worker),
+            reuse="auto",
+        )
+        if executor is not self._pool:
+            # New workers: the old warm-up times no longer describe the pool
+            self._pool = executor
+            self.worker_warmup_seconds = {}
+        return executor
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether workers have been started and warmed."""
+        return (
+            self._pool is not None
+            and bool(self.worker_warmup_seconds)
+            and not (self._pool._flags.broken or self._pool._flags.shutdown)
+        )
+
+    def warm(self) -> float:
+        """
+        Start and warm all workers now rather than on first use.
+
+        Returns
+        -------
+        float
+            Wall time in seconds until every worker has finished warming.
+        """
+        start = time.perf_counter()
+        executor = self._executor()
+        # A task only runs on an initialized worker: submit rounds of short
+        # no-op tasks until every worker has reported (or the timeout passes)
+        seen: set[int] = set()
+        while len(seen) < self.max_workers and time.perf_counter() - start < _WARM_TIMEOUT:
+            futures = [
+                executor.submit(_run_task, time.sleep, (0.05,)) for _ in range(self.max_workers)
+            ]
+            for future in futures:
+                pid, warmup, _ = future.result()
+                seen.add(pid)
+                if warmup is not None:
+                    self.worker_warmup_seconds[pid] = warmup
+        self.warmup_seconds = time.perf_counter() - start
+        logger.info(f"Warmed {self.max_workers} extraction workers in {self.warmup_seconds:.1f} s")
+        return self.warmup_seconds
+
+    def map(self, fn, items: list, desc: str | None = None) -> list:
+        """
+        Run ``fn(*args)`` for every ``args`` tuple in ``items``, preserving order.
+
+        Parameters
+        ----------
+        fn : callable
+            Module-level (picklable) function.
+        items : list[tuple]
+            Argument tuples, one per task.
+        desc : str, optional
+            Progress bar label (no progress bar if None).
+
+        Returns
+        -------
+        list
+            Results in ``items`` order.
+        """
+        executor = self._executor()
+        futures = [executor.submit(_run_task, fn, args) for args in items]
+
+        results = []
+        for future in tqdm(futures, desc=desc, disable=desc is None):
+            pid, warmup, result = future.result()
+            self.tasks_per_worker[pid] += 1
+            if warmup is not None:
+                self.worker_warmup_seconds[pid] = warmup
+            results.append(result)
+        return results
+
+    def stats(self) -> dict:
+        """Pool warm-up time, per-worker warm-up times and task counts."""
+        return {
+            "max_workers": self.max_workers,
+            "threads_per_worker": self.threads_per_worker,
+            "warmup_seconds": self.warmup_seconds,
+            "worker_warmup_seconds": dict(self.worker_warmup_seconds),
+            "tasks_per_worker": dict(self.tasks_per_worker),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self.worker_warmup_seconds = {}
+
+
+def get_extraction_executor(
+    jobs: int,
+    tier: str | None = None,
+    prosodic_backend: str | None = None,
+) -> ExtractionExecutor:
+    """
+    Return the process-wide extraction executor, creating it on first use.
+
+    Parameters
+    ----------
+    jobs : int
+        Number of worker processes. A different value replaces the executor.
+    tier, prosodic_backend : str, optional
+        Settings for the warm-up run when the executor is created. Workers
+        serve any tier or backend, so later values do not restart the pool.
+
+    Returns
+    -------
+    ExtractionExecutor
+        The shared executor. Its stats accumulate across calls.
+    """
+    global _shared_executor
+    if _shared_executor is None or _shared_executor.max_workers != jobs:
+        _shared_executor = ExtractionExecutor(jobs, tier, prosodic_backend)
+    return _shared_executor
@@ -6,32 +6,82 @@ Total: 47 features per WAV file.
 
 Usage:
     from thesis.features.extraction_simple import extract_all_features, run_extraction
-    
+
     # Single file
     features = extract_all_features("path/to/audio.wav")
-    
+
+    # Subset (only the analyses these features need are run)
+    features = extract_all_features("path/to/audio.wav", ["f0_mean", "mfcc_0_mean"])
+
     # Full dataset
     run_extraction("ReadText", "outputs/features/features_readtext.csv")
+
+    # Batch of files into one (n_files, n_features) array
+    batch = extract_feature_batch(manifest.to_dict("records"))
+    batch.X  # columns in get_all_feature_names() order
+
+Each feature CSV is accompanied by a ``*_metadata.json`` sidecar recording the
+feature set, extraction tier, prosodic backend and VAD mode, so downstream consumers can detect
+mismatches. With VAD_MODE != "off" the CSV gains a ``speech_ratio`` metadata
+column (see features/segmentation.py). With ``save_frames`` the frame-level
+tracks are written to a frame store for later re-aggregation
+(see features/frame_store.py).
+
+Recordings stored in zip/tar shards (data/archives.py) are extracted without
+unpacking: extract_feature_batch() runs one task per shard, which streams the
+shard in a single sequential read and decodes each member from memory.
+
+Batch paths (run_extraction, run_inference) use the array-native API:
+extract_features_into() writes one file's features into a preallocated row
+in plan order, and extract_feature_batch() fills an (n_files, n_features)
+array with the metadata in parallel arrays (FeatureBatch), so no per-file
+dicts or DataFrames are assembled.
 """
 
+import json
 import logging
-import os
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
-from tqdm import tqdm
 
 from parkinsons_voice_classification.features.prosodic_simple import (
     extract_prosodic_features,
+    get_prosodic_backend,
     get_prosodic_feature_names,
 )
 from parkinsons_voice_classification.features.spectral_simple import (
     extract_spectral_features,
     get_spectral_feature_names,
 )
+from parkinsons_voice_classification.features.executor import get_extraction_executor
+from parkinsons_voice_classification.features.frame_store import (
+    get_frame_store_dir,
+    write_frame_store,
+)
+from parkinsons_voice_classification.features.audio_io import AudioSource
+from parkinsons_voice_classification.features.plan import FeaturePlan, build_feature_plan
+from parkinsons_voice_classification.features.segmentation import (
+    SpeechSegments,
+    get_vad_mode,
+    segment_file,
+)
+from parkinsons_voice_classification.features.tiers import DEFAULT_TIER, get_extraction_tier
+from parkinsons_voice_classification.data.archives import (
+    iter_archive_members,
+    load_archive_manifest,
+    split_archive_path,
+)
 from parkinsons_voice_classification.data.mdvr_kcl import build_manifest
-from parkinsons_voice_classification.config import get_features_output_dir, USE_EXTENDED_FEATURES
+from parkinsons_voice_classification.parallel import default_jobs, get_executor
+from parkinsons_voice_classification.config import (
+    get_features_output_dir,
+    USE_EXTENDED_FEATURES,
+    METADATA_COLUMNS,
+    SAVE_FRAME_TRACKS,
+)
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -42,61 +92,424 @@ def get_all_feature_names() -> list[str]:
     return get_prosodic_feature_names() + get_spectral_feature_names()
 
 
-def extract_all_features(audio_path: str) -> dict:
+def extract_all_features(
+    audio_path: AudioSource,
+    feature_names: list[str] | None = None,
+    tier: str | None = None,
+    segments: SpeechSegments | None = None,
+    prosodic_backend: str | None = None,
+    tracks: dict | None = None,
+) -> dict:
     """
-    Extract all features from a single audio file.
+    Extract features from a single audio file.
 
     Parameters
     ----------
     audio_path : str
-        Path to WAV file.
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+    feature_names : list[str], optional
+        Subset of features to compute, in output order. Only the Praat and
+        librosa analyses these features depend on are run. Defaults to all
+        features (47 baseline or 78 extended).
+    tier : str, optional
+        Praat extraction quality tier. Defaults to EXTRACTION_TIER from config.
+    segments : SpeechSegments, optional
+        Speech intervals shared by the prosodic and spectral extractors; pauses
+        are removed before analysis. Defaults to analysing the full recording.
+    prosodic_backend : str, optional
+        'praat' or 'numpy' for pitch, harmonicity and intensity. Defaults to
+        PROSODIC_BACKEND from config.
+    tracks : dict, optional
+        If given, filled with the frame-level tracks of the analyses that ran,
+        as (times, values) pairs keyed by track name (see features/frame_store.py).
 
     Returns
     -------
     dict
-        Dictionary with 47 features.
+        Dictionary with the requested features, in the requested order.
+        Features the current configuration does not produce (e.g. extended
+        spectral features while USE_EXTENDED_FEATURES is False) are absent.
     """
+    plan = build_feature_plan(feature_names)
+    features = _run_extractors(audio_path, plan, tier, segments, prosodic_backend, tracks)
+    return {name: features[name] for name in plan.feature_names if name in features}
+
+
+def extract_features_into(
+    audio_path: AudioSource,
+    out: np.ndarray,
+    plan: FeaturePlan | None = None,
+    tier: str | None = None,
+    segments: SpeechSegments | None = None,
+    prosodic_backend: str | None = None,
+    tracks: dict | None = None,
+) -> np.ndarray:
+    """
+    Extract features from a single audio file into a preallocated row.
+
+    Parameters
+    ----------
+    audio_path : str
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+    out : np.ndarray
+        Row to fill, shape (len(plan.feature_names),), typically ``X[i]`` of a
+        batch array. Written in ``plan.feature_names`` order.
+    plan : FeaturePlan, optional
+        Features to compute. Defaults to the full feature set, i.e. the
+        ``get_all_feature_names()`` order.
+    tier, segments, prosodic_backend, tracks
+        As in extract_all_features.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, True for the columns the extractors produced. Columns
+        the current configuration does not produce are left NaN.
+    """
+    if plan is None:
+        plan = build_feature_plan()
+    if out.shape != (len(plan.feature_names),):
+        raise ValueError(
+            f"Output row has shape {out.shape}, plan has {len(plan.feature_names)} features"
+        )
+
+    features = _run_extractors(audio_path, plan, tier, segments, prosodic_backend, tracks)
+
+    produced = np.zeros(len(plan.feature_names), dtype=bool)
+    for j, name in enumerate(plan.feature_names):
+        value = features.get(name)
+        if value is None:
+            out[j] = np.nan
+        else:
+            out[j] = value
+            produced[j] = True
+    return produced
+
+
+def _run_extractors(
+    audio_path: AudioSource,
+    plan: FeaturePlan,
+    tier: str | None,
+    segments: SpeechSegments | None,
+    prosodic_backend: str | None,
+    tracks: dict | None,
+) -> dict:
+    """Run the prosodic and spectral extractors a plan needs (unordered)."""
     features = {}
 
     # Prosodic features (21)
-    prosodic = extract_prosodic_features(audio_path)
-    features.update(prosodic)
-
-    # Spectral features (26)
-    spectral = extract_spectral_features(audio_path)
-    features.update(spectral)
+    if plan.praat_analyses:
+        prosodic = extract_prosodic_features(
+            audio_path,
+            analyses=plan.praat_analyses,
+            tier=tier,
+            segments=segments,
+            backend=prosodic_backend,
+            tracks=tracks,
+        )
+        features.update(prosodic)
+
+    # Spectral features (26 or 57)
+    if plan.librosa_analyses:
+        spectral = extract_spectral_features(
+            audio_path, analyses=plan.librosa_analyses, segments=segments, tracks=tracks
+        )
+        features.update(spectral)
 
     return features
 
 
-def _extract_single_file(row: dict) -> dict | None:
+@dataclass
+class FeatureBatch:
+    """
+    Features of a batch of recordings as one array plus parallel metadata.
+
+    Attributes
+    ----------
+    X : np.ndarray
+        Feature matrix, shape (n_files, n_features), columns in
+        ``feature_names`` order.
+    feature_names : tuple[str, ...]
+        Column names of ``X``.
+    metadata : dict[str, np.ndarray]
+        Per-file metadata arrays of length n_files, keyed by column name
+        ('subject_id', 'label', 'task', 'filename' and, with VAD,
+        'speech_ratio'), in METADATA_COLUMNS order.
+    tracks : list[dict] or None
+        Frame-level tracks per file (``save_frames`` only).
+    """
+
+    X: np.ndarray
+    feature_names: tuple[str, ...]
+    metadata: dict[str, np.ndarray]
+    tracks: list[dict] | None = None
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a DataFrame with the metadata columns first, then the features."""
+        frame = pd.DataFrame(self.X, columns=list(self.feature_names))
+        meta = pd.DataFrame(self.metadata)
+        return pd.concat([meta, frame], axis=1)
+
+
+def _extract_single_file(
+    row: dict,
+    plan: FeaturePlan,
+    tier: str | None = None,
+    vad_mode: str = "off",
+    prosodic_backend: str | None = None,
+    save_frames: bool = False,
+    dtype: type = np.float64,
+    audio: bytes | None = None,
+) -> tuple[np.ndarray, float, dict | None] | None:
     """
     Worker function to extract features from a single audio file.
 
     Parameters
     ----------
     row : dict
-        Manifest row with 'filepath', 'subject_id', 'label', 'task', 'filename'.
+        Manifest row with 'filepath' and 'filename'.
+    plan : FeaturePlan
+        Features to compute, in column order.
+    tier : str, optional
+        Praat extraction quality tier.
+    vad_mode : str
+        Segmentation mode: 'off', 'measure' (record speech_ratio) or 'trim'
+        (record speech_ratio and analyse speech only).
+    prosodic_backend : str, optional
+        'praat' or 'numpy' for pitch, harmonicity and intensity.
+    save_frames : bool
+        If True, also collect the frame-level tracks.
+    dtype : type
+        Feature row dtype.
+    audio : bytes, optional
+        File contents already in memory (archive streaming); decoded instead
+        of reading ``row['filepath']``.
 
     Returns
     -------
-    dict or None
-        Feature dictionary with metadata, or None if extraction failed.
+    tuple[np.ndarray, float, dict or None] or None
+        Feature row, speech ratio (NaN without VAD) and the frame tracks
+        (None unless ``save_frames``), or None if extraction failed.
     """
     try:
-        features = extract_all_features(str(row["filepath"]))
-        features["subject_id"] = row["subject_id"]
-        features["label"] = row["label"]
-        features["task"] = row["task"]
-        features["filename"] = row["filename"]
-        return features
+        source = str(row["filepath"]) if audio is None else audio
+        tracks = {} if save_frames else None
+        segments = None
+        if vad_mode != "off":
+            segments = segment_file(source)
+
+        values = np.empty(len(plan.feature_names), dtype=dtype)
+        extract_features_into(
+            source,
+            values,
+            plan,
+            tier=tier,
+            segments=segments if vad_mode == "trim" else None,
+            prosodic_backend=prosodic_backend,
+            tracks=tracks,
+        )
+        speech_ratio = segments.speech_ratio if segments is not None else np.nan
+        return values, speech_ratio, tracks
     except Exception as e:
         logger.warning(f"Failed to extract features from {row['filename']}: {e}")
         return None
 
 
+def _extract_archive_shard(archive: str, rows: list[dict], *args) -> list:
+    """
+    Worker function: stream one archive shard and extract the requested members.
+
+    The shard is read once, front to back; each member is decoded from memory.
+    ``args`` are passed on to _extract_single_file.
+
+    Returns
+    -------
+    list
+        One _extract_single_file result per row (None for failed or missing members).
+    """
+    positions = {split_archive_path(row["filepath"])[1]: i for i, row in enumerate(rows)}
+    results = [None] * len(rows)
+    try:
+        for member, data in iter_archive_members(archive, set(positions)):
+            i = positions[member]
+            results[i] = _extract_single_file(rows[i], *args, audio=data)
+    except Exception as e:
+        logger.warning(f"Failed to read archive {archive}: {e}")
+    return results
+
+
+def _extract_group(rows: list[dict], *args) -> list:
+    """Worker function: one plain file, or all requested members of one archive shard."""
+    archive_member = split_archive_path(rows[0]["filepath"])
+    if archive_member is None:
+        return [_extract_single_file(rows[0], *args)]
+    return _extract_archive_shard(archive_member[0], rows, *args)
+
+
+def _group_by_source(rows: list[dict]) -> list[list[int]]:
+    """
+    Row indices per extraction task: one per plain file, one per archive shard.
+
+    The first archive member gets a task of its own, so that when only shards
+    are given, AdaptiveExecutor times one recording in-process rather than a
+    whole shard (its remaining members stay one task).
+    """
+    groups, shards = [], {}
+    for i, row in enumerate(rows):
+        archive_member = split_archive_path(row["filepath"])
+        if archive_member is None:
+            groups.append([i])
+        elif archive_member[0] in shards:
+            shards[archive_member[0]].append(i)
+        else:
+            shards[archive_member[0]] = [i]
+            groups.append(shards[archive_member[0]])
+    for position, group in enumerate(groups):
+        if len(group) > 1:
+            groups[position : position + 1] = [group[:1], group[1:]]
+            break
+    return groups
+
+
+def extract_feature_batch(
+    rows: list[dict],
+    feature_names: list[str] | None = None,
+    jobs: int | None = None,
+    tier: str | None = None,
+    vad_mode: str = "off",
+    prosodic_backend: str | None = None,
+    save_frames: bool = False,
+    dtype: type = np.float64,
+    desc: str | None = None,
+    queue: str | None = None,
+) -> FeatureBatch:
+    """
+    Extract features for a batch of recordings into one preallocated array.
+
+    Parameters
+    ----------
+    rows : list[dict]
+        Manifest rows with 'filepath', 'subject_id', 'label', 'task', 'filename'.
+        Rows whose 'filepath' is an archive member (data/archives.py) are
+        grouped into one task per shard, which reads the shard sequentially.
+    feature_names : list[str], optional
+        Features to compute, in column order. Defaults to get_all_feature_names().
+    jobs : int, optional
+        Maximum number of workers. Defaults to ``parallel.default_jobs()``.
+        The batch runs serially in-process if that is estimated to be faster
+        (parallel.AdaptiveExecutor), else on the shared, warmed extraction
+        pool (features/executor.py). 1 always runs in-process.
+    tier : str, optional
+        Praat extraction quality tier.
+    vad_mode : str
+        Segmentation mode ('off', 'measure', 'trim').
+    prosodic_backend : str, optional
+        'praat' or 'numpy' for pitch, harmonicity and intensity.
+    save_frames : bool
+        If True, also collect the frame-level tracks.
+    dtype : type
+        Dtype of the feature matrix (np.float64 or np.float32).
+    desc : str, optional
+        Progress bar label.
+    queue : str, optional
+        Shared work queue file (distributed.py); the batch then runs on the
+        queue's workers, ``jobs`` of them started locally. Defaults to
+        WORK_QUEUE_PATH from config (None = local execution only).
+
+    Returns
+    -------
+    FeatureBatch
+        Rows in ``rows`` order; failed files are dropped (with a warning).
+    """
+    plan = build_feature_plan(feature_names)
+    X = np.full((len(rows), len(plan.feature_names)), np.nan, dtype=dtype)
+    speech_ratio = np.full(len(rows), np.nan)
+    ok = np.zeros(len(rows), dtype=bool)
+    file_tracks = [None] * len(rows)
+
+    # One task per plain file or archive shard; serial for tiny/cheap batches,
+    # else the shared warmed process pool (or the work queue)
+    groups = _group_by_source(rows)
+    tasks = [
+        ([rows[i] for i in group], plan, tier, vad_mode, prosodic_backend, save_frames, dtype)
+        for group in groups
+    ]
+    jobs = default_jobs(len(groups)) if jobs is None else jobs
+    process_pool = get_extraction_executor(jobs, tier, prosodic_backend) if jobs > 1 else None
+    executor = get_executor(jobs, process_pool=process_pool, queue=queue)
+    sizes = [len(group) for group in groups]
+    for group, results in zip(groups, executor.map(_extract_group, tasks, desc, sizes)):
+        for i, result in zip(group, results):
+            if result is not None:
+                X[i], speech_ratio[i], file_tracks[i] = result
+                ok[i] = True
+
+    if not ok.all():
+        logger.warning(f"Failed to extract {int((~ok).sum())} files")
+
+    metadata = {}
+    for column in METADATA_COLUMNS:
+        if column == "speech_ratio":
+            if vad_mode != "off":
+                metadata[column] = speech_ratio[ok]
+        else:
+            metadata[column] = np.array([row[column] for row in rows])[ok]
+
+    return FeatureBatch(
+        X=X[ok],
+        feature_names=plan.feature_names,
+        metadata=metadata,
+        tracks=[t for t, keep in zip(file_tracks, ok) if keep] if save_frames else None,
+    )
+
+
+def get_feature_metadata_path(features_path: str | Path) -> Path:
+    """Return the metadata sidecar path for a feature CSV."""
+    features_path = Path(features_path)
+    return features_path.with_name(f"{features_path.stem}_metadata.json")
+
+
+def load_feature_metadata(features_path: str | Path) -> dict:
+    """
+    Load the metadata sidecar of a feature CSV.
+
+    Parameters
+    ----------
+    features_path : str or Path
+        Path to the feature CSV.
+
+    Returns
+    -------
+    dict
+        Feature-store metadata. Feature files written before tiers were
+        recorded have no sidecar and report the default ('accurate') tier,
+        the 'praat' backend and VAD mode 'off'.
+    """
+    metadata_path = get_feature_metadata_path(features_path)
+    if not metadata_path.exists():
+        return {"extraction_tier": DEFAULT_TIER, "prosodic_backend": "praat", "vad_mode": "off"}
+
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata.setdefault("extraction_tier", DEFAULT_TIER)
+    metadata.setdefault("prosodic_backend", "praat")
+    metadata.setdefault("vad_mode", "off")
+    return metadata
+
+
 def run_extraction(
-    task: str, output_path: str | None = None, jobs: int | None = None
+    task: str,
+    output_path: str | None = None,
+    jobs: int | None = None,
+    tier: str | None = None,
+    vad_mode: str | None = None,
+    prosodic_backend: str | None = None,
+    save_frames: bool | None = None,
+    queue: str | None = None,
+    archives: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Run feature extraction for a speech task.
@@ -108,45 +521,67 @@ def run_extraction(
     output_path : str, optional
         Path to save CSV. If None, saves to default location.
     jobs : int, optional
-        Number of parallel workers. Defaults to min(8, cpu_count - 1).
+        Number of parallel workers. Defaults to ``parallel.default_jobs()``
+        (cgroup-aware CPU count minus one, capped by MAX_WORKERS).
+    tier : str, optional
+        Praat extraction quality tier. Defaults to EXTRACTION_TIER from config.
+    vad_mode : str, optional
+        Segmentation mode ('off', 'measure', 'trim'). Defaults to VAD_MODE
+        from config.
+    prosodic_backend : str, optional
+        'praat' or 'numpy' for pitch, harmonicity and intensity. Defaults to
+        PROSODIC_BACKEND from config.
+    save_frames : bool, optional
+        Also write the frame-level tracks to outputs/frames/{task}/.
+        Defaults to SAVE_FRAME_TRACKS from config.
+    queue : str, optional
+        Shared work queue file for multi-host extraction (see distributed.py).
+        Defaults to WORK_QUEUE_PATH from config.
+    archives : list[str], optional
+        Zip/tar shards to read the recordings from, without unpacking (see
+        data/archives.py). Defaults to the MDVR-KCL directory.
 
     Returns
     -------
     pd.DataFrame
         DataFrame with features and metadata.
     """
+    tier = get_extraction_tier(tier).name
+    vad_mode = get_vad_mode(vad_mode)
+    prosodic_backend = get_prosodic_backend(prosodic_backend)
+    if save_frames is None:
+        save_frames = SAVE_FRAME_TRACKS
+
     # Determine number of parallel workers
     if jobs is None:
-        cpu_count = os.cpu_count() or 4
-        jobs = min(8, max(1, cpu_count - 1))
-    logger.info(f"Using {jobs} parallel workers")
+        jobs = default_jobs()
+    logger.info(
+        f"Using {jobs} parallel workers "
+        f"(extraction tier: {tier}, prosodic backend: {prosodic_backend}, VAD: {vad_mode})"
+    )
 
-    # Build manifest
-    manifest = build_manifest(task)
+    # Build manifest, sorted deterministically by filename for reproducibility
+    manifest = load_archive_manifest(task, archives) if archives else build_manifest(task)
     logger.info(f"Found {len(manifest)} recordings for task: {task}")
-
-    # Convert manifest rows to list of dicts for parallel processing
-    manifest_rows = manifest.to_dict("records")
-
-    # Extract features in parallel with progress bar
-    results = Parallel(n_jobs=jobs, backend="loky")(
-        delayed(_extract_single_file)(row) for row in tqdm(manifest_rows, desc=f"Extracting {task}")
+    manifest_rows = manifest.sort_values("filename").to_dict("records")
+
+    # Extract features in parallel into one (n_files, n_features) array
+    batch = extract_feature_batch(
+        manifest_rows,
+        jobs=jobs,
+        tier=tier,
+        vad_mode=vad_mode,
+        prosodic_backend=prosodic_backend,
+        save_frames=save_frames,
+        desc=f"Extracting {task}",
+        queue=queue,
     )
+    feature_cols = list(batch.feature_names)
 
-    # Filter out failed extractions (None values)
-    rows = [r for r in results if r is not None]
-
-    if len(rows) < len(manifest_rows):
-        logger.warning(f"Failed to extract {len(manifest_rows) - len(rows)} files")
-
-    # Create DataFrame and sort deterministically by filename for reproducibility
-    df = pd.DataFrame(rows)
-    df = df.sort_values("filename").reset_index(drop=True)
-
-    # Reorder columns: metadata first, then features
-    meta_cols = ["subject_id", "label", "task", "filename"]
-    feature_cols = get_all_feature_names()
-    df = df[meta_cols + feature_cols]
+    # Metadata first, then features; librosa features are float32, store them as such
+    df = batch.to_frame()
+    spectral_cols = [c for c in get_spectral_feature_names() if c in df.columns]
+    df[spectral_cols] = df[spectral_cols].astype(np.float32)
 
     # Save to CSV
     if output_path is None:
@@ -159,8 +594,39 @@ def run_extraction(
 
     df.to_csv(output_path_obj, index=False)
     logger.info(f"Saved features to: {output_path_obj}")
+
+    # Feature-store metadata sidecar (checked by pvc-train and inference)
+    metadata = {
+        "task": task,
+        "feature_set": "extended" if USE_EXTENDED_FEATURES else "baseline",
+        "extraction_tier": tier,
+        "prosodic_backend": prosodic_backend,
+        "vad_mode": vad_mode,
+        "mean_speech_ratio": (
+            float(df["speech_ratio"].mean()) if "speech_ratio" in df.columns else None
+        ),
+        "feature_count": len(feature_cols),
+        "feature_names": feature_cols,
+        "n_recordings": len(df),
+        "extracted_at": datetime.now().isoformat(),
+    }
+    with open(get_feature_metadata_path(output_path_obj), "w") as f:
+        json.dump(metadata, f, indent=2)
     logger.info(f"Shape: {df.shape} (rows × columns)")
 
+    # Frame-level tracks, in the same (filename) order as the CSV
+    if save_frames:
+        store_dir = write_frame_store(
+            get_frame_store_dir(task),
+            df["filename"].tolist(),
+            batch.tracks,
+            metadata={
+                key: metadata[key]
+                for key in ("task", "extraction_tier", "prosodic_backend", "vad_mode")
+            },
+        )
+        logger.info(f"Saved frame tracks to: {store_dir}")
+
     return df
 
 
@@ -0,0 +1,331 @@
+"""
+Frame-Level Track Store and Aggregation Engine
+
+The per-file feature CSVs keep only aggregates (means, std, min/max); the
+frame-level tracks behind them are discarded. With SAVE_FRAME_TRACKS enabled
+(or ``pvc-extract --save-frames``), extraction also persists these tracks so
+new aggregates (median, percentiles, voiced-only statistics) can be computed
+without re-running any DSP.
+
+Tracks (times in seconds, values float32):
+- f0:        F0 per pitch frame (Hz, 0 where unvoiced)
+- intensity: Intensity per frame (dB)
+- hnr:       Harmonics-to-noise ratio per frame (dB, NaN where unvoiced)
+- formants:  F1-F3 per formant frame (Hz, NaN where undefined)
+- mfcc:      MFCC 0-12 per STFT frame
+
+Layout (outputs/frames/{task}/):
+- {track}.npy        All files' frames concatenated, shape (n_frames_total, n_columns)
+- {track}_times.npy  Frame times, shape (n_frames_total,)
+- index.json         File order, per-track row offsets, column names, extraction settings
+
+Each file's frames form one contiguous chunk, and the arrays are plain
+``.npy`` files opened with ``mmap_mode="r"``, so reading one file or one
+track touches only those bytes. The store is not compressed, because
+compression would prevent memory mapping; float32 halves its size instead.
+
+Usage:
+    store = FrameStore(get_frame_store_dir("ReadText"))
+    df = aggregate_tracks(store, "f0", stats=["median", "p10", "p90"])
+    df = aggregate_tracks(store, "mfcc", stats=["mean"], voiced_only=True)
+"""
+
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from parkinsons_voice_classification.config import FRAME_STORE_DIR, MFCC_N_COEFFS
+
+TRACK_COLUMNS: dict[str, list[str]] = {
+    "f0": ["f0"],
+    "intensity": ["intensity"],
+    "hnr": ["hnr"],
+    "formants": ["f1", "f2", "f3"],
+    "mfcc": [f"mfcc_{i}" for i in range(MFCC_N_COEFFS)],
+}
+
+_PERCENTILE = re.compile(r"^p(\d{1,2}|100)$")
+_QUANTILES = {"median": 50.0, "min": 0.0, "max": 100.0}
+_STATS = {"mean", "std"} | set(_QUANTILES)
+
+
+def get_frame_store_dir(task: str) -> Path:
+    """Return the frame store directory for a speech task."""
+    return FRAME_STORE_DIR / task.lower()
+
+
+def write_frame_store(
+    store_dir: str | Path,
+    filenames: list[str],
+    file_tracks: list[dict],
+    metadata: dict | None = None,
+) -> Path:
+    """
+    Write per-file frame tracks to a frame store.
+
+    Parameters
+    ----------
+    store_dir : str or Path
+        Output directory (created if needed; existing tracks are replaced).
+    filenames : list[str]
+        Recording filenames, in store order.
+    file_tracks : list[dict]
+        For each file, a dict mapping track name to a (times, values) pair,
+        as filled by the extractors' ``tracks`` argument. Missing tracks are
+        stored as zero frames for that file.
+    metadata : dict, optional
+        Extraction settings recorded in the index (tier, backend, VAD mode).
+
+    Returns
+    -------
+    Path
+        The store directory.
+    """
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    offsets = {}
+    for track, columns in TRACK_COLUMNS.items():
+        times_chunks, value_chunks = [], []
+        for tracks in file_tracks:
+            times, values = tracks.get(track, (np.empty(0), np.empty((0, len(columns)))))
+            times_chunks.append(np.asarray(times, dtype=np.float32))
+            # Explicit column count: a zero-frame track cannot infer it from -1
+            values = np.asarray(values, dtype=np.float32).reshape(len(times), len(columns))
+            value_chunks.append(values)
+
+        np.save(store_dir / f"{track}.npy", np.concatenate(value_chunks))
+        np.save(store_dir / f"{track}_times.npy", np.concatenate(times_chunks))
+        offsets[track] = np.concatenate([[0], np.cumsum([len(t) for t in times_chunks])]).tolist()
+
+    index = {
+        "filenames": list(filenames),
+        "offsets": offsets,
+        "columns": TRACK_COLUMNS,
+        "metadata": metadata or {},
+    }
+    with open(store_dir / "index.json", "w") as f:
+        json.dump(index, f, indent=2)
+
+    return store_dir
+
+
+class FrameStore:
+    """
+    Read-only, memory-mapped view of a frame store.
+
+    Parameters
+    ----------
+    store_dir : str or Path
+        Directory written by ``write_frame_store``.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory has no index.json.
+    """
+
+    def __init__(self, store_dir: str | Path):
+        self.store_dir = Path(store_dir)
+        index_path = self.store_dir / "index.json"
+        if not index_path.exists():
+            raise FileNotFoundError(
+                f"Frame store not found at {self.store_dir}. "
+                f"Run 'pvc-extract --save-frames' first."
+            )
+
+        with open(index_path) as f:
+            index = json.load(f)
+        self.filenames: list[str] = index["filenames"]
+        self.metadata: dict = index["metadata"]
+        self._columns: dict[str, list[str]] = index["columns"]
+        self._offsets = {k: np.asarray(v, dtype=np.int64) for k, v in index["offsets"].items()}
+
+    def _check_track(self, track: str) -> None:
+        if track not in self._offsets:
+            raise ValueError(f"Unknown track: {track}. Available: {list(self._offsets)}")
+
+    def columns(self, track: str) -> list[str]:
+        """Column names of a track."""
+        self._check_track(track)
+        return self._columns[track]
+
+    def offsets(self, track: str) -> np.ndarray:
+        """Row offsets of each file's chunk, shape (n_files + 1,)."""
+        self._check_track(track)
+        return self._offsets[track]
+
+    def values(self, track: str) -> np.ndarray:
+        """Memory-mapped values of all files, shape (n_frames_total, n_columns)."""
+        self._check_track(track)
+        return np.load(self.store_dir / f"{track}.npy", mmap_mode="r")
+
+    def times(self, track: str) -> np.ndarray:
+        """Memory-mapped frame times of all files, shape (n_frames_total,)."""
+        self._check_track(track)
+        return np.load(self.store_dir / f"{track}_times.npy", mmap_mode="r")
+
+    def file_ids(self, track: str) -> np.ndarray:
+        """File index of every frame of a track, shape (n_frames_total,)."""
+        return np.repeat(np.arange(len(self.filenames)), np.diff(self.offsets(track)))
+
+    def get(self, filename: str, track: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return (times, values) of one file's track."""
+        i = self.filenames.index(filename)
+        start, end = self.offsets(track)[i : i + 2]
+        return self.times(track)[start:end], self.values(track)[start:end]
+
+
+def voiced_mask(store: FrameStore, track: str) -> np.ndarray:
+    """
+    Voicing of every frame of a track, from the nearest F0 frame of the same file.
+
+    Parameters
+    ----------
+    store : FrameStore
+        Frame store with an 'f0' track.
+    track : str
+        Track whose frames are classified.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, shape (n_frames_total,). True if the nearest pitch frame
+        (within one pitch time step) is voiced.
+    """
+    f0 = np.asarray(store.values("f0")[:, 0])
+    f0_times = np.asarray(store.times("f0"), dtype=np.float64)
+    f0_ids = store.file_ids("f0")
+    times = np.asarray(store.times(track), dtype=np.float64)
+    ids = store.file_ids(track)
+
+    if len(f0) == 0 or len(times) == 0:
+        return np.zeros(len(times), dtype=bool)
+
+    # One global sorted key (file, time) -> single searchsorted for all files
+    span = max(f0_times.max(), times.max()) + 1.0
+    f0_key = f0_ids * span + f0_times
+    key = ids * span + times
+
+    right = np.clip(np.searchsorted(f0_key, key), 0, len(f0_key) - 1)
+    left = np.clip(right - 1, 0, len(f0_key) - 1)
+    nearest = np.where(np.abs(f0_key[left] - key) <= np.abs(f0_key[right] - key), left, right)
+
+    step = np.diff(f0_times)[np.diff(f0_ids) == 0]
+    tolerance = np.median(step) if len(step) else np.inf
+
+    return (
+        (f0_ids[nearest] == ids)
+        & (np.abs(f0_times[nearest] - times) <= tolerance)
+        & (f0[nearest] > 0)
+    )
+
+
+def _segment_stats(
+    values: np.ndarray, file_ids: np.ndarray, n_files: int, stats: list[str]
+) -> dict[str, np.ndarray]:
+    """Per-file statistics of one column, vectorized over all files at once."""
+    counts = np.bincount(file_ids, minlength=n_files)
+    results = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sums = np.bincount(file_ids, weights=values, minlength=n_files)
+        means = np.where(counts > 0, sums / counts, np.nan)
+        if "mean" in stats:
+            results["mean"] = means
+        if "std" in stats:
+            squares = np.bincount(
+                file_ids, weights=(values - means[file_ids]) ** 2, minlength=n_files
+            )
+            results["std"] = np.where(counts > 0, np.sqrt(squares / counts), np.nan)
+
+    quantiles = {
+        stat: _QUANTILES[stat] if stat in _QUANTILES else float(stat[1:])
+        for stat in stats
+        if stat in _QUANTILES or _PERCENTILE.match(stat)
+    }
+
+    if quantiles:
+        # Sort by (file, value) once; each file's values are then one sorted run
+        order = np.lexsort((values, file_ids))
+        ordered = values[order]
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        has_data = counts > 0
+        for stat, q in quantiles.items():
+            # Linear interpolation between order statistics (numpy's default)
+            position = starts + (q / 100.0) * np.maximum(counts - 1, 0)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, starts + np.maximum(counts - 1, 0))
+            frac = position - lower
+            safe_lower = np.where(has_data, lower, 0)
+            safe_upper = np.where(has_data, upper, 0)
+            if len(ordered):
+                value = ordered[safe_lower] + frac * (ordered[safe_upper] - ordered[safe_lower])
+            else:
+                value = np.zeros(n_files)
+            results[stat] = np.where(has_data, value, np.nan)
+
+    return results
+
+
+def aggregate_tracks(
+    store: FrameStore,
+    track: str,
+    stats: list[str] | tuple[str, ...] = ("mean", "std", "median"),
+    voiced_only: bool = False,
+) -> pd.DataFrame:
+    """
+    Compute per-file aggregate features from a stored track.
+
+    Parameters
+    ----------
+    store : FrameStore
+        Frame store to read.
+    track : str
+        Track name ('f0', 'intensity', 'hnr', 'formants', 'mfcc').
+    stats : list[str]
+        Statistics: 'mean', 'std' (population, as np.std), 'median', 'min',
+        'max' and percentiles 'p0'...'p100'.
+    voiced_only : bool
+        If True, only frames whose nearest pitch frame is voiced are used.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per file (index: filename), one column per track column and
+        statistic, named '{column}_{stat}' (suffix '_voiced' if voiced_only).
+        Undefined frames (NaN, or unvoiced F0 = 0) are always excluded.
+
+    Raises
+    ------
+    ValueError
+        If the track or a statistic is unknown.
+    """
+    stats = list(stats)
+    unknown = [s for s in stats if s not in _STATS and not _PERCENTILE.match(s)]
+    if unknown:
+        raise ValueError(f"Unknown statistics: {unknown}. Use {sorted(_STATS)} or p0-p100")
+
+    values = np.asarray(store.values(track), dtype=np.float64)
+    file_ids = store.file_ids(track)
+    n_files = len(store.filenames)
+
+    frame_ok = np.ones(len(values), dtype=bool)
+    if voiced_only:
+        frame_ok &= voiced_mask(store, track)
+
+    suffix = "_voiced" if voiced_only else ""
+    columns = {}
+    for j, column in enumerate(store.columns(track)):
+        col = values[:, j]
+        valid = frame_ok & np.isfinite(col)
+        if track == "f0":
+            valid &= col > 0
+        results = _segment_stats(col[valid], file_ids[valid], n_files, stats)
+        for stat in stats:
+            columns[f"{column}_{stat}{suffix}"] = results[stat]
+
+    return pd.DataFrame(columns, index=pd.Index(store.filenames, name="filename"))
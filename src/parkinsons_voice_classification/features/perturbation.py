@@ -0,0 +1,399 @@
+"""
+Vectorized Jitter/Shimmer Engine (pure NumPy)
+
+Praat's "Get jitter (...)" and "Get shimmer (...)" queries each re-walk the
+PointProcess (and, for shimmer, re-read the sound amplitudes around every
+pulse). This module extracts the glottal pulse times once, measures the peak
+amplitude of every period once, and computes all jitter and shimmer variants
+from those two arrays with sliding-window kernels.
+
+The kernels reproduce Praat's definitions, including the period floor and
+ceiling (shortest/longest period), the maximum period factor and the maximum
+amplitude factor:
+
+- Jitter: local, local (absolute), rap, ppq5, ddp
+- Shimmer: local, local (dB), apq3, apq5, apq11, dda
+
+Parity with Praat is checked by ``compare_with_praat()`` (tests/test_perturbation.py).
+
+Usage:
+    sound = parselmouth.Sound("path/to/audio.wav")
+    features = extract_perturbation_features(sound)
+"""
+
+import numpy as np
+import parselmouth
+from numpy.lib.stride_tricks import sliding_window_view
+from parselmouth.praat import call
+
+from parkinsons_voice_classification.config import F0_MIN_HZ, F0_MAX_HZ
+
+# =============================================================================
+# PRAAT PERTURBATION PARAMETERS (locked, as used by the Praat queries)
+# =============================================================================
+PERIOD_FLOOR = 0.0001  # Shortest period (s)
+PERIOD_CEILING = 0.02  # Longest period (s)
+MAX_PERIOD_FACTOR = 1.3  # Largest ratio between consecutive periods
+MAX_AMPLITUDE_FACTOR = 1.6  # Largest ratio between consecutive amplitudes
+
+JITTER_NAMES = ["jitter_local", "jitter_local_abs", "jitter_rap", "jitter_ppq5", "jitter_ddp"]
+SHIMMER_NAMES = [
+    "shimmer_local",
+    "shimmer_local_db",
+    "shimmer_apq3",
+    "shimmer_apq5",
+    "shimmer_apq11",
+    "shimmer_dda",
+]
+
+
+def get_pulse_times(point_process: parselmouth.Data) -> np.ndarray:
+    """
+    Return all pulse times of a PointProcess as one array.
+
+    Parameters
+    ----------
+    point_process : parselmouth.Data
+        Praat PointProcess (e.g. from "To PointProcess (periodic, cc)").
+
+    Returns
+    -------
+    np.ndarray
+        Pulse times in seconds, shape (n_pulses,).
+    """
+    if call(point_process, "Get number of points") == 0:
+        return np.empty(0)
+    return np.asarray(call(point_process, "To Matrix").values[0], dtype=np.float64)
+
+
+def _ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise max(a/b, b/a), as Praat's interval and amplitude factors."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(a > b, a / b, b / a)
+
+
+def _in_range(periods: np.ndarray, pmin: float, pmax: float) -> np.ndarray:
+    """Period floor/ceiling rule (disabled when pmin == pmax, as in Praat)."""
+    if pmin == pmax:
+        return np.ones(periods.shape, dtype=bool)
+    return (periods >= pmin) & (periods <= pmax)
+
+
+def _mean_period(periods: np.ndarray, pmin: float, pmax: float, max_period_factor: float) -> float:
+    """Mean of the periods accepted by Praat's PointProcess_isPeriod rule."""
+    n = len(periods)
+    if n < 1:
+        return np.nan
+
+    valid = (periods > 0) & (periods >= pmin) & (periods <= pmax)
+
+    # A period is rejected if it differs too much from BOTH of its neighbours
+    previous_factor = np.full(n, np.nan)
+    next_factor = np.full(n, np.nan)
+    if n > 1:
+        factors = _ratio(periods[1:], periods[:-1])
+        factors[(periods[1:] <= 0) | (periods[:-1] <= 0)] = np.nan
+        previous_factor[1:] = factors
+        next_factor[:-1] = factors
+    if max_period_factor >= 1.0:
+        with np.errstate(invalid="ignore"):
+            valid &= ~((previous_factor > max_period_factor) & (next_factor > max_period_factor))
+
+    return float(periods[valid].mean()) if valid.any() else np.nan
+
+
+def _window_deviation(
+    values: np.ndarray, valid_windows: np.ndarray, width: int
+) -> tuple[float, int]:
+    """
+    Sum of |center - window mean| over valid sliding windows.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Periods or amplitudes.
+    valid_windows : np.ndarray
+        Boolean mask over the sliding windows (from ``_valid_windows``).
+    width : int
+        Window length (2 for local, 3/5/11 for rap/ppq5/apq).
+
+    Returns
+    -------
+    tuple[float, int]
+        (sum of deviations, number of valid windows)
+    """
+    windows = sliding_window_view(values, width)
+    windows = windows[valid_windows]
+    if width == 2:
+        deviations = np.abs(windows[:, 0] - windows[:, 1])
+    else:
+        deviations = np.abs(windows[:, width // 2] - windows.mean(axis=1))
+    return float(deviations.sum()), len(deviations)
+
+
+def _valid_windows(value_ok: np.ndarray, step_ok: np.ndarray, width: int) -> np.ndarray:
+    """Windows of ``width`` values whose values and consecutive steps are all valid."""
+    values_valid = sliding_window_view(value_ok, width).all(axis=1)
+    steps_valid = sliding_window_view(step_ok, width - 1).all(axis=1)
+    return values_valid & steps_valid
+
+
+def compute_jitter(
+    times: np.ndarray,
+    pmin: float = PERIOD_FLOOR,
+    pmax: float = PERIOD_CEILING,
+    max_period_factor: float = MAX_PERIOD_FACTOR,
+) -> dict:
+    """
+    Compute all jitter measures from pulse times.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Glottal pulse times in seconds.
+    pmin, pmax : float
+        Period floor and ceiling (s).
+    max_period_factor : float
+        Largest accepted ratio between consecutive periods.
+
+    Returns
+    -------
+    dict
+        jitter_local, jitter_local_abs, jitter_rap, jitter_ppq5, jitter_ddp
+        (NaN where Praat would report --undefined--).
+    """
+    features = {name: np.nan for name in JITTER_NAMES}
+    periods = np.diff(times)
+    if len(periods) < 2:
+        return features
+
+    mean_period = _mean_period(periods, pmin, pmax, max_period_factor)
+    period_ok = _in_range(periods, pmin, pmax)
+    if pmin == pmax:
+        step_ok = np.ones(len(periods) - 1, dtype=bool)
+    else:
+        step_ok = _ratio(periods[:-1], periods[1:]) <= max_period_factor
+
+    # Local: consecutive period pairs
+    total, count = _window_deviation(periods, _valid_windows(period_ok, step_ok, 2), 2)
+    if count >= 1:
+        features["jitter_local_abs"] = total / count
+        features["jitter_local"] = total / count / mean_period
+
+    # RAP: 3-period running average
+    if len(periods) >= 3:
+        total, count = _window_deviation(periods, _valid_windows(period_ok, step_ok, 3), 3)
+        if count >= 1:
+            features["jitter_rap"] = total / count / mean_period
+            features["jitter_ddp"] = 3.0 * features["jitter_rap"]
+
+    # PPQ5: 5-period running average
+    if len(periods) >= 5:
+        total, count = _window_deviation(periods, _valid_windows(period_ok, step_ok, 5), 5)
+        if count >= 1:
+            features["jitter_ppq5"] = total / count / mean_period
+
+    return features
+
+
+def get_pulse_amplitudes(
+    samples: np.ndarray,
+    x1: float,
+    dx: float,
+    times: np.ndarray,
+    pmin: float = PERIOD_FLOOR,
+    pmax: float = PERIOD_CEILING,
+    max_period_factor: float = MAX_PERIOD_FACTOR,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Measure the peak amplitude of every period, as Praat's AmplitudeTier (period).
+
+    For each interior pulse flanked by two valid periods p1 and p2, the
+    amplitude is the Hann-windowed RMS of the sound from ``t - 0.2·p1`` to
+    ``t + 0.2·p2``.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono sound samples.
+    x1 : float
+        Time of the first sample (s).
+    dx : float
+        Sampling period (s).
+    times : np.ndarray
+        Glottal pulse times (s).
+    pmin, pmax : float
+        Period floor and ceiling (s).
+    max_period_factor : float
+        Largest accepted ratio between the two flanking periods.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (amplitude times, amplitudes) of the accepted pulses.
+    """
+    if len(times) < 3:
+        return np.empty(0), np.empty(0)
+
+    tmid = times[1:-1]
+    p1 = times[1:-1] - times[:-2]
+    p2 = times[2:] - times[1:-1]
+    accepted = _in_range(p1, pmin, pmax) & _in_range(p2, pmin, pmax)
+    if pmin != pmax:
+        accepted &= _ratio(p1, p2) <= max_period_factor
+    tmid, p1, p2 = tmid[accepted], 0.2 * p1[accepted], 0.2 * p2[accepted]
+    if len(tmid) == 0:
+        return np.empty(0), np.empty(0)
+
+    # Sample index range of each window (Sampled_getWindowSamples)
+    n_samples = len(samples)
+    first = np.maximum(np.ceil((tmid - p1 - x1) / dx), 0).astype(np.int64)
+    last = np.minimum(np.floor((tmid + p2 - x1) / dx), n_samples - 1).astype(np.int64)
+    lengths = last - first + 1
+
+    # Gather all windows into one padded (n_pulses, max_length) block
+    offsets = np.arange(max(int(lengths.max()), 1))
+    index = first[:, None] + offsets[None, :]
+    inside = offsets[None, :] < lengths[:, None]
+    index = np.where(inside, index, 0)
+
+    t = x1 + index * dx
+    width = np.where(t < tmid[:, None], p1[:, None], p2[:, None])
+    window = np.where(inside, 0.5 + 0.5 * np.cos(np.pi * (t - tmid[:, None]) / width), 0.0)
+    windowed = samples[index] * window
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rms = np.sqrt((windowed**2).sum(axis=1) / (window**2).sum(axis=1))
+
+    keep = (lengths >= 3) & np.isfinite(rms) & (rms > 0)
+    return tmid[keep], rms[keep]
+
+
+def compute_shimmer(
+    amplitude_times: np.ndarray,
+    amplitudes: np.ndarray,
+    pmin: float = PERIOD_FLOOR,
+    pmax: float = PERIOD_CEILING,
+    max_amplitude_factor: float = MAX_AMPLITUDE_FACTOR,
+) -> dict:
+    """
+    Compute all shimmer measures from per-period peak amplitudes.
+
+    Parameters
+    ----------
+    amplitude_times : np.ndarray
+        Times of the amplitude points (s).
+    amplitudes : np.ndarray
+        Peak amplitudes from ``get_pulse_amplitudes``.
+    pmin, pmax : float
+        Period floor and ceiling (s), applied between amplitude points.
+    max_amplitude_factor : float
+        Largest accepted ratio between consecutive amplitudes.
+
+    Returns
+    -------
+    dict
+        shimmer_local, shimmer_local_db, shimmer_apq3, shimmer_apq5,
+        shimmer_apq11, shimmer_dda (NaN where Praat reports --undefined--).
+    """
+    features = {name: np.nan for name in SHIMMER_NAMES}
+    if len(amplitudes) < 2:
+        return features
+
+    # Praat normalizes by the mean of all amplitudes except the last one
+    mean_amplitude = amplitudes[:-1].mean()
+    if mean_amplitude == 0:
+        return features
+
+    # Validity of each step between consecutive amplitude points
+    period_ok = _in_range(np.diff(amplitude_times), pmin, pmax)
+    factor_ok = _ratio(amplitudes[:-1], amplitudes[1:]) <= max_amplitude_factor
+    step_ok = period_ok & factor_ok
+    value_ok = np.ones(len(amplitudes), dtype=bool)
+
+    # Local (relative and dB): consecutive amplitude pairs
+    local_windows = _valid_windows(value_ok, step_ok, 2)
+    total, count = _window_deviation(amplitudes, local_windows, 2)
+    if count >= 1:
+        features["shimmer_local"] = total / count / mean_amplitude
+        ratios = amplitudes[1:][local_windows] / amplitudes[:-1][local_windows]
+        features["shimmer_local_db"] = float(np.abs(20.0 * np.log10(ratios)).mean())
+
+    # APQ3 / APQ5 / APQ11: running-average perturbation quotients
+    for width, name in [(3, "shimmer_apq3"), (5, "shimmer_apq5"), (11, "shimmer_apq11")]:
+        if len(amplitudes) < width:
+            continue
+        total, count = _window_deviation(
+            amplitudes, _valid_windows(value_ok, step_ok, width), width
+        )
+        if count >= 1:
+            features[name] = total / count / mean_amplitude
+
+    if not np.isnan(features["shimmer_apq3"]):
+        features["shimmer_dda"] = 3.0 * features["shimmer_apq3"]
+
+    return features
+
+
+def extract_perturbation_features(
+    sound: parselmouth.Sound, point_process: parselmouth.Data | None = None
+) -> dict:
+    """
+    Compute every jitter and shimmer measure from one glottal-pulse array.
+
+    Parameters
+    ----------
+    sound : parselmouth.Sound
+        Loaded audio.
+    point_process : parselmouth.Data, optional
+        Precomputed "To PointProcess (periodic, cc)" of ``sound``.
+
+    Returns
+    -------
+    dict
+        5 jitter and 6 shimmer features (see JITTER_NAMES, SHIMMER_NAMES).
+    """
+    if point_process is None:
+        point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
+
+    times = get_pulse_times(point_process)
+
+    # Praat averages channels for the amplitude measurement
+    samples = sound.values.mean(axis=0) if sound.n_channels > 1 else sound.values[0]
+    amplitude_times, amplitudes = get_pulse_amplitudes(samples, sound.x1, sound.dx, times)
+
+    features = compute_jitter(times)
+    features.update(compute_shimmer(amplitude_times, amplitudes))
+    return features
+
+
+def compare_with_praat(audio_path: str) -> dict[str, tuple[float, float]]:
+    """
+    Parity check of the NumPy engine against Praat's own queries.
+
+    Parameters
+    ----------
+    audio_path : str
+        Path to WAV file.
+
+    Returns
+    -------
+    dict[str, tuple[float, float]]
+        Feature name -> (numpy value, Praat value).
+    """
+    sound = parselmouth.Sound(audio_path)
+    point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
+    engine = extract_perturbation_features(sound, point_process)
+
+    jitter_args = (0, 0, PERIOD_FLOOR, PERIOD_CEILING, MAX_PERIOD_FACTOR)
+    shimmer_args = jitter_args + (MAX_AMPLITUDE_FACTOR,)
+    jitter_queries = ["local", "local, absolute", "rap", "ppq5", "ddp"]
+    shimmer_queries = ["local", "local_dB", "apq3", "apq5", "apq11", "dda"]
+
+    praat = {}
+    for name, query in zip(JITTER_NAMES, jitter_queries):
+        praat[name] = call(point_process, f"Get jitter ({query})", *jitter_args)
+    for name, query in zip(SHIMMER_NAMES, shimmer_queries):
+        praat[name] = call([sound, point_process], f"Get shimmer ({query})", *shimmer_args)
+
+    return {name: (engine[name], praat[name]) for name in JITTER_NAMES + SHIMMER_NAMES}
@@ -0,0 +1,188 @@
+"""
+Feature Plan (lazy feature computation)
+
+Maps every feature name produced by the simplified pipeline to the Praat
+and librosa analyses it depends on. Given a requested subset of features
+(typically ``metadata["feature_names"]`` of a trained model), the plan
+resolves the minimal set of analyses to run, so that models trained on
+pruned feature lists get proportionally cheaper extraction.
+
+Analyses:
+- Praat: pitch, pitch_ac, point_process, harmonicity, intensity, formant
+- librosa: stft, mfcc, delta, delta2, zcr
+
+Usage:
+    from parkinsons_voice_classification.features.plan import build_feature_plan
+
+    plan = build_feature_plan(["f0_mean", "mfcc_0_mean"])
+    plan.analyses  # frozenset({'pitch', 'stft', 'mfcc'})
+"""
+
+import re
+from dataclasses import dataclass
+
+# =============================================================================
+# ANALYSIS IDENTIFIERS
+# =============================================================================
+# Praat (parselmouth) analyses
+PITCH = "pitch"  # To Pitch (autocorrelation method, default settings), F0 statistics
+PITCH_AC = "pitch_ac"  # To Pitch (ac) with explicit settings, used by autocorr_harmonicity
+POINT_PROCESS = "point_process"  # To PointProcess (periodic, cc), jitter + shimmer
+HARMONICITY = "harmonicity"  # To Harmonicity (cc)
+INTENSITY = "intensity"  # To Intensity
+FORMANT = "formant"  # To Formant (burg)
+
+# librosa analyses
+STFT = "stft"  # Magnitude spectrogram (shared by MFCC and spectral shape)
+MFCC = "mfcc"
+DELTA = "delta"
+DELTA2 = "delta2"
+ZCR = "zcr"
+
+PRAAT_ANALYSES = frozenset({PITCH, PITCH_AC, POINT_PROCESS, HARMONICITY, INTENSITY, FORMANT})
+LIBROSA_ANALYSES = frozenset({STFT, MFCC, DELTA, DELTA2, ZCR})
+
+# Upstream analyses each analysis consumes
+ANALYSIS_DEPENDENCIES: dict[str, frozenset[str]] = {
+    MFCC: frozenset({STFT}),
+    DELTA: frozenset({MFCC}),
+    DELTA2: frozenset({MFCC}),
+}
+
+# Exact-name and pattern rules mapping feature names to analyses
+_FEATURE_ANALYSES: dict[str, str] = {
+    "hnr_mean": HARMONICITY,
+    "autocorr_harmonicity": PITCH_AC,
+    "spectral_centroid_mean": STFT,
+    "spectral_bandwidth_mean": STFT,
+    "spectral_rolloff_mean": STFT,
+    "spectral_flatness_mean": STFT,
+    "zcr_mean": ZCR,
+}
+
+_FEATURE_PATTERNS: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"^f0_(mean|std|min|max)$"), PITCH),
+    (re.compile(r"^jitter_"), POINT_PROCESS),
+    (re.compile(r"^shimmer_"), POINT_PROCESS),
+    (re.compile(r"^intensity_(mean|min|max)$"), INTENSITY),
+    (re.compile(r"^f[1-3]_(mean|std)$"), FORMANT),
+    (re.compile(r"^mfcc_\d+_(mean|std)$"), MFCC),
+    (re.compile(r"^delta_mfcc_\d+_mean$"), DELTA),
+    (re.compile(r"^delta2_mfcc_\d+_mean$"), DELTA2),
+]
+
+
+def _resolve_dependencies(analyses: set[str]) -> frozenset[str]:
+    """Expand a set of analyses with everything they transitively depend on."""
+    resolved = set(analyses)
+    pending = list(analyses)
+    while pending:
+        for upstream in ANALYSIS_DEPENDENCIES.get(pending.pop(), frozenset()):
+            if upstream not in resolved:
+                resolved.add(upstream)
+                pending.append(upstream)
+    return frozenset(resolved)
+
+
+def get_feature_analyses(feature_name: str) -> frozenset[str]:
+    """
+    Return the analyses required to compute a single feature.
+
+    Parameters
+    ----------
+    feature_name : str
+        Feature column name (e.g. 'jitter_local', 'delta_mfcc_3_mean').
+
+    Returns
+    -------
+    frozenset[str]
+        Analysis identifiers, including transitive dependencies.
+
+    Raises
+    ------
+    ValueError
+        If the feature name is not produced by the simplified pipeline.
+    """
+    analysis = _FEATURE_ANALYSES.get(feature_name)
+    if analysis is None:
+        for pattern, candidate in _FEATURE_PATTERNS:
+            if pattern.match(feature_name):
+                analysis = candidate
+                break
+
+    if analysis is None:
+        raise ValueError(f"Unknown feature: {feature_name}")
+
+    return _resolve_dependencies({analysis})
+
+
+@dataclass(frozen=True)
+class FeaturePlan:
+    """
+    Resolved extraction plan for a subset of features.
+
+    Attributes
+    ----------
+    feature_names : tuple[str, ...]
+        Requested features, in output order.
+    analyses : frozenset[str]
+        Analyses that must run to produce the requested features.
+    """
+
+    feature_names: tuple[str, ...]
+    analyses: frozenset[str]
+
+    def needs(self, analysis: str) -> bool:
+        """Return True if the given analysis is part of the plan."""
+        return analysis in self.analyses
+
+    @property
+    def praat_analyses(self) -> frozenset[str]:
+        """Praat analyses in the plan."""
+        return self.analyses & PRAAT_ANALYSES
+
+    @property
+    def librosa_analyses(self) -> frozenset[str]:
+        """librosa analyses in the plan."""
+        return self.analyses & LIBROSA_ANALYSES
+
+
+def build_feature_plan(feature_names: list[str] | tuple[str, ...] | None = None) -> FeaturePlan:
+    """
+    Build an extraction plan for the requested features.
+
+    Parameters
+    ----------
+    feature_names : list[str], optional
+        Features to compute, in the desired output order. Defaults to the
+        complete feature set for the current configuration (47 or 78).
+
+    Returns
+    -------
+    FeaturePlan
+        Plan with the requested names and the analyses they require.
+
+    Raises
+    ------
+    ValueError
+        If any feature name is unknown or listed more than once.
+    """
+    if feature_names is None:
+        # Imported lazily: the extractors import the analysis identifiers above
+        from parkinsons_voice_classification.features.prosodic_simple import (
+            get_prosodic_feature_names,
+        )
+        from parkinsons_voice_classification.features.spectral_simple import (
+            get_spectral_feature_names,
+        )
+
+        feature_names = get_prosodic_feature_names() + get_spectral_feature_names()
+
+    if len(set(feature_names)) != len(feature_names):
+        raise ValueError("Duplicate feature names in feature plan")
+
+    analyses: set[str] = set()
+    for name in feature_names:
+        analyses |= get_feature_analyses(name)
+
+    return FeaturePlan(feature_names=tuple(feature_names), analyses=frozenset(analyses))
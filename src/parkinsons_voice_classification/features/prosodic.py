@@ -15,6 +15,9 @@ CRITICAL: Jitter, shimmer, and F0 are computed on VOICED FRAMES ONLY.
 This is the standard approach in voice pathology research and is handled
 automatically by Praat/Parselmouth.
 
+Jitter and shimmer share one PointProcess and are computed by the vectorized
+engine in features/perturbation.py (parity with Praat's queries).
+
 Feature count: 31 features
 - F0: 5 features
 - Jitter: 5 features
@@ -29,6 +32,12 @@ import parselmouth
 from parselmouth.praat import call
 
 from parkinsons_voice_classification.config import F0_MIN_HZ, F0_MAX_HZ
+from parkinsons_voice_classification.features.perturbation import (
+    get_pulse_times,
+    get_pulse_amplitudes,
+    compute_jitter,
+    compute_shimmer,
+)
 
 
 def extract_f0_features(sound: parselmouth.Sound) -> dict:
@@ -70,7 +79,9 @@ def extract_f0_features(sound: parselmouth.Sound) -> dict:
     }
 
 
-def extract_jitter_features(sound: parselmouth.Sound) -> dict:
+def extract_jitter_features(
+    sound: parselmouth.Sound, point_process: parselmouth.Data | None = None
+) -> dict:
     """
     Extract jitter (pitch perturbation) features.
 
@@ -84,39 +95,25 @@ def extract_jitter_features(sound: parselmouth.Sound) -> dict:
     ----------
     sound : parselmouth.Sound
         Loaded audio as Parselmouth Sound object.
+    point_process : parselmouth.Data, optional
+        Precomputed "To PointProcess (periodic, cc)" of ``sound``.
 
     Returns
     -------
     dict
         Jitter features: local, local_abs, rap, ppq5, ddp.
     """
-    point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
-
-    # Local jitter (relative, %)
-    jitter_local = call(point_process, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
-
-    # Local absolute jitter (seconds)
-    jitter_local_abs = call(point_process, "Get jitter (local, absolute)", 0, 0, 0.0001, 0.02, 1.3)
-
-    # RAP (Relative Average Perturbation)
-    jitter_rap = call(point_process, "Get jitter (rap)", 0, 0, 0.0001, 0.02, 1.3)
+    if point_process is None:
+        point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
 
-    # PPQ5 (5-point Period Perturbation Quotient)
-    jitter_ppq5 = call(point_process, "Get jitter (ppq5)", 0, 0, 0.0001, 0.02, 1.3)
+    # Local (relative), local absolute (s), RAP, PPQ5 and DDP from one pulse array
+    # (period floor 0.0001 s, ceiling 0.02 s, max period factor 1.3)
+    return compute_jitter(get_pulse_times(point_process))
 
-    # DDP (average absolute difference of differences of periods)
-    jitter_ddp = call(point_process, "Get jitter (ddp)", 0, 0, 0.0001, 0.02, 1.3)
 
-    return {
-        "jitter_local": jitter_local,
-        "jitter_local_abs": jitter_local_abs,
-        "jitter_rap": jitter_rap,
-        "jitter_ppq5": jitter_ppq5,
-        "jitter_ddp": jitter_ddp,
-    }
-
-
-def extract_shimmer_features(sound: parselmouth.Sound) -> dict:
+def extract_shimmer_features(
+    sound: parselmouth.Sound, point_process: parselmouth.Data | None = None
+) -> dict:
     """
     Extract shimmer (amplitude perturbation) features.
 
@@ -130,46 +127,26 @@ def extract_shimmer_features(sound: parselmouth.Sound) -> dict:
     ----------
     sound : parselmouth.Sound
         Loaded audio as Parselmouth Sound object.
+    point_process : parselmouth.Data, optional
+        Precomputed "To PointProcess (periodic, cc)" of ``sound``.
 
     Returns
     -------
     dict
         Shimmer features: local, local_db, apq3, apq5, apq11, dda.
     """
-    point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
+    if point_process is None:
+        point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
 
-    # Local shimmer (relative, %)
-    shimmer_local = call(
-        [sound, point_process], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6
+    # Peak amplitude of every period, measured once
+    samples = sound.values.mean(axis=0) if sound.n_channels > 1 else sound.values[0]
+    amplitude_times, amplitudes = get_pulse_amplitudes(
+        samples, sound.x1, sound.dx, get_pulse_times(point_process)
     )
 
-    # Local shimmer in dB
-    shimmer_local_db = call(
-        [sound, point_process], "Get shimmer (local_dB)", 0, 0, 0.0001, 0.02, 1.3, 1.6
-    )
-
-    # APQ3 (3-point Amplitude Perturbation Quotient)
-    shimmer_apq3 = call([sound, point_process], "Get shimmer (apq3)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
-
-    # APQ5 (5-point Amplitude Perturbation Quotient)
-    shimmer_apq5 = call([sound, point_process], "Get shimmer (apq5)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
-
-    # APQ11 (11-point Amplitude Perturbation Quotient)
-    shimmer_apq11 = call(
-        [sound, point_process], "Get shimmer (apq11)", 0, 0, 0.0001, 0.02, 1.3, 1.6
-    )
-
-    # DDA (average absolute difference of differences of amplitudes)
-    shimmer_dda = call([sound, point_process], "Get shimmer (dda)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
-
-    return {
-        "shimmer_local": shimmer_local,
-        "shimmer_local_db": shimmer_local_db,
-        "shimmer_apq3": shimmer_apq3,
-        "shimmer_apq5": shimmer_apq5,
-        "shimmer_apq11": shimmer_apq11,
-        "shimmer_dda": shimmer_dda,
-    }
+    # Local, local (dB), APQ3, APQ5, APQ11 and DDA
+    # (period floor 0.0001 s, ceiling 0.02 s, max amplitude factor 1.6)
+    return compute_shimmer(amplitude_times, amplitudes)
 
 
 def extract_harmonicity_features(sound: parselmouth.Sound) -> dict:
@@ -314,13 +291,14 @@ def extract_prosodic_features(audio_path: str) -> dict:
         Dictionary containing all 31 prosodic features.
     """
     sound = parselmouth.Sound(audio_path)
+    point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
 
     features = {}
 
     # Extract each feature group
     features.update(extract_f0_features(sound))
-    features.update(extract_jitter_features(sound))
-    features.update(extract_shimmer_features(sound))
+    features.update(extract_jitter_features(sound, point_process))
+    features.update(extract_shimmer_features(sound, point_process))
     features.update(extract_harmonicity_features(sound))
     features.update(extract_intensity_features(sound))
     features.update(extract_formant_features(sound))
@@ -0,0 +1,506 @@
+"""
+Pure-NumPy Prosodic Backend (pitch, intensity, harmonicity)
+
+Alternative to the Praat ``call()`` analyses for the F0, autocorrelation
+harmonicity, HNR and intensity features of prosodic_simple. Every frame of a
+recording is analysed at once: frames are gathered into a 2-D array and the
+autocorrelations / cross-correlations of all frames are computed with one
+batched FFT (in chunks of ``_FRAME_BATCH`` frames to bound memory).
+
+The algorithms follow Praat's:
+- Pitch: "To Pitch" / "To Pitch (ac)" (Boersma 1993). Hann-windowed
+  autocorrelation normalised by the window autocorrelation, up to 15
+  candidates per frame, then Viterbi path finding with the octave, octave-jump
+  and voiced/unvoiced costs. Both pitch features share one pitch track,
+  because the two Praat calls use identical parameters.
+- Harmonicity: "To Harmonicity (cc)". Normalised forward cross-correlation,
+  HNR = 10·log10(r / (1 - r)) on voiced frames.
+- Intensity: "To Intensity". Kaiser-windowed (β = 2π² + 0.5) mean-subtracted
+  power, in dB re 2·10⁻⁵ Pa.
+
+Peaks are refined by parabolic rather than sinc interpolation, so values
+differ slightly from Praat. Per-feature agreement and throughput are
+reported by scripts/check_prosodic_backend_parity.py.
+
+Jitter/shimmer (features/perturbation.py, which needs a Praat PointProcess)
+and formants always use Praat. The tier's pitch and harmonicity time steps
+are honoured; ``analysis_sample_rate`` is not, because these analyses are
+already cheap at the native rate.
+
+Selected with PROSODIC_BACKEND = "numpy" in config.py.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from parkinsons_voice_classification.config import F0_MIN_HZ, F0_MAX_HZ
+from parkinsons_voice_classification.features.plan import PITCH, PITCH_AC, HARMONICITY, INTENSITY
+from parkinsons_voice_classification.features.tiers import ExtractionTier
+
+# Analyses this backend implements; the rest of the prosodic set stays on Praat
+NUMPY_ANALYSES = frozenset({PITCH, PITCH_AC, HARMONICITY, INTENSITY})
+
+# =============================================================================
+# PRAAT PARAMETERS (as passed by prosodic_simple)
+# =============================================================================
+PITCH_PERIODS_PER_WINDOW = 3.0
+PITCH_MAX_CANDIDATES = 15
+PITCH_SILENCE_THRESHOLD = 0.03
+PITCH_VOICING_THRESHOLD = 0.45
+PITCH_OCTAVE_COST = 0.01
+PITCH_OCTAVE_JUMP_COST = 0.35
+PITCH_VOICED_UNVOICED_COST = 0.14
+
+HNR_SILENCE_THRESHOLD = 0.1
+
+# Frames per batched FFT (bounds peak memory on long dialogue recordings)
+_FRAME_BATCH = 512
+
+
+def _frame_centres(
+    n_samples: int, sample_rate: float, window_duration: float, time_step: float
+) -> np.ndarray:
+    """Frame centre times of Praat's short-term analysis (centred in the sound)."""
+    duration = n_samples / sample_rate
+    n_frames = int(np.floor((duration - window_duration) / time_step)) + 1
+    if n_frames < 1:
+        return np.empty(0)
+    mid_time = 0.5 * duration
+    return mid_time - 0.5 * (n_frames - 1) * time_step + np.arange(n_frames) * time_step
+
+
+def _gather_frames(padded: np.ndarray, starts: np.ndarray, length: int) -> np.ndarray:
+    """Gather (n_frames, length) frames from a padded signal, one fancy-indexed copy."""
+    return sliding_window_view(padded, length)[starts]
+
+
+def _local_peaks(r: np.ndarray, min_lag: int, max_lag: int, threshold: float):
+    """
+    Find and parabolically refine local maxima of correlation rows.
+
+    Parameters
+    ----------
+    r : np.ndarray
+        (n_frames, n_lags) correlation values, lag 0 in column 0.
+    min_lag, max_lag : int
+        Lag search range (inclusive).
+    threshold : float
+        Minimum correlation for a candidate.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Frame index, refined lag (samples) and refined strength per peak.
+    """
+    centre = r[:, min_lag : max_lag + 1]
+    left = r[:, min_lag - 1 : max_lag]
+    right = r[:, min_lag + 1 : max_lag + 2]
+    frames, offsets = np.nonzero((centre > threshold) & (centre > left) & (centre >= right))
+
+    y0 = centre[frames, offsets]
+    ym = left[frames, offsets]
+    yp = right[frames, offsets]
+    dr = 0.5 * (yp - ym)
+    d2r = 2 * y0 - ym - yp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(d2r > 0, dr / d2r, 0.0)
+        strength = np.where(d2r > 0, y0 + 0.5 * dr * shift, y0)
+    strength = np.where(strength > 1.0, 1.0 / strength, strength)
+
+    return frames, offsets + min_lag + shift, strength
+
+
+def _top_candidates(
+    n_frames: int, frames: np.ndarray, values: np.ndarray, keys: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Scatter per-peak values into a (n_frames, k) table, keeping the k best keys.
+
+    Returns the table (NaN where unused) and the matching keys (-inf where unused).
+    """
+    order = np.lexsort((-keys, frames))
+    frames, values, keys = frames[order], values[order], keys[order]
+    first = np.searchsorted(frames, np.arange(n_frames))
+    rank = np.arange(len(frames)) - first[frames]
+    keep = rank < k
+
+    table = np.full((n_frames, k), np.nan)
+    table_keys = np.full((n_frames, k), -np.inf)
+    table[frames[keep], rank[keep]] = values[keep]
+    table_keys[frames[keep], rank[keep]] = keys[keep]
+    return table, table_keys
+
+
+def compute_pitch_track(
+    samples: np.ndarray, sample_rate: float, time_step: float = 0.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a Praat-style autocorrelation pitch track.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono audio samples.
+    sample_rate : float
+        Sample rate in Hz.
+    time_step : float
+        Frame step in seconds. 0.0 = Praat automatic (0.75 / F0_MIN_HZ).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Frame times (s) and F0 per frame (Hz, 0 where unvoiced).
+    """
+    dx = 1.0 / sample_rate
+    if time_step <= 0:
+        time_step = PITCH_PERIODS_PER_WINDOW / F0_MIN_HZ / 4.0
+
+    window_duration = PITCH_PERIODS_PER_WINDOW / F0_MIN_HZ
+    half = int(np.floor(window_duration / dx)) // 2 - 1
+    n_window = 2 * half
+    half_period = int(np.floor(1.0 / dx / F0_MIN_HZ)) // 2 + 1
+    min_lag = max(2, int(np.floor(1.0 / dx / F0_MAX_HZ)))
+    max_lag = min(int(np.floor(n_window / PITCH_PERIODS_PER_WINDOW)) + 2, n_window - 2)
+
+    times = _frame_centres(len(samples), sample_rate, window_duration, time_step)
+    n_frames = len(times)
+    if n_frames == 0 or max_lag <= min_lag:
+        return times, np.zeros(n_frames)
+
+    n_fft = 1
+    while n_fft < n_window * 1.5:
+        n_fft *= 2
+
+    # Hann window and its normalised autocorrelation
+    window = 0.5 - 0.5 * np.cos(np.arange(1, n_window + 1) * 2 * np.pi / (n_window + 1))
+    window_r = np.fft.irfft(np.abs(np.fft.rfft(window, n_fft)) ** 2, n_fft)[: max_lag + 2]
+    window_r /= window_r[0]
+
+    global_peak = np.max(np.abs(samples - samples.mean()))
+    if global_peak == 0:
+        return times, np.zeros(n_frames)
+
+    pad = n_window + 2 * half_period
+    padded = np.pad(samples, pad)
+    mids = np.round(times * sample_rate - 0.5).astype(np.int64) + pad
+
+    peak_frames, peak_lags, peak_strengths, local_peaks = [], [], [], []
+    for batch in range(0, n_frames, _FRAME_BATCH):
+        batch_mids = mids[batch : batch + _FRAME_BATCH]
+
+        # Local mean over one period around the frame centre (as Praat)
+        means = _gather_frames(padded, batch_mids - half_period, 2 * half_period).mean(axis=1)
+        frames = _gather_frames(padded, batch_mids - half, n_window) - means[:, None]
+        local_peaks.append(np.max(np.abs(frames), axis=1))
+
+        spectrum = np.fft.rfft(frames * window, n_fft, axis=1)
+        ac = np.fft.irfft(np.abs(spectrum) ** 2, n_fft, axis=1)[:, : max_lag + 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = ac / ac[:, :1] / window_r
+        r[~np.isfinite(r)] = 0.0
+
+        f, lag, strength = _local_peaks(r, min_lag, max_lag, 0.5 * PITCH_VOICING_THRESHOLD)
+        peak_frames.append(f + batch)
+        peak_lags.append(lag)
+        peak_strengths.append(strength)
+
+    frames_idx = np.concatenate(peak_frames)
+    freqs = sample_rate / np.concatenate(peak_lags)
+    strengths = np.concatenate(peak_strengths)
+    intensity = np.concatenate(local_peaks) / global_peak
+
+    below_ceiling = freqs <= F0_MAX_HZ
+    frames_idx, freqs, strengths = (
+        frames_idx[below_ceiling],
+        freqs[below_ceiling],
+        strengths[below_ceiling],
+    )
+
+    # Candidate table: column 0 unvoiced, columns 1.. voiced (best by local score)
+    score = strengths - PITCH_OCTAVE_COST * np.log2(F0_MAX_HZ / freqs)
+    cand_freq, cand_score = _top_candidates(
+        n_frames, frames_idx, freqs, score, PITCH_MAX_CANDIDATES - 1
+    )
+    unvoiced = PITCH_VOICING_THRESHOLD + np.maximum(
+        0.0,
+        2.0 - intensity / (PITCH_SILENCE_THRESHOLD / (1.0 + PITCH_VOICING_THRESHOLD)),
+    )
+    cand_freq = np.column_stack([np.zeros(n_frames), cand_freq])
+    cand_score = np.column_stack([unvoiced, cand_score])
+
+    f0 = _viterbi(cand_freq, cand_score, time_step)
+    return times, f0
+
+
+def _viterbi(cand_freq: np.ndarray, cand_score: np.ndarray, time_step: float) -> np.ndarray:
+    """
+    Praat's pitch path finder over a (n_frames, n_candidates) table.
+
+    Candidate column 0 is the unvoiced candidate (frequency 0). Unused voiced
+    slots have frequency NaN and score -inf.
+    """
+    n_frames, n_cands = cand_freq.shape
+    correction = 0.01 / time_step
+    octave_jump = PITCH_OCTAVE_JUMP_COST * correction
+    voiced_unvoiced = PITCH_VOICED_UNVOICED_COST * correction
+
+    voiced = cand_freq > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_freq = np.where(voiced, np.log2(cand_freq), 0.0)
+
+    delta = cand_score[0].copy()
+    backpointers = np.zeros((n_frames, n_cands), dtype=np.intp)
+    for t in range(1, n_frames):
+        prev_v = voiced[t - 1][:, None]
+        cur_v = voiced[t][None, :]
+        cost = np.where(
+            prev_v & cur_v,
+            octave_jump * np.abs(log_freq[t - 1][:, None] - log_freq[t][None, :]),
+            np.where(prev_v != cur_v, voiced_unvoiced, 0.0),
+        )
+        total = delta[:, None] - cost
+        backpointers[t] = np.argmax(total, axis=0)
+        delta = total[backpointers[t], np.arange(n_cands)] + cand_score[t]
+
+    path = np.empty(n_frames, dtype=np.intp)
+    path[-1] = np.argmax(delta)
+    for t in range(n_frames - 1, 0, -1):
+        path[t - 1] = backpointers[t, path[t]]
+
+    f0 = cand_freq[np.arange(n_frames), path]
+    return np.where(np.isfinite(f0), f0, 0.0)
+
+
+def compute_harmonicity_track(
+    samples: np.ndarray,
+    sample_rate: float,
+    time_step: float = 0.01,
+    periods_per_window: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a Praat-style cross-correlation harmonicity track.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono audio samples.
+    sample_rate : float
+        Sample rate in Hz.
+    time_step : float
+        Frame step in seconds.
+    periods_per_window : float
+        Analysis window length in periods of F0_MIN_HZ.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Frame times (s) and HNR per frame in dB (NaN on unvoiced/silent frames).
+    """
+    dx = 1.0 / sample_rate
+    window_duration = periods_per_window / F0_MIN_HZ
+    half = int(np.floor(window_duration / dx)) // 2 - 1
+    n_window = 2 * half
+    min_lag = 2
+    max_lag = int(np.floor(n_window / periods_per_window)) + 2
+
+    times = _frame_centres(len(samples), sample_rate, 1.0 / F0_MIN_HZ + window_duration, time_step)
+    n_frames = len(times)
+    global_peak = np.max(np.abs(samples - samples.mean())) if len(samples) else 0.0
+    if n_frames == 0 or n_window < 4 or global_peak == 0:
+        return times, np.full(n_frames, np.nan)
+
+    span = n_window + max_lag + 1
+    n_fft = 1
+    while n_fft < span:
+        n_fft *= 2
+
+    pad = span
+    padded = np.pad(samples, pad)
+    starts = np.round(times * sample_rate - 0.5).astype(np.int64) - half + pad
+
+    hnr = np.full(n_frames, np.nan)
+    for batch in range(0, n_frames, _FRAME_BATCH):
+        extended = _gather_frames(padded, starts[batch : batch + _FRAME_BATCH], span)
+        extended = extended - extended.mean(axis=1, keepdims=True)
+        x = extended[:, :n_window]
+        local_peak = np.max(np.abs(x), axis=1)
+
+        # Forward cross-correlation of the first window with every lagged window
+        product = np.fft.irfft(
+            np.fft.rfft(extended, n_fft, axis=1) * np.conj(np.fft.rfft(x, n_fft, axis=1)),
+            n_fft,
+            axis=1,
+        )[:, : max_lag + 2]
+        energy = np.cumsum(np.pad(extended**2, ((0, 0), (1, 0))), axis=1)
+        lagged = energy[:, n_window : n_window + max_lag + 2] - energy[:, : max_lag + 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = product / np.sqrt(lagged * energy[:, n_window : n_window + 1])
+        r[~np.isfinite(r)] = 0.0
+
+        frames, _, strengths = _local_peaks(r, min_lag, max_lag, 0.0)
+        best = np.full(len(x), -np.inf)
+        np.maximum.at(best, frames, strengths)
+
+        unvoiced = np.maximum(0.0, 2.0 - (local_peak / global_peak) / HNR_SILENCE_THRESHOLD)
+        voiced = best > unvoiced
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = 10 * np.log10(best / (1 - best))
+        values = np.where(best <= 1e-15, -150.0, np.where(best > 1 - 1e-15, 150.0, values))
+        hnr[batch : batch + len(x)] = np.where(voiced, values, np.nan)
+
+    return times, hnr
+
+
+def compute_intensity_track(
+    samples: np.ndarray, sample_rate: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a Praat-style intensity track (automatic time step, mean subtracted).
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono audio samples.
+    sample_rate : float
+        Sample rate in Hz.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Frame times (s) and intensity per frame in dB.
+    """
+    dx = 1.0 / sample_rate
+    window_duration = 6.4 / F0_MIN_HZ
+    time_step = 0.8 / F0_MIN_HZ
+    half = int(np.floor(0.5 * window_duration / dx))
+
+    times = _frame_centres(len(samples), sample_rate, window_duration, time_step)
+    if len(times) == 0:
+        return times, np.empty(0)
+
+    x = np.arange(-half, half + 1) * dx / (0.5 * window_duration)
+    window = np.i0((2 * np.pi**2 + 0.5) * np.sqrt(np.clip(1 - x**2, 0.0, None)))
+    window[np.abs(x) >= 1] = 0.0
+
+    padded = np.pad(samples, half)
+    mids = np.round(times * sample_rate - 0.5).astype(np.int64)
+
+    # Frames are fully inside the sound by construction, so no edge clipping
+    intensity = np.empty(len(times))
+    for batch in range(0, len(times), _FRAME_BATCH):
+        frames = _gather_frames(padded, mids[batch : batch + _FRAME_BATCH], 2 * half + 1)
+        frames = frames - frames.mean(axis=1, keepdims=True)
+        intensity[batch : batch + len(frames)] = (frames**2 @ window) / window.sum()
+
+    with np.errstate(divide="ignore"):
+        return times, np.where(intensity > 0, 10 * np.log10(intensity / 4.0e-10), -300.0)
+
+
+def _parabolic_extremum(
+    values: np.ndarray, maximum: bool, valid: np.ndarray | None = None
+) -> float:
+    """
+    Extremum of a track with parabolic interpolation (Praat's "Parabolic").
+
+    As in Praat, every interior local extremum is refined, so a shallow dip
+    whose parabola overshoots can win over the deepest frame value. Frames
+    outside ``valid`` (e.g. unvoiced pitch frames) are ignored and break runs.
+    """
+    sign = -1.0 if maximum else 1.0
+    y = sign * np.asarray(values, dtype=float)
+    if valid is None:
+        valid = np.ones(len(y), dtype=bool)
+    if not valid.any():
+        return np.nan
+
+    ym, y0, yp = y[:-2], y[1:-1], y[2:]
+    local = valid[:-2] & valid[1:-1] & valid[2:] & (y0 <= ym) & (y0 <= yp)
+    d2 = ym - 2 * y0 + yp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        refined = np.where(d2 > 0, y0 - (yp - ym) ** 2 / (8 * d2), y0)
+    candidates = np.concatenate([y[valid], refined[local]])
+    return float(sign * candidates.min())
+
+
+def extract_numpy_prosodic_features(
+    samples: np.ndarray,
+    sample_rate: float,
+    analyses: frozenset[str],
+    tier: ExtractionTier,
+    tracks: dict | None = None,
+) -> dict:
+    """
+    Compute pitch, harmonicity and intensity features without Praat.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono audio samples.
+    sample_rate : float
+        Sample rate in Hz.
+    analyses : frozenset[str]
+        Analyses to run; only those in NUMPY_ANALYSES are handled.
+    tier : ExtractionTier
+        Extraction tier (pitch and harmonicity time steps).
+    tracks : dict, optional
+        If given, filled with the frame-level tracks ('f0', 'hnr',
+        'intensity') as (times, values) pairs (see features/frame_store.py).
+
+    Returns
+    -------
+    dict
+        Same feature names and meaning as the Praat backend in prosodic_simple.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    features = {}
+
+    if PITCH in analyses or PITCH_AC in analyses:
+        try:
+            times, f0 = compute_pitch_track(samples, sample_rate, tier.pitch_time_step)
+            if tracks is not None:
+                tracks["f0"] = (times, f0)
+            voiced = f0[f0 > 0]
+            if not len(voiced):
+                raise ValueError("no voiced frames")
+            f0_mean = float(voiced.mean())
+            if PITCH in analyses:
+                features["f0_mean"] = f0_mean
+                features["f0_std"] = float(voiced.std(ddof=1)) if len(voiced) > 1 else np.nan
+                features["f0_min"] = _parabolic_extremum(f0, maximum=False, valid=f0 > 0)
+                features["f0_max"] = _parabolic_extremum(f0, maximum=True, valid=f0 > 0)
+            if PITCH_AC in analyses:
+                features["autocorr_harmonicity"] = f0_mean
+        except Exception:
+            if PITCH in analyses:
+                features.update({k: np.nan for k in ["f0_mean", "f0_std", "f0_min", "f0_max"]})
+            if PITCH_AC in analyses:
+                features["autocorr_harmonicity"] = np.nan
+
+    if HARMONICITY in analyses:
+        try:
+            times, hnr = compute_harmonicity_track(
+                samples,
+                sample_rate,
+                tier.harmonicity_time_step,
+                tier.harmonicity_periods_per_window,
+            )
+            if tracks is not None:
+                tracks["hnr"] = (times, hnr)
+            features["hnr_mean"] = float(np.nanmean(hnr)) if np.isfinite(hnr).any() else np.nan
+        except Exception:
+            features["hnr_mean"] = np.nan
+
+    if INTENSITY in analyses:
+        try:
+            times, intensity = compute_intensity_track(samples, sample_rate)
+            if tracks is not None:
+                tracks["intensity"] = (times, intensity)
+            features["intensity_mean"] = float(intensity.mean())
+            features["intensity_min"] = _parabolic_extremum(intensity, maximum=False)
+            features["intensity_max"] = _parabolic_extremum(intensity, maximum=True)
+        except Exception:
+            features.update(
+                {k: np.nan for k in ["intensity_mean", "intensity_min", "intensity_max"]}
+            )
+
+    return features
@@ -12,13 +12,70 @@ Reduced feature set for baseline experiments:
 Total: 21 features
 
 CRITICAL: Jitter, shimmer, and F0 are computed on VOICED FRAMES ONLY.
+
+Only the Praat analyses listed in ``analyses`` are run (see features/plan.py);
+feature groups whose analysis is skipped are omitted from the output.
+Time steps and analysis sample rate follow the extraction tier (features/tiers.py).
+With the "numpy" backend, pitch, harmonicity and intensity are computed by
+features/prosodic_numpy.py instead of Praat.
+If speech ``segments`` are given (features/segmentation.py), only the speech
+intervals are analysed.
 """
 
 import numpy as np
 import parselmouth
 from parselmouth.praat import call
 
-from parkinsons_voice_classification.config import F0_MIN_HZ, F0_MAX_HZ
+from parkinsons_voice_classification.config import F0_MIN_HZ, F0_MAX_HZ, PROSODIC_BACKEND
+from parkinsons_voice_classification.features.audio_io import AudioSource, load_sound
+from parkinsons_voice_classification.features.plan import (
+    PITCH,
+    PITCH_AC,
+    POINT_PROCESS,
+    HARMONICITY,
+    INTENSITY,
+    FORMANT,
+    PRAAT_ANALYSES,
+)
+from parkinsons_voice_classification.features.perturbation import extract_perturbation_features
+from parkinsons_voice_classification.features.prosodic_numpy import (
+    NUMPY_ANALYSES,
+    extract_numpy_prosodic_features,
+)
+from parkinsons_voice_classification.features.segmentation import SpeechSegments, trim_sound
+from parkinsons_voice_classification.features.tiers import ExtractionTier, get_extraction_tier
+
+PROSODIC_BACKENDS = ("praat", "numpy")
+
+
+def get_prosodic_backend(backend: str | None = None) -> str:
+    """
+    Validate a prosodic backend name.
+
+    Parameters
+    ----------
+    backend : str, optional
+        'praat' or 'numpy'. Defaults to PROSODIC_BACKEND from config.
+
+    Returns
+    -------
+    str
+        The validated backend name.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    """
+    if backend is None:
+        backend = PROSODIC_BACKEND
+
+    if backend not in PROSODIC_BACKENDS:
+        raise ValueError(
+            f"Unknown prosodic backend: {backend}. Available: {list(PROSODIC_BACKENDS)}"
+        )
+
+    return backend
 
 
 def get_prosodic_feature_names() -> list[str]:
@@ -54,26 +111,110 @@ def get_prosodic_feature_names() -> list[str]:
     ]
 
 
-def extract_prosodic_features(audio_path: str) -> dict:
+def extract_prosodic_features(
+    audio_path: AudioSource,
+    analyses: frozenset[str] | None = None,
+    tier: str | None = None,
+    segments: SpeechSegments | None = None,
+    backend: str | None = None,
+    tracks: dict | None = None,
+) -> dict:
     """
-    Extract all prosodic features from a single audio file.
+    Extract prosodic features from a single audio file.
 
     Parameters
     ----------
     audio_path : str
-        Path to WAV file.
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+    analyses : frozenset[str], optional
+        Praat analyses to run (identifiers from features.plan). Defaults to
+        all of them, producing the full 21-feature set.
+    tier : str, optional
+        Extraction quality tier ('accurate', 'balanced', 'fast').
+        Defaults to EXTRACTION_TIER from config.
+    segments : SpeechSegments, optional
+        Speech intervals to keep. If given, pauses are removed before any
+        Praat analysis. Defaults to analysing the full recording.
+    backend : str, optional
+        'praat' or 'numpy' for pitch, harmonicity and intensity. Defaults to
+        PROSODIC_BACKEND from config.
+    tracks : dict, optional
+        If given, filled with the frame-level tracks computed along the way
+        ('f0', 'hnr', 'intensity', 'formants') as (times, values) pairs, for
+        the frame store (features/frame_store.py).
 
     Returns
     -------
     dict
-        Dictionary with 21 prosodic features.
+        Dictionary with the prosodic features of the requested analyses.
     """
-    sound = parselmouth.Sound(audio_path)
+    if analyses is None:
+        analyses = PRAAT_ANALYSES
+    tier_params = get_extraction_tier(tier)
+
+    sound = load_sound(audio_path)
+    if segments is not None:
+        sound = trim_sound(sound, segments)
     features = {}
 
+    # NumPy backend takes over pitch/harmonicity/intensity; Praat runs the rest
+    if get_prosodic_backend(backend) == "numpy":
+        numpy_analyses = analyses & NUMPY_ANALYSES
+        if numpy_analyses:
+            features.update(
+                extract_numpy_prosodic_features(
+                    sound.values.mean(axis=0),
+                    sound.sampling_frequency,
+                    numpy_analyses,
+                    tier_params,
+                    tracks=tracks,
+                )
+            )
+        analyses = analyses - numpy_analyses
+
+    # Downsampled copy for Harmonicity/Formant (faster tiers only)
+    analysis_sound = sound
+    rate = tier_params.analysis_sample_rate
+    if (
+        rate is not None
+        and sound.sampling_frequency > rate
+        and (HARMONICITY in analyses or FORMANT in analyses)
+    ):
+        analysis_sound = call(sound, "Resample", rate, 50)
+
     # === F0 Features (4) ===
+    if PITCH in analyses:
+        _add_pitch_features(sound, features, tier_params, tracks)
+
+    # === Jitter (3) + Shimmer (3) Features, from one shared PointProcess ===
+    if POINT_PROCESS in analyses:
+        _add_perturbation_features(sound, features)
+
+    # === Harmonicity Features (2) ===
+    if HARMONICITY in analyses:
+        _add_hnr_features(analysis_sound, features, tier_params, tracks)
+    if PITCH_AC in analyses:
+        _add_autocorr_features(sound, features, tier_params)
+
+    # === Intensity Features (3) ===
+    if INTENSITY in analyses:
+        _add_intensity_features(sound, features, tracks)
+
+    # === Formant Features (6) ===
+    if FORMANT in analyses:
+        _add_formant_features(analysis_sound, features, tier_params, tracks)
+
+    return {name: features[name] for name in get_prosodic_feature_names() if name in features}
+
+
+def _add_pitch_features(
+    sound: parselmouth.Sound, features: dict, tier: ExtractionTier, tracks: dict | None = None
+) -> None:
+    """Add F0 statistics (mean, std, min, max) from To Pitch."""
     try:
-        pitch = call(sound, "To Pitch", 0.0, F0_MIN_HZ, F0_MAX_HZ)
+        pitch = call(sound, "To Pitch", tier.pitch_time_step, F0_MIN_HZ, F0_MAX_HZ)
+        if tracks is not None:
+            tracks["f0"] = (pitch.xs(), pitch.selected_array["frequency"])
         features["f0_mean"] = call(pitch, "Get mean", 0, 0, "Hertz")
         features["f0_std"] = call(pitch, "Get standard deviation", 0, 0, "Hertz")
         features["f0_min"] = call(pitch, "Get minimum", 0, 0, "Hertz", "Parabolic")
@@ -81,42 +222,49 @@ def extract_prosodic_features(audio_path: str) -> dict:
     except Exception:
         features.update({k: np.nan for k in ["f0_mean", "f0_std", "f0_min", "f0_max"]})
 
-    # === Jitter Features (3) ===
+
+def _add_perturbation_features(sound: parselmouth.Sound, features: dict) -> None:
+    """Add jitter and shimmer features from a single glottal-pulse array."""
+    jitter_names = ["jitter_local", "jitter_rap", "jitter_ppq5"]
+    shimmer_names = ["shimmer_local", "shimmer_apq3", "shimmer_apq11"]
+
     try:
-        point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
-        features["jitter_local"] = call(
-            point_process, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3
-        )
-        features["jitter_rap"] = call(point_process, "Get jitter (rap)", 0, 0, 0.0001, 0.02, 1.3)
-        features["jitter_ppq5"] = call(point_process, "Get jitter (ppq5)", 0, 0, 0.0001, 0.02, 1.3)
+        # One PointProcess, one pass over pulses and amplitudes (features/perturbation.py)
+        perturbation = extract_perturbation_features(sound)
+        features.update({k: perturbation[k] for k in jitter_names + shimmer_names})
     except Exception:
-        features.update({k: np.nan for k in ["jitter_local", "jitter_rap", "jitter_ppq5"]})
+        features.update({k: np.nan for k in jitter_names + shimmer_names})
+
 
-    # === Shimmer Features (3) ===
+def _add_hnr_features(
+    sound: parselmouth.Sound, features: dict, tier: ExtractionTier, tracks: dict | None = None
+) -> None:
+    """Add mean harmonics-to-noise ratio from To Harmonicity (cc)."""
     try:
-        point_process = call(sound, "To PointProcess (periodic, cc)", F0_MIN_HZ, F0_MAX_HZ)
-        features["shimmer_local"] = call(
-            [sound, point_process], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6
-        )
-        features["shimmer_apq3"] = call(
-            [sound, point_process], "Get shimmer (apq3)", 0, 0, 0.0001, 0.02, 1.3, 1.6
-        )
-        features["shimmer_apq11"] = call(
-            [sound, point_process], "Get shimmer (apq11)", 0, 0, 0.0001, 0.02, 1.3, 1.6
+        harmonicity = call(
+            sound,
+            "To Harmonicity (cc)",
+            tier.harmonicity_time_step,
+            F0_MIN_HZ,
+            0.1,
+            tier.harmonicity_periods_per_window,
         )
+        features["hnr_mean"] = call(harmonicity, "Get mean", 0, 0)
+        if tracks is not None:
+            # Praat marks unvoiced frames with -200 dB
+            hnr = harmonicity.values[0]
+            tracks["hnr"] = (harmonicity.xs(), np.where(hnr == -200, np.nan, hnr))
     except Exception:
-        features.update({k: np.nan for k in ["shimmer_local", "shimmer_apq3", "shimmer_apq11"]})
+        features["hnr_mean"] = np.nan
 
-    # === Harmonicity Features (2) ===
-    try:
-        harmonicity = call(sound, "To Harmonicity (cc)", 0.01, F0_MIN_HZ, 0.1, 1.0)
-        features["hnr_mean"] = call(harmonicity, "Get mean", 0, 0)
 
-        # Autocorrelation-based harmonicity
+def _add_autocorr_features(sound: parselmouth.Sound, features: dict, tier: ExtractionTier) -> None:
+    """Add autocorrelation-based harmonicity from To Pitch (ac)."""
+    try:
         pitch = call(
             sound,
             "To Pitch (ac)",
-            0.0,
+            tier.pitch_time_step,
             F0_MIN_HZ,
             15,
             "no",
@@ -129,24 +277,35 @@ def extract_prosodic_features(audio_path: str) -> dict:
         )
         features["autocorr_harmonicity"] = call(pitch, "Get mean", 0, 0, "Hertz")
     except Exception:
-        features.update({k: np.nan for k in ["hnr_mean", "autocorr_harmonicity"]})
+        features["autocorr_harmonicity"] = np.nan
 
-    # === Intensity Features (3) ===
+
+def _add_intensity_features(
+    sound: parselmouth.Sound, features: dict, tracks: dict | None = None
+) -> None:
+    """Add intensity statistics (mean, min, max) in dB."""
     try:
         intensity = call(sound, "To Intensity", F0_MIN_HZ, 0.0, "yes")
+        if tracks is not None:
+            tracks["intensity"] = (intensity.xs(), intensity.values[0])
         features["intensity_mean"] = call(intensity, "Get mean", 0, 0, "dB")
         features["intensity_min"] = call(intensity, "Get minimum", 0, 0, "Parabolic")
         features["intensity_max"] = call(intensity, "Get maximum", 0, 0, "Parabolic")
     except Exception:
         features.update({k: np.nan for k in ["intensity_mean", "intensity_min", "intensity_max"]})
 
-    # === Formant Features (6) ===
+
+def _add_formant_features(
+    sound: parselmouth.Sound, features: dict, tier: ExtractionTier, tracks: dict | None = None
+) -> None:
+    """Add F1-F3 mean and standard deviation from To Formant (burg)."""
     try:
-        formants = call(sound, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
+        formants = call(sound, "To Formant (burg)", tier.formant_time_step, 5, 5500, 0.025, 50)
 
         # Get F1, F2, F3 values over time
         num_frames = call(formants, "Get number of frames")
         f1_vals, f2_vals, f3_vals = [], [], []
+        frame_values = np.full((num_frames, 3), np.nan)
 
         for frame in range(1, num_frames + 1):
             f1 = call(
@@ -174,6 +333,8 @@ def extract_prosodic_features(audio_path: str) -> dict:
                 "Linear",
             )
 
+            frame_values[frame - 1] = (f1, f2, f3)
+
             if not np.isnan(f1):
                 f1_vals.append(f1)
             if not np.isnan(f2):
@@ -181,6 +342,9 @@ def extract_prosodic_features(audio_path: str) -> dict:
             if not np.isnan(f3):
                 f3_vals.append(f3)
 
+        if tracks is not None:
+            tracks["formants"] = (formants.xs(), frame_values)
+
         features["f1_mean"] = np.mean(f1_vals) if f1_vals else np.nan
         features["f2_mean"] = np.mean(f2_vals) if f2_vals else np.nan
         features["f3_mean"] = np.mean(f3_vals) if f3_vals else np.nan
@@ -191,5 +355,3 @@ def extract_prosodic_features(audio_path: str) -> dict:
         features.update(
             {k: np.nan for k in ["f1_mean", "f2_mean", "f3_mean", "f1_std", "f2_std", "f3_std"]}
         )
-
-    return features
@@ -0,0 +1,272 @@
+"""
+Voice-Activity Segmentation Stage
+
+Energy/voicing-based speech detection, run once per recording ahead of the
+prosodic and spectral extractors. SpontaneousDialogue recordings contain long
+pauses, so with VAD_MODE = "trim" both extractors analyse only the detected
+speech, which cuts Praat and librosa work roughly in proportion to the
+speech ratio.
+
+Detection (all frames at once, 25 ms frames / 10 ms hop by default):
+1. Frame energy in dB relative to the loudest frame >= VAD_THRESHOLD_DB
+2. Voicing gate: zero-crossing rate <= VAD_MAX_ZCR_HZ (rejects broadband noise)
+3. Pauses shorter than VAD_MIN_SILENCE are bridged (keeps fricatives, stops)
+4. Speech runs shorter than VAD_MIN_SPEECH are dropped
+5. Intervals are padded by VAD_PADDING and merged
+
+Intervals are stored in seconds, so one segmentation applies to both the
+native-rate Praat sound and the resampled librosa signal.
+
+Modes (config.VAD_MODE):
+- off:     No segmentation (locked thesis behaviour)
+- measure: Record the per-file speech_ratio column; features use full audio
+- trim:    Record speech_ratio and concatenate speech intervals before analysis
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import parselmouth
+
+from parkinsons_voice_classification.config import (
+    VAD_MODE,
+    VAD_FRAME_LENGTH,
+    VAD_HOP_LENGTH,
+    VAD_THRESHOLD_DB,
+    VAD_MAX_ZCR_HZ,
+    VAD_MIN_SPEECH,
+    VAD_MIN_SILENCE,
+    VAD_PADDING,
+)
+from parkinsons_voice_classification.features.audio_io import AudioSource, load_sound
+
+VAD_MODES = ("off", "measure", "trim")
+
+
+@dataclass(frozen=True)
+class SpeechSegments:
+    """
+    Speech intervals detected in one recording.
+
+    Attributes
+    ----------
+    intervals : np.ndarray
+        (n_intervals, 2) array of [start, end) times in seconds, sorted and
+        non-overlapping.
+    duration : float
+        Total recording duration in seconds.
+    frame_mask : np.ndarray
+        Boolean speech mask per VAD frame, after smoothing (before padding).
+    hop_length : float
+        VAD frame hop in seconds (frame i starts at i * hop_length).
+    """
+
+    intervals: np.ndarray
+    duration: float
+    frame_mask: np.ndarray
+    hop_length: float
+
+    @property
+    def speech_duration(self) -> float:
+        """Total duration of speech in seconds."""
+        return float(np.sum(self.intervals[:, 1] - self.intervals[:, 0]))
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of the recording detected as speech (0.0 to 1.0)."""
+        if self.duration <= 0:
+            return np.nan
+        return self.speech_duration / self.duration
+
+    def mask_at(self, times: np.ndarray) -> np.ndarray:
+        """
+        Return a boolean speech mask for arbitrary time points.
+
+        Reusable for frame tracks of any analysis (e.g. Praat pitch frames or
+        librosa STFT frame times).
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Time points in seconds.
+
+        Returns
+        -------
+        np.ndarray
+            True where the time point falls inside a speech interval.
+        """
+        times = np.asarray(times, dtype=float)
+        idx = np.searchsorted(self.intervals[:, 0], times, side="right") - 1
+        valid = idx >= 0
+        mask = np.zeros(times.shape, dtype=bool)
+        mask[valid] = times[valid] < self.intervals[idx[valid], 1]
+        return mask
+
+    def sample_slices(self, sample_rate: float, n_samples: int) -> list[slice]:
+        """Return sample-index slices of the speech intervals at a given rate."""
+        bounds = np.round(self.intervals * sample_rate).astype(int)
+        bounds = np.clip(bounds, 0, n_samples)
+        return [slice(start, end) for start, end in bounds if end > start]
+
+
+def _run_bounds(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return start and (exclusive) end indices of the True runs in a mask."""
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def detect_speech(samples: np.ndarray, sample_rate: float) -> SpeechSegments:
+    """
+    Detect speech intervals in a mono signal.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Mono audio samples.
+    sample_rate : float
+        Sample rate in Hz.
+
+    Returns
+    -------
+    SpeechSegments
+        Detected speech intervals and frame mask.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    duration = len(samples) / sample_rate
+
+    frame_length = max(1, int(round(VAD_FRAME_LENGTH * sample_rate)))
+    hop_length = max(1, int(round(VAD_HOP_LENGTH * sample_rate)))
+    hop_seconds = hop_length / sample_rate
+
+    if len(samples) < frame_length:
+        empty = np.zeros((0, 2))
+        return SpeechSegments(empty, duration, np.zeros(0, dtype=bool), hop_seconds)
+
+    # (n_frames, frame_length) strided view, no copy
+    frames = np.lib.stride_tricks.sliding_window_view(samples, frame_length)[::hop_length]
+
+    # 1. Energy relative to the loudest frame
+    energy_db = 10 * np.log10(np.mean(frames**2, axis=1) + 1e-12)
+    energetic = energy_db >= energy_db.max() + VAD_THRESHOLD_DB
+
+    # 2. Voicing gate on zero-crossing rate (crossings per second)
+    crossings = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1)
+    zcr_hz = crossings * sample_rate / (frame_length - 1)
+    mask = energetic & (zcr_hz <= VAD_MAX_ZCR_HZ)
+
+    # 3. Bridge short pauses between speech runs
+    starts, ends = _run_bounds(~mask)
+    max_gap = VAD_MIN_SILENCE / hop_seconds
+    for start, end in zip(starts, ends):
+        if start > 0 and end < len(mask) and end - start < max_gap:
+            mask[start:end] = True
+
+    # 4. Drop short speech runs
+    starts, ends = _run_bounds(mask)
+    min_run = VAD_MIN_SPEECH / hop_seconds
+    for start, end in zip(starts, ends):
+        if end - start < min_run:
+            mask[start:end] = False
+
+    # 5. Frame runs -> padded, merged time intervals
+    starts, ends = _run_bounds(mask)
+    frame_seconds = frame_length / sample_rate
+    interval_starts = np.maximum(starts * hop_seconds - VAD_PADDING, 0.0)
+    interval_ends = np.minimum((ends - 1) * hop_seconds + frame_seconds + VAD_PADDING, duration)
+
+    intervals = []
+    for start, end in zip(interval_starts, interval_ends):
+        if intervals and start <= intervals[-1][1]:
+            intervals[-1][1] = max(intervals[-1][1], end)
+        else:
+            intervals.append([start, end])
+
+    return SpeechSegments(
+        intervals=np.array(intervals, dtype=float).reshape(-1, 2),
+        duration=duration,
+        frame_mask=mask,
+        hop_length=hop_seconds,
+    )
+
+
+def segment_sound(sound: parselmouth.Sound) -> SpeechSegments:
+    """Detect speech intervals in a parselmouth Sound (channels are averaged)."""
+    return detect_speech(sound.values.mean(axis=0), sound.sampling_frequency)
+
+
+def segment_file(audio_path: AudioSource) -> SpeechSegments:
+    """
+    Detect speech intervals in an audio file at its native sample rate.
+
+    Parameters
+    ----------
+    audio_path : str
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+
+    Returns
+    -------
+    SpeechSegments
+        Detected speech intervals.
+    """
+    return segment_sound(load_sound(audio_path))
+
+
+def trim_samples(samples: np.ndarray, sample_rate: float, segments: SpeechSegments) -> np.ndarray:
+    """
+    Concatenate the speech intervals of a signal.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        Audio samples, time on the last axis.
+    sample_rate : float
+        Sample rate of ``samples`` in Hz.
+    segments : SpeechSegments
+        Speech intervals (in seconds).
+
+    Returns
+    -------
+    np.ndarray
+        Speech-only signal. The input is returned unchanged if no speech was
+        detected, so extraction degrades to full-file analysis.
+    """
+    slices = segments.sample_slices(sample_rate, samples.shape[-1])
+    if not slices:
+        return samples
+    return np.concatenate([samples[..., s] for s in slices], axis=-1)
+
+
+def trim_sound(sound: parselmouth.Sound, segments: SpeechSegments) -> parselmouth.Sound:
+    """Return a parselmouth Sound holding only the speech intervals of ``sound``."""
+    if len(segments.intervals) == 0:
+        return sound
+    values = trim_samples(sound.values, sound.sampling_frequency, segments)
+    return parselmouth.Sound(values, sampling_frequency=sound.sampling_frequency)
+
+
+def get_vad_mode(mode: str | None = None) -> str:
+    """
+    Validate a segmentation mode name.
+
+    Parameters
+    ----------
+    mode : str, optional
+        'off', 'measure' or 'trim'. Defaults to VAD_MODE from config.
+
+    Returns
+    -------
+    str
+        The validated mode.
+
+    Raises
+    ------
+    ValueError
+        If the mode is unknown.
+    """
+    if mode is None:
+        mode = VAD_MODE
+
+    if mode not in VAD_MODES:
+        raise ValueError(f"Unknown VAD mode: {mode}. Available: {list(VAD_MODES)}")
+
+    return mode
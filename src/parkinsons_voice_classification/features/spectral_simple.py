@@ -14,8 +14,20 @@ Feature sets:
   - Spectral shape: 5 features (centroid, bandwidth, rolloff, flatness, zcr)
 
 Controlled by USE_EXTENDED_FEATURES in config.py
+
+A single magnitude STFT is computed per file and shared by the MFCCs and the
+spectral shape descriptors. Only the librosa analyses listed in ``analyses``
+are run (see features/plan.py). If speech ``segments`` are given
+(features/segmentation.py), only the speech intervals are analysed.
+
+STFT/mel/MFCC parameters come from a SpectralConfig (defaults: the locked
+MFCC_* values in config.py). compute_spectral_features() works on decoded
+samples and an optional precomputed magnitude STFT, so a parameter sweep can
+decode each file once (see features/spectral_sweep.py).
 """
 
+from dataclasses import dataclass
+
 import numpy as np
 import librosa
 
@@ -27,28 +39,75 @@ from parkinsons_voice_classification.config import (
     MFCC_N_MELS,
     USE_EXTENDED_FEATURES,
 )
+from parkinsons_voice_classification.features.audio_io import AudioSource, load_samples
+from parkinsons_voice_classification.features.plan import (
+    STFT,
+    MFCC,
+    DELTA,
+    DELTA2,
+    ZCR,
+    LIBROSA_ANALYSES,
+    get_feature_analyses,
+)
+from parkinsons_voice_classification.features.segmentation import SpeechSegments, trim_samples
+
+
+@dataclass(frozen=True)
+class SpectralConfig:
+    """
+    STFT, mel and MFCC parameters of the spectral extractor.
+
+    Attributes
+    ----------
+    n_fft : int
+        FFT window size (samples).
+    hop_length : int
+        Hop length (samples).
+    n_mels : int
+        Number of mel bands.
+    n_mfcc : int
+        Number of MFCC coefficients.
+    """
 
+    n_fft: int = MFCC_N_FFT
+    hop_length: int = MFCC_HOP_LENGTH
+    n_mels: int = MFCC_N_MELS
+    n_mfcc: int = MFCC_N_COEFFS
 
-def get_spectral_feature_names() -> list[str]:
-    """Return ordered list of spectral feature names (26 or 57 features)."""
+    @property
+    def name(self) -> str:
+        """Identifier used in sweep output filenames."""
+        return f"nfft{self.n_fft}_hop{self.hop_length}_mels{self.n_mels}_mfcc{self.n_mfcc}"
+
+
+DEFAULT_SPECTRAL_CONFIG = SpectralConfig()
+
+
+def compute_stft_magnitude(y: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Magnitude spectrogram shared by the MFCCs and the spectral shape features."""
+    return np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
+
+
+def get_spectral_feature_names(n_mfcc: int = MFCC_N_COEFFS) -> list[str]:
+    """Return ordered list of spectral feature names (26 or 57 features by default)."""
     names = []
 
     # MFCC means (13) - always included
-    for i in range(MFCC_N_COEFFS):
+    for i in range(n_mfcc):
         names.append(f"mfcc_{i}_mean")
 
     # MFCC std (13) - extended only
     if USE_EXTENDED_FEATURES:
-        for i in range(MFCC_N_COEFFS):
+        for i in range(n_mfcc):
             names.append(f"mfcc_{i}_std")
 
     # Delta MFCC means (13) - always included
-    for i in range(MFCC_N_COEFFS):
+    for i in range(n_mfcc):
         names.append(f"delta_mfcc_{i}_mean")
 
     # Delta-delta MFCC means (13) - extended only
     if USE_EXTENDED_FEATURES:
-        for i in range(MFCC_N_COEFFS):
+        for i in range(n_mfcc):
             names.append(f"delta2_mfcc_{i}_mean")
 
     # Spectral shape features (5) - extended only
@@ -66,91 +125,158 @@ def get_spectral_feature_names() -> list[str]:
     return names
 
 
-def extract_spectral_features(audio_path: str) -> dict:
+def extract_spectral_features(
+    audio_path: AudioSource,
+    analyses: frozenset[str] | None = None,
+    segments: SpeechSegments | None = None,
+    tracks: dict | None = None,
+) -> dict:
     """
     Extract spectral features from a single audio file.
 
     Parameters
     ----------
     audio_path : str
-        Path to WAV file.
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+    analyses : frozenset[str], optional
+        librosa analyses to run (identifiers from features.plan). Defaults to
+        all of them, producing the full 26 (baseline) or 57 (extended) set.
+    segments : SpeechSegments, optional
+        Speech intervals to keep. If given, pauses are removed before any
+        librosa analysis. Defaults to analysing the full recording.
+    tracks : dict, optional
+        If given, filled with the frame-level MFCC track ('mfcc', frames ×
+        coefficients) as a (times, values) pair, for the frame store
+        (features/frame_store.py).
 
     Returns
     -------
     dict
-        Dictionary with 26 (baseline) or 57 (extended) spectral features.
+        Dictionary with the spectral features of the requested analyses.
     """
+    try:
+        # Load audio
+        y, sr = load_samples(audio_path, TARGET_SAMPLE_RATE)
+        if segments is not None:
+            y = trim_samples(y, sr, segments)
+    except Exception:
+        y, sr = None, TARGET_SAMPLE_RATE
+
+    return compute_spectral_features(y, sr, analyses, tracks=tracks)
+
+
+def compute_spectral_features(
+    y: np.ndarray | None,
+    sr: int,
+    analyses: frozenset[str] | None = None,
+    config: SpectralConfig = DEFAULT_SPECTRAL_CONFIG,
+    S: np.ndarray | None = None,
+    tracks: dict | None = None,
+) -> dict:
+    """
+    Compute spectral features from decoded samples.
+
+    Parameters
+    ----------
+    y : np.ndarray or None
+        Audio samples at ``sr``. None (failed decode) yields NaN features.
+    sr : int
+        Sample rate in Hz.
+    analyses : frozenset[str], optional
+        librosa analyses to run. Defaults to all of them.
+    config : SpectralConfig
+        STFT/mel/MFCC parameters. Defaults to the locked config.py values.
+    S : np.ndarray, optional
+        Precomputed magnitude STFT for ``config.n_fft`` / ``config.hop_length``
+        (see compute_stft_magnitude). Computed here if not given.
+    tracks : dict, optional
+        If given, filled with the frame-level MFCC track (see extract_spectral_features).
+
+    Returns
+    -------
+    dict
+        Dictionary with the spectral features of the requested analyses.
+    """
+    if analyses is None:
+        analyses = LIBROSA_ANALYSES
+
+    n_fft, hop_length, n_mfcc = config.n_fft, config.hop_length, config.n_mfcc
     features = {}
 
     try:
-        # Load audio
-        y, sr = librosa.load(audio_path, sr=TARGET_SAMPLE_RATE)
-
-        # Compute MFCCs
-        mfccs = librosa.feature.mfcc(
-            y=y,
-            sr=sr,
-            n_mfcc=MFCC_N_COEFFS,
-            n_fft=MFCC_N_FFT,
-            hop_length=MFCC_HOP_LENGTH,
-            n_mels=MFCC_N_MELS,
-        )
+        if y is None:
+            raise ValueError("no audio")
 
-        # MFCC means (13) - always included
-        for i in range(MFCC_N_COEFFS):
-            features[f"mfcc_{i}_mean"] = np.mean(mfccs[i])
+        # Magnitude spectrogram, shared by MFCCs and spectral shape
+        if STFT in analyses and S is None:
+            S = compute_stft_magnitude(y, n_fft, hop_length)
 
-        # MFCC std (13) - extended only
-        if USE_EXTENDED_FEATURES:
-            for i in range(MFCC_N_COEFFS):
-                features[f"mfcc_{i}_std"] = np.std(mfccs[i])
+        if MFCC in analyses:
+            # Same computation as librosa.feature.mfcc(y=...), reusing S
+            mel = librosa.feature.melspectrogram(
+                S=S**2, sr=sr, n_fft=n_fft, hop_length=hop_length, n_mels=config.n_mels
+            )
+            mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=n_mfcc)
+            if tracks is not None:
+                times = librosa.frames_to_time(
+                    np.arange(mfccs.shape[1]), sr=sr, hop_length=hop_length
+                )
+                tracks["mfcc"] = (times, mfccs.T)
+
+            # MFCC means (13) - always included
+            for i in range(n_mfcc):
+                features[f"mfcc_{i}_mean"] = np.mean(mfccs[i])
+
+            # MFCC std (13) - extended only
+            if USE_EXTENDED_FEATURES:
+                for i in range(n_mfcc):
+                    features[f"mfcc_{i}_std"] = np.std(mfccs[i])
 
         # Delta MFCC means (13) - always included
-        delta_mfccs = librosa.feature.delta(mfccs, order=1)
-        for i in range(MFCC_N_COEFFS):
-            features[f"delta_mfcc_{i}_mean"] = np.mean(delta_mfccs[i])
+        if DELTA in analyses:
+            delta_mfccs = librosa.feature.delta(mfccs, order=1)
+            for i in range(n_mfcc):
+                features[f"delta_mfcc_{i}_mean"] = np.mean(delta_mfccs[i])
 
         # Delta-delta MFCC means (13) - extended only
-        if USE_EXTENDED_FEATURES:
+        if USE_EXTENDED_FEATURES and DELTA2 in analyses:
             delta2_mfccs = librosa.feature.delta(mfccs, order=2)
-            for i in range(MFCC_N_COEFFS):
+            for i in range(n_mfcc):
                 features[f"delta2_mfcc_{i}_mean"] = np.mean(delta2_mfccs[i])
 
         # Spectral shape features (5) - extended only
-        if USE_EXTENDED_FEATURES:
+        if USE_EXTENDED_FEATURES and STFT in analyses:
             # Spectral centroid
             centroid = librosa.feature.spectral_centroid(
-                y=y, sr=sr, n_fft=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH
+                S=S, sr=sr, n_fft=n_fft, hop_length=hop_length
             )
             features["spectral_centroid_mean"] = np.mean(centroid)
 
             # Spectral bandwidth
             bandwidth = librosa.feature.spectral_bandwidth(
-                y=y, sr=sr, n_fft=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH
+                S=S, sr=sr, n_fft=n_fft, hop_length=hop_length
             )
             features["spectral_bandwidth_mean"] = np.mean(bandwidth)
 
             # Spectral rolloff
             rolloff = librosa.feature.spectral_rolloff(
-                y=y, sr=sr, n_fft=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH
+                S=S, sr=sr, n_fft=n_fft, hop_length=hop_length
             )
             features["spectral_rolloff_mean"] = np.mean(rolloff)
 
             # Spectral flatness
-            flatness = librosa.feature.spectral_flatness(
-                y=y, n_fft=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH
-            )
+            flatness = librosa.feature.spectral_flatness(S=S, n_fft=n_fft, hop_length=hop_length)
             features["spectral_flatness_mean"] = np.mean(flatness)
 
+        if USE_EXTENDED_FEATURES and ZCR in analyses:
             # Zero crossing rate
-            zcr = librosa.feature.zero_crossing_rate(
-                y=y, frame_length=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH
-            )
+            zcr = librosa.feature.zero_crossing_rate(y=y, frame_length=n_fft, hop_length=hop_length)
             features["zcr_mean"] = np.mean(zcr)
 
     except Exception:
         # Fill with NaN on failure
-        for name in get_spectral_feature_names():
-            features[name] = np.nan
+        for name in get_spectral_feature_names(n_mfcc):
+            if get_feature_analyses(name) <= analyses:
+                features[name] = np.nan
 
     return features
@@ -0,0 +1,346 @@
+"""
+Multi-Configuration Spectral Sweep
+
+Comparing spectral parameterizations (FFT size, hop, mel bands, MFCC count)
+by re-running ``pvc-extract`` once per setting decodes, resamples and runs
+Praat on every file again each time. The sweep instead:
+
+- decodes and resamples each file once,
+- computes the prosodic features once (they do not depend on the spectral
+  parameters),
+- computes one magnitude STFT per distinct (n_fft, hop_length) pair and
+  shares it across all configurations that use it (e.g. several n_mels /
+  n_mfcc settings on the same STFT),
+
+and writes one feature table per configuration, each with the usual
+metadata sidecar plus a ``spectral_config`` entry.
+
+Configurations are written as ``N_FFT:HOP:N_MELS:N_MFCC``
+(e.g. ``2048:512:128:13``, the locked default in config.py).
+
+Layout (outputs/features/{baseline|extended}/sweep/):
+- features_{task}_nfft{N}_hop{H}_mels{M}_mfcc{C}.csv
+- features_{task}_nfft{N}_hop{H}_mels{M}_mfcc{C}_metadata.json
+
+Usage:
+    configs = [parse_spectral_config(s) for s in ["2048:512:128:13", "1024:256:64:20"]]
+    tables = run_spectral_sweep("ReadText", configs)
+"""
+
+import json
+import logging
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from parkinsons_voice_classification.config import (
+    METADATA_COLUMNS,
+    TARGET_SAMPLE_RATE,
+    USE_EXTENDED_FEATURES,
+    get_features_output_dir,
+)
+from parkinsons_voice_classification.data.archives import (
+    iter_archive_members,
+    load_archive_manifest,
+    split_archive_path,
+)
+from parkinsons_voice_classification.data.mdvr_kcl import build_manifest
+from parkinsons_voice_classification.features.audio_io import AudioSource, load_samples
+from parkinsons_voice_classification.features.executor import get_extraction_executor
+from parkinsons_voice_classification.features.extraction_simple import (
+    _group_by_source,
+    extract_all_features,
+    get_feature_metadata_path,
+)
+from parkinsons_voice_classification.features.plan import LIBROSA_ANALYSES
+from parkinsons_voice_classification.features.prosodic_simple import (
+    get_prosodic_backend,
+    get_prosodic_feature_names,
+)
+from parkinsons_voice_classification.features.segmentation import (
+    SpeechSegments,
+    get_vad_mode,
+    segment_file,
+    trim_samples,
+)
+from parkinsons_voice_classification.features.spectral_simple import (
+    SpectralConfig,
+    compute_spectral_features,
+    compute_stft_magnitude,
+    get_spectral_feature_names,
+)
+from parkinsons_voice_classification.features.tiers import get_extraction_tier
+from parkinsons_voice_classification.parallel import default_jobs, get_executor
+
+logger = logging.getLogger(__name__)
+
+
+def parse_spectral_config(spec: str) -> SpectralConfig:
+    """
+    Parse a ``N_FFT:HOP:N_MELS:N_MFCC`` specification.
+
+    Parameters
+    ----------
+    spec : str
+        Four positive integers separated by colons, e.g. '2048:512:128:13'.
+
+    Returns
+    -------
+    SpectralConfig
+        The parsed configuration.
+
+    Raises
+    ------
+    ValueError
+        If the specification is malformed or inconsistent.
+    """
+    parts = spec.split(":")
+    try:
+        n_fft, hop_length, n_mels, n_mfcc = (int(p) for p in parts)
+    except ValueError:
+        raise ValueError(
+            f"Invalid spectral configuration: {spec!r}. Expected N_FFT:HOP:N_MELS:N_MFCC"
+        ) from None
+
+    if min(n_fft, hop_length, n_mels, n_mfcc) <= 0:
+        raise ValueError(f"Invalid spectral configuration: {spec!r}. Values must be positive")
+    if n_mfcc > n_mels:
+        raise ValueError(f"Invalid spectral configuration: {spec!r}. N_MFCC exceeds N_MELS")
+
+    return SpectralConfig(n_fft=n_fft, hop_length=hop_length, n_mels=n_mels, n_mfcc=n_mfcc)
+
+
+def extract_spectral_sweep(
+    audio_path: AudioSource,
+    configs: list[SpectralConfig],
+    segments: SpeechSegments | None = None,
+) -> list[dict]:
+    """
+    Extract spectral features for several configurations from one decode.
+
+    Parameters
+    ----------
+    audio_path : str
+        Path to WAV file, archive member path or WAV bytes (see features/audio_io.py).
+    configs : list[SpectralConfig]
+        Spectral parameterizations to compute.
+    segments : SpeechSegments, optional
+        Speech intervals to keep. Defaults to analysing the full recording.
+
+    Returns
+    -------
+    list[dict]
+        One spectral feature dictionary per configuration, in ``configs``
+        order. Each equals ``compute_spectral_features`` with that config.
+    """
+    try:
+        y, sr = load_samples(audio_path, TARGET_SAMPLE_RATE)
+        if segments is not None:
+            y = trim_samples(y, sr, segments)
+    except Exception:
+        y, sr = None, TARGET_SAMPLE_RATE
+
+    # One magnitude STFT per distinct (n_fft, hop_length)
+    stft_cache = {}
+    results = []
+    for config in configs:
+        S = None
+        if y is not None:
+            key = (config.n_fft, config.hop_length)
+            if key not in stft_cache:
+                stft_cache[key] = compute_stft_magnitude(y, *key)
+            S = stft_cache[key]
+        results.append(compute_spectral_features(y, sr, LIBROSA_ANALYSES, config, S=S))
+
+    return results
+
+
+def _sweep_single_file(
+    row: dict,
+    configs: list[SpectralConfig],
+    tier: str | None = None,
+    vad_mode: str = "off",
+    prosodic_backend: str | None = None,
+    audio: bytes | None = None,
+) -> list[dict] | None:
+    """
+    Worker function: prosodic features once, spectral features per configuration.
+
+    ``audio`` holds the file contents when already in memory (archive
+    streaming); segmentation and both extraction stages then decode it
+    instead of reading ``row['filepath']``.
+
+    Returns
+    -------
+    list[dict] or None
+        One feature dictionary (with metadata) per configuration, or None if
+        extraction failed.
+    """
+    source = str(row["filepath"]) if audio is None else audio
+    try:
+        segments = None
+        if vad_mode != "off":
+            segments = segment_file(source)
+        analysed = segments if vad_mode == "trim" else None
+
+        shared = extract_all_features(
+            source,
+            feature_names=get_prosodic_feature_names(),
+            tier=tier,
+            segments=analysed,
+            prosodic_backend=prosodic_backend,
+        )
+        if segments is not None:
+            shared["speech_ratio"] = segments.speech_ratio
+        for key in ("subject_id", "label", "task", "filename"):
+            shared[key] = row[key]
+
+        spectral = extract_spectral_sweep(source, configs, segments=analysed)
+        return [{**shared, **features} for features in spectral]
+    except Exception as e:
+        logger.warning(f"Failed to extract features from {row['filename']}: {e}")
+        return None
+
+
+def _sweep_group(rows: list[dict], *args) -> list:
+    """
+    Worker function: one plain file, or all requested members of one archive shard.
+
+    A shard is read once, front to back, and each member's bytes are shared
+    by all stages of _sweep_single_file (as in extraction_simple).
+    """
+    archive_member = split_archive_path(rows[0]["filepath"])
+    if archive_member is None:
+        return [_sweep_single_file(rows[0], *args)]
+
+    positions = {split_archive_path(row["filepath"])[1]: i for i, row in enumerate(rows)}
+    results = [None] * len(rows)
+    try:
+        for member, data in iter_archive_members(archive_member[0], set(positions)):
+            i = positions[member]
+            results[i] = _sweep_single_file(rows[i], *args, audio=data)
+    except Exception as e:
+        logger.warning(f"Failed to read archive {archive_member[0]}: {e}")
+    return results
+
+
+def get_sweep_output_path(task: str, config: SpectralConfig) -> Path:
+    """Return the feature CSV path of one sweep configuration."""
+    return get_features_output_dir() / "sweep" / f"features_{task.lower()}_{config.name}.csv"
+
+
+def run_spectral_sweep(
+    task: str,
+    configs: list[SpectralConfig],
+    jobs: int | None = None,
+    tier: str | None = None,
+    vad_mode: str | None = None,
+    prosodic_backend: str | None = None,
+    queue: str | None = None,
+    archives: list[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Run a spectral parameter sweep for a speech task.
+
+    Parameters
+    ----------
+    task : str
+        'ReadText' or 'SpontaneousDialogue'
+    configs : list[SpectralConfig]
+        Spectral parameterizations (duplicates are dropped).
+    jobs : int, optional
+        Number of parallel workers. Defaults to ``parallel.default_jobs()``.
+    tier : str, optional
+        Praat extraction quality tier. Defaults to EXTRACTION_TIER from config.
+    vad_mode : str, optional
+        Segmentation mode ('off', 'measure', 'trim'). Defaults to VAD_MODE
+        from config.
+    prosodic_backend : str, optional
+        'praat' or 'numpy'. Defaults to PROSODIC_BACKEND from config.
+    queue : str, optional
+        Shared work queue file (see distributed.py). Defaults to
+        WORK_QUEUE_PATH from config.
+    archives : list[str], optional
+        Zip/tar shards to read the recordings from (see data/archives.py).
+        Each shard is read once, sequentially, by one task. Defaults to the
+        MDVR-KCL directory.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Feature table per configuration name. Each is also saved to
+        ``get_sweep_output_path(task, config)`` with a metadata sidecar.
+    """
+    configs = list(dict.fromkeys(configs))
+    if not configs:
+        raise ValueError("No spectral configurations given")
+
+    tier = get_extraction_tier(tier).name
+    vad_mode = get_vad_mode(vad_mode)
+    prosodic_backend = get_prosodic_backend(prosodic_backend)
+
+    if jobs is None:
+        jobs = default_jobs()
+    n_stfts = len({(c.n_fft, c.hop_length) for c in configs})
+    logger.info(
+        f"Spectral sweep: {len(configs)} configurations, {n_stfts} distinct STFTs, "
+        f"{jobs} parallel workers"
+    )
+
+    manifest = load_archive_manifest(task, archives) if archives else build_manifest(task)
+    manifest_rows = manifest.to_dict("records")
+    logger.info(f"Found {len(manifest)} recordings for task: {task}")
+
+    # One task per plain file or archive shard
+    groups = _group_by_source(manifest_rows)
+    process_pool = get_extraction_executor(jobs, tier, prosodic_backend) if jobs > 1 else None
+    group_results = get_executor(jobs, process_pool=process_pool, queue=queue).map(
+        _sweep_group,
+        [
+            ([manifest_rows[i] for i in group], configs, tier, vad_mode, prosodic_backend)
+            for group in groups
+        ],
+        desc=f"Sweeping {task}",
+        sizes=[len(group) for group in groups],
+    )
+    results = [r for group_result in group_results for r in group_result if r is not None]
+    if len(results) < len(manifest_rows):
+        logger.warning(f"Failed to extract {len(manifest_rows) - len(results)} files")
+
+    tables = {}
+    for i, config in enumerate(configs):
+        df = pd.DataFrame([file_rows[i] for file_rows in results])
+        df = df.sort_values("filename").reset_index(drop=True)
+
+        meta_cols = [c for c in METADATA_COLUMNS if c in df.columns]
+        feature_cols = get_prosodic_feature_names() + get_spectral_feature_names(config.n_mfcc)
+        df = df[meta_cols + feature_cols]
+
+        output_path = get_sweep_output_path(task, config)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(output_path, index=False)
+
+        metadata = {
+            "task": task,
+            "feature_set": "extended" if USE_EXTENDED_FEATURES else "baseline",
+            "extraction_tier": tier,
+            "prosodic_backend": prosodic_backend,
+            "vad_mode": vad_mode,
+            "mean_speech_ratio": (
+                float(df["speech_ratio"].mean()) if "speech_ratio" in df.columns else None
+            ),
+            "spectral_config": asdict(config),
+            "feature_count": len(feature_cols),
+            "feature_names": feature_cols,
+            "n_recordings": len(df),
+            "extracted_at": datetime.now().isoformat(),
+        }
+        with open(get_feature_metadata_path(output_path), "w") as f:
+            json.dump(metadata, f, indent=2)
+        logger.info(f"Saved {config.name}: {output_path} {df.shape}")
+
+        tables[config.name] = df
+
+    return tables
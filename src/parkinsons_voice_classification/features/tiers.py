@@ -0,0 +1,117 @@
+"""
+Extraction Quality Tiers for Praat Analyses
+
+Named speed/accuracy trade-offs for the prosodic extractor. Harmonicity and
+formant tracking dominate per-file time on long recordings, so the faster
+tiers coarsen their time steps and, where safe, analyse a downsampled copy
+of the sound.
+
+Tiers:
+- accurate: Locked thesis parameters (default, used for all reported results)
+- balanced: Coarser Harmonicity and Formant time steps, native sample rate
+- fast:     Coarse time steps; Harmonicity and Formant run on an 11 kHz copy
+
+Downsampling is applied only to Harmonicity and Formant. Formant (burg)
+resamples to twice its 5500 Hz ceiling internally anyway, so 11 kHz loses
+nothing there. Pitch, PointProcess (jitter/shimmer) and Intensity always use
+the native sample rate, as pulse timing precision depends on it.
+
+The tier is recorded in feature-store and model metadata; inference refuses
+to mix tiers (see inference.py).
+
+Benchmark report: scripts/benchmark_extraction_tiers.py
+"""
+
+from dataclasses import dataclass
+
+from parkinsons_voice_classification.config import EXTRACTION_TIER
+
+# Tier assumed for artifacts written before tiers were recorded
+DEFAULT_TIER = "accurate"
+
+
+@dataclass(frozen=True)
+class ExtractionTier:
+    """
+    Praat analysis parameters for one quality tier.
+
+    Attributes
+    ----------
+    name : str
+        Tier name ('accurate', 'balanced', 'fast').
+    pitch_time_step : float
+        Time step (s) for To Pitch / To Pitch (ac). 0.0 = Praat automatic.
+    harmonicity_time_step : float
+        Time step (s) for To Harmonicity (cc).
+    harmonicity_periods_per_window : float
+        Periods per window for To Harmonicity (cc).
+    formant_time_step : float
+        Time step (s) for To Formant (burg). 0.0 = Praat automatic (25% of window).
+    analysis_sample_rate : float or None
+        If set, Harmonicity and Formant run on a copy resampled to this rate.
+    """
+
+    name: str
+    pitch_time_step: float
+    harmonicity_time_step: float
+    harmonicity_periods_per_window: float
+    formant_time_step: float
+    analysis_sample_rate: float | None
+
+
+EXTRACTION_TIERS: dict[str, ExtractionTier] = {
+    "accurate": ExtractionTier(
+        name="accurate",
+        pitch_time_step=0.0,
+        harmonicity_time_step=0.01,
+        harmonicity_periods_per_window=1.0,
+        formant_time_step=0.0,
+        analysis_sample_rate=None,
+    ),
+    "balanced": ExtractionTier(
+        name="balanced",
+        pitch_time_step=0.0,
+        harmonicity_time_step=0.02,
+        harmonicity_periods_per_window=1.0,
+        formant_time_step=0.01,
+        analysis_sample_rate=None,
+    ),
+    "fast": ExtractionTier(
+        name="fast",
+        pitch_time_step=0.02,
+        harmonicity_time_step=0.02,
+        harmonicity_periods_per_window=1.0,
+        formant_time_step=0.02,
+        analysis_sample_rate=11000.0,
+    ),
+}
+
+
+def get_extraction_tier(name: str | None = None) -> ExtractionTier:
+    """
+    Look up an extraction tier by name.
+
+    Parameters
+    ----------
+    name : str, optional
+        Tier name. Defaults to EXTRACTION_TIER from config.
+
+    Returns
+    -------
+    ExtractionTier
+        Praat parameters for the tier.
+
+    Raises
+    ------
+    ValueError
+        If the tier name is unknown.
+    """
+    if name is None:
+        name = EXTRACTION_TIER
+
+    if name not in EXTRACTION_TIERS:
+        raise ValueError(
+            f"Unknown extraction tier: {name}. Available: {list(EXTRACTION_TIERS.keys())}"
+        )
+
+    return EXTRACTION_TIERS[name]
@@ -10,6 +10,7 @@ Design principles:
 - Config-driven model and feature selection
 - No implementation details exposed to callers
 - Metadata validation to catch pipeline mismatches
+- Lazy extraction: only the analyses the model's features need are run
 
 Usage:
     from parkinsons_voice_classification.inference import run_inference
@@ -35,11 +36,18 @@ from parkinsons_voice_classification.config import (
     LABEL_NAMES,
     BASELINE_FEATURE_COUNT,
     EXTENDED_FEATURE_COUNT,
+    EXTRACTION_TIER,
+    VAD_MODE,
+    PROSODIC_BACKEND,
 )
 from parkinsons_voice_classification.features.extraction_simple import (
-    extract_all_features,
+    extract_features_into,
     get_all_feature_names,
 )
+from parkinsons_voice_classification.features.executor import warm_extraction_state
+from parkinsons_voice_classification.features.plan import FeaturePlan, build_feature_plan
+from parkinsons_voice_classification.features.segmentation import segment_file
+from parkinsons_voice_classification.features.tiers import DEFAULT_TIER
 
 logger = logging.getLogger(__name__)
 
@@ -150,14 +158,14 @@ def _load_model(model_path: Optional[Path] = None) -> tuple:
     return pipeline, metadata
 
 
-def _validate_features(features: dict, metadata: dict) -> None:
+def _validate_features(feature_names: list[str], metadata: dict) -> None:
     """
     Validate extracted features against model metadata.
 
     Parameters
     ----------
-    features : dict
-        Extracted features from audio file.
+    feature_names : list[str]
+        Names of the features extraction produced, in column order.
     metadata : dict
         Model metadata with expected feature information.
 
@@ -167,7 +175,7 @@ def _validate_features(features: dict, metadata: dict) -> None:
         If feature count or names don't match expectations.
     """
     expected_count = metadata.get("feature_count", 0)
-    actual_count = len(features)
+    actual_count = len(feature_names)
 
     if actual_count != expected_count:
         raise FeatureMismatchError(
@@ -179,13 +187,114 @@ def _validate_features(features: dict, metadata: dict) -> None:
     # Optionally validate feature names if strict validation is needed
     expected_names = metadata.get("feature_names", [])
     if expected_names:
-        actual_names = list(features.keys())
+        actual_names = list(feature_names)
         if actual_names != expected_names:
             missing = set(expected_names) - set(actual_names)
             extra = set(actual_names) - set(expected_names)
             raise FeatureMismatchError(f"Feature name mismatch. Missing: {missing}, Extra: {extra}")
 
 
+def _validate_tier(metadata: dict) -> None:
+    """
+    Validate that the configured extraction tier matches the model's.
+
+    Parameters
+    ----------
+    metadata : dict
+        Model metadata. Artifacts without ``extraction_tier`` were trained on
+        features from the default ('accurate') tier.
+
+    Raises
+    ------
+    FeatureMismatchError
+        If the model was trained on features from a different tier.
+    """
+    model_tier = metadata.get("extraction_tier", DEFAULT_TIER)
+    if model_tier != EXTRACTION_TIER:
+        raise FeatureMismatchError(
+            f"Extraction tier mismatch: model was trained on '{model_tier}' features, "
+            f"but inference is configured for '{EXTRACTION_TIER}'. "
+            f"Check that EXTRACTION_TIER config matches the trained model."
+        )
+
+
+def _validate_backend(metadata: dict) -> None:
+    """
+    Validate that the configured prosodic backend matches the model's.
+
+    Parameters
+    ----------
+    metadata : dict
+        Model metadata. Artifacts without ``prosodic_backend`` were trained on
+        Praat features.
+
+    Raises
+    ------
+    FeatureMismatchError
+        If the model was trained on features from a different backend.
+    """
+    model_backend = metadata.get("prosodic_backend", "praat")
+    if model_backend != PROSODIC_BACKEND:
+        raise FeatureMismatchError(
+            f"Prosodic backend mismatch: model was trained on '{model_backend}' features, "
+            f"but inference is configured for '{PROSODIC_BACKEND}'. "
+            f"Check that PROSODIC_BACKEND config matches the trained model."
+        )
+
+
+def _validate_vad(metadata: dict) -> None:
+    """
+    Validate that silence trimming at inference matches the model's features.
+
+    Parameters
+    ----------
+    metadata : dict
+        Model metadata. Artifacts without ``vad_mode`` were trained on
+        full-recording features (mode 'off').
+
+    Raises
+    ------
+    FeatureMismatchError
+        If the model was trained with silence trimming and inference is not
+        configured for it, or vice versa. 'measure' only adds a metadata
+        column and is equivalent to 'off' here.
+    """
+    model_mode = metadata.get("vad_mode", "off")
+    if (model_mode == "trim") != (VAD_MODE == "trim"):
+        raise FeatureMismatchError(
+            f"VAD mode mismatch: model was trained on '{model_mode}' features, "
+            f"but inference is configured for '{VAD_MODE}'. "
+            f"Check that VAD_MODE config matches the trained model."
+        )
+
+
+def _build_inference_plan(metadata: dict) -> FeaturePlan:
+    """
+    Build the extraction plan for the features a model consumes.
+
+    Parameters
+    ----------
+    metadata : dict
+        Model metadata; ``feature_names`` selects the features to extract.
+        Artifacts without feature names fall back to the full feature set.
+
+    Returns
+    -------
+    FeaturePlan
+        Plan covering exactly the model's features.
+
+    Raises
+    ------
+    FeatureMismatchError
+        If the model lists features the extraction pipeline cannot produce.
+    """
+    expected_names = metadata.get("feature_names") or None
+    try:
+        return build_feature_plan(expected_names)
+    except ValueError as e:
+        raise FeatureMismatchError(f"Model features cannot be extracted: {e}") from e
+
+
 def run_inference(
     wav_path: str,
     task: str = "ReadText",
@@ -195,7 +304,7 @@ def run_inference(
     Run inference on a single WAV file.
 
     This is the ONLY public inference entry point. It abstracts away:
-    - Feature extraction implementation
+    - Feature extraction implementation (planned from model metadata)
     - Model loading and caching
     - Feature validation
     - Probability computation
@@ -233,18 +342,31 @@ def run_inference(
     # Load model (cached after first call)
     pipeline, metadata = _load_model(model_path)
 
+    # Plan extraction from the model's feature list (pruned models run fewer analyses)
+    _validate_tier(metadata)
+    _validate_backend(metadata)
+    _validate_vad(metadata)
+    plan = _build_inference_plan(metadata)
+
     # Extract features from audio
     try:
-        features = extract_all_features(wav_path)
+        segments = segment_file(wav_path) if VAD_MODE == "trim" else None
+        # Feature vector written in place, in the model's column order
+        X = np.empty((1, len(plan.feature_names)))
+        produced = extract_features_into(
+            wav_path,
+            X[0],
+            plan,
+            tier=EXTRACTION_TIER,
+            segments=segments,
+            prosodic_backend=PROSODIC_BACKEND,
+        )
     except Exception as e:
         raise InferenceError(f"Feature extraction failed: {e}") from e
 
     # Validate features match model expectations
-    _validate_features(features, metadata)
-
-    # Prepare feature vector in correct order
-    feature_names = metadata.get("feature_names", list(features.keys()))
-    X = np.array([[features[name] for name in feature_names]])
+    produced_names = [name for name, ok in zip(plan.feature_names, produced) if ok]
+    _validate_features(produced_names, metadata)
 
     # Run prediction
     prediction_label = pipeline.predict(X)[0]
@@ -266,10 +388,39 @@ def run_inference(
         model_name=metadata.get("model_name", "Unknown"),
         feature_set=metadata.get("feature_set", "Unknown"),
         task=metadata.get("task", task),
-        feature_count=len(features),
+        feature_count=len(produced_names),
     )
 
 
+def warm_up(model_path: Optional[Path] = None) -> float:
+    """
+    Prepare this process for low-latency inference.
+
+    Loads (and caches) the model, then runs one extraction on a short
+    synthetic recording so the first real request does not pay for library
+    imports, numba compilation or DSP set-up. Intended for long-lived
+    services (e.g. the demo app) at start-up.
+
+    Parameters
+    ----------
+    model_path : Path, optional
+        Override path to model file.
+
+    Returns
+    -------
+    float
+        Warm-up time in seconds. A missing model is logged, not raised.
+    """
+    try:
+        _load_model(model_path)
+    except ModelNotFoundError as e:
+        logger.warning(f"Warm-up without model: {e}")
+
+    seconds = warm_extraction_state(EXTRACTION_TIER, PROSODIC_BACKEND)
+    logger.info(f"Inference warm-up took {seconds:.1f} s")
+    return seconds
+
+
 def get_model_info(model_path: Optional[Path] = None) -> dict:
     """
     Get information about the loaded inference model.
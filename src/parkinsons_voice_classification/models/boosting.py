@@ -0,0 +1,47 @@
+"""
+Gradient Boosting for Small Training Sets
+
+HistGradientBoostingClassifier's leaf size and early stopping are absolute:
+with ``min_samples_leaf=20`` a CV training fold of Dataset A (about 30
+recordings) cannot be split at all, and a 15% validation split holds only
+four or five recordings. Every tree is then a single leaf and the model
+predicts the class prior for every sample (ROC-AUC 0.5).
+
+``AdaptiveHistGradientBoosting`` takes the same parameters but, at fit time:
+
+- caps ``min_samples_leaf`` at a tenth of the training samples (at least 2),
+- turns early stopping off below ``MIN_EARLY_STOPPING_SAMPLES`` training
+  samples, where the validation split is too small to stop on.
+
+Larger training sets such as Dataset B's folds are fitted exactly as by
+HistGradientBoostingClassifier. The parameters themselves are never changed,
+so ``get_params`` and ``clone`` see the configured values; the values used
+are stored as ``min_samples_leaf_`` and ``do_early_stopping_``.
+"""
+
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.utils.validation import _num_samples
+
+# Training samples below which early stopping is turned off
+MIN_EARLY_STOPPING_SAMPLES = 200
+
+
+class AdaptiveHistGradientBoosting(HistGradientBoostingClassifier):
+    """HistGradientBoostingClassifier with leaf size and early stopping scaled to the data."""
+
+    def fit(self, X, y, sample_weight=None, **fit_params):
+        """Fit with sample-scaled ``min_samples_leaf`` and early stopping (see module docstring)."""
+        n_samples = _num_samples(X)
+        min_samples_leaf = min(self.min_samples_leaf, max(2, n_samples // 10))
+        early_stopping = self.early_stopping
+        if early_stopping is True and n_samples < MIN_EARLY_STOPPING_SAMPLES:
+            early_stopping = False
+
+        configured = self.min_samples_leaf, self.early_stopping
+        self.min_samples_leaf, self.early_stopping = min_samples_leaf, early_stopping
+        try:
+            super().fit(X, y, sample_weight=sample_weight, **fit_params)
+        finally:
+            self.min_samples_leaf, self.early_stopping = configured
+        self.min_samples_leaf_ = min_samples_leaf
+        return self
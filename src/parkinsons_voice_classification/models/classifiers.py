@@ -7,42 +7,155 @@ Three classical ML models with default hyperparameters:
 - Random Forest
 
 All wrapped in sklearn Pipelines with StandardScaler.
+
+Optional models (OPTIONAL_MODELS), added with EXTRA_MODELS in config or the
+extra_models argument:
+- HistGradientBoosting: histogram-based gradient boosting for wide feature
+  matrices such as Dataset B's 752 features, with leaf size and early
+  stopping scaled to small training sets (models/boosting.py)
+- RBF_Approx: approximate RBF kernel (Nystroem or random Fourier features,
+  KERNEL_APPROXIMATION in config) followed by a linear Logistic Regression,
+  for datasets too large for the exact SVM_RBF
+- SGD_Logistic, SGD_Hinge: linear models trained by stochastic gradient
+  descent, which pvc-train --update refreshes with new recordings only
+  (models/incremental.py)
+
+With LR_BACKEND = "batched", Logistic Regression uses BatchedLogisticRegression
+(models/batched_logistic.py), which CV fits for all folds at once.
+SVM_PROBABILITY = "holdout" or "oof" replaces the SVM's internal 5-fold Platt
+scaling with SigmoidSVC (models/svm_probability.py).
+FEATURE_SELECTION other than "none" prepends a FeatureSelector step to every
+pipeline (models/feature_selection.py).
 """
 
+from sklearn.kernel_approximation import RBFSampler
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.svm import SVC
 from sklearn.ensemble import RandomForestClassifier
 
-from parkinsons_voice_classification.config import RANDOM_SEED, USE_CLASS_WEIGHT_BALANCED
+from parkinsons_voice_classification.config import (
+    EXTRA_MODELS,
+    FEATURE_SELECTION,
+    FEATURE_SELECTION_CORR_THRESHOLD,
+    FEATURE_SELECTION_K,
+    KERNEL_APPROX_COMPONENTS,
+    KERNEL_APPROXIMATION,
+    LR_BACKEND,
+    RANDOM_SEED,
+    SVM_PROBABILITY,
+    USE_CLASS_WEIGHT_BALANCED,
+)
+from parkinsons_voice_classification.models.batched_logistic import BatchedLogisticRegression
+from parkinsons_voice_classification.models.boosting import AdaptiveHistGradientBoosting
+from parkinsons_voice_classification.models.feature_selection import (
+    FeatureSelector,
+    SELECTION_METHODS,
+)
+from parkinsons_voice_classification.models.kernel_approximation import CappedNystroem
+from parkinsons_voice_classification.models.svm_probability import SigmoidSVC, SVM_CALIBRATIONS
+
+LR_BACKENDS = ("sklearn", "batched")
+SVM_PROBABILITY_MODES = ("platt",) + SVM_CALIBRATIONS
+KERNEL_APPROXIMATIONS = ("nystroem", "fourier")
+FEATURE_SELECTION_METHODS = ("none",) + SELECTION_METHODS
 
+DEFAULT_MODELS = ("LogisticRegression", "SVM_RBF", "RandomForest")
+OPTIONAL_MODELS = ("HistGradientBoosting", "RBF_Approx", "SGD_Logistic", "SGD_Hinge")
+MODEL_NAMES = DEFAULT_MODELS + OPTIONAL_MODELS
 
-def get_models() -> dict[str, Pipeline]:
+
+def get_models(
+    lr_backend: str | None = None,
+    svm_probability: str | None = None,
+    extra_models: list[str] | None = None,
+    kernel_approximation: str | None = None,
+    feature_selection: str | None = None,
+) -> dict[str, Pipeline]:
     """
     Return dictionary of model pipelines.
 
     All models use:
-    - StandardScaler preprocessing
+    - StandardScaler preprocessing, except HistGradientBoosting (trees on
+      binned features need no scaling)
     - Default hyperparameters
     - Fixed random seed for reproducibility
     - Optional class_weight="balanced" (controlled by USE_CLASS_WEIGHT_BALANCED)
 
+    Parameters
+    ----------
+    lr_backend : str, optional
+        'sklearn' or 'batched' solver for Logistic Regression. Defaults to
+        LR_BACKEND from config.
+    svm_probability : str, optional
+        'platt', 'holdout' or 'oof' probability estimates for the SVM.
+        Defaults to SVM_PROBABILITY from config.
+    extra_models : list[str], optional
+        OPTIONAL_MODELS to add after the three default models. Defaults to
+        EXTRA_MODELS from config.
+    kernel_approximation : str, optional
+        'nystroem' or 'fourier' feature map for RBF_Approx. Defaults to
+        KERNEL_APPROXIMATION from config.
+    feature_selection : str, optional
+        'none', 'correlation', 'mrmr', 'l1' or 'rfe' feature selection step.
+        Defaults to FEATURE_SELECTION from config.
+
     Returns
     -------
     dict[str, Pipeline]
         Mapping of model names to sklearn Pipelines.
+
+    Raises
+    ------
+    ValueError
+        If the LR backend, SVM probability mode, an extra model, the kernel
+        approximation or the feature selection method is unknown.
     """
+    if lr_backend is None:
+        lr_backend = LR_BACKEND
+    if lr_backend not in LR_BACKENDS:
+        raise ValueError(f"Unknown LR backend: {lr_backend}. Available: {list(LR_BACKENDS)}")
+    logistic_regression = (
+        BatchedLogisticRegression if lr_backend == "batched" else LogisticRegression
+    )
+    if svm_probability is None:
+        svm_probability = SVM_PROBABILITY
+    if svm_probability not in SVM_PROBABILITY_MODES:
+        raise ValueError(
+            f"Unknown SVM probability mode: {svm_probability}. "
+            f"Available: {list(SVM_PROBABILITY_MODES)}"
+        )
+    if extra_models is None:
+        extra_models = EXTRA_MODELS
+    for name in extra_models:
+        if name not in OPTIONAL_MODELS:
+            raise ValueError(f"Unknown extra model: {name}. Available: {list(OPTIONAL_MODELS)}")
+    if kernel_approximation is None:
+        kernel_approximation = KERNEL_APPROXIMATION
+    if kernel_approximation not in KERNEL_APPROXIMATIONS:
+        raise ValueError(
+            f"Unknown kernel approximation: {kernel_approximation}. "
+            f"Available: {list(KERNEL_APPROXIMATIONS)}"
+        )
+    if feature_selection is None:
+        feature_selection = FEATURE_SELECTION
+    if feature_selection not in FEATURE_SELECTION_METHODS:
+        raise ValueError(
+            f"Unknown feature selection method: {feature_selection}. "
+            f"Available: {list(FEATURE_SELECTION_METHODS)}"
+        )
+
     # Determine class weighting strategy based on config
     class_weight = "balanced" if USE_CLASS_WEIGHT_BALANCED else None
 
-    return {
+    models = {
         "LogisticRegression": Pipeline(
             [
                 ("scaler", StandardScaler()),
                 (
                     "clf",
-                    LogisticRegression(
+                    logistic_regression(
                         random_state=RANDOM_SEED,
                         max_iter=1000,
                         solver="lbfgs",
@@ -56,11 +169,20 @@ def get_models() -> dict[str, Pipeline]:
                 ("scaler", StandardScaler()),
                 (
                     "clf",
-                    SVC(
-                        kernel="rbf",
-                        random_state=RANDOM_SEED,
-                        probability=True,  # For ROC-AUC
-                        class_weight=class_weight,
+                    (
+                        SVC(
+                            kernel="rbf",
+                            random_state=RANDOM_SEED,
+                            probability=True,  # For ROC-AUC
+                            class_weight=class_weight,
+                        )
+                        if svm_probability == "platt"
+                        else SigmoidSVC(
+                            calibration=svm_probability,
+                            kernel="rbf",
+                            random_state=RANDOM_SEED,
+                            class_weight=class_weight,
+                        )
                     ),
                 ),
             ]
@@ -79,3 +201,108 @@ def get_models() -> dict[str, Pipeline]:
             ]
         ),
     }
+
+    if "HistGradientBoosting" in extra_models:
+        # Trees are scale-invariant and HistGradientBoosting bins features and
+        # routes NaN natively, so no scaler or imputer is needed. 63 bins (not
+        # 255) suit a few hundred training samples and cut histogram building
+        # ~4x on 752 features; shallow, L2-regularized trees and early stopping
+        # on a stratified 15% validation split of the training fold do the rest.
+        # On small folds (Dataset A) AdaptiveHistGradientBoosting lowers the
+        # leaf size and drops early stopping, which would leave single-leaf trees.
+        models["HistGradientBoosting"] = Pipeline(
+            [
+                (
+                    "clf",
+                    AdaptiveHistGradientBoosting(
+                        learning_rate=0.1,
+                        max_iter=300,
+                        max_bins=63,
+                        max_leaf_nodes=15,
+                        min_samples_leaf=20,
+                        l2_regularization=1.0,
+                        early_stopping=True,
+                        validation_fraction=0.15,
+                        n_iter_no_change=10,
+                        random_state=RANDOM_SEED,
+                        class_weight=class_weight,
+                    ),
+                ),
+            ]
+        )
+
+    if "RBF_Approx" in extra_models:
+        # On standardized features SVC's gamma="scale" is 1 / n_features, which is
+        # also Nystroem's default (gamma=None) and RBFSampler's gamma="scale".
+        # Fitting is linear in the samples for a fixed number of components, and
+        # prediction costs KERNEL_APPROX_COMPONENTS kernel evaluations per sample
+        # instead of one per support vector. CappedNystroem uses at most one
+        # landmark per training sample. C=1 as in SVM_RBF: in 3x repeated grouped
+        # CV on Dataset A it beats C=10 in ROC-AUC on both tasks and feature maps
+        # (0.78 vs 0.77 and 0.67 vs 0.63 with Nystroem). C=10 is 3 points more
+        # accurate on 4000 synthetic samples, so revisit it for larger datasets.
+        feature_map = (
+            CappedNystroem(
+                kernel="rbf",
+                n_components=KERNEL_APPROX_COMPONENTS,
+                random_state=RANDOM_SEED,
+            )
+            if kernel_approximation == "nystroem"
+            else RBFSampler(
+                gamma="scale",
+                n_components=KERNEL_APPROX_COMPONENTS,
+                random_state=RANDOM_SEED,
+            )
+        )
+        models["RBF_Approx"] = Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                ("feature_map", feature_map),
+                (
+                    "clf",
+                    LogisticRegression(
+                        C=1.0,
+                        random_state=RANDOM_SEED,
+                        max_iter=1000,
+                        solver="lbfgs",
+                        class_weight=class_weight,
+                    ),
+                ),
+            ]
+        )
+
+    # Every step supports partial_fit, so pvc-train --update can refresh these
+    # with new recordings only. "modified_huber" is the smoothed hinge loss, the
+    # one hinge variant of SGDClassifier with predict_proba (needed by inference).
+    for name, loss in [("SGD_Logistic", "log_loss"), ("SGD_Hinge", "modified_huber")]:
+        if name in extra_models:
+            models[name] = Pipeline(
+                [
+                    ("scaler", StandardScaler()),
+                    (
+                        "clf",
+                        SGDClassifier(
+                            loss=loss,
+                            alpha=1e-4,
+                            max_iter=1000,
+                            tol=1e-3,
+                            random_state=RANDOM_SEED,
+                            class_weight=class_weight,
+                        ),
+                    ),
+                ]
+            )
+
+    # Selection comes first, on the raw fold data, so every model of a CV fold
+    # (with or without a scaler) hits the same cached feature statistics
+    if feature_selection != "none":
+        for name, pipeline in models.items():
+            selector = FeatureSelector(
+                method=feature_selection,
+                n_features=FEATURE_SELECTION_K,
+                corr_threshold=FEATURE_SELECTION_CORR_THRESHOLD,
+                random_state=RANDOM_SEED,
+            )
+            models[name] = Pipeline([("select", selector)] + pipeline.steps)
+
+    return models
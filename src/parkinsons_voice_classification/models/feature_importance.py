@@ -11,12 +11,14 @@ All methods return importance scores aggregated across CV folds.
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import StratifiedKFold, StratifiedGroupKFold
 from sklearn.inspection import permutation_importance
 from sklearn.base import clone
+from sklearn.pipeline import Pipeline
 
 from parkinsons_voice_classification.config import RANDOM_SEED, N_FOLDS
 from parkinsons_voice_classification.models.classifiers import get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.parallel import get_executor
 
 
 def extract_model_importance(
@@ -41,16 +43,27 @@ def extract_model_importance(
     """
     clf = model.named_steps["clf"]
 
+    # Coefficients of a model on mapped features (e.g. RBF_Approx's kernel
+    # approximation) do not belong to the input features
+    if "feature_map" in model.named_steps:
+        return None
+
     # Random Forest: Gini importance
     if hasattr(clf, "feature_importances_"):
-        return clf.feature_importances_
+        importance = clf.feature_importances_
 
     # Logistic Regression: Absolute coefficients
-    if hasattr(clf, "coef_"):
+    elif hasattr(clf, "coef_"):
         # For binary classification, coef_ has shape (1, n_features)
-        return np.abs(clf.coef_).ravel()
+        importance = np.abs(clf.coef_).ravel()
+
+    else:
+        return None
 
-    return None
+    # With feature selection, unselected features get zero importance
+    if "select" in model.named_steps:
+        importance = model.named_steps["select"].inverse_transform(importance[None, :])[0]
+    return importance
 
 
 def compute_permutation_importance(
@@ -98,6 +111,7 @@ def run_importance_cv(
     use_groups: bool = False,
     n_folds: int = N_FOLDS,
     use_permutation: bool = False,
+    jobs: int | None = None,
 ) -> pd.DataFrame:
     """
     Run cross-validation and collect feature importance scores.
@@ -118,65 +132,118 @@ def run_importance_cv(
         Number of CV folds
     use_permutation : bool
         If True, also compute permutation importance for all models
+    jobs : int, optional
+        Maximum parallel workers for the (model, fold) fits; a model whose
+        final estimator has ``fit_batch`` is fitted for all folds in one
+        task. Defaults to ``parallel.default_jobs()``; the executor runs them
+        serially when that is estimated to be faster. Results do not depend
+        on it.
+        With WORK_QUEUE_PATH set in config, the fits run on the shared work
+        queue instead (see distributed.py).
 
     Returns
     -------
     pd.DataFrame
         Importance scores with columns: model, fold, feature, importance, method
     """
-    # Select CV strategy
-    if use_groups:
-        if groups is None:
-            raise ValueError("groups must be provided when use_groups=True")
-        cv = StratifiedGroupKFold(n_splits=n_folds, shuffle=True, random_state=RANDOM_SEED)
-        split_args = (X, y, groups)
-    else:
-        cv = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=RANDOM_SEED)
-        split_args = (X, y)
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
 
     models = get_models()
     results = []
 
-    for model_name, pipeline in models.items():
-        for fold_idx, (train_idx, test_idx) in enumerate(cv.split(*split_args)):
-            X_train, X_test = X[train_idx], X[test_idx]
-            y_train, y_test = y[train_idx], y[test_idx]
-
-            # Clone and fit model
-            model = clone(pipeline)
-            model.fit(X_train, y_train)
-
-            # Native importance (RF Gini or LR coef)
-            native_importance = extract_model_importance(model, feature_names)
-            if native_importance is not None:
-                for i, fname in enumerate(feature_names):
-                    results.append(
-                        {
-                            "model": model_name,
-                            "fold": fold_idx + 1,
-                            "feature": fname,
-                            "importance": native_importance[i],
-                            "method": "native",
-                        }
-                    )
-
-            # Permutation importance (optional, for all models)
-            if use_permutation:
-                perm_importance = compute_permutation_importance(model, X_test, y_test)
-                for i, fname in enumerate(feature_names):
-                    results.append(
-                        {
-                            "model": model_name,
-                            "fold": fold_idx + 1,
-                            "feature": fname,
-                            "importance": perm_importance[i],
-                            "method": "permutation",
-                        }
-                    )
+    # One task per (model, fold), or per model if its final estimator has
+    # fit_batch (all folds in one solve); fits run in parallel when worthwhile
+    splits = get_cv_splits(y, groups if use_groups else None, n_folds)
+    tasks = []
+    for pipeline in models.values():
+        if hasattr(pipeline.steps[-1][1], "fit_batch"):
+            tasks.append((pipeline, X, y, splits, feature_names, use_permutation))
+        else:
+            tasks.extend(
+                (pipeline, X, y, [split], feature_names, use_permutation) for split in splits
+            )
+    keys = [(name, fold_idx) for name in models for fold_idx in range(len(splits))]
+    outputs = [
+        out
+        for task_outputs in get_executor(jobs, releases_gil=True).map(_fold_importance, tasks)
+        for out in task_outputs
+    ]
+
+    for (model_name, fold_idx), (native_importance, perm_importance) in zip(keys, outputs):
+        # Native importance (RF Gini or LR coef)
+        if native_importance is not None:
+            for i, fname in enumerate(feature_names):
+                results.append(
+                    {
+                        "model": model_name,
+                        "fold": fold_idx + 1,
+                        "feature": fname,
+                        "importance": native_importance[i],
+                        "method": "native",
+                    }
+                )
+
+        # Permutation importance (optional, for all models)
+        if perm_importance is not None:
+            for i, fname in enumerate(feature_names):
+                results.append(
+                    {
+                        "model": model_name,
+                        "fold": fold_idx + 1,
+                        "feature": fname,
+                        "importance": perm_importance[i],
+                        "method": "permutation",
+                    }
+                )
 
     return pd.DataFrame(results)
 
 
+def _fold_importance(
+    pipeline,
+    X: np.ndarray,
+    y: np.ndarray,
+    splits: list[tuple[np.ndarray, np.ndarray]],
+    feature_names: list[str],
+    use_permutation: bool,
+) -> list[tuple[np.ndarray | None, np.ndarray | None]]:
+    """Fit clones of the pipeline on folds; return native and permutation importance per fold."""
+    models = _fit_pipelines(pipeline, X, y, [train_idx for train_idx, _ in splits])
+
+    results = []
+    for model, (_, test_idx) in zip(models, splits):
+        native_importance = extract_model_importance(model, feature_names)
+        perm_importance = None
+        if use_permutation:
+            perm_importance = compute_permutation_importance(model, X[test_idx], y[test_idx])
+        results.append((native_importance, perm_importance))
+    return results
+
+
+def _fit_pipelines(pipeline, X: np.ndarray, y: np.ndarray, train_indices: list[np.ndarray]) -> list:
+    """
+    Fit one clone of the pipeline per training index set.
+
+    If the final estimator has ``fit_batch`` (e.g. BatchedLogisticRegression),
+    the preprocessing is fitted per fold and the final estimators of all
+    folds in one call.
+    """
+    final_name, final = pipeline.steps[-1]
+    if not hasattr(final, "fit_batch"):
+        return [clone(pipeline).fit(X[idx], y[idx]) for idx in train_indices]
+
+    prefixes, datasets = [], []
+    for idx in train_indices:
+        prefix = clone(pipeline[:-1])
+        datasets.append((prefix.fit_transform(X[idx], y[idx]), y[idx]))
+        prefixes.append(prefix)
+    return [
+        Pipeline(prefix.steps + [(final_name, fitted)])
+        for prefix, fitted in zip(prefixes, final.fit_batch(datasets))
+    ]
+
+
 def summarize_importance(importance_df: pd.DataFrame) -> pd.DataFrame:
     """
     Summarize importance scores with mean ± std across folds.
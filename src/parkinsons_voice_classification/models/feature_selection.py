@@ -0,0 +1,251 @@
+"""
+Feature Selection
+
+Dataset B's 752 columns are highly redundant, and every model used to train
+on all of them. ``FeatureSelector`` is a pipeline step that keeps
+``n_features`` of them, fitted on each CV training fold only, so selection
+never sees the test rows:
+
+- "correlation": redundancy pruning. Features are visited from most to least
+  relevant (mutual information with the label) and dropped if their absolute
+  Pearson correlation with an already kept feature reaches
+  ``corr_threshold``.
+- "mrmr": minimum redundancy, maximum relevance. Greedily adds the feature
+  with the highest mutual information minus its mean absolute correlation
+  with the features selected so far.
+- "l1": the largest coefficients of an L1-penalized Logistic Regression.
+  Unless ``l1_C`` is given, its C is chosen per fold: the smallest C on a
+  log grid above sklearn's ``l1_min_c`` that leaves ``n_features`` nonzero
+  coefficients (a fixed C keeps a very different number of features on
+  Dataset A's 37 and Dataset B's 756 recordings).
+- "rfe": recursive feature elimination with Logistic Regression, dropping
+  10% of the remaining features per round.
+
+The expensive statistics of "correlation" and "mrmr" (the absolute
+correlation matrix and the mutual information of every feature) are computed
+once per training matrix and cached in memory and under
+``FEATURE_STATS_CACHE_DIR``, keyed by a hash of the data. Other models on the
+same fold, other methods and sizes, and repeated runs reuse them.
+
+Selected with ``FEATURE_SELECTION`` in config (see models/classifiers.py).
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+from sklearn.base import BaseEstimator
+from sklearn.feature_selection import RFE, SelectorMixin, mutual_info_classif
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import l1_min_c
+
+from parkinsons_voice_classification.config import FEATURE_STATS_CACHE_DIR, RANDOM_SEED
+
+logger = logging.getLogger(__name__)
+
+SELECTION_METHODS = ("correlation", "mrmr", "l1", "rfe")
+
+# Bump when the statistics change; older cache files are ignored
+FEATURE_STATS_CACHE_VERSION = 1
+
+# C grid of the "l1" method, as multiples of the smallest C with a nonzero coefficient
+_L1_C_FACTORS = np.logspace(0, 4, 17)
+
+# In-memory cache: key -> (absolute correlation matrix, mutual information)
+_MAX_CACHED = 16
+_stats_cache: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _stats_key(X: np.ndarray, y: np.ndarray) -> str:
+    """Hash of the data the statistics depend on."""
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    digest = hashlib.sha1()
+    digest.update(f"v{FEATURE_STATS_CACHE_VERSION}:{RANDOM_SEED}:{X.shape}".encode())
+    digest.update(X.tobytes())
+    digest.update(np.unique(y, return_inverse=True)[1].astype(np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def feature_statistics(
+    X: np.ndarray, y: np.ndarray, cache_dir: str | Path | None = FEATURE_STATS_CACHE_DIR
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Absolute correlation matrix and mutual information with the label, cached.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix (training rows only)
+    y : np.ndarray
+        Label array
+    cache_dir : str or Path, optional
+        Directory of the disk cache. None = memory only.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (abs_corr, mutual_info): |Pearson r| between features (0 for constant
+        features, shape n_features × n_features) and mutual information of
+        each feature with y (shape n_features).
+    """
+    key = _stats_key(X, y)
+    if key in _stats_cache:
+        return _stats_cache[key]
+
+    stats = None
+    path = None if cache_dir is None else Path(cache_dir) / f"stats_{key[:20]}.npz"
+    if path is not None and path.exists():
+        try:
+            with np.load(path) as cached:
+                stats = (cached["abs_corr"], cached["mutual_info"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable feature statistics cache {path}: {e}")
+
+    if stats is None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            abs_corr = np.abs(np.corrcoef(X, rowvar=False))
+        abs_corr = np.nan_to_num(abs_corr, nan=0.0)
+        mutual_info = mutual_info_classif(X, y, random_state=RANDOM_SEED)
+        stats = (abs_corr, mutual_info)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npz")
+                np.savez(tmp_path, abs_corr=abs_corr, mutual_info=mutual_info)
+                os.replace(tmp_path, path)  # atomic: concurrent runs never see a partial file
+            except OSError as e:
+                logger.warning(f"Could not save feature statistics cache {path}: {e}")
+
+    for array in stats:
+        array.setflags(write=False)
+    if len(_stats_cache) >= _MAX_CACHED:
+        _stats_cache.pop(next(iter(_stats_cache)))
+    _stats_cache[key] = stats
+    return stats
+
+
+def prune_correlated(
+    abs_corr: np.ndarray, relevance: np.ndarray, n_features: int, threshold: float
+) -> np.ndarray:
+    """Most relevant features whose |r| with every kept feature stays below threshold."""
+    selected = []
+    max_corr = np.zeros(len(relevance))  # Highest |r| with any kept feature
+    for j in np.argsort(-relevance, kind="stable"):
+        if max_corr[j] < threshold:
+            selected.append(j)
+            np.maximum(max_corr, abs_corr[j], out=max_corr)
+            if len(selected) == n_features:
+                break
+    return np.array(selected, dtype=np.intp)
+
+
+def mrmr(abs_corr: np.ndarray, relevance: np.ndarray, n_features: int) -> np.ndarray:
+    """Greedy mRMR: relevance minus mean |r| with the selected features."""
+    selected = [int(np.argmax(relevance))]
+    available = np.ones(len(relevance), dtype=bool)
+    available[selected[0]] = False
+    redundancy = abs_corr[selected[0]].astype(np.float64)  # Sum of |r| with the selected
+    while len(selected) < n_features:
+        score = np.where(available, relevance - redundancy / len(selected), -np.inf)
+        j = int(np.argmax(score))
+        selected.append(j)
+        available[j] = False
+        redundancy += abs_corr[j]
+    return np.array(selected, dtype=np.intp)
+
+
+def l1_weights(
+    X: np.ndarray, y: np.ndarray, n_features: int, C: float | None, random_state: int | None
+) -> np.ndarray:
+    """
+    Absolute coefficients of an L1-penalized Logistic Regression.
+
+    With ``C=None``, C increases along ``l1_min_c * _L1_C_FACTORS`` until at
+    least ``n_features`` coefficients are nonzero (or the grid ends).
+    """
+    grid = [C] if C is not None else l1_min_c(X, y, loss="log") * _L1_C_FACTORS
+    for value in grid:
+        lr = LogisticRegression(
+            l1_ratio=1.0, solver="liblinear", C=value, random_state=random_state
+        ).fit(X, y)
+        weights = np.abs(lr.coef_).ravel()
+        if np.count_nonzero(weights) >= n_features:
+            break
+    return weights
+
+
+class FeatureSelector(SelectorMixin, BaseEstimator):
+    """
+    Keep ``n_features`` columns chosen on the training data.
+
+    Parameters
+    ----------
+    method : str
+        'correlation', 'mrmr', 'l1' or 'rfe' (see module docstring)
+    n_features : int
+        Number of features to keep (all if there are fewer). 'correlation'
+        and 'l1' may keep fewer.
+    corr_threshold : float
+        Absolute correlation at which 'correlation' drops a feature
+    l1_C : float, optional
+        Inverse regularization strength of 'l1'. None chooses it per fold
+        (see module docstring).
+    random_state : int, optional
+        Seed of the Logistic Regression in 'l1' and 'rfe'
+    """
+
+    def __init__(
+        self,
+        method: str = "mrmr",
+        n_features: int = 100,
+        corr_threshold: float = 0.9,
+        l1_C: float | None = None,
+        random_state: int | None = None,
+    ):
+        self.method = method
+        self.n_features = n_features
+        self.corr_threshold = corr_threshold
+        self.l1_C = l1_C
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        """Choose the features; ``selected_`` lists them in order of selection."""
+        if self.method not in SELECTION_METHODS:
+            raise ValueError(
+                f"Unknown selection method: {self.method}. Available: {list(SELECTION_METHODS)}"
+            )
+        X, y = np.asarray(X, dtype=np.float64), np.asarray(y)
+        n_features = min(self.n_features, X.shape[1])
+
+        if self.method in ("correlation", "mrmr"):
+            abs_corr, mutual_info = feature_statistics(X, y)
+            if self.method == "correlation":
+                selected = prune_correlated(abs_corr, mutual_info, n_features, self.corr_threshold)
+            else:
+                selected = mrmr(abs_corr, mutual_info, n_features)
+        else:
+            X_scaled = StandardScaler().fit_transform(X)
+            if self.method == "l1":
+                weights = l1_weights(X_scaled, y, n_features, self.l1_C, self.random_state)
+                order = np.argsort(-weights, kind="stable")[:n_features]
+                # Keep at least one feature if the penalty zeroes them all
+                selected = order[: max(1, np.count_nonzero(weights[order]))]
+            else:
+                rfe = RFE(
+                    LogisticRegression(max_iter=1000, random_state=self.random_state),
+                    n_features_to_select=n_features,
+                    step=0.1,
+                ).fit(X_scaled, y)
+                selected = np.flatnonzero(rfe.support_)
+
+        self.selected_ = np.asarray(selected, dtype=np.intp)
+        self.support_ = np.zeros(X.shape[1], dtype=bool)
+        self.support_[self.selected_] = True
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def _get_support_mask(self) -> np.ndarray:
+        return self.support_
@@ -0,0 +1,92 @@
+"""
+Incremental Model Updates
+
+``pvc-train --update`` refreshes a saved model with the rows appended to the
+feature CSV since it was trained (after the byte offset of the
+``training_watermark`` in its metadata), instead of retraining on the whole
+archive:
+
+- Pipelines whose every step has ``partial_fit`` (StandardScaler and the
+  SGD_Logistic / SGD_Hinge models) are updated with the new rows only: the
+  scaler's running mean and variance absorb them and the SGD weights take
+  one pass over them. Update time depends on the number of new rows, not on
+  the archive size.
+- Other models (trees, SVMs, ...) cannot be updated. They are retrained on
+  all rows once their artifact is ``MODEL_REFRESH_DAYS`` old.
+"""
+
+from datetime import datetime
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+
+CLASSES = np.array([0, 1])
+
+
+def supports_partial_fit(pipeline: Pipeline) -> bool:
+    """True if every step of the pipeline can be updated with partial_fit."""
+    return all(hasattr(step, "partial_fit") for _, step in pipeline.steps)
+
+
+def balanced_class_weight(class_counts: dict[int, int]) -> dict[int, float]:
+    """
+    class_weight="balanced" weights for the given per-class sample counts.
+
+    SGDClassifier.partial_fit rejects "balanced" (it only sees one batch), so
+    incremental updates use the weights of the cumulative class distribution.
+    """
+    n_samples = sum(class_counts.values())
+    return {c: n_samples / (len(class_counts) * n) for c, n in class_counts.items() if n > 0}
+
+
+def partial_fit_pipeline(
+    pipeline: Pipeline, X: np.ndarray, y: np.ndarray, class_counts: dict[int, int]
+) -> Pipeline:
+    """
+    Update a fitted pipeline with new samples.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Fitted pipeline for which ``supports_partial_fit`` is True
+    X : np.ndarray
+        Feature matrix of the new samples only
+    y : np.ndarray
+        Labels of the new samples
+    class_counts : dict[int, int]
+        Class distribution of all samples seen so far, including the new
+        ones (for balanced class weights)
+
+    Returns
+    -------
+    Pipeline
+        The same pipeline, updated in place.
+    """
+    Xt = X
+    for _, step in pipeline.steps[:-1]:
+        Xt = step.partial_fit(Xt, y).transform(Xt)
+
+    clf = pipeline.steps[-1][1]
+    if clf.class_weight is not None:
+        # "balanced" from get_models, or the weights of an earlier update
+        clf.set_params(class_weight=balanced_class_weight(class_counts))
+    clf.partial_fit(Xt, y, classes=CLASSES)
+    return pipeline
+
+
+def refresh_due(metadata: dict, refresh_days: float, now: datetime | None = None) -> bool:
+    """
+    True if a model trained at ``metadata["trained_at"]`` is due for retraining.
+
+    Parameters
+    ----------
+    metadata : dict
+        Model artifact metadata
+    refresh_days : float
+        Minimum age in days before retraining
+    now : datetime, optional
+        Reference time. Defaults to the current time.
+    """
+    now = now or datetime.now()
+    trained_at = datetime.fromisoformat(metadata["trained_at"])
+    return (now - trained_at).total_seconds() >= refresh_days * 86400
@@ -0,0 +1,30 @@
+"""
+Nystroem Feature Map for Small Training Sets
+
+A Nystroem map cannot have more landmarks than training samples. sklearn
+then uses all samples as landmarks and warns on every fit, which with
+KERNEL_APPROX_COMPONENTS = 300 means every CV fold of Dataset A (about 30
+training recordings). ``CappedNystroem`` caps ``n_components`` at the
+number of training samples at fit time: the same map, without the warning.
+The configured value is left unchanged for ``get_params`` and ``clone``.
+
+The random Fourier map (RBFSampler) draws its features independently of the
+data and has no such limit.
+"""
+
+from sklearn.kernel_approximation import Nystroem
+from sklearn.utils.validation import _num_samples
+
+
+class CappedNystroem(Nystroem):
+    """Nystroem with ``n_components`` capped at the number of training samples."""
+
+    def fit(self, X, y=None):
+        """Fit with at most one landmark per training sample."""
+        configured = self.n_components
+        self.n_components = min(configured, _num_samples(X))
+        try:
+            super().fit(X, y)
+        finally:
+            self.n_components = configured
+        return self
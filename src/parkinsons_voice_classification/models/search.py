@@ -0,0 +1,547 @@
+"""
+Hyperparameter Search (Successive Halving)
+
+get_models uses default hyperparameters. ``successive_halving_search`` tunes
+one model's final estimator over a grid (SEARCH_SPACES) on the cached CV
+splits (models/splits.py): StratifiedGroupKFold when groups are given, else
+StratifiedKFold, repeated over SEARCH_REPEATS shuffles.
+
+- Successive halving: every candidate is first scored on a few splits; the
+  best 1/factor go on to factor times as many, until one candidate is left
+  or all splits are used. Surviving candidates only fit the new splits.
+- After each rung with at least SEARCH_MIN_DOMINANCE_SPLITS splits,
+  candidates that another survivor matches or beats on every split
+  evaluated so far (and beats on average) are discarded early. Earlier
+  rungs are too small for that: with a handful of test folds of a few
+  recordings each, a weaker candidate can match a stronger one by chance.
+- Preprocessing shared by the candidates (the StandardScaler) is fitted
+  once per split and reused across candidates and rungs.
+- (candidate, split) fits run in parallel on the CV executor; candidates
+  whose estimator has ``fit_batch`` fit all their splits in one task.
+
+Results are saved to outputs/search/ (``SEARCH_DIR``): the full history
+and the winning parameters, which ``pvc-train --tuned`` applies.
+
+``run_nested_cv`` estimates how well tuning generalizes: a full grid search
+in an inner grouped CV of each outer training set, the winner evaluated on
+the outer test fold.
+
+Usage:
+    result = successive_halving_search("SVM_RBF", X, y, groups, use_groups=True)
+    save_search_result(result, task="ReadText", feature_set="baseline")
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid
+from sklearn.pipeline import Pipeline
+
+from parkinsons_voice_classification.config import (
+    N_FOLDS,
+    RANDOM_SEED,
+    SEARCH_DIR,
+    SEARCH_HALVING_FACTOR,
+    SEARCH_METRIC,
+    SEARCH_MIN_DOMINANCE_SPLITS,
+    SEARCH_MIN_SPLITS,
+    SEARCH_REPEATS,
+)
+from parkinsons_voice_classification.models.classifiers import get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.models.training import (
+    _final_estimator,
+    _fit_and_evaluate,
+    _predict_fitted,
+    _score_fitted,
+    _shared_preprocessing,
+    _transform_fold,
+    compute_metrics,
+)
+from parkinsons_voice_classification.parallel import get_executor
+
+# Metrics that can be maximized (compute_metrics keys)
+SEARCH_METRICS = ("accuracy", "precision", "recall", "f1", "roc_auc")
+
+# Candidate values per final-estimator parameter
+SEARCH_SPACES: dict[str, dict[str, list]] = {
+    "LogisticRegression": {"C": [0.001, 0.01, 0.1, 1.0, 10.0, 100.0]},
+    "SVM_RBF": {"C": [0.1, 1.0, 10.0, 100.0], "gamma": ["scale", 0.001, 0.01, 0.1]},
+    "RandomForest": {"max_depth": [None, 3, 5, 10], "n_estimators": [100, 300, 500]},
+}
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a hyperparameter search.
+
+    Attributes
+    ----------
+    model_name : str
+        Model from get_models()
+    metric : str
+        Metric maximized (compute_metrics key)
+    best_params : dict
+        Winning final-estimator parameters
+    best_score : float
+        Mean metric of the winner over the splits it was scored on
+    n_splits : int
+        Number of splits the winner was scored on
+    history : pd.DataFrame
+        One row per (candidate, rung): candidate, params, rung, n_splits,
+        mean, std, status ('promoted', 'halved', 'dominated', 'best' or
+        'eliminated')
+    """
+
+    model_name: str
+    metric: str
+    best_params: dict
+    best_score: float
+    n_splits: int
+    history: pd.DataFrame
+
+
+def apply_params(pipeline: Pipeline, params: dict) -> Pipeline:
+    """Set final-estimator parameters on a model pipeline (in place) and return it."""
+    final_name = pipeline.steps[-1][0]
+    return pipeline.set_params(**{f"{final_name}__{key}": value for key, value in params.items()})
+
+
+def _metric_score(model, X_test: np.ndarray, y_test: np.ndarray, metric: str) -> float:
+    """One metric of a fitted model on preprocessed test data."""
+    y_pred, y_prob = _predict_fitted(model, X_test, y_test)
+    return compute_metrics(y_test, y_pred, y_prob)[metric]
+
+
+def _evaluate_on_folds(executor, evaluate, work: list[tuple]) -> dict:
+    """
+    Fit and evaluate estimators on preprocessed folds in parallel.
+
+    ``work`` holds (estimator, fold keys, folds) items, folds being
+    (X_train, y_train, X_test, y_test) tuples. Estimators with ``fit_batch``
+    get one task per item, others one task per fold.
+
+    Returns
+    -------
+    dict
+        Fold key -> ``evaluate(fitted, X_test, y_test)``.
+    """
+    tasks, task_keys = [], []
+    for estimator, keys, folds in work:
+        if hasattr(estimator, "fit_batch"):
+            tasks.append((evaluate, estimator, folds))
+            task_keys.append(keys)
+        else:
+            tasks.extend((evaluate, estimator, [fold]) for fold in folds)
+            task_keys.extend([key] for key in keys)
+    results = {}
+    for keys, values in zip(task_keys, executor.map(_fit_and_evaluate, tasks)):
+        results.update(zip(keys, values))
+    return results
+
+
+def _dominated(scores: np.ndarray, means: np.ndarray) -> np.ndarray:
+    """
+    Rows matched or beaten on every column by another row with a higher mean.
+
+    NaN scores (e.g. single-class ROC-AUC folds) are ignored.
+    """
+    filled = np.nan_to_num(scores, nan=-np.inf)
+    at_least = np.all(
+        (filled[None, :, :] >= filled[:, None, :]) | np.isnan(scores)[:, None, :], axis=2
+    )  # at_least[a, b]: b >= a on every split
+    better_mean = means[None, :] > means[:, None]
+    return np.any(at_least & better_mean, axis=1)
+
+
+def successive_halving_search(
+    model_name: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    use_groups: bool = False,
+    param_grid: dict[str, list] | None = None,
+    metric: str = SEARCH_METRIC,
+    n_folds: int = N_FOLDS,
+    n_repeats: int = SEARCH_REPEATS,
+    factor: int = SEARCH_HALVING_FACTOR,
+    min_splits: int | None = None,
+    min_dominance_splits: int = SEARCH_MIN_DOMINANCE_SPLITS,
+    jobs: int | None = None,
+    queue: str | None = None,
+) -> SearchResult:
+    """
+    Tune one model by successive halving over cached CV splits.
+
+    Parameters
+    ----------
+    model_name : str
+        Model from get_models()
+    X : np.ndarray
+        Feature matrix
+    y : np.ndarray
+        Label array (binary 0/1)
+    groups : np.ndarray, optional
+        Group labels for grouped CV (e.g., subject IDs)
+    use_groups : bool
+        If True, use StratifiedGroupKFold; else use StratifiedKFold
+    param_grid : dict[str, list], optional
+        Final-estimator parameter grid. Defaults to SEARCH_SPACES[model_name].
+    metric : str
+        compute_metrics key to maximize
+    n_folds : int
+        Number of CV folds per repeat
+    n_repeats : int
+        Shuffled CV repeats (seeds RANDOM_SEED, RANDOM_SEED + 1, ...); the
+        last rung uses all n_folds * n_repeats splits
+    factor : int
+        Halving factor: 1/factor of the candidates survive each rung, and
+        the next rung uses factor times as many splits
+    min_splits : int, optional
+        Splits in the first rung. Defaults to the number that leaves one
+        candidate when the last rung uses all splits, but at least
+        SEARCH_MIN_SPLITS.
+    min_dominance_splits : int
+        Splits a rung needs before dominated candidates are discarded
+        early (see module docstring)
+    jobs : int, optional
+        Maximum parallel workers (see run_cv).
+    queue : str, optional
+        Shared work queue file (see run_cv).
+
+    Returns
+    -------
+    SearchResult
+        Winning parameters, their score and the search history.
+    """
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
+    models = get_models()
+    if model_name not in models:
+        raise ValueError(f"Unknown model: {model_name}. Available: {list(models.keys())}")
+    if param_grid is None:
+        param_grid = SEARCH_SPACES[model_name]
+    if factor < 2:
+        raise ValueError(f"factor must be at least 2, got {factor}")
+    if metric not in SEARCH_METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Available: {list(SEARCH_METRICS)}")
+
+    candidates = list(ParameterGrid(param_grid))
+    pipelines = {
+        index: apply_params(clone(models[model_name]), params)
+        for index, params in enumerate(candidates)
+    }
+    prefixes, prefix_of = _shared_preprocessing(pipelines)
+
+    splits = [
+        split
+        for repeat in range(n_repeats)
+        for split in get_cv_splits(y, groups if use_groups else None, n_folds, RANDOM_SEED + repeat)
+    ]
+    max_splits = len(splits)
+    if min_splits is None:
+        n_halvings = math.ceil(math.log(len(candidates), factor)) if len(candidates) > 1 else 0
+        min_splits = max(SEARCH_MIN_SPLITS, max_splits // factor**n_halvings)
+
+    executor = get_executor(jobs, releases_gil=True, queue=queue)
+    evaluate = partial(_metric_score, metric=metric)
+    fold_data = {}  # (prefix index, split index) -> preprocessed fold, reused across rungs
+    scores = np.full((len(candidates), max_splits), np.nan)
+    alive = np.arange(len(candidates))
+    history = []
+    n_done, n_splits, rung = 0, min(min_splits, max_splits), 0
+
+    while True:
+        new_splits = range(n_done, n_splits)
+
+        # Preprocess each new split once per distinct prefix
+        needed = sorted({(prefix_of[c], s) for c in alive for s in new_splits} - fold_data.keys())
+        transformed = executor.map(
+            _transform_fold, [(prefixes[p], X, y, *splits[s]) for p, s in needed]
+        )
+        fold_data.update(zip(needed, transformed))
+
+        # Fit surviving candidates on the new splits only
+        work = [
+            (
+                _final_estimator(pipelines[c]),
+                [(c, s) for s in new_splits],
+                [fold_data[(prefix_of[c], s)] for s in new_splits],
+            )
+            for c in alive
+        ]
+        for (c, s), value in _evaluate_on_folds(executor, evaluate, work).items():
+            scores[c, s] = value
+        n_done = n_splits
+
+        alive_scores = scores[alive, :n_splits]
+        with np.errstate(all="ignore"):
+            means = np.nan_to_num(np.nanmean(alive_scores, axis=1), nan=-np.inf)
+            stds = np.nanstd(alive_scores, axis=1)
+
+        final = len(alive) == 1 or n_splits == max_splits
+        if final:
+            status = np.full(len(alive), "eliminated", dtype=object)
+            status[np.argmax(means)] = "best"
+        else:
+            # Keep the top 1/factor (stable: ties go to the earlier candidate),
+            # then discard survivors dominated split-by-split by another survivor
+            order = np.argsort(-means, kind="stable")
+            keep = np.zeros(len(alive), dtype=bool)
+            keep[order[: math.ceil(len(alive) / factor)]] = True
+            status = np.where(keep, "promoted", "halved").astype(object)
+            if n_splits >= max(2, min_dominance_splits):
+                dominated = np.zeros(len(alive), dtype=bool)
+                dominated[keep] = _dominated(alive_scores[keep], means[keep])
+                status[dominated] = "dominated"
+                keep &= ~dominated
+
+        for i, c in enumerate(alive):
+            history.append(
+                {
+                    "candidate": int(c),
+                    "params": json.dumps(candidates[c], default=str),
+                    "rung": rung,
+                    "n_splits": n_splits,
+                    "mean": means[i] if np.isfinite(means[i]) else np.nan,
+                    "std": stds[i],
+                    "status": status[i],
+                }
+            )
+
+        if final:
+            best = int(alive[np.argmax(means)])
+            return SearchResult(
+                model_name=model_name,
+                metric=metric,
+                best_params=candidates[best],
+                best_score=float(np.nanmean(scores[best, :n_splits])),
+                n_splits=n_splits,
+                history=pd.DataFrame(history),
+            )
+        alive = alive[keep]
+        n_splits = min(n_splits * factor, max_splits)
+        rung += 1
+
+
+def run_nested_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    use_groups: bool = False,
+    n_folds: int = N_FOLDS,
+    inner_folds: int = N_FOLDS,
+    param_grids: dict[str, dict[str, list]] | None = None,
+    metric: str = SEARCH_METRIC,
+    jobs: int | None = None,
+    queue: str | None = None,
+) -> pd.DataFrame:
+    """
+    Nested cross-validation: grid search in an inner CV, evaluation in the outer CV.
+
+    Each outer training set is split again (grouped when use_groups) into
+    ``inner_folds`` inner folds; every grid candidate is scored on them,
+    and the best (by mean ``metric``) is refitted on the outer training set
+    and evaluated on the outer test fold. Preprocessing is fitted once per
+    inner and outer split and shared by all candidates; all (outer fold,
+    candidate, inner fold) fits fan out over one executor.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix
+    y : np.ndarray
+        Label array (binary 0/1)
+    groups : np.ndarray, optional
+        Group labels for grouped CV (e.g., subject IDs)
+    use_groups : bool
+        If True, use StratifiedGroupKFold (outer and inner); else StratifiedKFold
+    n_folds : int
+        Number of outer CV folds (same folds as run_cv)
+    inner_folds : int
+        Number of inner CV folds
+    param_grids : dict[str, dict[str, list]], optional
+        Final-estimator grid per model. Defaults to SEARCH_SPACES; models
+        without a grid are evaluated with their default parameters.
+    metric : str
+        compute_metrics key maximized by the inner search
+    jobs : int, optional
+        Maximum parallel workers (see run_cv).
+    queue : str, optional
+        Shared work queue file (see run_cv).
+
+    Returns
+    -------
+    pd.DataFrame
+        Results with columns: model, fold, metric, value (as run_cv, so
+        summarize_results accepts them) and params, the parameters selected
+        for that outer fold.
+    """
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
+    if metric not in SEARCH_METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Available: {list(SEARCH_METRICS)}")
+    if param_grids is None:
+        param_grids = SEARCH_SPACES
+    models = get_models()
+
+    # Candidate pipelines: (model, candidate index) -> pipeline
+    candidates = {name: list(ParameterGrid(param_grids.get(name, {}))) for name in models}
+    pipelines = {
+        (name, c): apply_params(clone(model), params)
+        for name, model in models.items()
+        for c, params in enumerate(candidates[name])
+    }
+    prefixes, prefix_of = _shared_preprocessing(pipelines)
+
+    # Outer splits, then inner splits of each outer training set (as indices into X)
+    outer = get_cv_splits(y, groups if use_groups else None, n_folds)
+    splits = {("outer", o): split for o, split in enumerate(outer)}
+    for o, (train_idx, _) in enumerate(outer):
+        inner = get_cv_splits(y[train_idx], groups[train_idx] if use_groups else None, inner_folds)
+        for i, (inner_train, inner_test) in enumerate(inner):
+            splits[("inner", o, i)] = (train_idx[inner_train], train_idx[inner_test])
+
+    executor = get_executor(jobs, releases_gil=True, queue=queue)
+    needed = sorted({prefix_of[key] for key in pipelines})
+    fold_keys = [(p, split_key) for p in needed for split_key in splits]
+    transformed = executor.map(
+        _transform_fold, [(prefixes[p], X, y, *splits[split_key]) for p, split_key in fold_keys]
+    )
+    fold_data = dict(zip(fold_keys, transformed))
+
+    # Inner search: every candidate on every inner fold of every outer fold
+    inner_work = [
+        (
+            _final_estimator(pipeline),
+            [(key, o, i) for i in range(inner_folds)],
+            [fold_data[(prefix_of[key], ("inner", o, i))] for i in range(inner_folds)],
+        )
+        for key, pipeline in pipelines.items()
+        for o in range(len(outer))
+        if len(candidates[key[0]]) > 1
+    ]
+    inner_scores = _evaluate_on_folds(executor, partial(_metric_score, metric=metric), inner_work)
+
+    # Refit each outer fold's winner on the outer training set
+    selected = {}
+    for name in models:
+        for o in range(len(outer)):
+            if len(candidates[name]) == 1:
+                selected[(name, o)] = 0
+                continue
+            with np.errstate(all="ignore"):
+                means = [
+                    np.nanmean([inner_scores[((name, c), o, i)] for i in range(inner_folds)])
+                    for c in range(len(candidates[name]))
+                ]
+            selected[(name, o)] = int(np.argmax(np.nan_to_num(means, nan=-np.inf)))
+    outer_work = [
+        (
+            _final_estimator(pipelines[(name, c)]),
+            [(name, o)],
+            [fold_data[(prefix_of[(name, c)], ("outer", o))]],
+        )
+        for (name, o), c in selected.items()
+    ]
+    outer_results = _evaluate_on_folds(executor, _score_fitted, outer_work)
+
+    results = []
+    for name in models:
+        for o in range(len(outer)):
+            metrics, _, _ = outer_results[(name, o)]
+            params = json.dumps(candidates[name][selected[(name, o)]], default=str)
+            for metric_name, value in metrics.items():
+                results.append(
+                    {
+                        "model": name,
+                        "fold": o + 1,
+                        "metric": metric_name,
+                        "value": value,
+                        "params": params,
+                    }
+                )
+    return pd.DataFrame(results)
+
+
+def _search_stem(model_name: str, task: str, feature_set: str) -> str:
+    return f"{model_name}_{task}_{feature_set}"
+
+
+def save_search_result(
+    result: SearchResult, task: str, feature_set: str, output_dir: Path | None = None
+) -> Path:
+    """
+    Save a search's history (CSV) and winning parameters (JSON).
+
+    Parameters
+    ----------
+    result : SearchResult
+        Search outcome
+    task : str
+        Speech task searched on
+    feature_set : str
+        Feature set searched on ('baseline' or 'extended')
+    output_dir : Path, optional
+        Output directory. Defaults to SEARCH_DIR.
+
+    Returns
+    -------
+    Path
+        Path to the JSON file with the winning parameters.
+    """
+    output_dir = Path(output_dir or SEARCH_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = _search_stem(result.model_name, task, feature_set)
+
+    result.history.to_csv(output_dir / f"{stem}_history.csv", index=False)
+    best_path = output_dir / f"{stem}_best.json"
+    with open(best_path, "w") as f:
+        json.dump(
+            {
+                "model_name": result.model_name,
+                "task": task,
+                "feature_set": feature_set,
+                "metric": result.metric,
+                "best_params": result.best_params,
+                "best_score": result.best_score,
+                "n_splits": result.n_splits,
+                "n_candidates": int(result.history["candidate"].nunique()),
+                "searched_at": datetime.now().isoformat(),
+            },
+            f,
+            indent=2,
+        )
+    return best_path
+
+
+def load_best_params(
+    model_name: str, task: str, feature_set: str, search_dir: Path | None = None
+) -> dict:
+    """
+    Winning final-estimator parameters saved by save_search_result.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no search was saved for this model, task and feature set.
+    """
+    best_path = (
+        Path(search_dir or SEARCH_DIR) / f"{_search_stem(model_name, task, feature_set)}_best.json"
+    )
+    if not best_path.exists():
+        raise FileNotFoundError(
+            f"No search results: {best_path}\n"
+            f"Run 'pvc-search --task {task} --model {model_name} "
+            f"--feature-set {feature_set}' first."
+        )
+    with open(best_path) as f:
+        return json.load(f)["best_params"]
@@ -0,0 +1,263 @@
+"""
+Cross-Validation Split Service
+
+Fold indices depend only on (y, groups, n_folds, seed), yet they used to be
+recomputed by every CV run. Here they are computed once and cached, so
+``run_cv``, ``run_importance_cv`` and the confusion-matrix script share the
+same folds:
+
+- Dataset A (groups given): stratified group k-fold. Same algorithm and
+  output as sklearn's ``StratifiedGroupKFold(shuffle=True)``, but each
+  group's fold is chosen by scoring all candidate folds in one vectorized
+  step, and samples are assigned to folds with one array lookup. sklearn
+  scores folds one at a time and tests every sample's group in a Python
+  loop, which dominates for tens of thousands of subjects.
+- Dataset B (no groups): sklearn's ``StratifiedKFold(shuffle=True)``.
+
+Folds are stored as one fold id per sample. They are cached in memory and
+under outputs/splits/ (``SPLIT_CACHE_DIR``), keyed by a hash of the label
+and group encodings, n_folds, seed and strategy.
+
+Usage:
+    for train_idx, test_idx in get_cv_splits(y, groups=subject_ids):
+        ...
+"""
+
+import hashlib
+import logging
+import math
+import os
+import warnings
+from pathlib import Path
+
+import numpy as np
+from sklearn.model_selection import StratifiedKFold
+from sklearn.utils.multiclass import type_of_target
+
+from parkinsons_voice_classification.config import N_FOLDS, RANDOM_SEED, SPLIT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the fold assignment changes; older cache files are ignored
+SPLIT_CACHE_VERSION = 1
+
+# In-memory cache: key -> fold id per sample (oldest entries evicted first)
+_MAX_CACHED = 64
+_fold_cache: dict[str, np.ndarray] = {}
+
+
+def _stratified_group_folds(
+    y_inv: np.ndarray,
+    y_cnt: np.ndarray,
+    groups_inv: np.ndarray,
+    n_groups: int,
+    n_folds: int,
+    seed: int | None,
+) -> np.ndarray:
+    """
+    Fold id per sample, identical to StratifiedGroupKFold(shuffle=True).
+
+    Groups are visited in shuffled order, most class-imbalanced first; each
+    goes to the fold that minimises the mean (over classes) std of the
+    per-fold class fractions, ties going to the smallest fold.
+    """
+    n_classes = len(y_cnt)
+    y_counts_per_group = np.zeros((n_groups, n_classes))
+    np.add.at(y_counts_per_group, (groups_inv, y_inv), 1)
+
+    # Same random stream as sklearn's check_random_state(seed).shuffle
+    perm = np.arange(n_groups)
+    np.random.RandomState(seed).shuffle(perm)
+    y_counts_per_group = y_counts_per_group[perm]
+
+    # Stable sort keeps the shuffled order among equally imbalanced groups
+    order = np.argsort(-np.std(y_counts_per_group, axis=1), kind="stable")
+
+    y_counts_per_fold = np.zeros((n_folds, n_classes))
+    samples_per_fold = [0.0] * n_folds
+    # Row k of the candidates: fold counts with the current group added to fold k
+    add_to_fold = np.eye(n_folds)[:, :, None]
+    group_fold = np.empty(n_groups, dtype=np.intp)
+
+    for group_idx in order:
+        group_y_counts = y_counts_per_group[group_idx]
+        fractions = (y_counts_per_fold + add_to_fold * group_y_counts) / y_cnt
+        # np.std(axis=1) then np.mean(axis=1), spelled out as the same ufunc
+        # reductions (bit-identical) without their per-call overhead
+        deviations = fractions - np.add.reduce(fractions, axis=1, keepdims=True) / n_folds
+        std_per_class = np.sqrt(np.add.reduce(deviations * deviations, axis=1) / n_folds)
+        fold_evals = (np.add.reduce(std_per_class, axis=1) / n_classes).tolist()
+
+        best_fold, min_eval, min_samples = 0, math.inf, math.inf
+        for fold, fold_eval in enumerate(fold_evals):
+            # np.isclose defaults (rtol=1e-5, atol=1e-8); min_eval is finite here
+            is_better = fold_eval < min_eval or (
+                abs(fold_eval - min_eval) <= 1e-8 + 1e-5 * abs(min_eval)
+                and samples_per_fold[fold] < min_samples
+            )
+            if is_better:
+                best_fold, min_eval, min_samples = fold, fold_eval, samples_per_fold[fold]
+
+        y_counts_per_fold[best_fold] += group_y_counts
+        samples_per_fold[best_fold] += float(group_y_counts.sum())
+        group_fold[group_idx] = best_fold
+
+    # Sample -> original group -> shuffled position -> fold
+    inv_perm = np.empty_like(perm)
+    inv_perm[perm] = np.arange(n_groups)
+    return group_fold[inv_perm[groups_inv]]
+
+
+def _stratified_folds(y: np.ndarray, n_folds: int, seed: int | None) -> np.ndarray:
+    """Fold id per sample from StratifiedKFold(shuffle=True)."""
+    folds = np.empty(len(y), dtype=np.intp)
+    cv = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=seed)
+    for fold, (_, test_idx) in enumerate(cv.split(np.zeros((len(y), 1)), y)):
+        folds[test_idx] = fold
+    return folds
+
+
+def _compute_folds(
+    y: np.ndarray, groups: np.ndarray | None, n_folds: int, seed: int | None
+) -> np.ndarray:
+    if groups is None:
+        return _stratified_folds(y, n_folds, seed)
+
+    # Same input checks as StratifiedGroupKFold
+    target_type = type_of_target(y)
+    if target_type not in ("binary", "multiclass"):
+        raise ValueError(
+            f"Supported target types are: ('binary', 'multiclass'). Got {target_type!r} instead."
+        )
+    if n_folds > len(y):
+        raise ValueError(
+            f"Cannot have number of splits n_splits={n_folds} greater "
+            f"than the number of samples: n_samples={len(y)}."
+        )
+    _, y_inv, y_cnt = np.unique(y, return_inverse=True, return_counts=True)
+    if np.all(n_folds > y_cnt):
+        raise ValueError(
+            f"n_splits={n_folds} cannot be greater than the number of members in each class."
+        )
+    if n_folds > np.min(y_cnt):
+        warnings.warn(
+            f"The least populated class in y has only {np.min(y_cnt)} members, "
+            f"which is less than n_splits={n_folds}.",
+            UserWarning,
+        )
+    _, groups_inv = np.unique(groups, return_inverse=True)
+    n_groups = int(groups_inv.max()) + 1
+    if n_folds > n_groups:
+        raise ValueError(
+            f"Cannot have number of splits n_splits={n_folds} greater "
+            f"than the number of groups: {n_groups}."
+        )
+    return _stratified_group_folds(y_inv, y_cnt, groups_inv, n_groups, n_folds, seed)
+
+
+def _split_key(y: np.ndarray, groups: np.ndarray | None, n_folds: int, seed: int | None) -> str:
+    """Hash of everything the folds depend on (labels and groups up to renaming)."""
+    digest = hashlib.sha1()
+    digest.update(
+        f"v{SPLIT_CACHE_VERSION}:{'grouped' if groups is not None else 'stratified'}:"
+        f"{n_folds}:{seed}:{len(y)}".encode()
+    )
+    digest.update(np.unique(y, return_inverse=True)[1].astype(np.int64).tobytes())
+    if groups is not None:
+        digest.update(np.unique(groups, return_inverse=True)[1].astype(np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> Path | None:
+    return None if SPLIT_CACHE_DIR is None else Path(SPLIT_CACHE_DIR) / f"folds_{key[:20]}.npy"
+
+
+def get_cv_folds(
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    n_folds: int = N_FOLDS,
+    seed: int | None = RANDOM_SEED,
+) -> np.ndarray:
+    """
+    Test-fold id of every sample, from the cache when available.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Label array
+    groups : np.ndarray, optional
+        Group labels (e.g., subject IDs). If given, folds are stratified
+        group folds (StratifiedGroupKFold); otherwise StratifiedKFold.
+    n_folds : int
+        Number of CV folds
+    seed : int, optional
+        Shuffling seed
+
+    Returns
+    -------
+    np.ndarray
+        Fold id (0 .. n_folds-1) per sample.
+    """
+    y = np.asarray(y).ravel()
+    if groups is not None:
+        groups = np.asarray(groups).ravel()
+        if len(groups) != len(y):
+            raise ValueError(f"groups has {len(groups)} entries but y has {len(y)}")
+
+    key = _split_key(y, groups, n_folds, seed)
+    if key in _fold_cache:
+        return _fold_cache[key]
+
+    folds = None
+    path = _cache_path(key)
+    if path is not None and path.exists():
+        try:
+            folds = np.load(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable split cache {path}: {e}")
+        if folds is not None and (folds.shape != y.shape or folds.max(initial=0) >= n_folds):
+            folds = None
+
+    if folds is None:
+        folds = _compute_folds(y, groups, n_folds, seed).astype(np.int16)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npy")
+                np.save(tmp_path, folds)
+                os.replace(tmp_path, path)  # atomic: concurrent runs never see a partial file
+            except OSError as e:
+                logger.warning(f"Could not save split cache {path}: {e}")
+
+    folds.setflags(write=False)
+    if len(_fold_cache) >= _MAX_CACHED:
+        _fold_cache.pop(next(iter(_fold_cache)))
+    _fold_cache[key] = folds
+    return folds
+
+
+def get_cv_splits(
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    n_folds: int = N_FOLDS,
+    seed: int | None = RANDOM_SEED,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Cached (train_idx, test_idx) pairs, as from ``cv.split``.
+
+    Identical to ``StratifiedGroupKFold(n_folds, shuffle=True,
+    random_state=seed).split(X, y, groups)`` when groups is given, else to
+    ``StratifiedKFold(...).split(X, y)``. See get_cv_folds for parameters.
+
+    Returns
+    -------
+    list[tuple[np.ndarray, np.ndarray]]
+        Sorted train and test sample indices per fold.
+    """
+    folds = get_cv_folds(y, groups, n_folds, seed)
+    return [(np.flatnonzero(folds != i), np.flatnonzero(folds == i)) for i in range(n_folds)]
+
+
+def clear_split_cache() -> None:
+    """Drop the in-memory cache (the on-disk cache is left untouched)."""
+    _fold_cache.clear()
@@ -0,0 +1,279 @@
+"""
+Cheaper SVM Probabilities
+
+``SVC(probability=True)`` runs libsvm's internal 5-fold cross-validation for
+Platt scaling on every fit, so each SVM fit costs about six SVM trainings,
+even in CV where only the ranking of the scores matters for ROC-AUC.
+``SigmoidSVC`` is an SVC that fits Platt's sigmoid on its decision function
+more cheaply:
+
+- "holdout": the sigmoid is fitted on the decision values of a single
+  stratified held-out split (``holdout_size``), from an SVC trained on the
+  rest; the final SVC is then trained on all data. Two SVM trainings. The
+  hold-out is much smaller than libsvm's five folds together, so the
+  sigmoid is noisier; with fewer than ``MIN_HOLDOUT_PER_CLASS`` held-out
+  samples of a class (every Dataset A fold) a warning is issued.
+- "oof": only the final SVC is trained. ``predict_proba`` stays
+  unavailable (CV then scores ROC-AUC on decision values directly) until
+  ``fit_sigmoid`` is given out-of-fold decision values, e.g. from the outer
+  CV (``calibrate_oof``), which pvc-train does.
+
+Predictions come from the decision function in every mode, as with
+``SVC(probability=True)``, so they are identical to the default model's.
+
+Unlike libsvm, the sigmoid's slope is kept negative: on a handful of
+samples the fitted slope can come out positive, which would invert the
+ranking of the probabilities against the decision values (and ROC-AUC with
+it). Such a fit is replaced by the mirrored slope -|A| with B refitted.
+
+Selected with ``SVM_PROBABILITY`` in config (see models/classifiers.py).
+"""
+
+import warnings
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedShuffleSplit
+from sklearn.svm import SVC
+from sklearn.utils.metaestimators import available_if
+
+from parkinsons_voice_classification.models.splits import get_cv_splits
+
+SVM_CALIBRATIONS = ("holdout", "oof")
+
+# Held-out samples per class below which the 'holdout' sigmoid is flagged as unreliable
+MIN_HOLDOUT_PER_CLASS = 5
+
+# Smallest |A| * std(decision) of a mirrored slope, so it still separates the scores
+_MIN_SLOPE = 1e-3
+
+
+def fit_sigmoid(decision: np.ndarray, y: np.ndarray, max_iter: int = 100) -> tuple[float, float]:
+    """
+    Fit Platt's sigmoid P(y=1 | f) = 1 / (1 + exp(A * f + B)).
+
+    Newton's method with backtracking and Platt's smoothed targets, as in
+    libsvm's ``sigmoid_train`` (used by ``SVC(probability=True)``), except
+    that A is kept negative (see module docstring), so probabilities always
+    increase with the decision value.
+
+    Parameters
+    ----------
+    decision : np.ndarray
+        Decision values
+    y : np.ndarray
+        Binary targets (True/1 = positive class)
+    max_iter : int
+        Maximum Newton iterations
+
+    Returns
+    -------
+    tuple[float, float]
+        (A, B)
+    """
+    decision = np.asarray(decision, dtype=float)
+    positive = np.asarray(y).astype(bool)
+    n_pos = positive.sum()
+    n_neg = len(positive) - n_pos
+    target = np.where(positive, (n_pos + 1.0) / (n_pos + 2.0), 1.0 / (n_neg + 2.0))
+
+    def objective(a: float, b: float) -> float:
+        z = a * decision + b
+        # -log-likelihood, stable for either sign of z
+        return float(np.sum((target - 1.0) * z + np.logaddexp(0.0, z)))
+
+    def newton(a: float, b: float, fit_a: bool) -> tuple[float, float]:
+        """Minimize over (A, B), or over B alone with A fixed."""
+        f_value = objective(a, b)
+        for _ in range(max_iter):
+            z = a * decision + b
+            p = np.exp(-np.logaddexp(0.0, z))  # P(y=1) = 1 / (1 + exp(z))
+            d1 = target - p
+            d2 = p * (1.0 - p)
+            g_a, g_b = np.dot(decision, d1) if fit_a else 0.0, d1.sum()
+            if abs(g_a) < 1e-5 and abs(g_b) < 1e-5:
+                break
+            h22 = d2.sum() + 1e-12
+            if fit_a:
+                h11 = np.dot(decision * decision, d2) + 1e-12
+                h21 = np.dot(decision, d2)
+                det = h11 * h22 - h21 * h21
+                d_a = -(h22 * g_a - h21 * g_b) / det
+                d_b = -(-h21 * g_a + h11 * g_b) / det
+            else:
+                d_a, d_b = 0.0, -g_b / h22
+            slope = g_a * d_a + g_b * d_b
+
+            step = 1.0
+            while step >= 1e-10:
+                new_value = objective(a + step * d_a, b + step * d_b)
+                if new_value < f_value + 1e-4 * step * slope:
+                    a, b, f_value = a + step * d_a, b + step * d_b, new_value
+                    break
+                step /= 2.0
+            else:
+                break  # line search failed; keep the current sigmoid
+        return a, b
+
+    a, b = newton(0.0, np.log((n_neg + 1.0) / (n_pos + 1.0)), fit_a=True)
+    if a >= 0.0:
+        # Mirror the slope and refit the offset for it
+        scale = float(np.std(decision)) or 1.0
+        a = -max(abs(a), _MIN_SLOPE / scale)
+        a, b = newton(a, b, fit_a=False)
+    return float(a), float(b)
+
+
+def _has_sigmoid(estimator) -> bool:
+    return hasattr(estimator, "sigmoid_")
+
+
+class SigmoidSVC(SVC):
+    """
+    Binary SVC with a Platt sigmoid fitted by a single hold-out split or on
+    out-of-fold decision values, instead of libsvm's internal 5-fold CV.
+
+    Takes SVC's parameters (except ``probability``) plus:
+
+    Parameters
+    ----------
+    calibration : str
+        'holdout' or 'oof' (see module docstring)
+    holdout_size : float
+        Fraction of the training data held out for the sigmoid ('holdout')
+    """
+
+    def __init__(
+        self,
+        *,
+        calibration: str = "holdout",
+        holdout_size: float = 0.2,
+        C=1.0,
+        kernel="rbf",
+        degree=3,
+        gamma="scale",
+        coef0=0.0,
+        shrinking=True,
+        tol=1e-3,
+        cache_size=200,
+        class_weight=None,
+        verbose=False,
+        max_iter=-1,
+        decision_function_shape="ovr",
+        break_ties=False,
+        random_state=None,
+    ):
+        super().__init__(
+            C=C,
+            kernel=kernel,
+            degree=degree,
+            gamma=gamma,
+            coef0=coef0,
+            shrinking=shrinking,
+            tol=tol,
+            cache_size=cache_size,
+            class_weight=class_weight,
+            verbose=verbose,
+            max_iter=max_iter,
+            decision_function_shape=decision_function_shape,
+            break_ties=break_ties,
+            random_state=random_state,
+        )
+        self.calibration = calibration
+        self.holdout_size = holdout_size
+
+    def fit(self, X, y, sample_weight=None):
+        """Fit the SVC and, in 'holdout' mode, its sigmoid."""
+        if self.calibration not in SVM_CALIBRATIONS:
+            raise ValueError(
+                f"Unknown calibration: {self.calibration}. Available: {list(SVM_CALIBRATIONS)}"
+            )
+        if hasattr(self, "sigmoid_"):
+            del self.sigmoid_
+
+        X, y = np.asarray(X), np.asarray(y)
+        if len(np.unique(y)) != 2:
+            raise ValueError("SigmoidSVC only supports binary classification")
+
+        if self.calibration == "holdout":
+            splitter = StratifiedShuffleSplit(
+                n_splits=1, test_size=self.holdout_size, random_state=self.random_state
+            )
+            train_idx, hold_idx = next(splitter.split(X, y))
+            held_per_class = np.unique(y[hold_idx], return_counts=True)[1]
+            if len(held_per_class) < 2 or held_per_class.min() < MIN_HOLDOUT_PER_CLASS:
+                warnings.warn(
+                    f"SigmoidSVC hold-out has {held_per_class.min()} samples of its smallest "
+                    f"class (< {MIN_HOLDOUT_PER_CLASS}); the sigmoid will be unreliable. "
+                    f"Consider calibration='oof'.",
+                    UserWarning,
+                )
+            weights = None if sample_weight is None else np.asarray(sample_weight)[train_idx]
+            super().fit(X[train_idx], y[train_idx], sample_weight=weights)
+            hold_decision = self.decision_function(X[hold_idx])
+            super().fit(X, y, sample_weight=sample_weight)
+            self.fit_sigmoid(hold_decision, y[hold_idx])
+        else:
+            super().fit(X, y, sample_weight=sample_weight)
+        return self
+
+    def fit_sigmoid(self, decision: np.ndarray, y: np.ndarray) -> "SigmoidSVC":
+        """
+        Fit the probability sigmoid on decision values of held-out samples.
+
+        Parameters
+        ----------
+        decision : np.ndarray
+            Decision values of samples this SVC (or its CV clones) did not
+            train on
+        y : np.ndarray
+            Their labels
+        """
+        self.sigmoid_ = fit_sigmoid(decision, np.asarray(y) == self.classes_[1])
+        return self
+
+    @available_if(_has_sigmoid)
+    def predict_proba(self, X) -> np.ndarray:
+        """Class probabilities from the fitted sigmoid, columns in ``classes_`` order."""
+        a, b = self.sigmoid_
+        prob = np.exp(-np.logaddexp(0.0, a * self.decision_function(X) + b))
+        return np.column_stack([1.0 - prob, prob])
+
+    @available_if(_has_sigmoid)
+    def predict_log_proba(self, X) -> np.ndarray:
+        """Log of predict_proba."""
+        return np.log(self.predict_proba(X))
+
+
+def calibrate_oof(
+    pipeline, X: np.ndarray, y: np.ndarray, groups: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Fit a fitted SigmoidSVC pipeline's sigmoid on out-of-fold decision values.
+
+    Clones of the pipeline are trained on the CV folds of ``get_cv_splits``
+    (grouped when groups is given); their test-fold decision values go to the
+    final estimator's ``fit_sigmoid``.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline already fitted on (X, y), ending in a SigmoidSVC
+    X : np.ndarray
+        Feature matrix
+    y : np.ndarray
+        Label array
+    groups : np.ndarray, optional
+        Group labels (e.g., subject IDs) for grouped folds
+
+    Returns
+    -------
+    np.ndarray
+        Out-of-fold decision values.
+    """
+    decision = np.empty(len(y))
+    for train_idx, test_idx in get_cv_splits(y, groups):
+        fold_model = clone(pipeline).fit(X[train_idx], y[train_idx])
+        decision[test_idx] = fold_model.decision_function(X[test_idx])
+    pipeline.steps[-1][1].fit_sigmoid(decision, y)
+    return decision
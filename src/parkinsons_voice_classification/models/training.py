@@ -5,14 +5,25 @@ Cross-validation runner for both datasets:
 - Dataset A: StratifiedGroupKFold (grouped by subject)
 - Dataset B: StratifiedKFold (standard)
 
+Folds come from the cached split service (models/splits.py). Preprocessing
+shared by several model pipelines (e.g. the common StandardScaler) is fitted
+once per fold and its output fed to every model's final estimator.
+
+run_repeated_cv repeats the CV over many shuffled splits; its metrics are
+computed for all folds and repeats at once (compute_metrics_batch).
+
+run_tree_curve_cv scores the Random Forest at several tree counts from one
+forest per fold, grown at the largest count (see below).
+
 Metrics: Accuracy, Precision, Recall, F1, ROC-AUC
 """
 
+from functools import partial
 from typing import overload, Literal
 
+import joblib
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import StratifiedKFold, StratifiedGroupKFold
 from sklearn.metrics import (
     accuracy_score,
     precision_score,
@@ -21,9 +32,18 @@ from sklearn.metrics import (
     roc_auc_score,
 )
 from sklearn.base import clone
+from sklearn.pipeline import Pipeline
 
-from parkinsons_voice_classification.config import RANDOM_SEED, N_FOLDS
+from parkinsons_voice_classification.config import N_FOLDS, RANDOM_SEED
 from parkinsons_voice_classification.models.classifiers import get_models
+from parkinsons_voice_classification.models.splits import get_cv_splits
+from parkinsons_voice_classification.parallel import get_executor
+
+# Upper bound on preprocessed fold data held at once by run_repeated_cv
+_REPEATED_CV_CHUNK_BYTES = 256 * 1024**2
+
+# Forest sizes scored by run_tree_curve_cv
+TREE_CURVE_COUNTS = (10, 25, 50, 100, 200, 500)
 
 
 def compute_metrics(
@@ -73,6 +93,8 @@ def run_cv(
     n_folds: int = ...,
     *,
     collect_predictions: Literal[True],
+    jobs: int | None = ...,
+    queue: str | None = ...,
 ) -> tuple[pd.DataFrame, dict[str, tuple[np.ndarray, np.ndarray]]]: ...
 
 
@@ -84,6 +106,8 @@ def run_cv(
     use_groups: bool = ...,
     n_folds: int = ...,
     collect_predictions: Literal[False] = ...,
+    jobs: int | None = ...,
+    queue: str | None = ...,
 ) -> pd.DataFrame: ...
 
 
@@ -94,6 +118,8 @@ def run_cv(
     use_groups: bool = False,
     n_folds: int = N_FOLDS,
     collect_predictions: bool = False,
+    jobs: int | None = None,
+    queue: str | None = None,
 ) -> pd.DataFrame | tuple[pd.DataFrame, dict[str, tuple[np.ndarray, np.ndarray]]]:
     """
     Run cross-validation for all models.
@@ -113,6 +139,14 @@ def run_cv(
     collect_predictions : bool
         If True, also return aggregated out-of-fold predictions per model.
         Useful for confusion matrix generation.
+    jobs : int, optional
+        Maximum parallel workers for the per-fold preprocessing and the
+        (model, fold) fits. Defaults to ``parallel.default_jobs()``; the
+        executor runs them serially when that is estimated to be faster.
+        Results do not depend on it.
+    queue : str, optional
+        Shared work queue file (see distributed.py); the fits then run on the
+        queue's workers. Defaults to WORK_QUEUE_PATH from config.
 
     Returns
     -------
@@ -121,15 +155,8 @@ def run_cv(
         If collect_predictions is True: Tuple of (results_df, predictions_dict) where
         predictions_dict maps model_name -> (y_true, y_pred) aggregated across all folds.
     """
-    # Select CV strategy
-    if use_groups:
-        if groups is None:
-            raise ValueError("groups must be provided when use_groups=True")
-        cv = StratifiedGroupKFold(n_splits=n_folds, shuffle=True, random_state=RANDOM_SEED)
-        split_args = (X, y, groups)
-    else:
-        cv = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=RANDOM_SEED)
-        split_args = (X, y)
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
 
     models = get_models()
     results = []
@@ -137,42 +164,26 @@ def run_cv(
         {name: ([], []) for name in models} if collect_predictions else {}
     )
 
-    for model_name, pipeline in models.items():
-        for fold_idx, (train_idx, test_idx) in enumerate(cv.split(*split_args)):
-            X_train, X_test = X[train_idx], X[test_idx]
-            y_train, y_test = y[train_idx], y[test_idx]
-
-            # Clone and fit model
-            model = clone(pipeline)
-            model.fit(X_train, y_train)
-
-            # Predict
-            y_pred = model.predict(X_test)
-
-            # Get probabilities for ROC-AUC
-            if hasattr(model, "predict_proba"):
-                y_prob = model.predict_proba(X_test)[:, 1]
-            else:
-                y_prob = None
-
-            # Compute metrics
-            metrics = compute_metrics(y_test, y_pred, y_prob)
-
-            # Store results
-            for metric_name, value in metrics.items():
-                results.append(
-                    {
-                        "model": model_name,
-                        "fold": fold_idx + 1,
-                        "metric": metric_name,
-                        "value": value,
-                    }
-                )
-
-            # Collect out-of-fold predictions for confusion matrix
-            if collect_predictions:
-                predictions[model_name][0].extend(y_test.tolist())
-                predictions[model_name][1].extend(y_pred.tolist())
+    splits = get_cv_splits(y, groups if use_groups else None, n_folds)
+    executor = get_executor(jobs, releases_gil=True, queue=queue)
+    keys, outputs = _run_fold_tasks(_score_fitted, models, X, y, splits, executor)
+
+    for (model_name, fold_idx), (metrics, y_test, y_pred) in zip(keys, outputs):
+        # Store results
+        for metric_name, value in metrics.items():
+            results.append(
+                {
+                    "model": model_name,
+                    "fold": fold_idx + 1,
+                    "metric": metric_name,
+                    "value": value,
+                }
+            )
+
+        # Collect out-of-fold predictions for confusion matrix
+        if collect_predictions:
+            predictions[model_name][0].extend(y_test.tolist())
+            predictions[model_name][1].extend(y_pred.tolist())
 
     results_df = pd.DataFrame(results)
 
@@ -185,6 +196,482 @@ def run_cv(
     return results_df
 
 
+def _final_estimator(model):
+    """Last step of a Pipeline, or the model itself."""
+    return model.steps[-1][1] if isinstance(model, Pipeline) else model
+
+
+def _shared_preprocessing(models: dict) -> tuple[list[Pipeline | None], dict[str, int]]:
+    """
+    Distinct preprocessing prefixes (all Pipeline steps but the last).
+
+    Returns
+    -------
+    tuple[list, dict]
+        (prefixes, model name -> prefix index). Models whose unfitted
+        prefixes are identical (same steps and parameters) share an index;
+        None stands for no preprocessing.
+    """
+    prefixes, prefix_of_model, index_of_hash = [], {}, {}
+    for name, model in models.items():
+        prefix = model[:-1] if isinstance(model, Pipeline) and len(model.steps) > 1 else None
+        digest = joblib.hash(prefix)
+        if digest not in index_of_hash:
+            index_of_hash[digest] = len(prefixes)
+            prefixes.append(prefix)
+        prefix_of_model[name] = index_of_hash[digest]
+    return prefixes, prefix_of_model
+
+
+def _transform_fold(
+    prefix: Pipeline | None,
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fit a clone of the preprocessing on one fold; return transformed train/test data."""
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
+    if prefix is not None:
+        prefix = clone(prefix)
+        X_train = prefix.fit_transform(X_train, y_train)
+        X_test = prefix.transform(X_test)
+    return X_train, y_train, X_test, y_test
+
+
+def _run_fold_tasks(
+    evaluate, models: dict, X: np.ndarray, y: np.ndarray, splits: list, executor
+) -> tuple[list[tuple[str, int]], list]:
+    """
+    Fit every model on every split's preprocessed data and evaluate it.
+
+    Each distinct preprocessing prefix is fitted once per split (one task per
+    (prefix, split)). Final estimators are then fitted with one task per
+    (model, split), or one task per model covering all splits if the
+    estimator has ``fit_batch`` (e.g. BatchedLogisticRegression). Each
+    fitted model is passed to ``evaluate(model, X_test, y_test)``.
+
+    Returns
+    -------
+    tuple[list, list]
+        (model name, split index) keys, model-major, and evaluate's results.
+    """
+    # Shared preprocessing: fit each distinct pipeline prefix once per split
+    prefixes, prefix_of_model = _shared_preprocessing(models)
+    fold_keys = [(p, split_idx) for p in range(len(prefixes)) for split_idx in range(len(splits))]
+    transformed = executor.map(
+        _transform_fold, [(prefixes[p], X, y, *splits[split_idx]) for p, split_idx in fold_keys]
+    )
+    fold_data = dict(zip(fold_keys, transformed))
+
+    # Final estimators only: one task per (model, split), or per model if batched
+    tasks = []
+    for name, model in models.items():
+        estimator = _final_estimator(model)
+        folds = [fold_data[(prefix_of_model[name], split_idx)] for split_idx in range(len(splits))]
+        if hasattr(estimator, "fit_batch"):
+            tasks.append((evaluate, estimator, folds))
+        else:
+            tasks.extend((evaluate, estimator, [fold]) for fold in folds)
+    outputs = [
+        out for task_outputs in executor.map(_fit_and_evaluate, tasks) for out in task_outputs
+    ]
+
+    keys = [(name, split_idx) for name in models for split_idx in range(len(splits))]
+    return keys, outputs
+
+
+def _fit_and_evaluate(evaluate, estimator, folds: list[tuple]) -> list:
+    """
+    Fit clones of the estimator on preprocessed folds and evaluate them.
+
+    ``folds`` holds (X_train, y_train, X_test, y_test) tuples; estimators
+    with ``fit_batch`` fit all of them in one call.
+    """
+    if hasattr(estimator, "fit_batch"):
+        fitted = estimator.fit_batch([(X_train, y_train) for X_train, y_train, _, _ in folds])
+    else:
+        fitted = [clone(estimator).fit(X_train, y_train) for X_train, y_train, _, _ in folds]
+    return [evaluate(model, X_test, y_test) for model, (_, _, X_test, y_test) in zip(fitted, folds)]
+
+
+def _predict_fitted(
+    model, X_test: np.ndarray, y_test: np.ndarray
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Predictions and P(PD) of a fitted model on preprocessed test data."""
+    # Predict
+    y_pred = model.predict(X_test)
+
+    # Get probabilities for ROC-AUC
+    if hasattr(model, "predict_proba"):
+        y_prob = model.predict_proba(X_test)[:, 1]
+    elif hasattr(model, "decision_function"):
+        # ROC-AUC only needs a ranking (e.g. SigmoidSVC before its sigmoid is fitted)
+        y_prob = model.decision_function(X_test)
+    else:
+        y_prob = None
+    return y_pred, y_prob
+
+
+def _score_fitted(
+    model, X_test: np.ndarray, y_test: np.ndarray
+) -> tuple[dict, np.ndarray, np.ndarray]:
+    """Metrics, test labels and predictions of a fitted model on preprocessed test data."""
+    y_pred, y_prob = _predict_fitted(model, X_test, y_test)
+    return compute_metrics(y_test, y_pred, y_prob), y_test, y_pred
+
+
+def _batch_roc_auc(
+    y_true: np.ndarray, y_score: np.ndarray, segments: np.ndarray, n_segments: int
+) -> np.ndarray:
+    """
+    ROC-AUC per segment from tie-averaged ranks (Mann-Whitney U).
+
+    NaN for segments with a single class, like compute_metrics.
+    """
+    order = np.lexsort((y_score, segments))
+    seg_sorted, score_sorted = segments[order], y_score[order]
+    positive = (y_true[order] == 1).astype(float)
+
+    # Runs of equal (segment, score) share the average of their ranks
+    n = len(order)
+    starts_run = np.ones(n, dtype=bool)
+    starts_run[1:] = (seg_sorted[1:] != seg_sorted[:-1]) | (score_sorted[1:] != score_sorted[:-1])
+    run_start = np.flatnonzero(starts_run)
+    run_end = np.append(run_start[1:], n)
+    segment_start = np.searchsorted(seg_sorted, np.arange(n_segments))
+    run_rank = (run_start + run_end + 1) / 2 - segment_start[seg_sorted[run_start]]
+    ranks = run_rank[np.cumsum(starts_run) - 1]
+
+    n_total = np.bincount(seg_sorted, minlength=n_segments)
+    n_pos = np.bincount(seg_sorted, weights=positive, minlength=n_segments)
+    n_neg = n_total - n_pos
+    pos_rank_sum = np.bincount(seg_sorted, weights=ranks * positive, minlength=n_segments)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        auc = (pos_rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+    auc[(n_pos == 0) | (n_neg == 0)] = np.nan
+    return auc
+
+
+def compute_metrics_batch(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_prob: np.ndarray | None,
+    segments: np.ndarray,
+    n_segments: int | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Compute all evaluation metrics for many folds in one vectorized pass.
+
+    Same values as compute_metrics applied to each segment separately
+    (binary 0/1 labels; ROC-AUC agrees to floating-point rounding), without
+    sklearn's per-call input validation.
+
+    Parameters
+    ----------
+    y_true : np.ndarray
+        Ground truth labels, stacked over segments
+    y_pred : np.ndarray
+        Predicted labels
+    y_prob : np.ndarray, optional
+        Predicted probabilities for positive class (NaN marks a segment
+        without probabilities)
+    segments : np.ndarray
+        Segment (e.g. fold) index of each sample
+    n_segments : int, optional
+        Number of segments. Defaults to ``segments.max() + 1``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Metric name -> value per segment (compute_metrics keys).
+    """
+    segments = np.asarray(segments, dtype=np.intp)
+    if n_segments is None:
+        n_segments = int(segments.max()) + 1 if len(segments) else 0
+    y_true = np.asarray(y_true) == 1
+    y_pred = np.asarray(y_pred) == 1
+
+    # Confusion counts per segment
+    tp = np.bincount(segments, weights=y_true & y_pred, minlength=n_segments)
+    fp = np.bincount(segments, weights=~y_true & y_pred, minlength=n_segments)
+    fn = np.bincount(segments, weights=y_true & ~y_pred, minlength=n_segments)
+    n = np.bincount(segments, minlength=n_segments)
+    tn = n - tp - fp - fn
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = {
+            "accuracy": (tp + tn) / n,
+            # zero_division=0, as in compute_metrics
+            "precision": np.where(tp + fp > 0, tp / (tp + fp), 0.0),
+            "recall": np.where(tp + fn > 0, tp / (tp + fn), 0.0),
+            "f1": np.where(2 * tp + fp + fn > 0, 2 * tp / (2 * tp + fp + fn), 0.0),
+        }
+
+    if y_prob is None:
+        metrics["roc_auc"] = np.full(n_segments, np.nan)
+    else:
+        y_prob = np.asarray(y_prob, dtype=float)
+        missing = np.bincount(segments, weights=np.isnan(y_prob), minlength=n_segments) > 0
+        metrics["roc_auc"] = _batch_roc_auc(y_true, np.nan_to_num(y_prob), segments, n_segments)
+        metrics["roc_auc"][missing] = np.nan
+    return metrics
+
+
+def run_repeated_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    use_groups: bool = False,
+    n_folds: int = N_FOLDS,
+    n_repeats: int = 100,
+    seeds: list[int] | None = None,
+    jobs: int | None = None,
+    queue: str | None = None,
+) -> pd.DataFrame:
+    """
+    Run repeated cross-validation (one shuffled split per seed) for all models.
+
+    All (model, repeat, fold) fits fan out over one executor, and metrics for
+    every fold of every repeat are computed in one vectorized pass
+    (compute_metrics_batch) from the stacked predictions.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix
+    y : np.ndarray
+        Label array (binary 0/1)
+    groups : np.ndarray, optional
+        Group labels for grouped CV (e.g., subject IDs)
+    use_groups : bool
+        If True, use StratifiedGroupKFold; else use StratifiedKFold
+    n_folds : int
+        Number of CV folds
+    n_repeats : int
+        Number of repeats (ignored if seeds is given)
+    seeds : list[int], optional
+        Split seed per repeat. Defaults to RANDOM_SEED, RANDOM_SEED + 1, ...
+        so repeat 0 has run_cv's folds.
+    jobs : int, optional
+        Maximum parallel workers (see run_cv).
+    queue : str, optional
+        Shared work queue file (see run_cv).
+
+    Returns
+    -------
+    pd.DataFrame
+        Results with columns: model, repeat, seed, fold, metric, value.
+    """
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
+    if seeds is None:
+        seeds = [RANDOM_SEED + r for r in range(n_repeats)]
+
+    models = get_models()
+    executor = get_executor(jobs, releases_gil=True, queue=queue)
+
+    # Repeats are submitted in chunks so the preprocessed fold arrays
+    # (~ X.nbytes per prefix and repeat) stay within _REPEATED_CV_CHUNK_BYTES
+    n_prefixes = len(_shared_preprocessing(models)[0])
+    chunk = max(1, int(_REPEATED_CV_CHUNK_BYTES // max(1, n_prefixes * X.nbytes)))
+
+    pieces = {name: [] for name in models}  # (repeat, fold, test_idx, y_pred, y_prob)
+    for first in range(0, len(seeds), chunk):
+        repeat_ids = range(first, min(first + chunk, len(seeds)))
+        split_keys, splits = [], []
+        for repeat in repeat_ids:
+            for fold_idx, split in enumerate(
+                get_cv_splits(y, groups if use_groups else None, n_folds, seeds[repeat])
+            ):
+                split_keys.append((repeat, fold_idx))
+                splits.append(split)
+        keys, outputs = _run_fold_tasks(_predict_fitted, models, X, y, splits, executor)
+        for (name, split_idx), (y_pred, y_prob) in zip(keys, outputs):
+            repeat, fold_idx = split_keys[split_idx]
+            pieces[name].append((repeat, fold_idx, splits[split_idx][1], y_pred, y_prob))
+
+    # Stack predictions (model-major, then repeat, fold) and score all segments at once
+    segment_keys = [(name, *piece[:2]) for name in models for piece in pieces[name]]
+    stacked = [piece for name in models for piece in pieces[name]]
+    test_idx = [piece[2] for piece in stacked]
+    metrics = compute_metrics_batch(
+        y[np.concatenate(test_idx)],
+        np.concatenate([piece[3] for piece in stacked]),
+        np.concatenate(
+            [
+                piece[4] if piece[4] is not None else np.full(len(piece[2]), np.nan)
+                for piece in stacked
+            ]
+        ),
+        np.repeat(np.arange(len(stacked)), [len(idx) for idx in test_idx]),
+        n_segments=len(stacked),
+    )
+
+    # Long format, same metric order as run_cv
+    names, repeats, folds = (np.array(column) for column in zip(*segment_keys))
+    n_metrics = len(metrics)
+    return pd.DataFrame(
+        {
+            "model": np.repeat(names, n_metrics),
+            "repeat": np.repeat(repeats, n_metrics),
+            "seed": np.repeat(np.asarray(seeds)[repeats], n_metrics),
+            "fold": np.repeat(folds + 1, n_metrics),
+            "metric": np.tile(list(metrics), len(stacked)),
+            "value": np.column_stack(list(metrics.values())).ravel(),
+        }
+    )
+
+
+def _predict_tree_prefixes(
+    forest, X_test: np.ndarray, y_test: np.ndarray, tree_counts: tuple[int, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Predictions and P(PD) of the forest's first k trees, for each k in tree_counts.
+
+    A forest's probabilities are the mean of its trees' leaf class fractions.
+    All trees' leaf values are gathered with one lookup into their stacked
+    node tables and accumulated with a cumulative sum over trees, so every
+    prefix costs no more than the full forest. Values are bit-identical to
+    ``predict``/``predict_proba`` of a forest fitted with n_estimators=k
+    (tree seeds are drawn in order, so the first k trees are the same).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        y_pred and y_prob, shape (len(tree_counts), n_test).
+    """
+    leaves = forest.apply(X_test)  # (n_test, n_trees) leaf node ids
+    tables, offsets, offset = [], [], 0
+    for tree in forest.estimators_:
+        value = tree.tree_.value[:, 0, :]
+        normalizer = value.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        tables.append(value / normalizer)  # as DecisionTreeClassifier.predict_proba
+        offsets.append(offset)
+        offset += len(value)
+
+    tree_proba = np.concatenate(tables)[leaves + np.array(offsets)]  # (n_test, n_trees, n_cls)
+    cumulative = np.cumsum(tree_proba, axis=1)
+    counts = np.asarray(tree_counts)
+    proba = cumulative[:, counts - 1, :] / counts[None, :, None]  # (n_test, n_counts, n_cls)
+
+    y_pred = forest.classes_.take(np.argmax(proba, axis=2).T, axis=0)
+    return y_pred, proba[:, :, 1].T
+
+
+def run_tree_curve_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    groups: np.ndarray | None = None,
+    use_groups: bool = False,
+    n_folds: int = N_FOLDS,
+    tree_counts: tuple[int, ...] = TREE_CURVE_COUNTS,
+    model_name: str = "RandomForest",
+    jobs: int | None = None,
+    queue: str | None = None,
+) -> pd.DataFrame:
+    """
+    Score a forest model at several tree counts from one training pass per fold.
+
+    Each fold fits the model once with n_estimators=max(tree_counts); the
+    metrics at every count come from prefixes of its ``estimators_`` and
+    equal those of run_cv with the model's n_estimators set to that count.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix
+    y : np.ndarray
+        Label array (binary 0/1)
+    groups : np.ndarray, optional
+        Group labels for grouped CV (e.g., subject IDs)
+    use_groups : bool
+        If True, use StratifiedGroupKFold; else use StratifiedKFold
+    n_folds : int
+        Number of CV folds
+    tree_counts : tuple[int, ...]
+        Forest sizes to score
+    model_name : str
+        Model from get_models() whose final estimator is a forest
+    jobs : int, optional
+        Maximum parallel workers (see run_cv).
+    queue : str, optional
+        Shared work queue file (see run_cv).
+
+    Returns
+    -------
+    pd.DataFrame
+        Results with columns: model, n_estimators, fold, metric, value.
+    """
+    if use_groups and groups is None:
+        raise ValueError("groups must be provided when use_groups=True")
+    models = get_models()
+    if model_name not in models:
+        raise ValueError(f"Unknown model: {model_name}. Available: {list(models.keys())}")
+    model = clone(models[model_name])
+    if "n_estimators" not in _final_estimator(model).get_params():
+        raise ValueError(f"{model_name} is not a forest model")
+    tree_counts = tuple(sorted(set(int(k) for k in tree_counts)))
+    if tree_counts[0] < 1:
+        raise ValueError(f"Tree counts must be positive, got {tree_counts}")
+    _final_estimator(model).set_params(n_estimators=tree_counts[-1])
+
+    splits = get_cv_splits(y, groups if use_groups else None, n_folds)
+    executor = get_executor(jobs, releases_gil=True, queue=queue)
+    _, outputs = _run_fold_tasks(
+        partial(_predict_tree_prefixes, tree_counts=tree_counts),
+        {model_name: model},
+        X,
+        y,
+        splits,
+        executor,
+    )
+
+    # Segments: (fold, tree count), fold-major
+    n_counts = len(tree_counts)
+    test_sizes = [len(test_idx) for _, test_idx in splits]
+    metrics = compute_metrics_batch(
+        np.concatenate([np.tile(y[test_idx], n_counts) for _, test_idx in splits]),
+        np.concatenate([y_pred.ravel() for y_pred, _ in outputs]),
+        np.concatenate([y_prob.ravel() for _, y_prob in outputs]),
+        np.repeat(np.arange(len(splits) * n_counts), np.repeat(test_sizes, n_counts)),
+        n_segments=len(splits) * n_counts,
+    )
+
+    n_metrics = len(metrics)
+    return pd.DataFrame(
+        {
+            "model": model_name,
+            "n_estimators": np.repeat(np.tile(tree_counts, len(splits)), n_metrics),
+            "fold": np.repeat(np.arange(len(splits)) + 1, n_counts * n_metrics),
+            "metric": np.tile(list(metrics), len(splits) * n_counts),
+            "value": np.column_stack(list(metrics.values())).ravel(),
+        }
+    )
+
+
+def summarize_tree_curve(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize tree-count curves with mean ± std across folds.
+
+    Parameters
+    ----------
+    results_df : pd.DataFrame
+        Raw results from run_tree_curve_cv() with dataset and task columns
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary with mean and std per model/tree count/metric
+    """
+    keys = ["dataset", "task", "model", "n_estimators", "metric"]
+    summary = results_df.groupby(keys)["value"].agg(["mean", "std"])
+    summary["mean_std"] = summary.apply(lambda row: f"{row['mean']:.3f} ± {row['std']:.3f}", axis=1)
+    return summary.reset_index()
+
+
 def summarize_results(results_df: pd.DataFrame) -> pd.DataFrame:
     """
     Summarize CV results with mean ± std.
@@ -204,3 +691,28 @@ def summarize_results(results_df: pd.DataFrame) -> pd.DataFrame:
     )
     summary["mean_std"] = summary.apply(lambda row: f"{row['mean']:.3f} ± {row['std']:.3f}", axis=1)
     return summary.reset_index()
+
+
+def summarize_repeated_results(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize repeated CV results with mean ± std across repeats.
+
+    Each repeat's fold values are averaged first, so the std measures the
+    spread of the CV estimate over shuffles rather than over folds.
+
+    Parameters
+    ----------
+    results_df : pd.DataFrame
+        Raw results from run_repeated_cv() with dataset and task columns
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary with mean and std per model/metric, and the number of repeats
+    """
+    keys = ["dataset", "task", "model", "metric"]
+    per_repeat = results_df.groupby(keys + ["repeat"])["value"].mean()
+    summary = per_repeat.groupby(keys).agg(["mean", "std", "count"])
+    summary = summary.rename(columns={"count": "n_repeats"})
+    summary["mean_std"] = summary.apply(lambda row: f"{row['mean']:.3f} ± {row['std']:.3f}", axis=1)
+    return summary.reset_index()
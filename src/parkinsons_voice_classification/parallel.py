@@ -0,0 +1,358 @@
+"""
+Adaptive Parallel Execution
+
+One executor drives the embarrassingly parallel loops of the pipeline:
+per-file feature extraction, per-(model, fold) cross-validation and
+per-(model, fold) feature importance.
+
+Execution mode is chosen per batch, not hard-coded:
+- serial:  in-process loop (tiny batches, cheap tasks, or a single CPU)
+- thread:  thread pool, for tasks that release the GIL (sklearn fits)
+- process: loky process pool, for GIL-bound work (Praat/librosa extraction)
+
+The first task runs in-process and is timed; the remaining tasks go to the
+mode with the lowest estimated wall time given that per-task cost, the
+worker count and PROCESS_STARTUP_SECONDS for a cold process pool (zero for an
+already-warm pool). When tasks differ in size (``sizes``, e.g. recordings per
+archive shard), the smallest task is timed instead and its cost is scaled by
+the size of the others, so a large task never runs in-process just to be
+measured. Results are always returned in input order, so the choice never
+changes the output.
+
+Worker counts come from ``available_cpus()``, which respects CPU affinity
+and cgroup CPU quotas (containers, CI runners), capped by MAX_WORKERS. Each
+worker gets a thread budget of ``available_cpus() // workers`` for nested
+BLAS/OpenMP/numba pools, so parallel workers do not oversubscribe cores.
+
+Note: the generic process pool here is a module-owned loky pool, separate
+from loky's process-wide reusable executor (used by the warmed extraction
+pool of features/executor.py and by joblib), so neither adopts the other's
+workers.
+
+``get_executor()`` returns the shared work-queue backend of distributed.py
+instead when a queue is given or WORK_QUEUE_PATH is set; both have the same
+``map`` interface.
+
+Usage:
+    executor = AdaptiveExecutor(jobs=None, releases_gil=True)
+    results = executor.map(fit_fold, [(model, train, test) for ...])
+    executor.last_mode  # 'serial', 'thread' or 'process'
+"""
+
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from joblib import cpu_count
+from joblib.externals.loky import BrokenProcessPool, ProcessPoolExecutor
+from threadpoolctl import threadpool_limits
+from tqdm import tqdm
+
+from parkinsons_voice_classification.config import (
+    MAX_WORKERS,
+    PROCESS_STARTUP_SECONDS,
+    WORK_QUEUE_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("serial", "thread", "process")
+
+# Environment variables read by BLAS/OpenMP/numba when they start their pools
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+# Per-task submit/pickle overhead of the process pool (seconds)
+_PROCESS_TASK_OVERHEAD = 0.005
+
+# Generic process pool and its worker count, once started (see _process_map)
+_generic_pool: ProcessPoolExecutor | None = None
+_generic_pool_workers: int | None = None
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may use.
+
+    Uses joblib's (loky's) count, which honours the CPU affinity mask and
+    cgroup v1/v2 CPU quotas, unlike ``os.cpu_count()``.
+    """
+    return max(1, cpu_count())
+
+
+def default_jobs(n_tasks: int | None = None) -> int:
+    """
+    Default number of parallel workers.
+
+    Parameters
+    ----------
+    n_tasks : int, optional
+        Batch size; the worker count never exceeds it.
+
+    Returns
+    -------
+    int
+        ``available_cpus() - 1`` (at least 1), capped by MAX_WORKERS and ``n_tasks``.
+    """
+    jobs = max(1, available_cpus() - 1)
+    if MAX_WORKERS is not None:
+        jobs = min(jobs, MAX_WORKERS)
+    if n_tasks is not None:
+        jobs = min(jobs, max(1, n_tasks))
+    return jobs
+
+
+def thread_budget(jobs: int) -> int:
+    """Nested BLAS/OpenMP/numba threads allowed per worker when ``jobs`` workers run."""
+    return max(1, available_cpus() // max(1, jobs))
+
+
+def limit_worker_threads(n_threads: int) -> None:
+    """
+    Cap nested thread pools in a worker process.
+
+    Sets the thread environment variables (for libraries not loaded yet,
+    e.g. numba) and applies threadpoolctl limits to those already loaded.
+    Used as a process-pool initializer.
+    """
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(n_threads)
+    threadpool_limits(limits=n_threads)
+
+
+def choose_mode(
+    n_tasks: int,
+    task_seconds: float,
+    jobs: int,
+    releases_gil: bool = False,
+    pool_warm: bool = False,
+) -> str:
+    """
+    Choose the execution mode with the lowest estimated wall time.
+
+    Parameters
+    ----------
+    n_tasks : int
+        Number of tasks still to run.
+    task_seconds : float
+        Measured cost of one task.
+    jobs : int
+        Available workers.
+    releases_gil : bool
+        Whether tasks spend their time in GIL-releasing code (thread mode
+        is only considered then).
+    pool_warm : bool
+        Whether a process pool with warmed workers already exists.
+
+    Returns
+    -------
+    str
+        'serial', 'thread' or 'process'. Ties favour serial.
+    """
+    if jobs <= 1 or n_tasks <= 1:
+        return "serial"
+
+    workers = min(jobs, n_tasks)
+    parallel = math.ceil(n_tasks / workers) * task_seconds
+    estimates = {
+        "serial": n_tasks * task_seconds,
+        "process": parallel
+        + n_tasks * _PROCESS_TASK_OVERHEAD / workers
+        + (0.0 if pool_warm else PROCESS_STARTUP_SECONDS),
+    }
+    if releases_gil:
+        estimates["thread"] = parallel
+    return min(estimates, key=estimates.get)
+
+
+class AdaptiveExecutor:
+    """
+    Map tasks serially, on threads or on processes, whichever is cheapest.
+
+    Parameters
+    ----------
+    jobs : int, optional
+        Maximum number of workers. Defaults to ``default_jobs()``.
+    releases_gil : bool
+        Whether tasks release the GIL (enables thread mode).
+    process_pool : object, optional
+        Pool used for process mode, with ``map(fn, items, desc=None)`` and an
+        ``is_warm`` attribute (e.g. features.executor.ExtractionExecutor).
+        Defaults to a module-level loky pool with a thread-budget initializer.
+    mode : str, optional
+        Force 'serial', 'thread' or 'process' instead of choosing.
+
+    Attributes
+    ----------
+    last_mode : str or None
+        Mode used by the last ``map`` call.
+    last_task_seconds : float or None
+        Measured cost of the timed task of the last ``map`` call, per unit
+        of ``sizes`` when given.
+    """
+
+    def __init__(
+        self,
+        jobs: int | None = None,
+        releases_gil: bool = False,
+        process_pool=None,
+        mode: str | None = None,
+    ):
+        if mode is not None and mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {mode}. Available: {list(EXECUTION_MODES)}")
+        self.jobs = default_jobs() if jobs is None else max(1, jobs)
+        self.releases_gil = releases_gil
+        self.process_pool = process_pool
+        self.mode = mode
+        self.last_mode: str | None = None
+        self.last_task_seconds: float | None = None
+
+    def _pool_warm(self, jobs: int) -> bool:
+        if self.process_pool is not None:
+            return bool(getattr(self.process_pool, "is_warm", False))
+        return _generic_pool is not None and _generic_pool_workers == jobs
+
+    def map(self, fn, items: list, desc: str | None = None, sizes: list[int] | None = None) -> list:
+        """
+        Run ``fn(*args)`` for every ``args`` tuple in ``items``.
+
+        Parameters
+        ----------
+        fn : callable
+            Task function (module-level, so it can be pickled for process mode).
+        items : list[tuple]
+            Argument tuples, one per task.
+        desc : str, optional
+            Progress bar label (no progress bar if None).
+        sizes : list[int], optional
+            Relative cost of each task (e.g. recordings per archive shard).
+            The smallest task is timed and the others' cost scaled from it.
+            Defaults to equal sizes (the first task is timed).
+
+        Returns
+        -------
+        list
+            Results in ``items`` order.
+        """
+        items = list(items)
+        if not items:
+            return []
+        if sizes is not None and len(sizes) != len(items):
+            raise ValueError(f"sizes has {len(sizes)} entries but there are {len(items)} tasks")
+        jobs = min(self.jobs, len(items))
+
+        probe, probe_result = None, None
+        mode = self.mode
+        self.last_task_seconds = None
+        if mode is None:
+            if jobs <= 1:
+                mode = "serial"
+            elif self._pool_warm(jobs) and not self.releases_gil:
+                # Warm workers beat any alternative for GIL-bound work
+                mode = "process"
+            else:
+                # Measure the per-task cost on the smallest task, in-process
+                probe = 0 if sizes is None else min(range(len(items)), key=sizes.__getitem__)
+                start = time.perf_counter()
+                probe_result = fn(*items[probe])
+                self.last_task_seconds = time.perf_counter() - start
+                task_seconds = self.last_task_seconds
+                if sizes is not None:
+                    self.last_task_seconds /= max(1, sizes[probe])
+                    rest = [size for i, size in enumerate(sizes) if i != probe]
+                    if rest:
+                        task_seconds = self.last_task_seconds * sum(rest) / len(rest)
+                mode = choose_mode(
+                    len(items) - 1,
+                    task_seconds,
+                    jobs,
+                    self.releases_gil,
+                    self._pool_warm(jobs),
+                )
+        self.last_mode = mode
+        logger.debug(f"{desc or 'tasks'}: {len(items)} tasks, mode={mode}, jobs={jobs}")
+
+        remaining = items if probe is None else items[:probe] + items[probe + 1 :]
+        if not remaining:
+            results = []
+        elif mode == "serial":
+            results = [fn(*args) for args in tqdm(remaining, desc=desc, disable=desc is None)]
+        elif mode == "thread":
+            results = self._thread_map(fn, remaining, jobs, desc)
+        elif self.process_pool is not None:
+            results = self.process_pool.map(fn, remaining, desc=desc)
+        else:
+            results = self._process_map(fn, remaining, jobs, desc)
+        if probe is not None:
+            results.insert(probe, probe_result)
+        return results
+
+    @staticmethod
+    def _thread_map(fn, items: list, jobs: int, desc: str | None) -> list:
+        with threadpool_limits(limits=thread_budget(jobs)), ThreadPoolExecutor(jobs) as pool:
+            futures = [pool.submit(fn, *args) for args in items]
+            return [f.result() for f in tqdm(futures, desc=desc, disable=desc is None)]
+
+    @staticmethod
+    def _process_map(fn, items: list, jobs: int, desc: str | None) -> list:
+        global _generic_pool, _generic_pool_workers
+        if _generic_pool is None or _generic_pool_workers != jobs:
+            if _generic_pool is not None:
+                _generic_pool.shutdown(wait=True)
+            # The thread budget depends on jobs, so a new size needs new workers
+            _generic_pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=limit_worker_threads,
+                initargs=(thread_budget(jobs),),
+            )
+            _generic_pool_workers = jobs
+        try:
+            futures = [_generic_pool.submit(fn, *args) for args in items]
+            return [f.result() for f in tqdm(futures, desc=desc, disable=desc is None)]
+        except BrokenProcessPool:
+            # A worker died: start a fresh pool next time
+            _generic_pool = _generic_pool_workers = None
+            raise
+
+
+def get_executor(
+    jobs: int | None = None,
+    releases_gil: bool = False,
+    process_pool=None,
+    queue: str | None = None,
+):
+    """
+    Return the executor for a batch of tasks.
+
+    Parameters
+    ----------
+    jobs : int, optional
+        Maximum local workers. With a work queue, the number of worker
+        processes started on this host alongside any external ``pvc-worker``
+        processes (0 = external workers only).
+    releases_gil : bool
+        Whether tasks release the GIL (see AdaptiveExecutor).
+    process_pool : object, optional
+        Local process pool for AdaptiveExecutor.
+    queue : str, optional
+        Work queue file. Defaults to WORK_QUEUE_PATH from config.
+
+    Returns
+    -------
+    AdaptiveExecutor or distributed.DistributedExecutor
+        The work-queue executor if a queue is configured, else AdaptiveExecutor.
+    """
+    queue = WORK_QUEUE_PATH if queue is None else queue
+    if queue is not None:
+        from parkinsons_voice_classification.distributed import DistributedExecutor
+
+        return DistributedExecutor(queue, local_workers=default_jobs() if jobs is None else jobs)
+    return AdaptiveExecutor(jobs, releases_gil=releases_gil, process_pool=process_pool)
@@ -0,0 +1,23 @@
+"""Shared fixtures: small synthetic datasets with the shape of the real ones."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def grouped_data() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """X, y and subject groups: 73 recordings of 37 subjects, 20 features (like Dataset A)."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(73, 20))
+    y = (X[:, 0] + rng.normal(size=73) > 0).astype(int)
+    groups = np.repeat(np.arange(37), 2)[:73]
+    return X, y, groups
+
+
+@pytest.fixture(autouse=True)
+def split_cache_dir(tmp_path, monkeypatch):
+    """Keep the CV split cache out of the repository's outputs/ directory."""
+    from parkinsons_voice_classification.models import splits
+
+    monkeypatch.setattr(splits, "SPLIT_CACHE_DIR", tmp_path / "splits")
+    splits.clear_split_cache()
@@ -0,0 +1,81 @@
+"""BatchedLogisticRegression (models/batched_logistic.py) vs sklearn's lbfgs."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from parkinsons_voice_classification.models import batched_logistic
+from parkinsons_voice_classification.models.batched_logistic import (
+    MAX_BATCHED_FEATURES,
+    BatchedLogisticRegression,
+)
+from parkinsons_voice_classification.models.splits import get_cv_splits
+
+
+@pytest.mark.parametrize("class_weight", [None, "balanced", {0: 2.0, 1: 0.5}])
+@pytest.mark.parametrize("C", [0.01, 1.0, 100.0])
+def test_fit_batch_matches_lbfgs_per_fold(grouped_data, C, class_weight):
+    X, y, groups = grouped_data
+    X = StandardScaler().fit_transform(X)
+    # Folds of different sizes, padded to a common shape inside fit_batch
+    splits = get_cv_splits(y, groups, 5, 0)
+    params = dict(C=C, class_weight=class_weight, max_iter=1000)
+
+    fitted = BatchedLogisticRegression(**params).fit_batch(
+        [(X[train], y[train]) for train, _ in splits]
+    )
+
+    for model, (train, test) in zip(fitted, splits):
+        reference = LogisticRegression(**params, tol=1e-10).fit(X[train], y[train])
+        np.testing.assert_allclose(model.coef_, reference.coef_, rtol=1e-4, atol=1e-6)
+        np.testing.assert_allclose(model.intercept_, reference.intercept_, rtol=1e-4, atol=1e-6)
+        np.testing.assert_allclose(
+            model.predict_proba(X[test]), reference.predict_proba(X[test]), atol=1e-6
+        )
+        np.testing.assert_array_equal(model.predict(X[test]), reference.predict(X[test]))
+
+
+def test_fit_matches_fit_batch_of_one(grouped_data):
+    X, y, _ = grouped_data
+    labels = np.array(["HC", "PD"])[y]
+    model = BatchedLogisticRegression().fit(X, labels)
+    batch_model = BatchedLogisticRegression().fit_batch([(X, labels)])[0]
+
+    np.testing.assert_array_equal(model.classes_, ["HC", "PD"])
+    np.testing.assert_array_equal(model.coef_, batch_model.coef_)
+    np.testing.assert_array_equal(model.predict(X), batch_model.predict(X))
+
+
+def test_unsupported_penalty_is_rejected(grouped_data):
+    X, y, _ = grouped_data
+    with pytest.raises(ValueError, match="L2 penalty"):
+        BatchedLogisticRegression(l1_ratio=1.0, solver="saga").fit(X, y)
+
+
+def test_wide_designs_fall_back_to_lbfgs():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, MAX_BATCHED_FEATURES + 1))
+    y = (X[:, 0] + rng.normal(size=120) > 0).astype(int)
+    datasets = [(X[:100], y[:100]), (X[20:], y[20:])]
+
+    fitted = BatchedLogisticRegression(C=0.1).fit_batch(datasets)
+
+    for model, (X_fold, y_fold) in zip(fitted, datasets):
+        reference = LogisticRegression(C=0.1).fit(X_fold, y_fold)
+        assert isinstance(model, BatchedLogisticRegression)
+        np.testing.assert_array_equal(model.coef_, reference.coef_)
+        np.testing.assert_array_equal(model.intercept_, reference.intercept_)
+
+
+def test_chunked_batch_matches_single_batch(grouped_data, monkeypatch):
+    X, y, groups = grouped_data
+    datasets = [(X[train], y[train]) for train, _ in get_cv_splits(y, groups, 5, 0)]
+    whole = BatchedLogisticRegression().fit_batch(datasets)
+
+    # Room for two folds per solve
+    monkeypatch.setattr(batched_logistic, "_MAX_BATCH_BYTES", 2 * 3 * 8 * (60 * 21 + 21**2))
+    chunked = BatchedLogisticRegression().fit_batch(datasets)
+
+    for a, b in zip(whole, chunked):
+        np.testing.assert_allclose(a.coef_, b.coef_, rtol=1e-10, atol=1e-12)
@@ -0,0 +1,38 @@
+"""AdaptiveHistGradientBoosting (models/boosting.py) on small and large training sets."""
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from parkinsons_voice_classification.models.classifiers import get_models
+
+
+def _hgb():
+    return get_models(extra_models=["HistGradientBoosting"])["HistGradientBoosting"][-1]
+
+
+def test_small_training_set_grows_real_trees(grouped_data):
+    X, y, _ = grouped_data
+    model = clone(_hgb()).fit(X[:30], y[:30])
+
+    assert model.min_samples_leaf_ == 3
+    assert not model.do_early_stopping_
+    # Single-leaf trees would predict the class prior for every sample
+    assert len(np.unique(model.predict_proba(X[30:])[:, 1])) > 1
+    # The configured parameters are left untouched
+    assert model.get_params()["min_samples_leaf"] == 20
+    assert model.get_params()["early_stopping"] is True
+
+
+def test_large_training_set_matches_sklearn():
+    X, y = make_classification(n_samples=600, n_features=30, random_state=0)
+    model = clone(_hgb())
+    reference = HistGradientBoostingClassifier(**model.get_params())
+
+    model.fit(X, y)
+    reference.fit(X, y)
+
+    assert model.min_samples_leaf_ == 20
+    assert model.do_early_stopping_
+    np.testing.assert_array_equal(model.predict_proba(X), reference.predict_proba(X))
@@ -0,0 +1,71 @@
+"""Work-queue backend (distributed.py): same results as serial execution."""
+
+import os
+
+import pytest
+
+from parkinsons_voice_classification.distributed import (
+    DONE,
+    PENDING,
+    RUNNING,
+    DistributedExecutor,
+    WorkQueue,
+)
+from parkinsons_voice_classification.models.training import run_cv
+
+
+def test_run_cv_on_queue_matches_serial(grouped_data, tmp_path):
+    X, y, groups = grouped_data
+    serial, serial_predictions = run_cv(
+        X, y, groups=groups, use_groups=True, collect_predictions=True, jobs=1
+    )
+    # Two local workers sharing one queue file
+    queued, queued_predictions = run_cv(
+        X,
+        y,
+        groups=groups,
+        use_groups=True,
+        collect_predictions=True,
+        jobs=2,
+        queue=str(tmp_path / "queue.sqlite"),
+    )
+
+    assert queued.equals(serial)
+    for name, (y_true, y_prob) in serial_predictions.items():
+        assert (queued_predictions[name][0] == y_true).all()
+        assert (queued_predictions[name][1] == y_prob).all()
+
+
+def test_map_preserves_order_across_workers(tmp_path):
+    executor = DistributedExecutor(tmp_path / "queue.sqlite", local_workers=3)
+    items = [(i, 7) for i in range(20)]
+    assert executor.map(divmod, items) == [divmod(*args) for args in items]
+
+
+def test_map_raises_when_local_workers_die(tmp_path):
+    executor = DistributedExecutor(tmp_path / "queue.sqlite", local_workers=2, lease_seconds=1.0)
+    # Every task kills the worker that runs it; no external workers exist
+    with pytest.raises(RuntimeError, match="local workers exited"):
+        executor.map(os._exit, [(3,), (3,), (3,)])
+
+
+def test_outcome_of_lost_lease_is_discarded(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    try:
+        batch = queue.submit(divmod, [(7, 2)], lease_seconds=0.0)
+        task_id = queue.claim("worker-a")[0]
+        # worker-a's lease has expired: worker-b takes the task over
+        assert queue.claim("worker-b")[0] == task_id
+
+        assert not queue.complete(task_id, "worker-a", "stale")
+        assert not queue.fail(task_id, "worker-a", "stale error")
+        assert queue.progress(batch) == {RUNNING: 1}
+
+        assert queue.fail(task_id, "worker-b", "error")
+        assert queue.progress(batch) == {PENDING: 1}
+        task_id = queue.claim("worker-b")[0]
+        assert queue.complete(task_id, "worker-b", (3, 1))
+        assert queue.progress(batch) == {DONE: 1}
+        assert queue.results(batch) == [(3, 1)]
+    finally:
+        queue.close()
@@ -0,0 +1,34 @@
+"""AdaptiveExecutor (parallel.py): mode choice never changes results or their order."""
+
+import time
+
+import pytest
+
+from parkinsons_voice_classification.parallel import AdaptiveExecutor
+
+
+def _sleep_units(units: int) -> int:
+    time.sleep(0.02 * units)
+    return units
+
+
+def test_smallest_task_is_timed_and_order_kept():
+    executor = AdaptiveExecutor(jobs=2)
+    sizes = [10, 1, 5, 10]
+
+    results = executor.map(_sleep_units, [(size,) for size in sizes], sizes=sizes)
+
+    assert results == sizes
+    # Per-unit cost from the one-unit task, not the ten-unit task in front
+    assert executor.last_task_seconds < 0.1
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread", "process"])
+def test_forced_modes_agree(mode):
+    items = [(i, 7) for i in range(10)]
+    assert AdaptiveExecutor(jobs=2, mode=mode).map(divmod, items) == [divmod(*a) for a in items]
+
+
+def test_sizes_must_match_items():
+    with pytest.raises(ValueError, match="sizes"):
+        AdaptiveExecutor(jobs=2).map(divmod, [(1, 2)], sizes=[1, 2])
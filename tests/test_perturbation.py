@@ -0,0 +1,51 @@
+"""NumPy jitter/shimmer engine (features/perturbation.py) vs Praat's own queries."""
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+from parkinsons_voice_classification.data.mdvr_kcl import discover_recordings
+from parkinsons_voice_classification.features.perturbation import compare_with_praat
+
+RTOL = 1e-6
+
+
+def _voiced_signal(seed: int, pause: bool, sr: int = 16000) -> np.ndarray:
+    """1.5 s of a ~120 Hz harmonic pulse train with period and amplitude perturbation."""
+    rng = np.random.default_rng(seed)
+    cycles, n_samples = [], 0
+    while n_samples < 1.5 * sr:
+        n = int(round(sr / (120 * (1 + 0.02 * rng.normal()))))
+        phase = np.arange(n) / n
+        harmonics = sum(np.sin(2 * np.pi * k * phase) / 2 ** (k - 1) for k in (1, 2, 3))
+        cycles.append((1 + 0.1 * rng.normal()) * harmonics * np.exp(-3 * phase))
+        n_samples += n
+    if pause:
+        # An unvoiced stretch in the middle: periods across it must be skipped
+        cycles.insert(len(cycles) // 2, np.zeros(sr // 4))
+    signal = np.concatenate(cycles)
+    signal += 0.005 * rng.normal(size=len(signal))
+    return (0.5 * signal / np.abs(signal).max()).astype(np.float32)
+
+
+def _assert_parity(results: dict[str, tuple[float, float]]) -> None:
+    for feature, (engine, praat) in results.items():
+        assert np.isnan(engine) == np.isnan(praat), feature
+        if not np.isnan(praat):
+            assert engine == pytest.approx(praat, rel=RTOL), feature
+
+
+@pytest.mark.parametrize("pause", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_synthetic_voice_matches_praat(tmp_path, seed, pause):
+    path = tmp_path / "voice.wav"
+    wavfile.write(path, 16000, _voiced_signal(seed, pause))
+    _assert_parity(compare_with_praat(str(path)))
+
+
+def test_mdvr_kcl_recordings_match_praat():
+    recordings = discover_recordings("ReadText") + discover_recordings("SpontaneousDialogue")
+    if not recordings:
+        pytest.skip("MDVR-KCL recordings not found")
+    for recording in recordings:
+        _assert_parity(compare_with_praat(str(recording.filepath)))
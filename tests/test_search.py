@@ -0,0 +1,37 @@
+"""Successive halving (models/search.py) vs an exhaustive grid search."""
+
+import pytest
+
+from parkinsons_voice_classification.config import SEARCH_MIN_DOMINANCE_SPLITS
+from parkinsons_voice_classification.data.mdvr_kcl import load_features
+from parkinsons_voice_classification.models.search import successive_halving_search
+
+
+def test_halving_winner_is_close_to_full_grid_winner(grouped_data):
+    X, y, groups = grouped_data
+    search = dict(X=X, y=y, groups=groups, use_groups=True, jobs=1)
+    halving = successive_halving_search("SVM_RBF", **search)
+    # A first rung on every split scores the whole grid exhaustively
+    full = successive_halving_search(
+        "SVM_RBF", **search, min_splits=halving.history["n_splits"].max()
+    )
+
+    assert halving.n_splits == full.n_splits
+    assert halving.best_score == pytest.approx(full.best_score, abs=0.03)
+
+    # Dominance pruning only on rungs with enough splits
+    early = halving.history[halving.history["n_splits"] < SEARCH_MIN_DOMINANCE_SPLITS]
+    assert not (early["status"] == "dominated").any()
+
+
+def test_readtext_svm_search_finds_full_grid_winner():
+    # Dataset A regression: pruning on the 3-split first rung discarded the best candidate
+    try:
+        X, y, groups = load_features("ReadText")
+    except FileNotFoundError:
+        pytest.skip("ReadText features not extracted")
+    search = dict(X=X, y=y, groups=groups, use_groups=True, jobs=1)
+    halving = successive_halving_search("SVM_RBF", **search)
+    full = successive_halving_search("SVM_RBF", **search, min_splits=halving.n_splits)
+
+    assert halving.best_score == pytest.approx(full.best_score, abs=0.03)
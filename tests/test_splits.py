@@ -0,0 +1,52 @@
+"""CV split service (models/splits.py): same folds as sklearn's splitters."""
+
+import numpy as np
+import pytest
+from sklearn.model_selection import StratifiedGroupKFold, StratifiedKFold
+
+from parkinsons_voice_classification.models import splits
+from parkinsons_voice_classification.models.splits import get_cv_folds, get_cv_splits
+
+
+def _assert_same_splits(ours, reference) -> None:
+    reference = list(reference)
+    assert len(ours) == len(reference)
+    for (train, test), (ref_train, ref_test) in zip(ours, reference):
+        np.testing.assert_array_equal(train, np.sort(ref_train))
+        np.testing.assert_array_equal(test, np.sort(ref_test))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42, 1234])
+def test_grouped_splits_match_stratified_group_kfold(grouped_data, seed):
+    X, y, groups = grouped_data
+    cv = StratifiedGroupKFold(n_splits=5, shuffle=True, random_state=seed)
+    _assert_same_splits(get_cv_splits(y, groups, 5, seed), cv.split(X, y, groups))
+
+
+def test_grouped_splits_match_with_uneven_groups_and_labels():
+    # Groups of 1-6 recordings, string labels, three classes
+    rng = np.random.default_rng(1)
+    groups = np.repeat(np.arange(150), rng.integers(1, 7, size=150))
+    y = np.array(["HC", "PD", "other"])[rng.integers(0, 3, size=len(groups))]
+    X = np.zeros((len(y), 1))
+    cv = StratifiedGroupKFold(n_splits=4, shuffle=True, random_state=7)
+    _assert_same_splits(get_cv_splits(y, groups, 4, 7), cv.split(X, y, groups))
+
+
+@pytest.mark.parametrize("seed", [0, 42])
+def test_ungrouped_splits_match_stratified_kfold(grouped_data, seed):
+    X, y, _ = grouped_data
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=seed)
+    _assert_same_splits(get_cv_splits(y, None, 5, seed), cv.split(X, y))
+
+
+def test_folds_are_cached_on_disk(grouped_data):
+    _, y, groups = grouped_data
+    folds = get_cv_folds(y, groups, 5, 0)
+    assert len(list(splits.SPLIT_CACHE_DIR.glob("folds_*.npy"))) == 1
+
+    splits.clear_split_cache()
+    np.testing.assert_array_equal(get_cv_folds(y, groups, 5, 0), folds)
+    # Renamed groups give the same folds and hit the same cache entry
+    np.testing.assert_array_equal(get_cv_folds(y, groups + 100, 5, 0), folds)
+    assert len(list(splits.SPLIT_CACHE_DIR.glob("folds_*.npy"))) == 1
@@ -0,0 +1,46 @@
+"""SigmoidSVC (models/svm_probability.py): Platt sigmoid without libsvm's internal CV."""
+
+import numpy as np
+import pytest
+
+from parkinsons_voice_classification.models.svm_probability import SigmoidSVC, fit_sigmoid
+
+
+def test_sigmoid_is_platts_fit():
+    rng = np.random.default_rng(0)
+    decision = rng.normal(size=200)
+    y = decision + 0.5 * rng.normal(size=200) > 0
+
+    a, b = fit_sigmoid(decision, y)
+
+    assert a < 0
+    # Stationary point of Platt's objective: the gradient in A and B vanishes
+    n_pos, n_neg = y.sum(), (~y).sum()
+    target = np.where(y, (n_pos + 1) / (n_pos + 2), 1 / (n_neg + 2))
+    residual = target - 1 / (1 + np.exp(a * decision + b))
+    assert abs(residual.sum()) < 1e-4
+    assert abs(np.dot(decision, residual)) < 1e-4
+
+
+def test_inverted_hold_out_keeps_ranking():
+    # Held-out decision values that happen to rank the classes backwards
+    decision = np.array([-2.0, -1.0, -0.5, 0.5, 1.0, 2.0])
+    y = np.array([1, 1, 0, 1, 0, 0], dtype=bool)
+
+    a, b = fit_sigmoid(decision, y)
+
+    assert a < 0
+    prob = 1 / (1 + np.exp(a * decision + b))
+    assert (np.diff(prob) > 0).all()
+
+
+def test_holdout_probabilities_follow_decision_function(grouped_data):
+    X, y, _ = grouped_data
+    with pytest.warns(UserWarning, match="hold-out"):
+        model = SigmoidSVC(calibration="holdout", random_state=0).fit(X[:30], y[:30])
+
+    decision = model.decision_function(X[30:])
+    prob = model.predict_proba(X[30:])[:, 1]
+    order = np.argsort(decision)
+    assert (np.diff(prob[order]) >= 0).all()
+    np.testing.assert_array_equal(model.predict(X[30:]), model.classes_[(decision > 0).astype(int)])
@@ -0,0 +1,59 @@
+"""Repeated CV and vectorized metrics (models/training.py) vs per-fold scoring."""
+
+import numpy as np
+import pytest
+
+from parkinsons_voice_classification.config import RANDOM_SEED
+from parkinsons_voice_classification.models.training import (
+    compute_metrics,
+    compute_metrics_batch,
+    run_cv,
+    run_repeated_cv,
+)
+
+
+def test_batch_metrics_match_per_segment_metrics():
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(5, 40, size=50)
+    segments = np.repeat(np.arange(len(sizes)), sizes)
+    y_true = rng.integers(0, 2, size=len(segments))
+    y_pred = rng.integers(0, 2, size=len(segments))
+    # Rounded scores give tied ranks
+    y_prob = np.round(rng.random(len(segments)), 1)
+    # Degenerate segments: one class only, no positive predictions, all scores tied
+    y_true[segments == 0] = 1
+    y_pred[segments == 1] = 0
+    y_prob[segments == 2] = 0.5
+
+    batch = compute_metrics_batch(y_true, y_pred, y_prob, segments)
+
+    for segment in range(len(sizes)):
+        mask = segments == segment
+        expected = compute_metrics(y_true[mask], y_pred[mask], y_prob[mask])
+        for metric, value in expected.items():
+            if np.isnan(value):
+                assert np.isnan(batch[metric][segment]), (metric, segment)
+            else:
+                assert batch[metric][segment] == pytest.approx(value, rel=1e-12), (metric, segment)
+
+
+def test_batch_metrics_without_probabilities():
+    y = np.array([0, 1, 1, 0])
+    batch = compute_metrics_batch(y, y, None, np.array([0, 0, 1, 1]))
+    assert np.isnan(batch["roc_auc"]).all()
+    np.testing.assert_array_equal(batch["accuracy"], [1.0, 1.0])
+
+
+def test_first_repeat_matches_run_cv(grouped_data):
+    X, y, groups = grouped_data
+    single = run_cv(X, y, groups=groups, use_groups=True, jobs=1)
+    repeated = run_repeated_cv(X, y, groups=groups, use_groups=True, seeds=[RANDOM_SEED], jobs=1)
+
+    assert (repeated["seed"] == RANDOM_SEED).all()
+    merged = single.merge(
+        repeated, on=["model", "fold", "metric"], how="outer", suffixes=("_cv", "_repeated")
+    )
+    assert len(merged) == len(single) == len(repeated)
+    np.testing.assert_allclose(
+        merged["value_repeated"], merged["value_cv"], rtol=1e-12, equal_nan=True
+    )